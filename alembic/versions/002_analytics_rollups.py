@@ -0,0 +1,126 @@
+"""Analytics rollup tables and upsert keys
+
+Revision ID: 002_analytics_rollups
+Revises: 001_initial
+Create Date: 2026-10-16 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_analytics_rollups'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Add rollup columns, upsert keys and the rollup tables"""
+
+    # daily_statistics: columns for profit factor, best/worst trade and average duration
+    op.add_column('daily_statistics', sa.Column('gross_profit', sa.Numeric(precision=18, scale=8), server_default='0', nullable=True))
+    op.add_column('daily_statistics', sa.Column('gross_loss', sa.Numeric(precision=18, scale=8), server_default='0', nullable=True))
+    op.add_column('daily_statistics', sa.Column('best_trade', sa.Numeric(precision=18, scale=8), nullable=True))
+    op.add_column('daily_statistics', sa.Column('worst_trade', sa.Numeric(precision=18, scale=8), nullable=True))
+    op.add_column('daily_statistics', sa.Column('total_duration_seconds', sa.Integer(), server_default='0', nullable=True))
+    op.create_unique_constraint('uq_daily_statistics_user_date', 'daily_statistics', ['user_id', 'date'])
+
+    # daily_returns / strategy_performance: create_all (init_database.py) already
+    # makes them; databases built from migrations or init.sql do not have them yet
+    if _has_table('daily_returns'):
+        op.create_unique_constraint('uq_daily_returns_user_date', 'daily_returns', ['user_id', 'date'])
+    else:
+        op.create_table(
+            'daily_returns',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('user_id', sa.String(length=50), nullable=False),
+            sa.Column('date', sa.Date(), nullable=False),
+            sa.Column('return_pct', sa.Numeric(precision=8, scale=4), nullable=False),
+            sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('user_id', 'date', name='uq_daily_returns_user_date')
+        )
+        op.create_index('ix_daily_returns_user_id', 'daily_returns', ['user_id'])
+        op.create_index('ix_daily_returns_date', 'daily_returns', ['date'])
+
+    if _has_table('strategy_performance'):
+        op.create_unique_constraint('uq_strategy_performance_user_strategy', 'strategy_performance',
+                                    ['user_id', 'strategy_name'])
+    else:
+        op.create_table(
+            'strategy_performance',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('user_id', sa.String(length=50), nullable=False),
+            sa.Column('strategy_name', sa.String(length=50), nullable=False),
+            sa.Column('total_trades', sa.Integer(), nullable=True),
+            sa.Column('winning_trades', sa.Integer(), nullable=True),
+            sa.Column('losing_trades', sa.Integer(), nullable=True),
+            sa.Column('total_pnl', sa.Numeric(precision=18, scale=8), nullable=True),
+            sa.Column('sharpe_ratio', sa.Numeric(precision=8, scale=4), nullable=True),
+            sa.Column('max_drawdown_pct', sa.Numeric(precision=8, scale=4), nullable=True),
+            sa.Column('current_allocation_pct', sa.Numeric(precision=8, scale=4), nullable=True),
+            sa.Column('last_updated', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+            sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('user_id', 'strategy_name', name='uq_strategy_performance_user_strategy')
+        )
+        op.create_index('ix_strategy_performance_user_id', 'strategy_performance', ['user_id'])
+        op.create_index('ix_strategy_performance_strategy_name', 'strategy_performance', ['strategy_name'])
+
+    # Create market_statistics table
+    op.create_table(
+        'market_statistics',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.String(length=50), nullable=False),
+        sa.Column('pair', sa.String(length=20), nullable=False),
+        sa.Column('total_trades', sa.Integer(), nullable=True),
+        sa.Column('winning_trades', sa.Integer(), nullable=True),
+        sa.Column('losing_trades', sa.Integer(), nullable=True),
+        sa.Column('total_pnl', sa.Numeric(precision=18, scale=8), nullable=True),
+        sa.Column('total_fees', sa.Numeric(precision=18, scale=8), nullable=True),
+        sa.Column('total_volume', sa.Numeric(precision=18, scale=8), nullable=True),
+        sa.Column('last_trade_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'pair', name='uq_market_statistics_user_pair')
+    )
+
+    # Create trade_rollups table
+    op.create_table(
+        'trade_rollups',
+        sa.Column('trade_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.String(length=50), nullable=False),
+        sa.Column('applied_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['trade_id'], ['trades.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('trade_id')
+    )
+    op.create_index('ix_trade_rollups_user_id', 'trade_rollups', ['user_id'])
+
+
+def downgrade() -> None:
+    """Drop the rollup tables, upsert keys and columns"""
+    op.drop_index('ix_trade_rollups_user_id', table_name='trade_rollups')
+    op.drop_table('trade_rollups')
+    op.drop_table('market_statistics')
+    # daily_returns / strategy_performance may predate this revision (create_all),
+    # so only their upsert keys are dropped
+    if _has_table('strategy_performance'):
+        op.drop_constraint('uq_strategy_performance_user_strategy', 'strategy_performance', type_='unique')
+    if _has_table('daily_returns'):
+        op.drop_constraint('uq_daily_returns_user_date', 'daily_returns', type_='unique')
+    op.drop_constraint('uq_daily_statistics_user_date', 'daily_statistics', type_='unique')
+    op.drop_column('daily_statistics', 'total_duration_seconds')
+    op.drop_column('daily_statistics', 'worst_trade')
+    op.drop_column('daily_statistics', 'best_trade')
+    op.drop_column('daily_statistics', 'gross_loss')
+    op.drop_column('daily_statistics', 'gross_profit')
@@ -26,6 +26,11 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import pandas as pd
 
+try:
+    from bot.event_log import event_stream
+except ImportError:
+    from event_log import event_stream  # type: ignore[import]
+
 logger = logging.getLogger("nija.activity_feed")
 
 
@@ -97,6 +102,7 @@ class ActivityFeed:
         # Activity files
         self.activity_file = os.path.join(feed_dir, "activity_feed.jsonl")
         self.summary_file = os.path.join(feed_dir, "daily_summary.json")
+        self._activity_stream = event_stream(self.activity_file)
 
         # In-memory cache for recent activity (last 1000 events)
         self.recent_events: List[ActivityEvent] = []
@@ -109,6 +115,7 @@ class ActivityFeed:
 
     def _load_recent_events(self) -> None:
         """Load recent events from file into memory."""
+        self._activity_stream.flush()
         if not os.path.exists(self.activity_file):
             return
 
@@ -441,10 +448,11 @@ class ActivityFeed:
         if len(self.recent_events) > self.max_recent_events:
             self.recent_events.pop(0)
 
-        # Write to file (JSONL format - one JSON object per line)
+        # Queue for the file (JSONL format - one JSON object per line); the
+        # shared event-log thread does the serialisation and batched append.
         try:
-            with open(self.activity_file, 'a') as f:
-                f.write(json.dumps(event.to_dict()) + '\n')
+            if not self._activity_stream.append(event.to_dict()):
+                logger.debug("Activity feed queue full - event not persisted")
         except Exception as e:
             logger.error(f"Error writing to activity feed: {e}")
 
@@ -587,6 +595,7 @@ class ActivityFeed:
         Returns:
             Number of events archived
         """
+        self._activity_stream.flush()
         if not os.path.exists(self.activity_file):
             return 0
 
@@ -44,15 +44,24 @@ class ApexBacktest:
         self,
         df: pd.DataFrame,
         symbol: str,
-        commission: float = 0.001
+        commission: float = 0.001,
+        vectorized: bool = True
     ) -> Dict:
         """
         Run backtest on historical data
 
+        The default replay precomputes every indicator column once and steps
+        through the candles with NumPy arrays and zero-copy prefix views, so
+        a run is linear in the number of candles.  ``vectorized=False`` runs
+        the original loop that recomputes indicators on a copied prefix each
+        candle (quadratic; kept for parity checks and benchmarks).  Both
+        produce identical trades and statistics.
+
         Args:
             df: DataFrame with OHLCV data
             symbol: Trading symbol
             commission: Commission per trade as decimal (0.001 = 0.1%)
+            vectorized: Use the precomputed replay engine
 
         Returns:
             dict: Backtest results and statistics
@@ -71,6 +80,110 @@ class ApexBacktest:
         self.equity_curve = []
         self.current_balance = self.initial_balance
 
+        if vectorized:
+            self._replay_precomputed(df, symbol, commission, min_candles)
+        else:
+            self._replay_legacy(df, symbol, commission, min_candles)
+
+        # Close any remaining positions at end
+        final_price = df.iloc[-1]['close']
+        for position_id in list(self.positions.keys()):
+            self._close_position(
+                position_id,
+                final_price,
+                1.0,
+                commission,
+                "End of backtest"
+            )
+
+        # Calculate statistics
+        results = self._calculate_statistics()
+
+        logger.info(f"Backtest complete: {len(self.trades)} trades, "
+                   f"Final balance: ${self.current_balance:,.2f}")
+
+        return results
+
+    def _replay_precomputed(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        commission: float,
+        min_candles: int
+    ):
+        """Replay candles against indicator columns computed once up front"""
+        precomputed = self.strategy.precompute_indicators(df)
+        closes = df['close'].to_numpy()
+        timestamps = df.index.tolist()
+        strategy = self.strategy
+
+        for i in range(min_candles, len(df)):
+            # Prefix view, not a copy: with indicators precomputed the
+            # strategy only reads the last few rows of it.
+            historical_df = df.iloc[:i+1]
+            close = closes[i]
+            indicators = strategy.indicators_at(precomputed, i)
+
+            # Record equity
+            total_equity = self._calculate_total_equity(close)
+            self.equity_curve.append({
+                'timestamp': timestamps[i],
+                'equity': total_equity,
+                'cash': self.current_balance,
+                'position_value': total_equity - self.current_balance,
+            })
+
+            # Update existing positions
+            positions_to_close = []
+            for position_id, position in self.positions.items():
+                update_result = strategy.update_position(
+                    position_id,
+                    historical_df,
+                    position,
+                    indicators
+                )
+
+                if update_result['action'] == 'exit':
+                    self._close_position(
+                        position_id,
+                        close,
+                        update_result['exit_percentage'],
+                        commission,
+                        update_result['reason']
+                    )
+                    positions_to_close.append(position_id)
+
+                elif update_result['action'] == 'update_stop':
+                    self.positions[position_id]['stop_loss'] = update_result['new_stop']
+
+            for position_id in positions_to_close:
+                if position_id in self.positions:
+                    del self.positions[position_id]
+
+            # Check for new entry opportunities (if no positions)
+            if len(self.positions) == 0:
+                entry_analysis = strategy.analyze_entry_opportunity(
+                    historical_df,
+                    symbol,
+                    indicators
+                )
+
+                if entry_analysis['should_enter']:
+                    self._open_position(
+                        symbol,
+                        entry_analysis,
+                        close,
+                        commission
+                    )
+
+    def _replay_legacy(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        commission: float,
+        min_candles: int
+    ):
+        """Original per-candle loop: copies the prefix and recomputes indicators"""
         # Process each candle
         for i in range(min_candles, len(df)):
             # Get historical data up to current candle
@@ -132,25 +245,6 @@ class ApexBacktest:
                         commission
                     )
 
-        # Close any remaining positions at end
-        final_price = df.iloc[-1]['close']
-        for position_id in list(self.positions.keys()):
-            self._close_position(
-                position_id,
-                final_price,
-                1.0,
-                commission,
-                "End of backtest"
-            )
-
-        # Calculate statistics
-        results = self._calculate_statistics()
-
-        logger.info(f"Backtest complete: {len(self.trades)} trades, "
-                   f"Final balance: ${self.current_balance:,.2f}")
-
-        return results
-
     def _open_position(
         self,
         symbol: str,
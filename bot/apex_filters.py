@@ -66,12 +66,20 @@ class ApexSmartFilters:
         self.last_news_event_time = event_time
         self.blocked_until = event_time + timedelta(minutes=cooldown_minutes)
 
-    def check_low_volume(self, df: pd.DataFrame) -> Tuple[bool, str]:
+    def check_low_volume(
+        self,
+        df: pd.DataFrame,
+        avg_volume: Optional[float] = None,
+        current_volume: Optional[float] = None
+    ) -> Tuple[bool, str]:
         """
         Check if current volume is too low for trading
 
         Args:
             df: DataFrame with volume data
+            avg_volume: Precomputed 20-candle average volume for the last
+                candle (skips the rolling mean over ``df``)
+            current_volume: Precomputed volume of the last candle
 
         Returns:
             tuple: (is_blocked, reason)
@@ -82,8 +90,10 @@ class ApexSmartFilters:
         if len(df) < 20:
             return True, "Insufficient data for volume analysis"
 
-        current_volume = df['volume'].iloc[-1]
-        avg_volume = df['volume'].rolling(window=20, min_periods=20).mean().iloc[-1]
+        if current_volume is None:
+            current_volume = df['volume'].iloc[-1]
+        if avg_volume is None:
+            avg_volume = df['volume'].rolling(window=20, min_periods=20).mean().iloc[-1]
 
         threshold = SMART_FILTERS['low_volume']['threshold']
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
@@ -148,7 +158,9 @@ class ApexSmartFilters:
         df: pd.DataFrame,
         adx: float,
         candle_open_time: Optional[datetime] = None,
-        current_time: Optional[datetime] = None
+        current_time: Optional[datetime] = None,
+        avg_volume: Optional[float] = None,
+        current_volume: Optional[float] = None
     ) -> Tuple[bool, list]:
         """
         Check all filters at once
@@ -158,6 +170,8 @@ class ApexSmartFilters:
             adx: ADX value
             candle_open_time: When current candle opened
             current_time: Current time
+            avg_volume: Precomputed 20-candle average volume (optional)
+            current_volume: Precomputed volume of the last candle (optional)
 
         Returns:
             tuple: (any_blocked, list_of_blocking_reasons)
@@ -170,7 +184,7 @@ class ApexSmartFilters:
             blocking_reasons.append(f"News: {reason}")
 
         # Check low volume
-        is_blocked, reason = self.check_low_volume(df)
+        is_blocked, reason = self.check_low_volume(df, avg_volume, current_volume)
         if is_blocked:
             blocking_reasons.append(f"Volume: {reason}")
 
@@ -92,7 +92,7 @@ class ApexRiskManager:
             tuple: (position_size_usd, position_size_pct, risk_amount)
         """
         # Get position size percentage based on trend quality
-        sizing_config = POSITION_SIZING['trend_quality']
+        sizing_config = POSITION_SIZING.get('trend_quality', {})
 
         if trend_quality in sizing_config:
             position_size_pct = sizing_config[trend_quality]['position_size']
@@ -139,6 +139,154 @@ class ApexStrategyV7:
 
         return indicators
 
+    def precompute_indicators(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Calculate every indicator column once over the whole series
+
+        All indicators are causal (rolling windows, ``adjust=False`` EMAs,
+        cumulative VWAP), so row ``i`` of each column equals the last value
+        :meth:`calculate_all_indicators` returns for ``df.iloc[:i+1]``.
+        Backtests use this with :meth:`indicators_at` instead of
+        recomputing on a growing prefix every candle.
+
+        Args:
+            df: DataFrame with OHLCV data
+
+        Returns:
+            dict: Column name -> NumPy array aligned with ``df``
+        """
+        adx, plus_di, minus_di = calculate_adx(df, INDICATORS['adx_period'])
+        atr = calculate_atr(df, INDICATORS['atr_period'])
+        vwap = calculate_vwap(df)
+        rsi = calculate_rsi(df, INDICATORS['rsi_period'])
+        macd_line, signal_line, histogram, hist_direction = calculate_enhanced_macd(
+            df,
+            INDICATORS['macd_fast'],
+            INDICATORS['macd_slow'],
+            INDICATORS['macd_signal']
+        )
+        close = df['close']
+        ema9 = close.ewm(span=9, adjust=False).mean().to_numpy()
+        ema21 = close.ewm(span=21, adjust=False).mean().to_numpy()
+        ema50 = close.ewm(span=50, adjust=False).mean().to_numpy()
+
+        volume = df['volume'].to_numpy()
+        avg_volume = df['volume'].rolling(window=20, min_periods=20).mean()
+
+        # Reversal candles, same rules as is_bullish/bearish_reversal_candle
+        open_ = df['open'].to_numpy()
+        high = df['high'].to_numpy()
+        low = df['low'].to_numpy()
+        closes = close.to_numpy()
+        prev_low = np.r_[np.nan, low[:-1]]
+        prev_high = np.r_[np.nan, high[:-1]]
+        range_size = high - low
+        with np.errstate(divide='ignore', invalid='ignore'):
+            close_position = (closes - low) / range_size
+        has_range = range_size > 0
+        bullish_reversal = (closes > open_) & (low < prev_low) & has_range & (close_position >= 0.5)
+        bearish_reversal = (closes < open_) & (high > prev_high) & has_range & (close_position <= 0.5)
+
+        lookback = STOP_LOSS['swing_lookback']
+        swing_low = df['low'].rolling(window=lookback, min_periods=1).min()
+        swing_high = df['high'].rolling(window=lookback, min_periods=1).max()
+
+        return {
+            'close': closes,
+            'volume': volume,
+            'adx': adx.to_numpy(),
+            'plus_di': plus_di.to_numpy(),
+            'minus_di': minus_di.to_numpy(),
+            'atr': atr.to_numpy(),
+            'vwap': vwap.to_numpy(),
+            'rsi': rsi.to_numpy(),
+            'macd_line': macd_line.to_numpy(),
+            'macd_signal': signal_line.to_numpy(),
+            'macd_histogram': histogram.to_numpy(),
+            'macd_direction': hist_direction.to_numpy(),
+            'ema9': ema9,
+            'ema21': ema21,
+            'ema50': ema50,
+            'avg_volume': avg_volume.to_numpy(),
+            'volume_ok': volume >= avg_volume.ffill().to_numpy() * MARKET_FILTER['volume_threshold'],
+            'bullish_reversal': bullish_reversal,
+            'bearish_reversal': bearish_reversal,
+            'swing_low': swing_low.to_numpy(),
+            'swing_high': swing_high.to_numpy(),
+        }
+
+    def indicators_at(self, precomputed: Dict[str, np.ndarray], i: int) -> Optional[Dict]:
+        """
+        Indicator dict for candle ``i`` from :meth:`precompute_indicators`
+
+        Same keys and values as ``calculate_all_indicators(df.iloc[:i+1])``
+        plus the window-dependent inputs the entry/exit checks would
+        otherwise recompute from ``df`` (volume average, previous EMAs).
+
+        Returns:
+            dict or None: None when fewer than ``min_candles_required`` candles
+        """
+        n = i + 1
+        if n < EXECUTION['min_candles_required']:
+            return None
+
+        ema9 = precomputed['ema9'][i]
+        ema21 = precomputed['ema21'][i]
+        indicators = {
+            'adx': float(precomputed['adx'][i]),
+            'plus_di': float(precomputed['plus_di'][i]),
+            'minus_di': float(precomputed['minus_di'][i]),
+            'atr': float(precomputed['atr'][i]),
+            'vwap': float(precomputed['vwap'][i]),
+            'rsi': float(precomputed['rsi'][i]),
+            'macd_line': float(precomputed['macd_line'][i]),
+            'macd_signal': float(precomputed['macd_signal'][i]),
+            'macd_histogram': float(precomputed['macd_histogram'][i]),
+            'macd_direction': float(precomputed['macd_direction'][i]),
+            'ema9': float(ema9),
+            'ema21': float(ema21),
+        }
+        if n >= 50:
+            ema50 = precomputed['ema50'][i]
+            indicators['ema_bullish_alignment'] = ema9 > ema21 and ema21 > ema50
+            indicators['ema_bearish_alignment'] = ema9 < ema21 and ema21 < ema50
+            indicators['ema50'] = float(ema50)
+        else:
+            indicators['ema_bullish_alignment'] = ema9 > ema21
+            indicators['ema_bearish_alignment'] = ema9 < ema21
+
+        indicators['close'] = precomputed['close'][i]
+        indicators['volume'] = precomputed['volume'][i]
+        indicators['avg_volume'] = precomputed['avg_volume'][i]
+        indicators['volume_ok'] = bool(precomputed['volume_ok'][i])
+        indicators['bullish_reversal'] = bool(precomputed['bullish_reversal'][i])
+        indicators['bearish_reversal'] = bool(precomputed['bearish_reversal'][i])
+        indicators['swing_low'] = precomputed['swing_low'][i]
+        indicators['swing_high'] = precomputed['swing_high'][i]
+        indicators['prev_ema9'] = precomputed['ema9'][i - 1]
+        indicators['prev_ema21'] = precomputed['ema21'][i - 1]
+        return indicators
+
+    # Window-dependent inputs: precomputed value when present, else from df
+
+    def _last_close(self, df: pd.DataFrame, indicators: Dict) -> float:
+        if 'close' in indicators:
+            return indicators['close']
+        return df['close'].iloc[-1]
+
+    def _volume_confirmed(self, df: pd.DataFrame, indicators: Dict) -> bool:
+        if 'volume_ok' in indicators:
+            return indicators['volume_ok']
+        return is_volume_above_threshold(df, MARKET_FILTER['volume_threshold'])
+
+    def _reversal_candle(self, df: pd.DataFrame, indicators: Dict, side: str) -> bool:
+        key = 'bullish_reversal' if side == 'long' else 'bearish_reversal'
+        if key in indicators:
+            return indicators[key]
+        if side == 'long':
+            return is_bullish_reversal_candle(df)
+        return is_bearish_reversal_candle(df)
+
     def check_market_filter(self, df: pd.DataFrame, indicators: Dict) -> Tuple[bool, str, str]:
         """
         Check if market conditions are suitable for trading
@@ -165,13 +313,15 @@ class ApexStrategyV7:
             return False, 'NEUTRAL', "No clear trend direction"
 
         # 3. Check volume
-        volume_ok = is_volume_above_threshold(df, MARKET_FILTER['volume_threshold'])
+        volume_ok = self._volume_confirmed(df, indicators)
         if not volume_ok:
             return False, trend_direction, "Volume below threshold"
 
         # 4. Check smart filters
         any_blocked, blocking_reasons = self.smart_filters.check_all_filters(
-            df, adx, candle_open_time=None, current_time=None
+            df, adx, candle_open_time=None, current_time=None,
+            avg_volume=indicators.get('avg_volume'),
+            current_volume=indicators.get('volume')
         )
 
         if any_blocked:
@@ -190,7 +340,7 @@ class ApexStrategyV7:
         Returns:
             tuple: (should_enter, score, conditions_met)
         """
-        current_price = df['close'].iloc[-1]
+        current_price = self._last_close(df, indicators)
         conditions_met = []
         score = 0
 
@@ -213,7 +363,7 @@ class ApexStrategyV7:
             score += 1
 
         # Condition 3: Bullish reversal candle
-        if is_bullish_reversal_candle(df):
+        if self._reversal_candle(df, indicators, 'long'):
             conditions_met.append("Bullish reversal candle")
             score += 1
 
@@ -223,7 +373,7 @@ class ApexStrategyV7:
             score += 1
 
         # Condition 5: Volume confirmation
-        if is_volume_above_threshold(df, MARKET_FILTER['volume_threshold']):
+        if self._volume_confirmed(df, indicators):
             conditions_met.append("Volume confirmed")
             score += 1
 
@@ -244,7 +394,7 @@ class ApexStrategyV7:
         Returns:
             tuple: (should_enter, score, conditions_met)
         """
-        current_price = df['close'].iloc[-1]
+        current_price = self._last_close(df, indicators)
         conditions_met = []
         score = 0
 
@@ -267,7 +417,7 @@ class ApexStrategyV7:
             score += 1
 
         # Condition 3: Bearish reversal candle
-        if is_bearish_reversal_candle(df):
+        if self._reversal_candle(df, indicators, 'short'):
             conditions_met.append("Bearish reversal candle")
             score += 1
 
@@ -277,7 +427,7 @@ class ApexStrategyV7:
             score += 1
 
         # Condition 5: Volume confirmation
-        if is_volume_above_threshold(df, MARKET_FILTER['volume_threshold']):
+        if self._volume_confirmed(df, indicators):
             conditions_met.append("Volume confirmed")
             score += 1
 
@@ -299,13 +449,15 @@ class ApexStrategyV7:
         Returns:
             float: Stop loss price
         """
-        entry_price = df['close'].iloc[-1]
+        entry_price = self._last_close(df, indicators)
         atr = indicators['atr']
         atr_buffer = atr * STOP_LOSS['atr_multiplier']
 
         if side == 'long':
             # Find swing low
-            swing_low = find_swing_low(df, STOP_LOSS['swing_lookback'])
+            swing_low = indicators.get('swing_low')
+            if swing_low is None:
+                swing_low = find_swing_low(df, STOP_LOSS['swing_lookback'])
             stop_loss = swing_low - atr_buffer
 
             # Ensure minimum/maximum stop distance
@@ -315,7 +467,9 @@ class ApexStrategyV7:
 
         else:  # short
             # Find swing high
-            swing_high = find_swing_high(df, STOP_LOSS['swing_lookback'])
+            swing_high = indicators.get('swing_high')
+            if swing_high is None:
+                swing_high = find_swing_high(df, STOP_LOSS['swing_lookback'])
             stop_loss = swing_high + atr_buffer
 
             # Ensure minimum/maximum stop distance
@@ -328,7 +482,8 @@ class ApexStrategyV7:
     def analyze_entry_opportunity(
         self,
         df: pd.DataFrame,
-        symbol: str
+        symbol: str,
+        indicators: Optional[Dict] = None
     ) -> Dict:
         """
         Analyze potential entry opportunity for a symbol
@@ -336,12 +491,15 @@ class ApexStrategyV7:
         Args:
             df: DataFrame with OHLCV data
             symbol: Trading symbol
+            indicators: Precomputed indicators for the last candle
+                (see :meth:`indicators_at`); calculated from ``df`` if omitted
 
         Returns:
             dict: Analysis results with entry recommendation
         """
         # Calculate indicators
-        indicators = self.calculate_all_indicators(df)
+        if indicators is None:
+            indicators = self.calculate_all_indicators(df)
 
         if indicators is None:
             return {
@@ -406,7 +564,7 @@ class ApexStrategyV7:
             }
 
         # Calculate trade parameters
-        entry_price = df['close'].iloc[-1]
+        entry_price = self._last_close(df, indicators)
         stop_loss = self.calculate_stop_loss(df, indicators, side)
 
         # Assess trend quality
@@ -452,7 +610,8 @@ class ApexStrategyV7:
         self,
         position_id: str,
         df: pd.DataFrame,
-        position: Dict
+        position: Dict,
+        indicators: Optional[Dict] = None
     ) -> Dict:
         """
         Update position with trailing stops and exit signals
@@ -461,15 +620,18 @@ class ApexStrategyV7:
             position_id: Unique position identifier
             df: Current DataFrame with OHLCV data
             position: Position dict with entry details
+            indicators: Precomputed indicators for the last candle
+                (see :meth:`indicators_at`); calculated from ``df`` if omitted
 
         Returns:
             dict: Updated position with exit recommendations
         """
-        indicators = self.calculate_all_indicators(df)
+        if indicators is None:
+            indicators = self.calculate_all_indicators(df)
         if indicators is None:
             return {'action': 'hold', 'reason': 'Insufficient data'}
 
-        current_price = df['close'].iloc[-1]
+        current_price = self._last_close(df, indicators)
         entry_price = position['entry_price']
         stop_loss = position['stop_loss']
         side = position['side']
@@ -504,7 +666,13 @@ class ApexStrategyV7:
 
         # Check trend break
         if EXIT_LOGIC['trend_break']['enabled']:
-            trend_broken = self.trailing_system.check_trend_break(df, side)
+            if 'prev_ema9' in indicators and len(df) >= 21:
+                trend_broken = self.trailing_system.is_trend_break(
+                    indicators['prev_ema9'], indicators['prev_ema21'],
+                    indicators['ema9'], indicators['ema21'], side
+                )
+            else:
+                trend_broken = self.trailing_system.check_trend_break(df, side)
             if trend_broken:
                 return {
                     'action': 'exit',
@@ -247,12 +247,29 @@ class ApexTrailingSystem:
         ema9 = df['close'].ewm(span=9, adjust=False).mean()
         ema21 = df['close'].ewm(span=21, adjust=False).mean()
 
-        # Check current and previous values
-        current_ema9 = ema9.iloc[-1]
-        current_ema21 = ema21.iloc[-1]
-        prev_ema9 = ema9.iloc[-2]
-        prev_ema21 = ema21.iloc[-2]
+        return self.is_trend_break(
+            ema9.iloc[-2], ema21.iloc[-2], ema9.iloc[-1], ema21.iloc[-1], side
+        )
+
+    @staticmethod
+    def is_trend_break(
+        prev_ema9: float,
+        prev_ema21: float,
+        current_ema9: float,
+        current_ema21: float,
+        side: str
+    ) -> bool:
+        """
+        EMA9/EMA21 cross test behind :meth:`check_trend_break`
 
+        Args:
+            prev_ema9, prev_ema21: EMA values on the previous candle
+            current_ema9, current_ema21: EMA values on the current candle
+            side: 'long' or 'short'
+
+        Returns:
+            bool: True if trend broken
+        """
         if side == 'long':
             # Trend breaks when EMA9 crosses below EMA21
             was_above = prev_ema9 > prev_ema21
@@ -425,7 +425,7 @@ def _try_patch_loaded() -> bool:
     except RuntimeError:
         modules = list(dict(sys.modules).items())
     for name, module in modules:
-        if isinstance(module, ModuleType) and (name.endswith("core_loop") or hasattr(module, "NijaCoreLoop")):
+        if isinstance(module, ModuleType) and (name.endswith("core_loop") or "NijaCoreLoop" in vars(module)):
             try:
                 patched = _patch_core_loop_module(module) or patched
             except Exception as exc:
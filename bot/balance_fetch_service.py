@@ -0,0 +1,397 @@
+"""Pooled, rate-limited balance fetching for ``MultiAccountBrokerManager``.
+
+``MultiAccountBrokerManager._get_cached_balance`` used to start a new
+thread for every balance fetch and ``time.sleep`` on the caller between
+Kraken calls, so refreshing 50 accounts was strictly serial and blocked the
+trading cycle for close to a minute.  ``BalanceFetchService`` replaces that:
+
+* **Fixed worker pool** — one ``ThreadPoolExecutor`` shared by every venue.
+  Requests are queued per venue ("lane"); a lane never runs more than its
+  configured number of concurrent fetches (Kraken: 1, to keep nonces
+  ordered).
+* **Token-bucket rate limiting** — each lane owns a :class:`TokenBucket`.
+  Pacing waits happen on the lane's worker, never on the caller.
+* **Per-call timeout** — each broker call runs on a separate call pool and
+  its callers wait at most ``call_timeout`` for it: the timed-out call is
+  recorded as a failure and the waiters fall back to the cached value.  The
+  lane slot stays taken until the call actually returns, so two nonce-bearing
+  calls never overlap on a single-slot lane (Kraken); a late balance is
+  still cached.
+* **Stale-while-revalidate** — :meth:`BalanceFetchService.get` returns a
+  fresh cached value immediately; a stale one is returned immediately too
+  and a single background refresh is scheduled.  Only a cold (or
+  invalidated / very old) entry makes the caller wait, bounded by
+  ``fetch_timeout``, with the stale value (or ``0.0``) as fallback.
+* **Bulk refresh** — :meth:`BalanceFetchService.refresh_all` fans out across
+  all lanes in parallel while each lane keeps its own rate; with ``max_age``
+  it only refetches entries older than that, so it can pre-warm the cache.
+* **Metrics** — per-account freshness / latency / failure counters and
+  per-venue latency percentiles via :meth:`BalanceFetchService.metrics`.
+
+Environment variables (all optional, safe defaults provided)
+------------------------------------------------------------
+NIJA_BALANCE_FETCH_WORKERS        — worker pool size (default 8)
+NIJA_BALANCE_CALL_TIMEOUT         — seconds a lane waits for one broker call
+                                    (default: the service's fetch_timeout)
+NIJA_BALANCE_RATE_<VENUE>         — calls per second for a venue, e.g.
+                                    NIJA_BALANCE_RATE_KRAKEN (default 1/1.1 for
+                                    kraken, 5 for other venues)
+NIJA_BALANCE_CONCURRENCY_<VENUE>  — concurrent fetches per venue (default 1 for
+                                    kraken, 2 for other venues); also the
+                                    token-bucket burst size
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger("nija.balance_fetch_service")
+
+DEFAULT_WORKERS = 8
+DEFAULT_RATE = 5.0
+DEFAULT_CONCURRENCY = 2
+# Kraken: sequential calls spaced 1.1s apart (Railway Golden Rule #3).
+VENUE_DEFAULTS: Dict[str, Tuple[float, int]] = {
+    "kraken": (1.0 / 1.1, 1),
+}
+
+_LATENCY_WINDOW = 256
+
+BalanceKey = Hashable
+Fetcher = Callable[[], float]
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, "") or default)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, "") or default)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens/s, at most ``capacity`` banked."""
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return the seconds to wait."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is available; return the total time waited."""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire()
+            if delay <= 0.0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+
+@dataclass
+class _Entry:
+    venue: str
+    fetcher: Optional[Fetcher] = None
+    balance: Optional[float] = None
+    fetched_at: float = 0.0  # wall clock of the last successful fetch
+    done: Optional[threading.Event] = None  # set while a fetch is queued / running
+    last_latency_s: Optional[float] = None
+    last_error: Optional[str] = None
+    fetches: int = 0
+    failures: int = 0
+
+
+@dataclass
+class _Lane:
+    venue: str
+    bucket: TokenBucket
+    concurrency: int
+    pending: Deque[BalanceKey] = field(default_factory=deque)
+    workers: int = 0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+    throttled_s: float = 0.0
+    stalled: int = 0  # slots held by calls that outlived call_timeout
+
+
+class BalanceFetchService:
+    """Cache + fixed worker pool for account balance reads."""
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        fetch_timeout: float = 25.0,
+        stale_max_age: float = 300.0,
+        max_workers: Optional[int] = None,
+        venue_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        call_timeout: Optional[float] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.fetch_timeout = fetch_timeout
+        self.stale_max_age = stale_max_age
+        self.call_timeout = call_timeout or _env_float("NIJA_BALANCE_CALL_TIMEOUT", fetch_timeout)
+        self.max_workers = max_workers or _env_int("NIJA_BALANCE_FETCH_WORKERS", DEFAULT_WORKERS)
+        self._venue_limits = dict(VENUE_DEFAULTS)
+        self._venue_limits.update(venue_limits or {})
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="nija-balance")
+        # Broker calls run here so a lane worker can give up on a hung one.
+        self._calls = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="nija-balance-call")
+        self._lock = threading.Lock()
+        self._entries: Dict[BalanceKey, _Entry] = {}
+        self._lanes: Dict[str, _Lane] = {}
+
+    # ------------------------------------------------------------------
+    # Lanes / workers
+    # ------------------------------------------------------------------
+
+    def _lane(self, venue: str) -> _Lane:
+        lane = self._lanes.get(venue)
+        if lane is None:
+            rate, concurrency = self._venue_limits.get(venue, (DEFAULT_RATE, DEFAULT_CONCURRENCY))
+            suffix = venue.upper()
+            rate = _env_float(f"NIJA_BALANCE_RATE_{suffix}", rate)
+            concurrency = _env_int(f"NIJA_BALANCE_CONCURRENCY_{suffix}", concurrency)
+            lane = self._lanes[venue] = _Lane(venue, TokenBucket(rate, concurrency), concurrency)
+        return lane
+
+    def _schedule(self, key: BalanceKey, venue: str, fetcher: Fetcher) -> threading.Event:
+        """Queue a refresh of *key* unless one is already pending; return its event."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(venue=venue)
+            entry.fetcher = fetcher
+            if entry.done is not None:
+                return entry.done
+            entry.done = threading.Event()
+            lane = self._lane(entry.venue)
+            lane.pending.append(key)
+            if lane.workers < lane.concurrency:
+                lane.workers += 1
+                self._executor.submit(self._drain, lane)
+            return entry.done
+
+    def _drain(self, lane: _Lane) -> None:
+        while True:
+            with self._lock:
+                if not lane.pending:
+                    lane.workers -= 1
+                    return
+                key = lane.pending.popleft()
+                entry = self._entries[key]
+                fetcher = entry.fetcher
+            waited = lane.bucket.acquire()
+            started, requested_at = time.perf_counter(), time.time()
+            call = self._calls.submit(fetcher)
+            timed_out = False
+            try:
+                balance, error = float(call.result(timeout=self.call_timeout)), None
+            except FutureTimeout:
+                balance, timed_out = None, True
+                error = TimeoutError(f"no response after {self.call_timeout:.0f}s")
+            except Exception as exc:  # broker errors must not kill the lane
+                balance, error = None, exc
+            latency = time.perf_counter() - started
+            with self._lock:
+                lane.throttled_s += waited
+                lane.latencies.append(latency)
+                self._apply(entry, balance, latency, error)
+                done, entry.done = entry.done, None
+                if timed_out:
+                    lane.stalled += 1
+            if error is not None:
+                logger.warning("Balance fetch failed for %s: %s", key, error)
+            done.set()
+            if timed_out:
+                # Keep the slot until the broker answers: the next call on this
+                # lane must not overlap the abandoned one (Kraken nonces).
+                wait_futures([call])
+                with self._lock:
+                    lane.stalled -= 1
+                self._late_result(key, call, started, requested_at)
+
+    def _late_result(self, key: BalanceKey, call: Future, started: float, requested_at: float) -> None:
+        """Cache the balance of a call that finished after its callers stopped waiting.
+
+        Ignored if a newer fetch for *key* has succeeded in the meantime.
+        """
+        if call.cancelled() or call.exception() is not None:
+            return
+        try:
+            balance = float(call.result())
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.fetched_at >= requested_at:
+                return
+            self._apply(entry, balance, time.perf_counter() - started, None)
+        logger.info("Late balance for %s arrived after the call timeout", key)
+
+    @staticmethod
+    def _apply(entry: _Entry, balance: Optional[float], latency: float, error: Optional[BaseException]) -> None:
+        entry.fetches += 1
+        entry.last_latency_s = latency
+        if error is None:
+            entry.balance = balance
+            entry.fetched_at = time.time()
+            entry.last_error = None
+        else:
+            entry.failures += 1
+            entry.last_error = f"{type(error).__name__}: {error}"
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, key: BalanceKey, venue: str, fetcher: Fetcher) -> float:
+        """Return the balance for *key*, refreshing through the pool when stale.
+
+        Fresh → cached value.  Stale but younger than ``stale_max_age`` →
+        cached value, refreshed in the background.  Cold, invalidated or
+        older than ``stale_max_age`` → wait up to ``fetch_timeout`` for the
+        refresh, then fall back to the stale value (``0.0`` if none).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            cached = entry.balance if entry is not None else None
+            age = time.time() - entry.fetched_at if entry is not None else float("inf")
+        if cached is not None and age < self.ttl:
+            return cached
+        done = self._schedule(key, venue, fetcher)
+        if cached is not None and age <= self.stale_max_age:
+            logger.debug("Serving stale balance for %s (age %.1fs); refresh queued", key, age)
+            return cached
+        if not done.wait(self.fetch_timeout):
+            logger.warning("Balance fetch for %s still pending after %.0fs", key, self.fetch_timeout)
+        with self._lock:
+            entry = self._entries[key]
+            if entry.balance is None:
+                logger.error("No cached balance available for %s; returning 0", key)
+                return 0.0
+            if entry.last_error is not None or entry.done is not None:
+                logger.warning(
+                    "Using stale cached balance $%.2f (age %.0fs) for %s",
+                    entry.balance, time.time() - entry.fetched_at, key,
+                )
+            return entry.balance
+
+    def refresh_all(
+        self,
+        items: Iterable[Tuple[BalanceKey, str, Fetcher]],
+        timeout: Optional[float] = None,
+        max_age: Optional[float] = None,
+    ) -> Dict[BalanceKey, Optional[float]]:
+        """Refresh every ``(key, venue, fetcher)`` in parallel across venues.
+
+        With *max_age*, keys fetched less than *max_age* seconds ago are not
+        refetched.  Waits up to *timeout* (default ``fetch_timeout``; ``0``
+        returns at once) and returns the latest known balance per key
+        (``None`` if never fetched).
+        """
+        now = time.time()
+        keys, waits = [], []
+        for key, venue, fetcher in items:
+            keys.append(key)
+            with self._lock:
+                entry = self._entries.get(key)
+                fresh = (
+                    max_age is not None and entry is not None and entry.balance is not None
+                    and now - entry.fetched_at < max_age
+                )
+            if not fresh:
+                waits.append(self._schedule(key, venue, fetcher))
+        deadline = time.monotonic() + (self.fetch_timeout if timeout is None else timeout)
+        for done in waits:
+            done.wait(max(0.0, deadline - time.monotonic()))
+        with self._lock:
+            return {key: self._entries[key].balance for key in keys}
+
+    def invalidate(self) -> None:
+        """Force the next read of every key to wait for a fresh fetch.
+
+        Cached values are kept as the fallback if that fetch fails.
+        """
+        with self._lock:
+            for entry in self._entries.values():
+                entry.fetched_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-account freshness / latency and per-venue latency percentiles."""
+        now = time.time()
+        with self._lock:
+            accounts = {}
+            for key, entry in self._entries.items():
+                name = "/".join(str(part) for part in key) if isinstance(key, tuple) else str(key)
+                age = now - entry.fetched_at if entry.fetched_at else None
+                accounts[name] = {
+                    "venue": entry.venue,
+                    "balance": entry.balance,
+                    "age_s": round(age, 3) if age is not None else None,
+                    "fresh": age is not None and age < self.ttl,
+                    "last_latency_ms": round(entry.last_latency_s * 1000, 3) if entry.last_latency_s is not None else None,
+                    "fetches": entry.fetches,
+                    "failures": entry.failures,
+                    "last_error": entry.last_error,
+                    "in_flight": entry.done is not None,
+                }
+            venues = {}
+            for venue, lane in self._lanes.items():
+                ordered = sorted(lane.latencies)
+                venues[venue] = {
+                    "rate_per_s": round(lane.bucket.rate, 4),
+                    "concurrency": lane.concurrency,
+                    "queued": len(lane.pending),
+                    "samples": len(ordered),
+                    "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+                    "p95_ms": round(_percentile(ordered, 0.95) * 1000, 3),
+                    "throttled_s": round(lane.throttled_s, 3),
+                    "stalled_calls": lane.stalled,
+                }
+        return {"accounts": accounts, "venues": venues}
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
+        self._calls.shutdown(wait=wait)
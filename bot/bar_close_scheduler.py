@@ -0,0 +1,292 @@
+"""Bar-close scheduler for the per-broker scan loops.
+
+``IndependentBrokerTrader`` used to wake each broker thread on a fixed
+``stop_flag.wait(90)`` / ``wait(150)`` and stagger thread starts with
+``BROKER_STAGGER_DELAY``, so scans landed at arbitrary offsets from candle
+closes and often read a partial last bar.  ``BarCloseScheduler`` wakes each
+loop ("lane") once per sealed bar instead:
+
+* **Timeframe per venue** — ``NIJA_BAR_TIMEFRAME_<VENUE>_S`` (default
+  ``NIJA_BAR_TIMEFRAME_S``, 300 s = the 5m candles the strategies request).
+* **Two triggers** — a :class:`MarketDataEngine` bar event for the lane's
+  venue seals the bar immediately; otherwise wall-clock alignment fires at
+  ``bar_close + settle_s`` (exchanges publish the final candle a moment
+  after the boundary).  A bar is delivered once, by whichever comes first.
+* **Spread across lanes** — lane *i* gets a slot ``i * spread_s`` after the
+  trigger, so platform and user loops sharing a venue do not burst the
+  venue's rate limit at the same instant.
+* **Lag reporting** — :meth:`BarCloseScheduler.record_decision` measures bar
+  close → end of the scan cycle; :meth:`BarCloseScheduler.metrics` reports
+  p50/p95/max lag, trigger sources and skipped bars per lane.
+
+The scheduler is opt-in.  When enabled, the scan loops wait for a bar with
+their old fixed interval as ``timeout``, so a bar close can only bring a scan
+forward: exits and position management still run at least every 90 s
+(platform) / 150 s (user).
+
+Environment variables (all optional, safe defaults provided):
+    NIJA_BAR_CLOSE_SCHEDULER      – "1" aligns scans to bar closes (default "0": fixed sleeps)
+    NIJA_BAR_TIMEFRAME_S          – default bar length in seconds (default 300)
+    NIJA_BAR_TIMEFRAME_<VENUE>_S  – bar length for one venue, e.g. NIJA_BAR_TIMEFRAME_KRAKEN_S
+    NIJA_BAR_SETTLE_S             – clock-trigger delay after the boundary (default 2)
+    NIJA_BAR_SPREAD_S             – slot spacing between lanes (default 3)
+
+Author: NIJA Trading Systems
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger("nija.bar_close_scheduler")
+
+DEFAULT_TIMEFRAME_S = 300.0
+DEFAULT_SETTLE_S = 2.0
+DEFAULT_SPREAD_S = 3.0
+
+# Upper bound on one Condition.wait so a stop flag set without wake() is
+# still noticed promptly.
+_STOP_POLL_S = 5.0
+_LAG_WINDOW = 256
+
+
+def _env_float(name: str, default: float, minimum: float = 0.0) -> float:
+    try:
+        value = float(os.getenv(name, "") or default)
+    except (TypeError, ValueError):
+        return default
+    return value if value >= minimum else default
+
+
+def scheduler_enabled() -> bool:
+    return os.getenv("NIJA_BAR_CLOSE_SCHEDULER", "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+@dataclass(frozen=True)
+class BarTick:
+    """One sealed bar delivered to a lane."""
+
+    lane: str
+    bar_close: float   # epoch seconds of the bar boundary
+    source: str        # "event" | "clock"
+    fired_at: float
+
+    @property
+    def wake_lag_s(self) -> float:
+        return self.fired_at - self.bar_close
+
+
+@dataclass
+class _Lane:
+    name: str
+    venue: str
+    timeframe_s: float
+    slot_s: float
+    last_close: float = 0.0
+    event_close: float = 0.0
+    ticks: Dict[str, int] = field(default_factory=lambda: {"event": 0, "clock": 0})
+    skipped_bars: int = 0
+    decisions: int = 0
+    lags: Deque[float] = field(default_factory=lambda: deque(maxlen=_LAG_WINDOW))
+
+
+class BarCloseScheduler:
+    """Wakes registered scan loops once per sealed bar of their venue."""
+
+    def __init__(
+        self,
+        timeframe_s: Optional[float] = None,
+        settle_s: Optional[float] = None,
+        spread_s: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.default_timeframe_s = timeframe_s or _env_float("NIJA_BAR_TIMEFRAME_S", DEFAULT_TIMEFRAME_S, 1.0)
+        self.settle_s = _env_float("NIJA_BAR_SETTLE_S", DEFAULT_SETTLE_S) if settle_s is None else settle_s
+        self.spread_s = _env_float("NIJA_BAR_SPREAD_S", DEFAULT_SPREAD_S) if spread_s is None else spread_s
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._lanes: Dict[str, _Lane] = {}
+        self._slots_used = 0
+
+    # ------------------------------------------------------------------
+    # Lanes
+    # ------------------------------------------------------------------
+
+    def timeframe_for(self, venue: str) -> float:
+        return _env_float(f"NIJA_BAR_TIMEFRAME_{venue.upper()}_S", self.default_timeframe_s, 1.0)
+
+    def register(self, lane: str, venue: str, timeframe_s: Optional[float] = None) -> None:
+        """Add a lane; re-registering an existing lane keeps its slot and stats."""
+        venue = str(venue or "unknown").lower()
+        with self._cond:
+            if lane in self._lanes:
+                return
+            tf = float(timeframe_s or self.timeframe_for(venue))
+            # Slots wrap within half a bar so every lane still scans a fresh bar.
+            slot = (self._slots_used * self.spread_s) % max(tf / 2.0, 1e-9)
+            self._slots_used += 1
+            # The bar in progress at registration is partial; start with the next close.
+            last = math.floor(self._clock() / tf) * tf
+            self._lanes[lane] = _Lane(lane, venue, tf, slot, last_close=last)
+        logger.info("BAR_SCHEDULER_LANE lane=%s venue=%s timeframe_s=%.0f slot_s=%.1f", lane, venue, tf, slot)
+
+    def unregister(self, lane: str) -> None:
+        with self._cond:
+            self._lanes.pop(lane, None)
+            self._cond.notify_all()
+
+    def wake(self) -> None:
+        """Wake every waiting lane so it re-checks its stop flag."""
+        with self._cond:
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Triggers
+    # ------------------------------------------------------------------
+
+    def on_bar(self, bar: Any) -> None:
+        """``MarketDataEngine`` subscriber: a bar for ``bar.exchange`` arrived."""
+        venue = str(getattr(bar, "exchange", "") or "").lower()
+        start = float(getattr(bar, "timestamp", 0.0) or 0.0)
+        if not venue or start <= 0:
+            return
+        now = self._clock()
+        with self._cond:
+            woke = False
+            for lane in self._lanes.values():
+                if lane.venue != venue:
+                    continue
+                tf = lane.timeframe_s
+                boundary = math.floor(start / tf) * tf
+                # A completed bar seals its own close; an in-progress bar
+                # proves the previous one (ending at its start) is sealed.
+                sealed = boundary + tf if boundary + tf <= now else boundary
+                if sealed > lane.event_close:
+                    lane.event_close = sealed
+                    woke = True
+            if woke:
+                self._cond.notify_all()
+
+    def attach(self, engine: Any) -> None:
+        engine.subscribe(self.on_bar)
+
+    def _next(self, lane: _Lane, now: float):
+        """Return ``(bar_close, due_at, source)`` for the lane's next bar."""
+        if lane.event_close > lane.last_close:
+            return lane.event_close, lane.event_close + lane.slot_s, "event"
+        tf = lane.timeframe_s
+        close = math.floor(now / tf) * tf
+        while close <= lane.last_close:
+            close += tf
+        return close, close + self.settle_s + lane.slot_s, "clock"
+
+    def wait_for_bar(
+        self,
+        lane_name: str,
+        stop_flag: Optional[threading.Event] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[BarTick]:
+        """Block until the lane's next bar seals.
+
+        Returns None when *stop_flag* is set, the lane is unregistered, or
+        *timeout* elapses first.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            while True:
+                lane = self._lanes.get(lane_name)
+                if lane is None or (stop_flag is not None and stop_flag.is_set()):
+                    return None
+                now = self._clock()
+                close, due, source = self._next(lane, now)
+                if due <= now:
+                    if lane.last_close and close - lane.last_close > lane.timeframe_s * 1.5:
+                        lane.skipped_bars += int(round((close - lane.last_close) / lane.timeframe_s)) - 1
+                    lane.last_close = close
+                    lane.ticks[source] += 1
+                    return BarTick(lane_name, close, source, now)
+                if deadline is not None and now >= deadline:
+                    return None
+                wait_s = min(due - now, _STOP_POLL_S)
+                if deadline is not None:
+                    wait_s = min(wait_s, deadline - now)
+                self._cond.wait(max(wait_s, 0.001))
+
+    def record_decision(self, tick: BarTick) -> float:
+        """Record the end of the scan for *tick*; returns bar-close → decision lag."""
+        lag = self._clock() - tick.bar_close
+        with self._cond:
+            lane = self._lanes.get(tick.lane)
+            if lane is not None:
+                lane.decisions += 1
+                lane.lags.append(lag)
+        logger.info(
+            "BAR_CLOSE_DECISION lane=%s source=%s bar_close=%.0f wake_lag_ms=%.0f decision_lag_ms=%.0f",
+            tick.lane,
+            tick.source,
+            tick.bar_close,
+            tick.wake_lag_s * 1000.0,
+            lag * 1000.0,
+        )
+        return lag
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._cond:
+            lanes = {name: lane for name, lane in self._lanes.items()}
+            out = {}
+            for name, lane in lanes.items():
+                ordered = sorted(lane.lags)
+                out[name] = {
+                    "venue": lane.venue,
+                    "timeframe_s": lane.timeframe_s,
+                    "slot_s": lane.slot_s,
+                    "last_bar_close": lane.last_close or None,
+                    "ticks": dict(lane.ticks),
+                    "skipped_bars": lane.skipped_bars,
+                    "decisions": lane.decisions,
+                    "lag_p50_ms": round(_percentile(ordered, 0.50) * 1000, 1),
+                    "lag_p95_ms": round(_percentile(ordered, 0.95) * 1000, 1),
+                    "lag_max_ms": round((ordered[-1] if ordered else 0.0) * 1000, 1),
+                }
+        return out
+
+
+_SCHEDULER: Optional[BarCloseScheduler] = None
+_SCHEDULER_LOCK = threading.Lock()
+
+
+def get_bar_close_scheduler() -> BarCloseScheduler:
+    """Process-wide scheduler, subscribed to the market data engine when available."""
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        with _SCHEDULER_LOCK:
+            if _SCHEDULER is None:
+                scheduler = BarCloseScheduler()
+                try:
+                    try:
+                        from bot.market_data_engine import get_market_data_engine
+                    except ImportError:
+                        from market_data_engine import get_market_data_engine  # type: ignore[import]
+                    scheduler.attach(get_market_data_engine())
+                except Exception as exc:
+                    logger.info("BAR_SCHEDULER_CLOCK_ONLY reason=%s", exc)
+                _SCHEDULER = scheduler
+    return _SCHEDULER
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+NIJA Apex Backtest - Replay Benchmark
+======================================
+
+Compares wall time and peak RSS of the original per-candle backtest loop
+(``run_backtest(..., vectorized=False)``) against the precomputed replay
+(``run_backtest(...)``) on synthetic 1-minute OHLCV series.
+
+Each measurement runs in a fresh subprocess so peak RSS (``ru_maxrss``) is
+not polluted by earlier runs.  The legacy loop is quadratic, so sizes above
+``--legacy-max-bars`` are measured at that size and extrapolated as
+``t * (n / m) ** 2`` (marked ``~`` in the table).
+
+Usage:
+    python bot/benchmark_apex_backtest.py
+    python bot/benchmark_apex_backtest.py --bars 100000,1000000,2500000 --legacy-max-bars 10000
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_BARS = "100000,1000000,2500000"
+
+
+def make_ohlcv(n: int, seed: int = 42) -> pd.DataFrame:
+    """Random-walk 1m candles with alternating drift regimes"""
+    rng = np.random.default_rng(seed)
+    drift = np.repeat(rng.choice([-0.05, 0.0, 0.05], size=n // 500 + 1), 500)[:n]
+    close = np.maximum(100.0 + np.cumsum(drift + rng.normal(0, 0.5, n)), 1.0)
+    open_ = np.r_[close[0], close[:-1]] + rng.normal(0, 0.05, n)
+    high = np.maximum(open_, close) + rng.uniform(0, 0.3, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 0.3, n)
+    volume = rng.uniform(10, 1000, n)
+    return pd.DataFrame(
+        {'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume},
+        index=pd.date_range('2020-01-01', periods=n, freq='1min'),
+    )
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _worker(engine: str, bars: int, seed: int) -> dict:
+    """Run one backtest in this process and return its measurements"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    logging.disable(logging.CRITICAL)
+    from apex_backtest import ApexBacktest
+
+    df = make_ohlcv(bars, seed)
+    rss_before = _peak_rss_mb()
+    backtest = ApexBacktest()
+    start = time.perf_counter()
+    results = backtest.run_backtest(df, 'BENCH-USD', vectorized=(engine == 'vectorized'))
+    wall = time.perf_counter() - start
+    return {
+        'engine': engine,
+        'bars': bars,
+        'wall_s': wall,
+        'peak_rss_mb': _peak_rss_mb(),
+        'data_rss_mb': rss_before,
+        'trades': results['total_trades'],
+        'final_balance': results['final_balance'],
+    }
+
+
+def _measure(engine: str, bars: int, seed: int) -> dict:
+    cmd = [sys.executable, os.path.abspath(__file__), '--worker', engine, str(bars), '--seed', str(seed)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Apex backtest replay engines')
+    parser.add_argument('--bars', default=DEFAULT_BARS, help='Comma-separated candle counts')
+    parser.add_argument('--legacy-max-bars', type=int, default=10000,
+                        help='Largest size the quadratic legacy loop is actually run at')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--worker', nargs=2, metavar=('ENGINE', 'BARS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker[0], int(args.worker[1]), args.seed)))
+        return
+
+    sizes = [int(b) for b in args.bars.split(',') if b.strip()]
+    legacy_cache = {}
+
+    print(f"{'bars':>10} {'engine':>10} {'wall_s':>12} {'peak_rss_mb':>12} {'trades':>7}")
+    for bars in sizes:
+        fast = _measure('vectorized', bars, args.seed)
+        print(f"{bars:>10} {'vectorized':>10} {fast['wall_s']:>12.2f} "
+              f"{fast['peak_rss_mb']:>12.1f} {fast['trades']:>7}", flush=True)
+
+        measured = min(bars, args.legacy_max_bars)
+        if measured not in legacy_cache:
+            legacy_cache[measured] = _measure('legacy', measured, args.seed)
+        legacy = legacy_cache[measured]
+        if measured == bars:
+            print(f"{bars:>10} {'legacy':>10} {legacy['wall_s']:>12.2f} "
+                  f"{legacy['peak_rss_mb']:>12.1f} {legacy['trades']:>7}", flush=True)
+            if legacy['trades'] != fast['trades'] or legacy['final_balance'] != fast['final_balance']:
+                print(f"{'':>10} WARNING: engines disagree at {bars} bars", flush=True)
+        else:
+            projected = legacy['wall_s'] * (bars / measured) ** 2
+            print(f"{bars:>10} {'legacy':>10} {'~' + format(projected, '.0f'):>12} "
+                  f"{'n/a':>12} {'n/a':>7}  (measured {legacy['wall_s']:.2f}s "
+                  f"/ {legacy['peak_rss_mb']:.1f} MB at {measured} bars)", flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+NIJA Indicator Kernels - Benchmark
+==================================
+
+Times each indicator in ``indicators.py`` against the pandas implementation
+it replaced, at the candle-window sizes the bot actually sees (200 rows per
+scan) up to full-history backtests (500k rows):
+
+* ``pandas``  — the previous ``rolling`` / ``ewm`` / ``shift`` chains (kept
+  below as the reference implementations), Supertrend as a per-element
+  NumPy loop.
+* ``kernels`` — the current wrappers over ``indicator_kernels`` (Numba when
+  installed, NumPy otherwise; the active backend is printed).
+
+Each row reports the best-of-N wall time per call and the maximum absolute
+difference between the two outputs.
+
+Usage:
+    python bot/benchmark_indicator_kernels.py
+    python bot/benchmark_indicator_kernels.py --sizes 200,5000 --indicators rsi,adx
+    NIJA_INDICATOR_NUMBA=0 python bot/benchmark_indicator_kernels.py
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SIZES = "200,5000,500000"
+EPSILON = 1e-6
+
+
+# ---------------------------------------------------------------------------
+# Reference implementations (the pandas code before indicator_kernels)
+# ---------------------------------------------------------------------------
+
+
+def _ref_true_range(df):
+    prev_close = df['close'].shift()
+    return np.maximum(np.maximum(df['high'] - df['low'], (df['high'] - prev_close).abs()),
+                      (df['low'] - prev_close).abs())
+
+
+def ref_rsi(df, period=14):
+    delta = df['close'].diff()
+    avg_gain = delta.clip(lower=0).rolling(window=period, min_periods=period).mean()
+    avg_loss = (-delta.clip(upper=0)).rolling(window=period, min_periods=period).mean()
+    return (100 - (100 / (1 + avg_gain / avg_loss))).ffill().fillna(50)
+
+
+def ref_atr(df, period=14):
+    return _ref_true_range(df).rolling(window=period, min_periods=period).mean().ffill().fillna(0)
+
+
+def ref_adx(df, period=14):
+    up_move = df['high'].diff()
+    down_move = -df['low'].diff()
+    plus_dm = up_move.where((up_move > 0) & (up_move >= down_move), other=0.0)
+    minus_dm = down_move.where((down_move > 0) & (down_move > up_move), other=0.0)
+    atr = _ref_true_range(df).rolling(window=period, min_periods=period).mean()
+    plus_di = 100 * (plus_dm.rolling(window=period, min_periods=period).mean() / atr)
+    minus_di = 100 * (minus_dm.rolling(window=period, min_periods=period).mean() / atr)
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+    adx = dx.rolling(window=period, min_periods=period).mean()
+    return adx.ffill().fillna(0), plus_di.ffill().fillna(0), minus_di.ffill().fillna(0)
+
+
+def ref_bollinger(df, period=20, std_dev=2):
+    middle = df['close'].rolling(window=period, min_periods=period).mean()
+    std = df['close'].rolling(window=period, min_periods=period).std()
+    upper = middle + std * std_dev
+    lower = middle - std * std_dev
+    return (upper.ffill().fillna(df['close']), middle.ffill().fillna(df['close']),
+            lower.ffill().fillna(df['close']), ((upper - lower) / middle).ffill().fillna(0))
+
+
+def ref_stochastic(df, k_period=14, d_period=3):
+    low_min = df['low'].rolling(window=k_period, min_periods=k_period).min()
+    high_max = df['high'].rolling(window=k_period, min_periods=k_period).max()
+    stoch_k = 100 * ((df['close'] - low_min) / (high_max - low_min + EPSILON))
+    stoch_d = stoch_k.rolling(window=d_period, min_periods=d_period).mean()
+    return stoch_k.ffill().fillna(50), stoch_d.ffill().fillna(50)
+
+
+def ref_macd(df, fast=12, slow=26, signal=9):
+    macd_line = (df['close'].ewm(span=fast, adjust=False).mean()
+                 - df['close'].ewm(span=slow, adjust=False).mean())
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    return macd_line.ffill(), signal_line.ffill(), (macd_line - signal_line).ffill()
+
+
+def ref_supertrend(df, period=10, multiplier=3.0):
+    hl2 = (df['high'] + df['low']) / 2.0
+    atr = ref_atr(df, period)
+    close = df['close'].to_numpy(dtype=float)
+    ru = (hl2 + multiplier * atr).to_numpy(dtype=float)
+    rl = (hl2 - multiplier * atr).to_numpy(dtype=float)
+    fu, fl = ru.copy(), rl.copy()
+    n = len(df)
+    for i in range(1, n):
+        fu[i] = min(ru[i], fu[i - 1]) if close[i - 1] <= fu[i - 1] else ru[i]
+        fl[i] = max(rl[i], fl[i - 1]) if close[i - 1] >= fl[i - 1] else rl[i]
+    dir_vals = np.ones(n, dtype=int)
+    st_vals = np.zeros(n, dtype=float)
+    for i in range(1, n):
+        prev_dir = dir_vals[i - 1]
+        if prev_dir == -1 and close[i] > fu[i]:
+            dir_vals[i] = 1
+        elif prev_dir == 1 and close[i] < fl[i]:
+            dir_vals[i] = -1
+        else:
+            dir_vals[i] = prev_dir
+        st_vals[i] = fl[i] if dir_vals[i] == 1 else fu[i]
+    st_vals[0] = fl[0]
+    return pd.Series(st_vals, index=df.index).ffill(), pd.Series(dir_vals, index=df.index)
+
+
+def ref_regime(df):
+    adx = ref_adx(df)[0].iloc[-1]
+    bandwidth = ref_bollinger(df)[3].iloc[-1]
+    emas = [df['close'].ewm(span=p, adjust=False).mean().iloc[-1] for p in (9, 21, 50)]
+    return adx, bandwidth, emas
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+
+def _cases():
+    from bot import indicators
+
+    return {
+        "rsi": (ref_rsi, indicators.calculate_rsi),
+        "atr": (ref_atr, indicators.calculate_atr),
+        "adx": (ref_adx, indicators.calculate_adx),
+        "bollinger": (ref_bollinger, indicators.calculate_bollinger_bands),
+        "stochastic": (ref_stochastic, indicators.calculate_stochastic),
+        "macd": (ref_macd, indicators.calculate_macd),
+        "supertrend": (ref_supertrend, indicators.calculate_supertrend),
+        "regime": (ref_regime, indicators.detect_market_regime),
+    }
+
+
+def _best_of(fn, df, repeats: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _max_diff(reference, result) -> float:
+    if isinstance(result, dict):
+        return max(abs(float(reference[0]) - float(result['adx'])),
+                   abs(float(reference[1]) - float(result['bandwidth'])))
+    if not isinstance(reference, tuple):
+        reference, result = (reference,), (result,)
+    return max(float(np.nanmax(np.abs(a.to_numpy(dtype=float) - b.to_numpy(dtype=float))))
+               for a, b in zip(reference, result))
+
+
+def run(size: int, names=None, seed: int = 11) -> list:
+    """Time every selected indicator on *size* synthetic candles"""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    logging.disable(logging.CRITICAL)
+    from bot.benchmark_apex_backtest import make_ohlcv
+
+    df = make_ohlcv(size, seed=seed)
+    repeats = max(1, min(50, 200_000 // size))
+    rows = []
+    for name, (reference_fn, kernel_fn) in _cases().items():
+        if names and name not in names:
+            continue
+        kernel_fn(df.iloc[:64])  # warm-up (Numba compilation, imports)
+        pandas_s, reference = _best_of(reference_fn, df, repeats)
+        kernel_s, result = _best_of(kernel_fn, df, repeats)
+        rows.append({
+            "indicator": name,
+            "rows": size,
+            "pandas_ms": 1000.0 * pandas_s,
+            "kernel_ms": 1000.0 * kernel_s,
+            "max_abs_diff": _max_diff(reference, result),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indicator kernels against pandas")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated row counts")
+    parser.add_argument("--indicators", default="", help="Comma-separated subset (default: all)")
+    args = parser.parse_args()
+    names = {n.strip() for n in args.indicators.split(",") if n.strip()}
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from bot.indicator_kernels import BACKEND
+
+    print(f"backend: {BACKEND}")
+    print(f"{'indicator':>11} {'rows':>8} {'pandas_ms':>10} {'kernel_ms':>10} {'speedup':>8} {'max_abs_diff':>13}")
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        for r in run(size, names):
+            print(f"{r['indicator']:>11} {r['rows']:>8} {r['pandas_ms']:>10.3f} {r['kernel_ms']:>10.3f} "
+                  f"{r['pandas_ms'] / r['kernel_ms']:>7.1f}x {r['max_abs_diff']:>13.2e}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
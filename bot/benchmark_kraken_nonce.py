@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+NIJA Kraken Nonce - Issuance Benchmark
+=======================================
+
+Measures nonce throughput (nonces/sec) and per-call latency (p50 / p99) of
+``KrakenNonceManager.next_nonce()`` in file mode, comparing the per-nonce
+lock-and-persist path (block size 0) with block reservation
+(``NIJA_KRAKEN_NONCE_BLOCK_SIZE``).
+
+Each account is one thread driving its own per-key manager and state file,
+as in the multi-account broker setup; all managers share the module-level
+``_LOCK`` exactly as they do in production.  Managers are wired directly
+(no PID lock / NTP probe / startup authority) so the benchmark touches only a
+temporary directory.
+
+Usage:
+    python bot/benchmark_kraken_nonce.py
+    python bot/benchmark_kraken_nonce.py --accounts 1,8,32 --nonces 2000 --block-size 256
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+DEFAULT_ACCOUNTS = "1,8,32"
+
+
+def _make_manager(gkn, state_dir: str, key_id: str, block_size: int):
+    mgr = object.__new__(gkn.KrakenNonceManager)
+    mgr._key_id = key_id
+    mgr._state_file = os.path.join(state_dir, f"kraken_nonce_{key_id}.state")
+    mgr._lock_file = mgr._state_file + ".lock"
+    mgr._redis_backend = None
+    mgr._last_nonce = int(time.time() * 1000)
+    mgr._block_size = block_size
+    mgr._block_end = 0
+    mgr._blocks_reserved = 0
+    return mgr
+
+
+def run(accounts: int, nonces: int, block_size: int) -> dict:
+    """Issue *nonces* per account from *accounts* threads and return measurements"""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    logging.disable(logging.CRITICAL)
+    from bot import global_kraken_nonce as gkn
+
+    with tempfile.TemporaryDirectory(prefix="nija_nonce_bench_") as state_dir:
+        managers = [_make_manager(gkn, state_dir, f"acct{i}", block_size) for i in range(accounts)]
+        latencies = [np.empty(nonces, dtype=np.int64) for _ in range(accounts)]
+        barrier = threading.Barrier(accounts + 1)
+
+        def worker(idx: int) -> None:
+            mgr, lat = managers[idx], latencies[idx]
+            clock = time.perf_counter_ns
+            barrier.wait()
+            for j in range(nonces):
+                t0 = clock()
+                mgr.next_nonce()
+                lat[j] = clock() - t0
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(accounts)]
+        for t in threads:
+            t.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - start
+
+    lat_us = np.concatenate(latencies) / 1000.0
+    return {
+        "accounts": accounts,
+        "block_size": block_size,
+        "nonces_per_s": accounts * nonces / wall,
+        "p50_us": float(np.percentile(lat_us, 50)),
+        "p99_us": float(np.percentile(lat_us, 99)),
+        "blocks_reserved": sum(m._blocks_reserved for m in managers),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Kraken nonce issuance")
+    parser.add_argument("--accounts", default=DEFAULT_ACCOUNTS, help="Comma-separated concurrent account counts")
+    parser.add_argument("--nonces", type=int, default=2000, help="Nonces issued per account")
+    parser.add_argument("--block-size", type=int, default=256, help="Block size for the reservation mode")
+    args = parser.parse_args()
+
+    print(f"{'accounts':>8} {'mode':>12} {'nonces/s':>12} {'p50_us':>10} {'p99_us':>10} {'persists':>9}")
+    for accounts in [int(a) for a in args.accounts.split(",") if a.strip()]:
+        for block_size in (0, args.block_size):
+            r = run(accounts, args.nonces, block_size)
+            mode = "per-nonce" if block_size == 0 else f"block={block_size}"
+            persists = accounts * args.nonces if block_size == 0 else r["blocks_reserved"]
+            print(f"{accounts:>8} {mode:>12} {r['nonces_per_s']:>12.0f} "
+                  f"{r['p50_us']:>10.1f} {r['p99_us']:>10.1f} {persists:>9}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+NIJA Meta-AI - Population Fitness Benchmark
+============================================
+
+Compares one GA generation scored the original way (one backtest +
+``evaluate_fitness`` per genome, O(P^2) pair-loop diversity) against
+``PopulationEvaluator`` (batched blocks in a process pool over shared
+market data, genome-hash cache, vectorized diversity) at several
+population sizes.  ``gen2`` re-scores the next generation, where elites
+and unmutated clones come from the cache.
+
+The backtest is a synthetic EMA-crossover on 1-minute closes.  The batched
+variant computes each EMA period once per block and reuses it for every
+genome in the block that asks for it.
+
+Usage:
+    python bot/benchmark_population_fitness.py
+    python bot/benchmark_population_fitness.py --population 50,200,1000 --bars 20000 --workers 4
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bot.meta_ai.evolution_config import GENETIC_CONFIG, PARAMETER_SEARCH_SPACE  # noqa: E402
+from bot.meta_ai.genetic_evolution import GeneticEvolution  # noqa: E402
+from bot.meta_ai.population_evaluator import PopulationEvaluator  # noqa: E402
+
+DEFAULT_POPULATIONS = "50,200,1000"
+
+
+def make_closes(n: int, seed: int = 42) -> pd.DataFrame:
+    """Random-walk 1m closes with alternating drift regimes"""
+    rng = np.random.default_rng(seed)
+    drift = np.repeat(rng.choice([-0.05, 0.0, 0.05], size=n // 500 + 1), 500)[:n]
+    close = np.maximum(100.0 + np.cumsum(drift + rng.normal(0, 0.5, n)), 1.0)
+    return pd.DataFrame({'close': close}, index=pd.date_range('2020-01-01', periods=n, freq='1min'))
+
+
+def _ema(close: np.ndarray, period: int) -> np.ndarray:
+    return pd.Series(close).ewm(span=period, adjust=False).mean().to_numpy()
+
+
+def _metrics(close: np.ndarray, fast: np.ndarray, slow: np.ndarray, fee: float) -> dict:
+    position = (fast > slow).astype(np.float64)[:-1]
+    returns = np.diff(close) / close[:-1] * position
+    trades = int(np.count_nonzero(np.diff(position)))
+    returns[1:] -= np.abs(np.diff(position)) * fee
+    wins, losses = returns[returns > 0].sum(), -returns[returns < 0].sum()
+    equity = np.cumsum(returns)
+    vol = float(returns.std())
+    return {
+        'sharpe_ratio': float(returns.mean() / vol * np.sqrt(252)) if vol > 0 else 0.0,
+        'profit_factor': float(wins / losses) if losses > 0 else 0.0,
+        'win_rate': float((returns > 0).sum() / max(1, (returns != 0).sum())),
+        'max_drawdown': float((np.maximum.accumulate(equity) - equity).max()),
+        'total_trades': trades,
+    }
+
+
+def ema_cross_backtest(params: dict, data: pd.DataFrame) -> dict:
+    """Per-genome backtest (the original evaluation path)"""
+    close = data['close'].to_numpy()
+    return _metrics(close, _ema(close, int(round(params['ema_fast']))),
+                    _ema(close, int(round(params['ema_slow']))), params['stop_loss_pct'] * 0.1)
+
+
+def ema_cross_block(block: np.ndarray, names: list, data: pd.DataFrame) -> list:
+    """Batched backtest: EMAs shared across the genomes of a block"""
+    close = data['close'].to_numpy()
+    col = {name: i for i, name in enumerate(names)}
+    periods = np.rint(block[:, [col['ema_fast'], col['ema_slow']]]).astype(int)
+    emas = {p: _ema(close, p) for p in np.unique(periods)}
+    fees = block[:, col['stop_loss_pct']] * 0.1
+    return [_metrics(close, emas[f], emas[s], fee) for (f, s), fee in zip(periods, fees)]
+
+
+def legacy_diversity(population) -> float:
+    """The original O(P^2 * params) pair loop, kept for comparison"""
+    params = list(PARAMETER_SEARCH_SPACE.keys())
+    differences = []
+    for i in range(len(population)):
+        for j in range(i + 1, len(population)):
+            param_diffs = []
+            for param in params:
+                min_val, max_val = PARAMETER_SEARCH_SPACE[param]
+                diff = abs(population[i].parameters[param] - population[j].parameters[param])
+                param_diffs.append(diff / (max_val - min_val))
+            differences.append(np.mean(param_diffs))
+    return float(np.mean(differences))
+
+
+def _engine(population: int, seed: int) -> GeneticEvolution:
+    random.seed(seed)
+    np.random.seed(seed)
+    engine = GeneticEvolution(dict(GENETIC_CONFIG, population_size=population))
+    engine.initialize_population()
+    return engine
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def run(populations, bars: int, workers: int, seed: int, skip_legacy: bool = False) -> list:
+    data = make_closes(bars, seed)
+    rows = []
+    with PopulationEvaluator(data, ema_cross_block, workers=workers) as evaluator:
+        for size in populations:
+            row = {'population': size}
+            if not skip_legacy:
+                engine = _engine(size, seed)
+                _, row['legacy_eval_s'] = _timed(lambda: [
+                    engine.evaluate_fitness(g, ema_cross_backtest(g.parameters, data)) for g in engine.population
+                ])
+                legacy_fitness = [g.fitness for g in engine.population]
+                row['legacy_div'], row['legacy_div_s'] = _timed(lambda: legacy_diversity(engine.population))
+
+            engine = _engine(size, seed)
+            evaluator.stats.update(evaluated=0, cache_hits=0, failed=0)
+            fitness, row['batched_eval_s'] = _timed(lambda: evaluator.evaluate(engine))
+            row['batched_div'], row['batched_div_s'] = _timed(engine.get_population_diversity)
+            if not skip_legacy and not np.allclose(fitness, legacy_fitness):
+                print(f"WARNING: fitness differs at population {size}", flush=True)
+            if not skip_legacy and not np.isclose(row['batched_div'], row['legacy_div']):
+                print(f"WARNING: diversity differs at population {size}", flush=True)
+
+            engine.evolve_generation()
+            _, row['gen2_eval_s'] = _timed(lambda: evaluator.evaluate(engine))
+            row['gen2_cache_hits'] = evaluator.stats['cache_hits']
+            rows.append(row)
+            _print_row(row)
+    return rows
+
+
+def _print_row(row: dict) -> None:
+    def cell(key, fmt='.3f'):
+        return format(row[key], fmt) if key in row else 'n/a'
+    print(f"{row['population']:>6} {cell('legacy_eval_s'):>12} {cell('batched_eval_s'):>12} "
+          f"{cell('gen2_eval_s'):>10} {row['gen2_cache_hits']:>6} "
+          f"{cell('legacy_div_s', '.4f'):>12} {cell('batched_div_s', '.4f'):>12}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batched GA population fitness evaluation')
+    parser.add_argument('--population', default=DEFAULT_POPULATIONS, help='Comma-separated population sizes')
+    parser.add_argument('--bars', type=int, default=20000, help='1-minute closes in the market data')
+    parser.add_argument('--workers', type=int, default=max(1, min(8, os.cpu_count() or 1)))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-legacy', action='store_true', help='Only run the batched path')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    sizes = [int(p) for p in args.population.split(',') if p.strip()]
+    print(f"bars={args.bars} workers={args.workers}")
+    print(f"{'pop':>6} {'legacy_s':>12} {'batched_s':>12} {'gen2_s':>10} {'hits':>6} "
+          f"{'legacy_div_s':>12} {'vector_div_s':>12}")
+    run(sizes, args.bars, args.workers, args.seed, skip_legacy=args.skip_legacy)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+NIJA Portfolio Correlation - Refresh Benchmark
+==============================================
+
+Compares the cost of keeping the portfolio correlation matrix current after
+each new bar:
+
+* ``pandas``    — the previous ``PortfolioRiskEngine._calculate_correlations``
+  path: slice every symbol's last ``lookback`` prices, ``pct_change`` them,
+  build a DataFrame and call ``DataFrame.corr()`` (O(N²·L) per refresh).
+* ``streaming`` — ``StreamingCorrelation``: one ``add`` per symbol per bar
+  (O(N) each) plus a vectorised O(N²) matrix read, and an O(N) "max
+  correlation of a candidate vs. the open book" lookup.
+
+Both paths see the same synthetic price histories (a shared market factor
+plus idiosyncratic noise) and the maximum absolute difference between the two
+matrices is reported.
+
+Usage:
+    python bot/benchmark_portfolio_correlation.py
+    python bot/benchmark_portfolio_correlation.py --symbols 50,150,300 --bars 50 --lookback 100
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SYMBOLS = "50,150"
+
+
+def pandas_correlations(price_history: dict, lookback: int) -> np.ndarray:
+    """The pre-streaming ``_calculate_correlations`` computation."""
+    max_lookback = min(min(len(s) for s in price_history.values()), lookback)
+    returns = {
+        symbol: series.iloc[-max_lookback:].pct_change().dropna()
+        for symbol, series in price_history.items()
+    }
+    return pd.DataFrame(returns).corr().values
+
+
+def _prices(symbols: int, length: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, length)
+    beta = rng.uniform(0.2, 1.2, symbols)
+    noise = rng.normal(0, 0.01, (length, symbols))
+    returns = market[:, None] * beta[None, :] + noise
+    return 100.0 * np.cumprod(1.0 + returns, axis=0)
+
+
+def run(symbols: int, bars: int, lookback: int, seed: int = 7) -> dict:
+    """Advance *bars* bars over *symbols* symbols and time both refresh paths"""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    logging.disable(logging.CRITICAL)
+    from bot.streaming_correlation import StreamingCorrelation
+
+    warmup = lookback + 1
+    prices = _prices(symbols, warmup + bars, seed)
+    index = pd.date_range("2026-01-01", periods=warmup + bars, freq="5min")
+    names = [f"SYM{i}-USD" for i in range(symbols)]
+    book = names[: max(1, symbols // 10)]
+
+    stream = StreamingCorrelation(window=lookback - 1)
+    for j, name in enumerate(names):
+        series = prices[:warmup, j]
+        stream.extend(name, zip(index[1:warmup], series[1:] / series[:-1] - 1.0))
+
+    pandas_s = streaming_s = lookup_s = 0.0
+    max_diff = 0.0
+    for t in range(warmup, warmup + bars):
+        history = {name: pd.Series(prices[: t + 1, j], index=index[: t + 1]) for j, name in enumerate(names)}
+
+        start = time.perf_counter()
+        reference = pandas_correlations(history, lookback)
+        pandas_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for j, name in enumerate(names):
+            stream.add(name, index[t], prices[t, j] / prices[t - 1, j] - 1.0)
+        matrix = stream.matrix()
+        streaming_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        stream.max_correlation(names[-1], book)
+        lookup_s += time.perf_counter() - start
+
+        max_diff = max(max_diff, float(np.nanmax(np.abs(matrix - reference))))
+
+    return {
+        "symbols": symbols,
+        "pandas_ms": 1000.0 * pandas_s / bars,
+        "streaming_ms": 1000.0 * streaming_s / bars,
+        "lookup_us": 1e6 * lookup_s / bars,
+        "max_abs_diff": max_diff,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark portfolio correlation refresh")
+    parser.add_argument("--symbols", default=DEFAULT_SYMBOLS, help="Comma-separated symbol counts")
+    parser.add_argument("--bars", type=int, default=30, help="Bars to advance per run")
+    parser.add_argument("--lookback", type=int, default=100, help="Correlation lookback (prices)")
+    args = parser.parse_args()
+
+    print(f"{'symbols':>8} {'pandas_ms/bar':>14} {'stream_ms/bar':>14} {'speedup':>8} "
+          f"{'lookup_us':>10} {'max_abs_diff':>13}")
+    for symbols in [int(s) for s in args.symbols.split(",") if s.strip()]:
+        r = run(symbols, args.bars, args.lookback)
+        print(f"{symbols:>8} {r['pandas_ms']:>14.2f} {r['streaming_ms']:>14.2f} "
+              f"{r['pandas_ms'] / r['streaming_ms']:>7.1f}x {r['lookup_us']:>10.1f} "
+              f"{r['max_abs_diff']:>13.2e}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -333,6 +333,13 @@ class BrokerCircuitBreaker:
         """Record a failed API call (public interface)."""
         self._record_failure(error)
 
+    def allow_request(self) -> bool:
+        """Return True if a call may be attempted now (public interface).
+
+        Moves an OPEN circuit to HALF_OPEN once the recovery timeout has passed.
+        """
+        return self._should_allow_request()
+
     def recovery_time_remaining(self) -> float:
         """
         Return seconds remaining before the circuit exits OPEN state.
@@ -184,6 +184,17 @@ except ImportError:
         get_circuit_breaker = None  # type: ignore[assignment]
         CIRCUIT_BREAKER_AVAILABLE = False
 
+try:
+    from bot.http_transport import get_http_transport
+    HTTP_TRANSPORT_AVAILABLE = True
+except ImportError:
+    try:
+        from http_transport import get_http_transport  # type: ignore[import]
+        HTTP_TRANSPORT_AVAILABLE = True
+    except ImportError:
+        get_http_transport = None  # type: ignore[assignment]
+        HTTP_TRANSPORT_AVAILABLE = False
+
 try:
     from bot.rate_limiter import RateLimiter
 except ImportError:
@@ -1776,6 +1787,12 @@ RATE_LIMIT_BASE_DELAY = 5.0  # Base delay in seconds for exponential backoff on
 FORBIDDEN_BASE_DELAY = 60.0  # Fixed delay for 403 "Forbidden" errors (increased from 30s to 60s for API key temporary ban)
 FORBIDDEN_JITTER_MAX = 30.0   # Maximum additional random delay for 403 "Forbidden" errors (60-90s total, increased from 30-45s)
 
+# Batched candle fetches (BaseBroker.get_candles_batch)
+# NIJA_CANDLE_BATCH_WORKERS — concurrent get_candles calls per broker in the default fan-out (1 = sequential)
+# NIJA_ALPACA_BARS_BATCH    — symbols per multi-symbol Alpaca StockBarsRequest
+CANDLE_BATCH_WORKERS = max(1, int(os.getenv('NIJA_CANDLE_BATCH_WORKERS', '4') or 4))
+ALPACA_BARS_BATCH_SIZE = max(1, int(os.getenv('NIJA_ALPACA_BARS_BATCH', '100') or 100))
+
 # Fallback market list - popular crypto trading pairs used when API fails
 FALLBACK_MARKETS = [
     'BTC-USD', 'ETH-USD', 'SOL-USD', 'XRP-USD', 'ADA-USD',
@@ -1864,6 +1881,9 @@ class AccountType(Enum):
     USER = "user"
 
 
+_CANDLE_EXECUTOR_LOCK = threading.Lock()
+
+
 class BaseBroker(ABC):
     """Base class for all broker integrations"""
 
@@ -1915,6 +1935,22 @@ class BaseBroker(ABC):
         if self.circuit_breaker:
             return self.circuit_breaker.get_health_state().value
         return None
+
+    def http_session(self, venue: Optional[str] = None):
+        """
+        Shared keep-alive HTTP session for this broker's venue.
+
+        Subclasses making direct REST calls should use this instead of opening
+        a connection per call; pooling, timeouts, retries, the venue circuit
+        breaker and latency histograms come from ``bot/http_transport.py``.
+
+        Returns:
+            VenueSession, or None if the transport module is unavailable
+        """
+        if not HTTP_TRANSPORT_AVAILABLE:
+            return None
+        broker_type = getattr(self, "broker_type", None)
+        return get_http_transport().session(venue or getattr(broker_type, "value", "default"))
     
     def is_trading_allowed(self) -> bool:
         """
@@ -2181,6 +2217,58 @@ class BaseBroker(ABC):
         """Get candle data. Optional method, brokers can override."""
         return []
 
+    def get_candles_batch(self, symbols: List[str], timeframe: str, count: int) -> Dict[str, List[Dict]]:
+        """
+        Get candle data for many symbols at once.
+
+        Default implementation fans ``get_candles`` out over a small thread
+        pool owned by this broker instance (``NIJA_CANDLE_BATCH_WORKERS``).
+        Brokers whose venue serves several symbols per request override this.
+
+        Args:
+            symbols: Symbols in the broker's own format
+            timeframe: Candle interval (same values as ``get_candles``)
+            count: Number of candles per symbol
+
+        Returns:
+            dict: symbol -> candle list (empty list when a symbol has no data),
+            in the order of *symbols*
+        """
+        unique = list(dict.fromkeys(symbols))
+        if not unique:
+            return {}
+        if CANDLE_BATCH_WORKERS == 1 or len(unique) == 1:
+            return {symbol: self._get_candles_safe(symbol, timeframe, count) for symbol in unique}
+
+        executor = self._candle_batch_executor()
+        futures = {
+            symbol: executor.submit(self._get_candles_safe, symbol, timeframe, count)
+            for symbol in unique
+        }
+        return {symbol: future.result() for symbol, future in futures.items()}
+
+    def _get_candles_safe(self, symbol: str, timeframe: str, count: int) -> List[Dict]:
+        try:
+            return self.get_candles(symbol, timeframe, count) or []
+        except Exception as e:
+            logging.debug(f"get_candles_batch: {symbol} failed: {e}")
+            return []
+
+    def _candle_batch_executor(self):
+        """Lazily create the per-broker fan-out pool (reused across batches)."""
+        executor = getattr(self, '_candle_executor', None)
+        if executor is None:
+            with _CANDLE_EXECUTOR_LOCK:
+                executor = getattr(self, '_candle_executor', None)
+                if executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+                    executor = ThreadPoolExecutor(
+                        max_workers=CANDLE_BATCH_WORKERS,
+                        thread_name_prefix=f"candles-{self.broker_type.value}",
+                    )
+                    self._candle_executor = executor
+        return executor
+
     def get_current_price(self, symbol: str) -> float:
         """Get current price. Optional method, brokers can override."""
         return 0.0
@@ -4377,7 +4465,11 @@ class CoinbaseBroker(BaseBroker):
                 token = jwt.encode(payload, private_key, algorithm='ES256',
                                   headers={'kid': api_key, 'nonce': str(int(time.time()))})
                 headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
-                response = requests.get(f"https://api.coinbase.com/v2/accounts", headers=headers, timeout=10)
+                _v2_session = self.http_session("coinbase")
+                if _v2_session is not None:
+                    response = _v2_session.get("https://api.coinbase.com/v2/accounts", headers=headers, timeout=10)
+                else:
+                    response = requests.get(f"https://api.coinbase.com/v2/accounts", headers=headers, timeout=10)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -6754,6 +6846,8 @@ class AlpacaBroker(BaseBroker):
         self._api_key = ""
         self._api_secret = ""
         self._paper = True
+        self._data_client = None
+        self._data_client_creds = None
 
         # Set identifier for logging
         if account_type == AccountType.PLATFORM:
@@ -7298,17 +7392,8 @@ class AlpacaBroker(BaseBroker):
             )
             return []
 
-        data_client = StockHistoricalDataClient(api_key, api_secret)
-
-        # Timeframe mapping (constant for all retries)
-        timeframe_map = {
-            "1m": TimeFrame.Minute,
-            "5m": TimeFrame(5, TimeFrame.Minute),
-            "15m": TimeFrame(15, TimeFrame.Minute),
-            "1h": TimeFrame.Hour,
-            "1d": TimeFrame.Day
-        }
-        tf = timeframe_map.get(timeframe, TimeFrame(5, TimeFrame.Minute))
+        data_client = self._get_data_client(StockHistoricalDataClient)
+        tf = self._alpaca_timeframe(TimeFrame, timeframe)
 
         # Retry loop for API call (1-based indexing for clearer log messages)
         for attempt in range(1, RATE_LIMIT_MAX_RETRIES + 1):
@@ -7383,6 +7468,79 @@ class AlpacaBroker(BaseBroker):
 
         return []
 
+    def _get_data_client(self, client_cls):
+        """Return the market-data client, created once per credential set."""
+        creds = (self._api_key, self._api_secret)
+        if getattr(self, '_data_client', None) is None or getattr(self, '_data_client_creds', None) != creds:
+            self._data_client = client_cls(self._api_key, self._api_secret)
+            self._data_client_creds = creds
+        return self._data_client
+
+    @staticmethod
+    def _alpaca_timeframe(TimeFrame, timeframe: str):
+        timeframe_map = {
+            "1m": TimeFrame.Minute,
+            "5m": TimeFrame(5, TimeFrame.Minute),
+            "15m": TimeFrame(15, TimeFrame.Minute),
+            "1h": TimeFrame.Hour,
+            "1d": TimeFrame.Day
+        }
+        return timeframe_map.get(timeframe, TimeFrame(5, TimeFrame.Minute))
+
+    def get_candles_batch(self, symbols: List[str], timeframe: str = "5m", count: int = 200) -> Dict[str, List[Dict]]:
+        """
+        Get candles for many stocks with multi-symbol ``StockBarsRequest`` calls.
+
+        Symbols are requested ``NIJA_ALPACA_BARS_BATCH`` at a time.  A chunk
+        whose request fails (e.g. one delisted symbol rejects the whole
+        request) falls back to per-symbol ``get_candles`` with its retry logic.
+        """
+        unique = list(dict.fromkeys(symbols))
+        if not unique:
+            return {}
+        try:
+            from alpaca.data.historical import StockHistoricalDataClient
+            from alpaca.data.requests import StockBarsRequest
+            from alpaca.data.timeframe import TimeFrame
+            from datetime import datetime, timedelta
+        except ImportError:
+            logging.error("Alpaca SDK not installed. Run: pip install alpaca-py")
+            return {symbol: [] for symbol in unique}
+        if not self._api_key or not self._api_secret:
+            logging.error(
+                "Alpaca API credentials not configured for %s",
+                self.account_identifier,
+            )
+            return {symbol: [] for symbol in unique}
+
+        data_client = self._get_data_client(StockHistoricalDataClient)
+        tf = self._alpaca_timeframe(TimeFrame, timeframe)
+        result: Dict[str, List[Dict]] = {}
+        for i in range(0, len(unique), ALPACA_BARS_BATCH_SIZE):
+            chunk = unique[i:i + ALPACA_BARS_BATCH_SIZE]
+            try:
+                bars = data_client.get_stock_bars(StockBarsRequest(
+                    symbol_or_symbols=chunk,
+                    timeframe=tf,
+                    start=datetime.now() - timedelta(days=7)
+                ))
+                by_symbol = getattr(bars, 'data', None) or {}
+            except Exception as e:
+                logging.debug(f"Alpaca batch bars failed for {len(chunk)} symbols ({e}); fetching individually")
+                result.update(super().get_candles_batch(chunk, timeframe, count))
+                continue
+            for symbol in chunk:
+                candles = [{
+                    'time': bar.timestamp,
+                    'open': float(bar.open),
+                    'high': float(bar.high),
+                    'low': float(bar.low),
+                    'close': float(bar.close),
+                    'volume': float(bar.volume)
+                } for bar in by_symbol.get(symbol, [])]
+                result[symbol] = candles[-count:] if len(candles) > count else candles
+        return {symbol: result.get(symbol, []) for symbol in unique}
+
     def supports_asset_class(self, asset_class: str) -> bool:
         """Alpaca supports US equities and exchange-traded funds."""
         return asset_class.lower() in {
@@ -12883,9 +13041,13 @@ class _OKXRestClient:
             self.BASE_URL,
             simulated,
         )
-        if not _REQUESTS_AVAILABLE or _requests_lib is None:
-            raise RuntimeError("requests is required for OKX REST trading")
-        self.session = _requests_lib.Session()
+        # Shared keep-alive pool (bot/http_transport.py); requests is the fallback.
+        if HTTP_TRANSPORT_AVAILABLE:
+            self.session = get_http_transport().session("okx")
+        elif _REQUESTS_AVAILABLE and _requests_lib is not None:
+            self.session = _requests_lib.Session()
+        else:
+            raise RuntimeError("http_transport or requests is required for OKX REST trading")
 
     @staticmethod
     def _timestamp() -> str:
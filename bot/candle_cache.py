@@ -0,0 +1,412 @@
+"""Shared per-(broker, symbol, timeframe) candle store with delta fetching.
+
+``NijaCoreLoop._fetch_df`` used to pull a full 200-candle window from the
+broker on every call, and it is called for the same symbol several times per
+cycle (phase 2 position management, phase 3 scan, the selection re-fetch and
+the forced-entry path).  ``CandleCache`` sits in front of it:
+
+* **Same cycle** — once a symbol has been fetched in the current cycle of a
+  broker, later calls get a copy of the cached window without any I/O
+  (callers such as ``calculate_indicators`` coerce columns in place, so the
+  cached window itself is never handed out).
+* **Next cycle** — only the bars newer than the last cached timestamp are
+  requested (plus a small overlap so the previously-open bar is refreshed),
+  appended to the cached window and trimmed back to ``window`` rows.
+* **Fallback** — frames without a usable timestamp column, gaps larger than
+  the window, or a failed delta fetch all fall back to a full-window fetch,
+  so the cache can only ever save calls, never serve a hole.
+
+A "cycle" is opened by :meth:`CandleCache.begin_cycle` and closed by
+:meth:`CandleCache.end_cycle`; the core loop wraps every ``run_scan_phase``
+call in one.  Outside an explicit cycle the cached frame is reused for
+``NIJA_CANDLE_CACHE_REUSE_TTL_S`` seconds.
+
+Counters (``stats()``): ``hits``, ``misses`` (full fetches), ``delta_fetches``,
+``delta_fallbacks``, ``rows_fetched``, ``rows_saved`` and ``bytes_saved``
+(rows not transferred × the cached frame's bytes per row).
+
+Environment variables (all optional, safe defaults provided)
+------------------------------------------------------------
+NIJA_CANDLE_CACHE_ENABLED     — set to false to bypass the cache (default true)
+NIJA_CANDLE_CACHE_OVERLAP     — bars re-requested before the last cached bar (default 2)
+NIJA_CANDLE_CACHE_REUSE_TTL_S — reuse window outside an explicit cycle (default 5 s)
+NIJA_CANDLE_CACHE_MAX_ENTRIES — LRU bound on cached (broker, symbol, tf) keys (default 2000)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger("nija.candle_cache")
+
+_TRUE = {"1", "true", "yes", "on", "enabled", "y"}
+
+# Fixed pool of fetch locks; a key always maps to the same stripe, so no lock
+# is ever dropped while another thread holds it.
+_KEY_LOCK_STRIPES = 64
+
+# Column names that brokers use for the bar open time, in preference order.
+TIMESTAMP_COLUMNS = ("timestamp", "time", "start", "date", "datetime")
+
+_TIMEFRAME_SECONDS = {
+    "1m": 60, "3m": 180, "5m": 300, "15m": 900, "30m": 1800,
+    "1h": 3600, "2h": 7200, "4h": 14400, "6h": 21600, "12h": 43200,
+    "1d": 86400,
+}
+
+CacheKey = Tuple[str, str, str]
+# fetch_fn(count, min_rows) -> Optional[DataFrame]
+FetchFn = Callable[[int, int], Optional[pd.DataFrame]]
+
+
+def _truthy(name: str, default: str = "true") -> bool:
+    return str(os.environ.get(name, default)).strip().lower() in _TRUE
+
+
+def _int_env(name: str, default: int) -> int:
+    try:
+        return max(0, int(float(os.environ.get(name, default))))
+    except Exception:
+        return default
+
+
+def _float_env(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except Exception:
+        return default
+
+
+def timeframe_seconds(timeframe: str) -> int:
+    """Return the bar length of *timeframe* (``"1m"``, ``"5m"``, ``"1h"``...)."""
+    tf = str(timeframe or "").strip().lower()
+    if tf in _TIMEFRAME_SECONDS:
+        return _TIMEFRAME_SECONDS[tf]
+    try:
+        unit = tf[-1]
+        value = int(tf[:-1])
+        return value * {"m": 60, "h": 3600, "d": 86400}[unit]
+    except (KeyError, ValueError, IndexError):
+        return 60
+
+
+def bar_timestamps(frame: pd.DataFrame) -> Optional[pd.Series]:
+    """Return the bar open times of *frame* as UTC ``Timestamp`` values.
+
+    Numeric epochs are accepted in seconds or milliseconds.  Returns ``None``
+    when the frame has no recognisable timestamp column or index.
+    """
+    for col in TIMESTAMP_COLUMNS:
+        if col in frame.columns:
+            raw = frame[col]
+            break
+    else:
+        if isinstance(frame.index, pd.DatetimeIndex):
+            raw = frame.index.to_series(index=frame.index)
+        else:
+            return None
+    try:
+        if pd.api.types.is_numeric_dtype(raw):
+            numeric = pd.to_numeric(raw, errors="coerce")
+            unit = "ms" if float(numeric.abs().max()) > 1e11 else "s"
+            stamps = pd.to_datetime(numeric, unit=unit, utc=True, errors="coerce")
+        else:
+            as_numeric = pd.to_numeric(raw, errors="coerce")
+            if as_numeric.notna().all():
+                unit = "ms" if float(as_numeric.abs().max()) > 1e11 else "s"
+                stamps = pd.to_datetime(as_numeric, unit=unit, utc=True, errors="coerce")
+            else:
+                stamps = pd.to_datetime(raw, utc=True, errors="coerce")
+    except Exception:
+        return None
+    if stamps.isna().any():
+        return None
+    return pd.Series(stamps.to_numpy(), index=frame.index)
+
+
+@dataclass
+class _Entry:
+    """Cached window for one (broker, symbol, timeframe) key."""
+
+    base: pd.DataFrame            # sorted, de-duplicated window (never handed out)
+    stamps: Optional[pd.Series]   # bar open times aligned with ``base``
+    cycle_token: int
+    fetched_at: float
+    bytes_per_row: float
+
+
+@dataclass
+class CandleCacheStats:
+    hits: int = 0
+    misses: int = 0
+    delta_fetches: int = 0
+    delta_fallbacks: int = 0
+    rows_fetched: int = 0
+    rows_saved: int = 0
+    bytes_saved: int = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        calls = self.hits + self.misses + self.delta_fetches
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "delta_fetches": self.delta_fetches,
+            "delta_fallbacks": self.delta_fallbacks,
+            "rows_fetched": self.rows_fetched,
+            "rows_saved": self.rows_saved,
+            "bytes_saved": self.bytes_saved,
+            "hit_rate": round(self.hits / calls, 4) if calls else 0.0,
+        }
+
+
+class CandleCache:
+    """Thread-safe candle store shared by every fetch path of the core loop."""
+
+    def __init__(
+        self,
+        window: int = 200,
+        overlap: Optional[int] = None,
+        reuse_ttl_s: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.window = int(window)
+        self.overlap = _int_env("NIJA_CANDLE_CACHE_OVERLAP", 2) if overlap is None else int(overlap)
+        self.reuse_ttl_s = (
+            _float_env("NIJA_CANDLE_CACHE_REUSE_TTL_S", 5.0) if reuse_ttl_s is None else float(reuse_ttl_s)
+        )
+        self.max_entries = (
+            _int_env("NIJA_CANDLE_CACHE_MAX_ENTRIES", 2000) if max_entries is None else int(max_entries)
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        # broker key -> current cycle token (0 = no explicit cycle)
+        self._cycles: Dict[str, int] = {}
+        self._next_token = 1
+        # Striped fetch locks so concurrent callers for one symbol share a fetch
+        self._key_locks = tuple(threading.Lock() for _ in range(_KEY_LOCK_STRIPES))
+        self._stats = CandleCacheStats()
+
+    # ------------------------------------------------------------------
+    # Cycle boundaries
+    # ------------------------------------------------------------------
+
+    def begin_cycle(self, broker_key: str) -> int:
+        """Start a new cycle for *broker_key*; returns the cycle token."""
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._cycles[str(broker_key)] = token
+            return token
+
+    def end_cycle(self, broker_key: str, token: Optional[int] = None) -> None:
+        """Forget the explicit cycle for *broker_key* (TTL reuse applies again).
+
+        With *token*, only that cycle is closed — a newer cycle opened for the
+        same venue by another account's loop stays open.
+        """
+        with self._lock:
+            key = str(broker_key)
+            if token is None or self._cycles.get(key) == token:
+                self._cycles.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        broker_key: str,
+        symbol: str,
+        timeframe: str,
+        fetch_fn: FetchFn,
+    ) -> Optional[pd.DataFrame]:
+        """Return the candle window for the key, fetching only what is missing.
+
+        ``fetch_fn(count, min_rows)`` performs the actual broker request for
+        the newest *count* bars and returns a normalised OHLCV frame (or
+        ``None``); *min_rows* is the smallest payload the caller accepts.
+        Each call returns its own copy, which the caller may mutate.
+        """
+        key: CacheKey = (str(broker_key), str(symbol), str(timeframe))
+        key_lock = self._key_locks[hash(key) % len(self._key_locks)]
+
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                token = self._cycles.get(key[0], 0)
+                now = self._clock()
+                hit = entry is not None and self._reusable(entry, token, now)
+                if hit:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    self._stats.rows_saved += len(entry.base)
+                    self._stats.bytes_saved += int(len(entry.base) * entry.bytes_per_row)
+            if hit:
+                return entry.base.copy()
+
+            frame = None
+            if entry is not None and entry.stamps is not None:
+                frame = self._delta_update(key, entry, fetch_fn, token, now)
+            if frame is None:
+                frame = self._full_fetch(key, fetch_fn, token, now)
+            return frame
+
+    def _reusable(self, entry: _Entry, token: int, now: float) -> bool:
+        if token:
+            return entry.cycle_token == token
+        return (now - entry.fetched_at) < self.reuse_ttl_s
+
+    def _full_fetch(self, key: CacheKey, fetch_fn: FetchFn, token: int, now: float) -> Optional[pd.DataFrame]:
+        fetched = fetch_fn(self.window, 10)
+        with self._lock:
+            self._stats.misses += 1
+        if fetched is None or len(fetched) == 0:
+            return None
+        with self._lock:
+            self._stats.rows_fetched += len(fetched)
+        return self._store(key, fetched, bar_timestamps(fetched), token, now)
+
+    def _delta_update(
+        self,
+        key: CacheKey,
+        entry: _Entry,
+        fetch_fn: FetchFn,
+        token: int,
+        now: float,
+    ) -> Optional[pd.DataFrame]:
+        tf_s = timeframe_seconds(key[2])
+        last_ts = entry.stamps.iloc[-1]
+        elapsed_bars = max(0, int(math.floor((now - last_ts.timestamp()) / tf_s)))
+        count = elapsed_bars + 1 + self.overlap
+        if count >= self.window:
+            return None
+
+        fetched = fetch_fn(count, 1)
+        new_stamps = bar_timestamps(fetched) if fetched is not None and len(fetched) else None
+        if new_stamps is None or new_stamps.iloc[0] > last_ts:
+            # Missing payload, no timestamps or a gap after the cached bar.
+            with self._lock:
+                self._stats.delta_fallbacks += 1
+            return None
+
+        keep_old = entry.stamps < new_stamps.iloc[0]
+        fresh_cols = [c for c in entry.base.columns if c in fetched.columns]
+        merged = pd.concat(
+            [entry.base.loc[keep_old.to_numpy()], fetched[fresh_cols]],
+            ignore_index=True,
+        )
+        merged_stamps = pd.concat(
+            [entry.stamps.loc[keep_old.to_numpy()], new_stamps], ignore_index=True
+        )
+        with self._lock:
+            self._stats.delta_fetches += 1
+            self._stats.rows_fetched += len(fetched)
+            saved = max(0, self.window - len(fetched))
+            self._stats.rows_saved += saved
+            self._stats.bytes_saved += int(saved * entry.bytes_per_row)
+        return self._store(key, merged, merged_stamps, token, now)
+
+    def _store(
+        self,
+        key: CacheKey,
+        frame: pd.DataFrame,
+        stamps: Optional[pd.Series],
+        token: int,
+        now: float,
+    ) -> pd.DataFrame:
+        base = frame.reset_index(drop=True)
+        if stamps is not None:
+            stamps = stamps.reset_index(drop=True)
+            order = stamps.argsort(kind="stable").to_numpy()
+            base = base.iloc[order].reset_index(drop=True)
+            stamps = stamps.iloc[order].reset_index(drop=True)
+            # Later rows win for duplicate bar times (a refreshed open bar).
+            dup = stamps.duplicated(keep="last").to_numpy()
+            if dup.any():
+                base = base.loc[~dup].reset_index(drop=True)
+                stamps = stamps.loc[~dup].reset_index(drop=True)
+        if len(base) > self.window:
+            base = base.iloc[-self.window:].reset_index(drop=True)
+            if stamps is not None:
+                stamps = stamps.iloc[-self.window:].reset_index(drop=True)
+        rows = max(1, len(base))
+        entry = _Entry(
+            base=base,
+            stamps=stamps,
+            cycle_token=token,
+            fetched_at=now,
+            bytes_per_row=float(base.memory_usage(index=False, deep=False).sum()) / rows,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while self.max_entries and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return base.copy()
+
+    # ------------------------------------------------------------------
+    # Maintenance / telemetry
+    # ------------------------------------------------------------------
+
+    def invalidate(self, broker_key: Optional[str] = None, symbol: Optional[str] = None) -> None:
+        """Drop cached windows matching *broker_key* and/or *symbol* (all when both None)."""
+        with self._lock:
+            for key in list(self._entries):
+                if broker_key is not None and key[0] != broker_key:
+                    continue
+                if symbol is not None and key[1] != symbol:
+                    continue
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            snap = self._stats.snapshot()
+            snap["entries"] = len(self._entries)
+            return snap
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = CandleCacheStats()
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_cache: Optional[CandleCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_candle_cache() -> CandleCache:
+    """Return the process-wide :class:`CandleCache` singleton."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CandleCache()
+    return _cache
+
+
+def candle_cache_enabled() -> bool:
+    return _truthy("NIJA_CANDLE_CACHE_ENABLED", "true")
+
+
+def broker_cache_key(broker: Any) -> str:
+    """Venue-level cache key: candles are public, so accounts on one venue share them."""
+    broker_type = getattr(broker, "broker_type", None)
+    value = getattr(broker_type, "value", broker_type)
+    if value:
+        return str(value).lower()
+    # No venue identity (adapters, test doubles): never share across objects.
+    return f"{type(broker).__name__.lower()}:{id(broker):x}"
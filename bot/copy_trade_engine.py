@@ -23,8 +23,42 @@ Signal flow
             copy_engine.broadcast(signal) →
                 for each connected user:
                     size = allocator.compute_user_size(user_id, platform_size_usd)
+                fan out on the shared worker pool, per follower:
+                    wait for a venue slot + rate-limit token (until the deadline)
                     submit_market_order_via_pipeline(...)
-                    ledger.record_copy_trade(...)
+                ledger.record_copy_trades([...])     — one batched write
+
+Fan-out
+-------
+Followers are submitted concurrently on a bounded worker pool shared by all
+broadcasts.  Each exchange has a concurrency cap and an order-rate token
+bucket (shared across broadcasts, since they protect the venue's IP-level
+limits).  A follower that has not been submitted when the broadcast
+deadline passes is skipped rather than filled late; orders already in
+flight get a short grace period to acknowledge, and any still pending after
+that are reported as unacknowledged and recorded when they complete.
+
+Exits (``CopySignal.is_exit``: a sell, or ``metadata["is_exit"]`` /
+``metadata["reduce_only"]``) are never skipped: skipping a closing copy
+would leave the follower holding a position the platform already closed.
+They wait for a venue slot and rate token however long it takes; those
+still queued or in flight at the deadline are reported as pending and
+recorded when they complete.
+
+Every :class:`CopyResult` carries ``signal_to_submit_ms`` (signal creation →
+order handed to the pipeline: queueing, venue slot, rate limit) and
+``submit_to_ack_ms`` (pipeline submit → acknowledgement);
+:meth:`CopyTradeEngine.get_stats` reports p50/p95/max of the last broadcast.
+
+Environment variables (all optional, safe defaults provided):
+    NIJA_COPY_MAX_WORKERS               – fan-out worker threads (default 16)
+    NIJA_COPY_VENUE_CONCURRENCY         – in-flight copy orders per exchange (default 8)
+    NIJA_COPY_VENUE_CONCURRENCY_<EXCH>  – per-exchange override, e.g. ..._KRAKEN
+    NIJA_COPY_VENUE_RATE                – copy orders per second per exchange (default 20)
+    NIJA_COPY_VENUE_RATE_<EXCH>         – per-exchange override
+    NIJA_COPY_BROADCAST_DEADLINE_S      – no entry follower is submitted later than this
+                                          after broadcast() starts (default 10)
+    NIJA_COPY_ACK_GRACE_S               – wait for in-flight orders past the deadline (default 5)
 
 Usage
 -----
@@ -59,17 +93,31 @@ Date: March 2026
 from __future__ import annotations
 
 import logging
+import os
 import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("nija.copy_trade_engine")
 
 #: Maximum characters stored for error messages in audit records.
 _MAX_ERROR_LENGTH = 120
 
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_VENUE_CONCURRENCY = 8
+DEFAULT_VENUE_RATE = 20.0
+DEFAULT_BROADCAST_DEADLINE_S = 10.0
+DEFAULT_ACK_GRACE_S = 5.0
+
+try:
+    from bot.balance_fetch_service import TokenBucket
+except ImportError:
+    from balance_fetch_service import TokenBucket  # type: ignore[import]
+
 try:
     from bot.pipeline_order_submitter import submit_market_order_via_pipeline
 except ImportError:
@@ -79,6 +127,29 @@ except ImportError:
         submit_market_order_via_pipeline = None  # type: ignore[assignment]
 
 
+def _env_float(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, "") or default)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, "") or default)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
@@ -109,12 +180,24 @@ class CopySignal:
     metadata: Dict[str, Any] = field(default_factory=dict)
     """Extra data (RSI values, regime, confidence, etc.) for the ledger."""
 
+    created_at: float = field(default_factory=time.monotonic)
+    """``time.monotonic()`` when the signal was created (start of signal→submit latency)."""
+
     def __post_init__(self) -> None:
         self.side = self.side.lower()
         self.exchange = self.exchange.upper()
         if not self.platform_trade_id:
             self.platform_trade_id = str(uuid.uuid4())
 
+    @property
+    def is_exit(self) -> bool:
+        """True for closing trades, which are exempt from the broadcast deadline."""
+        return (
+            self.side == "sell"
+            or bool(self.metadata.get("is_exit"))
+            or bool(self.metadata.get("reduce_only"))
+        )
+
 
 @dataclass
 class CopyResult:
@@ -128,6 +211,37 @@ class CopyResult:
     error: Optional[str] = None
     skipped: bool = False
     skip_reason: str = ""
+    signal_to_submit_ms: Optional[float] = None
+    submit_to_ack_ms: Optional[float] = None
+
+
+class _VenueGate:
+    """Per-exchange cap on in-flight copy orders plus an order-rate token bucket."""
+
+    def __init__(self, concurrency: int, rate: float) -> None:
+        self.concurrency = concurrency
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self.bucket = TokenBucket(rate, capacity=concurrency)
+
+    def enter(self, deadline: Optional[float]) -> Optional[str]:
+        """Take a slot and a rate token before *deadline*; returns a skip reason on timeout.
+
+        With ``deadline=None`` (exits) it waits as long as needed and never skips.
+        """
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not self.slots.acquire(timeout=timeout):
+            return "venue concurrency limit until broadcast deadline"
+        while True:
+            delay = self.bucket.try_acquire()
+            if delay <= 0.0:
+                return None
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                self.slots.release()
+                return "venue rate limit until broadcast deadline"
+            time.sleep(delay)
+
+    def leave(self) -> None:
+        self.slots.release()
 
 
 # ---------------------------------------------------------------------------
@@ -151,6 +265,13 @@ class CopyTradeEngine:
         self._ledger = None                 # TradeLedgerDB
         self._pal = None                    # PlatformAccountLayer
 
+        self.max_workers = _env_int("NIJA_COPY_MAX_WORKERS", DEFAULT_MAX_WORKERS)
+        self.deadline_s = _env_float("NIJA_COPY_BROADCAST_DEADLINE_S", DEFAULT_BROADCAST_DEADLINE_S)
+        self.ack_grace_s = _env_float("NIJA_COPY_ACK_GRACE_S", DEFAULT_ACK_GRACE_S)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._gates: Dict[str, _VenueGate] = {}
+        self._last_stats: Dict[str, Any] = {}
+
         self._load_dependencies()
 
         logger.info(
@@ -195,17 +316,23 @@ class CopyTradeEngine:
         3. For every connected user broker on the target exchange:
            a. Compute proportional size via ``CrossAccountCapitalAllocator``.
            b. Skip if size is below minimum or allocation is not approved.
-           c. Execute via ``submit_market_order_via_pipeline(...)``.
-           d. Record the result to ``TradeLedgerDB``.
-        4. Return a list of :class:`CopyResult` objects.
+        4. Fan the approved followers out on the worker pool; each one waits
+           for a venue slot and rate-limit token, then executes via
+           ``submit_market_order_via_pipeline(...)``.  Entry followers not
+           yet submitted at the broadcast deadline are skipped; exits are
+           always submitted.
+        5. Record all results to ``TradeLedgerDB`` in one batched write.
+        6. Return a list of :class:`CopyResult` objects.
 
         Args:
             signal: The :class:`CopySignal` to replicate.
 
         Returns:
-            List of :class:`CopyResult` — one entry per user account attempted.
+            List of :class:`CopyResult` — one entry per user account attempted,
+            in ``user_brokers`` order.
         """
         results: List[CopyResult] = []
+        started = time.monotonic()
 
         # -- 1. Platform-presence gate -----------------------------------
         if self._pal is not None:
@@ -250,6 +377,9 @@ class CopyTradeEngine:
             signal.exchange,
         )
 
+        rows: List[Dict[str, Any]] = []
+        jobs: List[Tuple[int, str, Any, float]] = []   # (result slot, user_id, broker, size_usd)
+
         for user_id, brokers in user_brokers.items():
             for broker_type, broker in brokers.items():
                 # Only replicate on the same exchange as the platform trade
@@ -290,88 +420,256 @@ class CopyTradeEngine:
                         skipped=True,
                         skip_reason=alloc.reason,
                     ))
-                    self._record(signal, user_id, "skipped", error=alloc.reason)
+                    rows.append(self._ledger_row(signal, user_id, "skipped", error=alloc.reason))
                     continue
 
                 size_usd = alloc.allocated_size_usd if alloc is not None else signal.platform_size_usd
+                jobs.append((len(results), user_id, broker, size_usd))
+                results.append(None)  # type: ignore[arg-type]  # filled by the fan-out
 
-                # -- b. Execute order ------------------------------------
-                try:
-                    if submit_market_order_via_pipeline is None:
-                        order_result = {
-                            "status": "error",
-                            "error": "ExecutionPipeline submit helper unavailable; direct broker fallback blocked",
-                        }
-                    else:
-                        order_result = submit_market_order_via_pipeline(
-                            broker=broker,
-                            symbol=signal.symbol,
-                            side=signal.side,
-                            quantity=size_usd,
-                            size_type="quote",
-                            strategy="CopyTradeEngine",
-                        )
-                    is_dict = isinstance(order_result, dict)
-                    status = order_result.get("status", "unknown") if is_dict else "unknown"
-                    user_order_id = order_result.get("order_id", "") if is_dict else ""
+        # -- 4. Fan out ---------------------------------------------------
+        if jobs:
+            self._fan_out(signal, jobs, results, rows, started)
 
-                    success = status not in ("error", "failed", "skipped")
-                    filled = size_usd if success else 0.0
+        # -- 5. Batched ledger write --------------------------------------
+        self._record_many(rows)
 
-                    result = CopyResult(
-                        user_id=user_id,
-                        exchange=signal.exchange,
-                        success=success,
-                        filled_usd=filled,
-                        order_id=user_order_id,
-                        error=order_result.get("error") if (is_dict and not success) else None,
-                    )
+        # -- 6. Log summary ----------------------------------------------
+        filled = sum(1 for r in results if r.success)
+        skipped = sum(1 for r in results if r.skipped)
+        failed = sum(1 for r in results if not r.success and not r.skipped)
+        stats = self._latency_stats(results)
+        stats.update(
+            filled=filled, skipped=skipped, failed=failed,
+            followers=len(jobs),
+            elapsed_ms=round((time.monotonic() - started) * 1000.0, 1),
+        )
+        with self._lock:
+            self._last_stats = stats
 
-                    if success:
-                        logger.info(
-                            "[CopyEngine] ✅ %s/%s filled $%.2f (order_id=%s)",
-                            user_id, signal.exchange, filled, user_order_id,
-                        )
-                    else:
-                        logger.warning(
-                            "[CopyEngine] ❌ %s/%s failed — %s",
-                            user_id, signal.exchange, status,
-                        )
+        logger.info(
+            "[CopyEngine] broadcast complete: filled=%d skipped=%d failed=%d "
+            "in %.0fms (signal→submit p50=%.1fms p95=%.1fms, submit→ack p50=%.1fms p95=%.1fms max=%.1fms)",
+            filled, skipped, failed, stats["elapsed_ms"],
+            stats["signal_to_submit_p50_ms"], stats["signal_to_submit_p95_ms"],
+            stats["submit_to_ack_p50_ms"], stats["submit_to_ack_p95_ms"],
+            stats["submit_to_ack_max_ms"],
+        )
+        return results
 
-                    self._record(
-                        signal, user_id,
-                        "filled" if success else "failed",
-                        user_order_id=user_order_id,
-                        user_size=size_usd,
-                        error=result.error,
-                    )
+    def get_stats(self) -> Dict[str, Any]:
+        """Return counts and latency percentiles of the most recent broadcast."""
+        with self._lock:
+            return dict(getattr(self, "_last_stats", {}) or {})
 
-                except Exception as exc:
-                    logger.error(
-                        "[CopyEngine] order execution exception for %s: %s",
-                        user_id, exc,
+    # ------------------------------------------------------------------
+    # Fan-out
+    # ------------------------------------------------------------------
+
+    def _fan_out(
+        self,
+        signal: CopySignal,
+        jobs: List[Tuple[int, str, Any, float]],
+        results: List[CopyResult],
+        rows: List[Dict[str, Any]],
+        started: float,
+    ) -> None:
+        """Run *jobs* on the worker pool and write their outcomes into *results*/*rows*."""
+        deadline = started + getattr(self, "deadline_s", DEFAULT_BROADCAST_DEADLINE_S)
+        # Exits are submitted whatever the delay; the deadline only bounds how long we wait here.
+        submit_deadline = None if signal.is_exit else deadline
+        gate = self._venue_gate(signal.exchange)
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._execute_copy, signal, user_id, broker, size_usd, gate, submit_deadline): (slot, user_id)
+            for slot, user_id, broker, size_usd in jobs
+        }
+
+        wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        pending = [f for f in futures if not f.done()]
+        if submit_deadline is not None:
+            for future in pending:
+                future.cancel()     # queued behind the pool: never reached a venue
+        running = [f for f in pending if not f.cancelled()]
+        if running:
+            wait(running, timeout=getattr(self, "ack_grace_s", DEFAULT_ACK_GRACE_S))
+
+        late = 0
+        for future, (slot, user_id) in futures.items():
+            if future.cancelled():
+                results[slot] = CopyResult(
+                    user_id=user_id, exchange=signal.exchange, success=False,
+                    skipped=True, skip_reason="broadcast deadline exceeded",
+                )
+                rows.append(self._ledger_row(signal, user_id, "skipped", error="broadcast deadline exceeded"))
+            elif future.done():
+                results[slot], row = future.result()
+                rows.append(row)
+            else:
+                # Submitted (or, for exits, still queued) but unacknowledged:
+                # report now, record the real outcome when it lands.
+                late += 1
+                results[slot] = CopyResult(
+                    user_id=user_id, exchange=signal.exchange, success=False,
+                    error=(
+                        "exit pending after broadcast deadline (still submitted)"
+                        if signal.is_exit
+                        else "no ack before broadcast deadline (order may still fill)"
+                    ),
+                )
+                future.add_done_callback(self._record_late)
+        if late:
+            logger.warning(
+                "[CopyEngine] %d order(s) on %s unacknowledged %.1fs after the broadcast deadline",
+                late, signal.exchange, getattr(self, "ack_grace_s", DEFAULT_ACK_GRACE_S),
+            )
+
+    def _execute_copy(
+        self,
+        signal: CopySignal,
+        user_id: str,
+        broker: Any,
+        size_usd: float,
+        gate: _VenueGate,
+        deadline: Optional[float],
+    ) -> Tuple[CopyResult, Dict[str, Any]]:
+        """Submit one follower order (worker thread).  Returns the result and its ledger row.
+
+        *deadline* is None for exits, which are never skipped.
+        """
+        if deadline is not None and time.monotonic() >= deadline:
+            reason = "broadcast deadline exceeded"
+        else:
+            reason = gate.enter(deadline)
+        if reason is not None:
+            logger.info("[CopyEngine] %s/%s skipped — %s", user_id, signal.exchange, reason)
+            result = CopyResult(
+                user_id=user_id, exchange=signal.exchange, success=False,
+                skipped=True, skip_reason=reason,
+            )
+            return result, self._ledger_row(signal, user_id, "skipped", error=reason)
+
+        submitted = time.monotonic()
+        try:
+            try:
+                if submit_market_order_via_pipeline is None:
+                    order_result = {
+                        "status": "error",
+                        "error": "ExecutionPipeline submit helper unavailable; direct broker fallback blocked",
+                    }
+                else:
+                    order_result = submit_market_order_via_pipeline(
+                        broker=broker,
+                        symbol=signal.symbol,
+                        side=signal.side,
+                        quantity=size_usd,
+                        size_type="quote",
+                        strategy="CopyTradeEngine",
                     )
-                    err_msg = str(exc)[:_MAX_ERROR_LENGTH]
-                    result = CopyResult(
-                        user_id=user_id,
-                        exchange=signal.exchange,
-                        success=False,
-                        error=err_msg,
+                is_dict = isinstance(order_result, dict)
+                status = order_result.get("status", "unknown") if is_dict else "unknown"
+                user_order_id = order_result.get("order_id", "") if is_dict else ""
+
+                success = status not in ("error", "failed", "skipped")
+                filled = size_usd if success else 0.0
+
+                result = CopyResult(
+                    user_id=user_id,
+                    exchange=signal.exchange,
+                    success=success,
+                    filled_usd=filled,
+                    order_id=user_order_id,
+                    error=order_result.get("error") if (is_dict and not success) else None,
+                )
+
+                if success:
+                    logger.info(
+                        "[CopyEngine] ✅ %s/%s filled $%.2f (order_id=%s)",
+                        user_id, signal.exchange, filled, user_order_id,
+                    )
+                else:
+                    logger.warning(
+                        "[CopyEngine] ❌ %s/%s failed — %s",
+                        user_id, signal.exchange, status,
                     )
-                    self._record(signal, user_id, "failed", error=err_msg)
 
-                results.append(result)
+                row = self._ledger_row(
+                    signal, user_id,
+                    "filled" if success else "failed",
+                    user_order_id=user_order_id,
+                    user_size=size_usd,
+                    error=result.error,
+                )
 
-        # -- 4. Log summary ----------------------------------------------
-        filled = sum(1 for r in results if r.success)
-        skipped = sum(1 for r in results if r.skipped)
-        failed = sum(1 for r in results if not r.success and not r.skipped)
+            except Exception as exc:
+                logger.error(
+                    "[CopyEngine] order execution exception for %s: %s",
+                    user_id, exc,
+                )
+                err_msg = str(exc)[:_MAX_ERROR_LENGTH]
+                result = CopyResult(
+                    user_id=user_id,
+                    exchange=signal.exchange,
+                    success=False,
+                    error=err_msg,
+                )
+                row = self._ledger_row(signal, user_id, "failed", error=err_msg)
+        finally:
+            gate.leave()
+
+        result.signal_to_submit_ms = round((submitted - signal.created_at) * 1000.0, 3)
+        result.submit_to_ack_ms = round((time.monotonic() - submitted) * 1000.0, 3)
+        return result, row
+
+    def _record_late(self, future) -> None:
+        """Done-callback for orders that acknowledged after the broadcast returned."""
+        try:
+            _result, row = future.result()
+        except Exception as exc:
+            logger.debug("[CopyEngine] late copy order error: %s", exc)
+            return
+        self._record_many([row])
 
-        logger.info(
-            "[CopyEngine] broadcast complete: filled=%d skipped=%d failed=%d",
-            filled, skipped, failed,
-        )
-        return results
+    def _venue_gate(self, exchange: str) -> _VenueGate:
+        """Return the shared concurrency/rate gate for *exchange* (created on first use)."""
+        with self._lock:
+            gates = getattr(self, "_gates", None)
+            if gates is None:
+                gates = self._gates = {}
+            gate = gates.get(exchange)
+            if gate is None:
+                suffix = exchange.upper()
+                concurrency = _env_int(
+                    f"NIJA_COPY_VENUE_CONCURRENCY_{suffix}",
+                    _env_int("NIJA_COPY_VENUE_CONCURRENCY", DEFAULT_VENUE_CONCURRENCY),
+                )
+                rate = _env_float(
+                    f"NIJA_COPY_VENUE_RATE_{suffix}",
+                    _env_float("NIJA_COPY_VENUE_RATE", DEFAULT_VENUE_RATE),
+                )
+                gate = gates[exchange] = _VenueGate(concurrency, rate)
+            return gate
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the engine-wide fan-out pool (created on first broadcast)."""
+        with self._lock:
+            executor = getattr(self, "_executor", None)
+            if executor is None:
+                executor = self._executor = ThreadPoolExecutor(
+                    max_workers=getattr(self, "max_workers", DEFAULT_MAX_WORKERS),
+                    thread_name_prefix="CopyFanout",
+                )
+            return executor
+
+    @staticmethod
+    def _latency_stats(results: List[CopyResult]) -> Dict[str, float]:
+        stats: Dict[str, float] = {}
+        for name in ("signal_to_submit", "submit_to_ack"):
+            values = sorted(getattr(r, f"{name}_ms") for r in results if getattr(r, f"{name}_ms") is not None)
+            stats[f"{name}_p50_ms"] = round(_percentile(values, 0.50), 3)
+            stats[f"{name}_p95_ms"] = round(_percentile(values, 0.95), 3)
+            stats[f"{name}_max_ms"] = round(values[-1], 3) if values else 0.0
+        return stats
 
     # ------------------------------------------------------------------
     # Convenience: broadcast from a plain dict (legacy compatibility)
@@ -403,6 +701,29 @@ class CopyTradeEngine:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _ledger_row(
+        signal: CopySignal,
+        user_id: str,
+        status: str,
+        user_order_id: str = "",
+        user_size: Optional[float] = None,
+        error: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the ``TradeLedgerDB.record_copy_trade`` keyword arguments for one follower."""
+        return dict(
+            platform_trade_id=signal.platform_trade_id,
+            master_symbol=signal.symbol,
+            master_side=signal.side,
+            master_order_id=signal.order_id or None,
+            platform_user_id="platform",
+            user_id=user_id,
+            user_status=status,
+            user_order_id=user_order_id or None,
+            user_error=error,
+            user_size=user_size,
+        )
+
     def _record(
         self,
         signal: CopySignal,
@@ -413,21 +734,19 @@ class CopyTradeEngine:
         error: Optional[str] = None,
     ) -> None:
         """Write a copy-trade audit record to the TradeLedgerDB."""
-        if self._ledger is None:
+        self._record_many([self._ledger_row(signal, user_id, status, user_order_id, user_size, error)])
+
+    def _record_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Write copy-trade audit records to the TradeLedgerDB in one batch."""
+        if self._ledger is None or not rows:
             return
         try:
-            self._ledger.record_copy_trade(
-                platform_trade_id=signal.platform_trade_id,
-                master_symbol=signal.symbol,
-                master_side=signal.side,
-                master_order_id=signal.order_id or None,
-                platform_user_id="platform",
-                user_id=user_id,
-                user_status=status,
-                user_order_id=user_order_id or None,
-                user_error=error,
-                user_size=user_size,
-            )
+            record_batch = getattr(self._ledger, "record_copy_trades", None)
+            if record_batch is not None:
+                record_batch(rows)
+            else:
+                for row in rows:
+                    self._ledger.record_copy_trade(**row)
         except Exception as exc:
             logger.debug("[CopyEngine] ledger record error: %s", exc)
 
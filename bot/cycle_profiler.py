@@ -0,0 +1,454 @@
+"""Always-on span recorder for ``NijaCoreLoop`` trading cycles.
+
+``run_scan_phase`` logs plenty but never recorded where wall time went, so a
+slow cycle could not be attributed to network, pandas or the gate stack.
+``CycleProfiler`` answers that with a handful of ``perf_counter`` calls per
+span:
+
+* **Spans** — ``with profiler.span("phase3.fetch"):`` records the wall time
+  of the block.  Spans nest per thread; each span also tracks its *self*
+  time (wall time minus child spans), so the self time of ``phase3`` is what
+  the gate stack, ranking and logging cost once fetch / indicators / AI
+  scoring / execution are taken out.
+* **Rolling percentiles** — the last ``NIJA_CYCLE_PROFILE_WINDOW`` samples of
+  every span are kept and summarised as p50 / p95 / p99 / max on demand.
+* **Cycles** — ``with profiler.cycle():`` wraps one ``run_scan_phase`` call
+  and keeps a per-span breakdown of the last and the slowest cycle (within
+  the same rolling window).
+* **Sampling dump (opt-in)** — with ``NIJA_CYCLE_PROFILE_SAMPLING=true`` a
+  daemon thread samples the cycle thread's Python stack every
+  ``NIJA_CYCLE_PROFILE_SAMPLE_MS`` while a cycle runs.  Whenever a cycle is
+  the slowest in the window its collapsed stacks are written to
+  ``cycle_profile_slowest.json`` (top stacks) and
+  ``cycle_profile_slowest.folded`` (flamegraph.pl / speedscope input).
+
+Snapshots are flushed to ``$NIJA_DATA_DIR/cycle_profile.json`` at most every
+``NIJA_CYCLE_PROFILE_FLUSH_S`` seconds so the dashboard server, which runs as
+a separate process, can serve them at ``/api/cycle-profile``.
+
+Spans opened on worker threads (e.g. pipelined candle prefetch) feed the
+rolling percentiles but not the per-cycle breakdown, which belongs to the
+thread that opened the cycle.
+
+Environment variables (all optional, safe defaults provided)
+------------------------------------------------------------
+NIJA_CYCLE_PROFILER_ENABLED  — set to false to turn span recording off (default true)
+NIJA_CYCLE_PROFILE_WINDOW    — samples kept per span / cycles kept for "slowest" (default 200)
+NIJA_CYCLE_PROFILE_FLUSH_S   — minimum seconds between snapshot writes (default 15)
+NIJA_CYCLE_PROFILE_SAMPLING  — enable the stack-sampling dump of the slowest cycle (default false)
+NIJA_CYCLE_PROFILE_SAMPLE_MS — stack sampling interval in milliseconds (default 10)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("nija.cycle_profiler")
+
+_TRUE = {"1", "true", "yes", "on", "enabled", "y"}
+
+_DATA_DIR = Path(os.environ.get("NIJA_DATA_DIR", "/tmp/nija_monitoring"))
+SNAPSHOT_FILE = "cycle_profile.json"
+SLOWEST_FILE = "cycle_profile_slowest.json"
+SLOWEST_FOLDED_FILE = "cycle_profile_slowest.folded"
+
+# Stacks listed in the JSON dump; the .folded file always has all of them.
+_TOP_STACKS = 50
+# Frames kept per sampled stack (innermost frames win).
+_MAX_STACK_DEPTH = 64
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default)) or default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, str(default)) or default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    return raw.strip().lower() in _TRUE
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+class _SpanStats:
+    """Rolling wall-time samples (ms) for one span name."""
+
+    __slots__ = ("samples", "count", "total_ms", "self_ms")
+
+    def __init__(self, window: int) -> None:
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total_ms = 0.0
+        self.self_ms = 0.0
+
+    def add(self, wall_ms: float, self_ms: float) -> None:
+        self.samples.append(wall_ms)
+        self.count += 1
+        self.total_ms += wall_ms
+        self.self_ms += self_ms
+
+    def summary(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "p50_ms": round(_percentile(ordered, 50), 3),
+            "p95_ms": round(_percentile(ordered, 95), 3),
+            "p99_ms": round(_percentile(ordered, 99), 3),
+            "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "self_mean_ms": round(self.self_ms / self.count, 3) if self.count else 0.0,
+        }
+
+
+class _StackSampler:
+    """Samples one thread's Python stack on a daemon thread until stopped."""
+
+    def __init__(self, thread_id: int, interval_s: float) -> None:
+        self._thread_id = thread_id
+        self._interval_s = interval_s
+        self._stop = threading.Event()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._thread = threading.Thread(target=self._run, name="nija-cycle-sampler", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            parts: List[str] = []
+            while frame is not None and len(parts) < _MAX_STACK_DEPTH:
+                code = frame.f_code
+                parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(parts))] += 1
+            self.samples += 1
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+
+class _CycleRecord:
+    """Per-cycle span breakdown held in the cycle thread's local state."""
+
+    __slots__ = ("started_at", "start", "spans", "sampler")
+
+    def __init__(self, sampler: Optional[_StackSampler]) -> None:
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.spans: Dict[str, List[float]] = {}
+        self.sampler = sampler
+
+    def add(self, name: str, wall_ms: float) -> None:
+        entry = self.spans.get(name)
+        if entry is None:
+            self.spans[name] = [wall_ms, 1]
+        else:
+            entry[0] += wall_ms
+            entry[1] += 1
+
+    def as_dict(self, total_ms: float) -> Dict[str, Any]:
+        return {
+            "started_at": _iso(self.started_at),
+            "total_ms": round(total_ms, 3),
+            "spans": {
+                name: {"ms": round(ms, 3), "calls": int(calls)}
+                for name, (ms, calls) in sorted(self.spans.items(), key=lambda kv: -kv[1][0])
+            },
+        }
+
+
+class CycleProfiler:
+    """Thread-safe span recorder with rolling percentiles per span name."""
+
+    def __init__(
+        self,
+        window: Optional[int] = None,
+        enabled: Optional[bool] = None,
+        sampling: Optional[bool] = None,
+        sample_interval_ms: Optional[float] = None,
+        flush_interval_s: Optional[float] = None,
+        data_dir: Optional[Path] = None,
+    ) -> None:
+        self.window = window if window is not None else _env_int("NIJA_CYCLE_PROFILE_WINDOW", 200)
+        self.enabled = enabled if enabled is not None else _env_flag("NIJA_CYCLE_PROFILER_ENABLED", True)
+        self.sampling = sampling if sampling is not None else _env_flag("NIJA_CYCLE_PROFILE_SAMPLING", False)
+        if sample_interval_ms is None:
+            sample_interval_ms = _env_float("NIJA_CYCLE_PROFILE_SAMPLE_MS", 10.0)
+        self.sample_interval_s = max(0.001, sample_interval_ms / 1000.0)
+        self.flush_interval_s = (
+            flush_interval_s if flush_interval_s is not None else _env_float("NIJA_CYCLE_PROFILE_FLUSH_S", 15.0)
+        )
+        self.data_dir = Path(data_dir) if data_dir is not None else _DATA_DIR
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._spans: Dict[str, _SpanStats] = {}
+        self._cycles = 0
+        self._recent_cycles: Deque[float] = deque(maxlen=self.window)
+        self._last_cycle: Optional[Dict[str, Any]] = None
+        self._slowest_cycle: Optional[Dict[str, Any]] = None
+        self._slowest_dump: Optional[str] = None
+        self._last_flush = 0.0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _stack(self) -> List[List[Any]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Record the wall time of the ``with`` block under *name*."""
+        if not self.enabled:
+            yield
+            return
+        stack = self._stack()
+        # [name, start, child_seconds]
+        frame = [name, time.perf_counter(), 0.0]
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - frame[1]
+            stack.pop()
+            if stack:
+                stack[-1][2] += wall
+            self._record(name, wall * 1000.0, (wall - frame[2]) * 1000.0)
+
+    def _record(self, name: str, wall_ms: float, self_ms: float) -> None:
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = _SpanStats(self.window)
+            stats.add(wall_ms, self_ms)
+        cycle = getattr(self._local, "cycle", None)
+        if cycle is not None:
+            cycle.add(name, wall_ms)
+
+    @contextmanager
+    def cycle(self) -> Iterator[None]:
+        """Wrap one trading cycle; nested cycles on the same thread are ignored."""
+        if not self.enabled or getattr(self._local, "cycle", None) is not None:
+            yield
+            return
+        sampler = _StackSampler(threading.get_ident(), self.sample_interval_s) if self.sampling else None
+        record = _CycleRecord(sampler)
+        self._local.cycle = record
+        try:
+            with self.span("cycle"):
+                yield
+        finally:
+            self._local.cycle = None
+            if sampler is not None:
+                sampler.stop()
+            self._finish_cycle(record)
+
+    def _finish_cycle(self, record: _CycleRecord) -> None:
+        total_ms = (time.perf_counter() - record.start) * 1000.0
+        summary = record.as_dict(total_ms)
+        with self._lock:
+            self._cycles += 1
+            self._recent_cycles.append(total_ms)
+            self._last_cycle = summary
+            # "Slowest" is relative to the rolling window so an early cold
+            # start cycle does not pin the dump forever.
+            is_slowest = total_ms >= max(self._recent_cycles)
+            if is_slowest or self._slowest_cycle is None:
+                self._slowest_cycle = summary
+        if is_slowest and record.sampler is not None:
+            self._dump_samples(summary, record.sampler)
+        if time.time() - self._last_flush >= self.flush_interval_s:
+            self.flush()
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return rolling per-span percentiles plus last / slowest cycle breakdowns."""
+        with self._lock:
+            spans = {name: stats.summary() for name, stats in sorted(self._spans.items())}
+            return {
+                "generated_at": _iso(time.time()),
+                "enabled": self.enabled,
+                "window": self.window,
+                "cycles": self._cycles,
+                "spans": spans,
+                "last_cycle": self._last_cycle,
+                "slowest_cycle": self._slowest_cycle,
+                "sampling": {
+                    "enabled": self.sampling,
+                    "interval_ms": round(self.sample_interval_s * 1000.0, 3),
+                    "slowest_dump": self._slowest_dump,
+                },
+            }
+
+    def flush(self) -> Optional[Path]:
+        """Atomically write :meth:`snapshot` to ``<data_dir>/cycle_profile.json``."""
+        self._last_flush = time.time()
+        path = self.data_dir / SNAPSHOT_FILE
+        try:
+            _write_json(path, self.snapshot())
+            return path
+        except Exception as exc:
+            logger.debug("cycle profile snapshot write failed: %s", exc)
+            return None
+
+    def _dump_samples(self, summary: Dict[str, Any], sampler: _StackSampler) -> None:
+        interval_ms = self.sample_interval_s * 1000.0
+        ranked: List[Tuple[str, int]] = sampler.stacks.most_common()
+        payload = {
+            "cycle": summary,
+            "samples": sampler.samples,
+            "interval_ms": round(interval_ms, 3),
+            "stacks": [
+                {"stack": stack, "samples": count, "approx_ms": round(count * interval_ms, 1)}
+                for stack, count in ranked[:_TOP_STACKS]
+            ],
+        }
+        path = self.data_dir / SLOWEST_FILE
+        try:
+            _write_json(path, payload)
+            folded = self.data_dir / SLOWEST_FOLDED_FILE
+            tmp = folded.with_suffix(".tmp")
+            tmp.write_text("".join(f"{stack} {count}\n" for stack, count in ranked))
+            os.replace(tmp, folded)
+        except Exception as exc:
+            logger.debug("cycle profile sample dump failed: %s", exc)
+            return
+        with self._lock:
+            self._slowest_dump = str(path)
+        logger.info(
+            "🐢 [CycleProfiler] slowest cycle in window: %.0f ms (%d stack samples) → %s",
+            summary["total_ms"], sampler.samples, path,
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._cycles = 0
+            self._recent_cycles.clear()
+            self._last_cycle = None
+            self._slowest_cycle = None
+            self._slowest_dump = None
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as fh:
+        json.dump(payload, fh, indent=2, default=str)
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------------------------------
+# Singleton
+# ---------------------------------------------------------------------------
+
+_profiler: Optional[CycleProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_cycle_profiler() -> CycleProfiler:
+    """Return the process-wide :class:`CycleProfiler`."""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = CycleProfiler()
+    return _profiler
+
+
+def profile_span(name: str):
+    """Shorthand for ``get_cycle_profiler().span(name)``."""
+    return get_cycle_profiler().span(name)
+
+
+# ---------------------------------------------------------------------------
+# Dashboard routes
+# ---------------------------------------------------------------------------
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def create_cycle_profile_blueprint() -> Any:
+    """
+    Create the cycle-profile Flask Blueprint.
+
+    ``/api/cycle-profile`` serves the in-process snapshot when this process
+    runs trading cycles, otherwise the last snapshot flushed by the bot.
+    ``/api/cycle-profile/slowest`` serves the sampling dump of the slowest
+    cycle (only present with ``NIJA_CYCLE_PROFILE_SAMPLING=true``).
+    """
+    from flask import Blueprint, jsonify
+
+    bp = Blueprint("cycle_profile", __name__)
+
+    @bp.route("/api/cycle-profile")
+    def cycle_profile():
+        profiler = get_cycle_profiler()
+        snapshot = profiler.snapshot()
+        if snapshot["cycles"]:
+            return jsonify(snapshot)
+        data = _read_json(profiler.data_dir / SNAPSHOT_FILE)
+        if data is None:
+            return jsonify({"cycles": 0, "spans": {}, "available": False})
+        return jsonify(data)
+
+    @bp.route("/api/cycle-profile/slowest")
+    def cycle_profile_slowest():
+        data = _read_json(get_cycle_profiler().data_dir / SLOWEST_FILE)
+        if data is None:
+            return jsonify({"available": False}), 404
+        return jsonify(data)
+
+    return bp
+
+
+def register_cycle_profile_dashboard(app: Any) -> None:
+    """Register the cycle-profile Blueprint with a Flask app."""
+    app.register_blueprint(create_cycle_profile_blueprint())
+    logger.info("✅ Cycle profile routes registered (/api/cycle-profile, /api/cycle-profile/slowest)")
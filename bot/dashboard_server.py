@@ -20,7 +20,6 @@ import logging
 import os
 import sys
 from pathlib import Path
-from collections import Counter, deque
 from datetime import datetime, timedelta
 import psutil
 import signal as sig
@@ -142,6 +141,28 @@ except ImportError:
         _PHASE5_DASH_AVAILABLE = False
         register_phase5_dashboard = None  # type: ignore[assignment]
 
+# Import per-cycle span profiler routes (/api/cycle-profile)
+try:
+    from cycle_profiler import register_cycle_profile_dashboard
+    _CYCLE_PROFILE_AVAILABLE = True
+except ImportError:
+    try:
+        from bot.cycle_profiler import register_cycle_profile_dashboard
+        _CYCLE_PROFILE_AVAILABLE = True
+    except ImportError:
+        logger.warning("Cycle profiler routes not available")
+        _CYCLE_PROFILE_AVAILABLE = False
+        register_cycle_profile_dashboard = None  # type: ignore[assignment]
+
+# Shared incremental reader for the trade-decision feed
+try:
+    from decision_feed_index import get_decision_feed_index
+except ImportError:
+    try:
+        from bot.decision_feed_index import get_decision_feed_index
+    except ImportError:
+        get_decision_feed_index = None  # type: ignore[assignment]
+
 # Auto-refresh interval in seconds
 AUTO_REFRESH_INTERVAL = 10  # 10 seconds
 
@@ -184,63 +205,37 @@ def _get_account_manager():
 
 
 def _get_not_taken_decision_summary(limit: int = 300, window_seconds: int = 300) -> dict:
-    """Aggregate recent trade-not-taken reasons from decision feed."""
+    """Aggregate recent trade-not-taken reasons from decision feed.
+
+    Served from the shared incremental index (see ``decision_feed_index``),
+    so a poll only parses lines appended since the previous one.
+    """
     decision_path = Path(
         os.getenv("NIJA_DECISION_FEED_FILE", "./data/audit_logs/trade_decisions.jsonl")
     )
-    if not decision_path.exists():
+    if not decision_path.exists() or get_decision_feed_index is None:
         return {
             "available": False,
             "path": str(decision_path),
-            "reason": "decision_feed_missing",
+            "reason": "decision_feed_missing" if get_decision_feed_index else "decision_feed_index_unavailable",
             "top_reasons": [],
             "recent_not_taken": [],
             "not_taken_last_window": 0,
         }
 
-    reason_counts: Counter[str] = Counter()
-    recent_not_taken = deque(maxlen=20)
-    not_taken_last_window = 0
-    now = datetime.now()
-
     try:
-        with decision_path.open("r", encoding="utf-8") as handle:
-            lines = handle.readlines()[-max(50, limit):]
-
-        for raw in lines:
-            line = raw.strip()
-            if not line:
-                continue
-            try:
-                event = json.loads(line)
-            except Exception:
-                continue
-
-            action = str(event.get("action") or "")
-            if action not in {"vetoed", "rejected", "skipped"}:
-                continue
-
-            reason_code = str(event.get("reason_code") or "unknown")
-            reason_counts[reason_code] += 1
-            recent_not_taken.append(event)
-
-            ts_raw = str(event.get("timestamp") or "")
-            try:
-                ts = datetime.fromisoformat(ts_raw.replace("Z", "+00:00")).replace(tzinfo=None)
-                if 0 <= (now - ts).total_seconds() <= window_seconds:
-                    not_taken_last_window += 1
-            except Exception:
-                pass
-
+        summary = get_decision_feed_index(decision_path).summary(
+            limit=max(50, limit), window_seconds=window_seconds, recent=20, top=10,
+        )
         return {
             "available": True,
             "path": str(decision_path),
-            "not_taken_last_window": not_taken_last_window,
+            "not_taken_last_window": summary["not_taken_last_window"],
             "top_reasons": [
                 {"reason": reason, "count": count}
-                for reason, count in reason_counts.most_common(10)
+                for reason, count in summary["top_reasons"]
             ],
-            "recent_not_taken": list(recent_not_taken),
+            "recent_not_taken": summary["recent_not_taken"],
         }
     except Exception as exc:
         logger.debug("Decision summary unavailable: %s", exc)
@@ -2613,6 +2608,15 @@ if __name__ == "__main__":
     else:
         logger.warning("⚠️ Phase 5 Live Performance Tuner dashboard not available")
 
+    # Register per-cycle span profiler routes
+    if _CYCLE_PROFILE_AVAILABLE and register_cycle_profile_dashboard:
+        try:
+            register_cycle_profile_dashboard(app)
+        except Exception as _cp_err:
+            logger.warning("⚠️ Could not register cycle profile routes: %s", _cp_err)
+    else:
+        logger.warning("⚠️ Cycle profile routes not available")
+
     print("🚀 Starting NIJA Dashboard Server...")
     print("📊 Dashboard will be available at: http://localhost:5001")
     print("👥 Users Dashboard: http://localhost:5001/users")
@@ -2622,6 +2626,7 @@ if __name__ == "__main__":
     print("🧠 AI Monitoring: http://localhost:5001/ai/regime")
     print("💰 Compounding Dashboard: http://localhost:5001/compounding/dashboard")
     print("⚡ Phase 5 Live Tuner: http://localhost:5001/phase5/dashboard")
+    print("⏱️ Cycle Profile: http://localhost:5001/api/cycle-profile")
     print(f"🔄 Auto-refresh every {AUTO_REFRESH_INTERVAL} seconds")
     print("\nPress Ctrl+C to stop\n")
 
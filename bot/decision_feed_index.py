@@ -0,0 +1,310 @@
+"""Incremental index over the ``trade_decisions.jsonl`` decision feed.
+
+The dashboards used to ``readlines()`` the whole decision feed on every poll
+and keep only the last few hundred lines; after a few weeks the file is
+hundreds of MB and every refresh cost seconds and a large allocation.
+``DecisionFeedIndex`` keeps the request cost independent of the file size:
+
+* **Bootstrap** — the first call seeks to the end of the file and reads
+  *backwards* in fixed-size chunks (:func:`iter_lines_reverse`) until it has
+  the last ``capacity`` lines and every not-taken event inside the retention
+  window (bounded by ``max_bootstrap_lines``).
+* **Incremental** — later calls ``stat`` the file and parse only the bytes
+  appended since the previous call (a partial trailing line is carried over).
+  Truncation or replacement (inode change / shrink) triggers a fresh
+  bootstrap, as does an append backlog larger than ``max_catchup_bytes``.
+* **Aggregates** — the last ``capacity`` events are kept for "last N lines"
+  summaries, and not-taken events (``vetoed`` / ``rejected`` / ``skipped``)
+  inside the retention window are kept with a rolling per-reason count that
+  is updated as lines arrive and expire.
+
+Both ``dashboard_server`` and ``performance_dashboard_enhanced`` read the
+feed through :func:`get_decision_feed_index`.
+
+Timestamps with an offset (or ``Z``) are compared as absolute times; naive
+timestamps are taken as local time.  Window counts assume the feed is
+appended in roughly chronological order.
+
+Environment variables (all optional, safe defaults provided)
+------------------------------------------------------------
+NIJA_DECISION_FEED_FILE        — feed path (default ./data/audit_logs/trade_decisions.jsonl)
+NIJA_DECISION_FEED_CAPACITY    — most recent events kept in memory (default 1000)
+NIJA_DECISION_FEED_RETENTION_S — window of not-taken events kept for rolling counts (default 3600)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger("nija.decision_feed_index")
+
+DEFAULT_FEED_PATH = "./data/audit_logs/trade_decisions.jsonl"
+NOT_TAKEN_ACTIONS = frozenset({"vetoed", "rejected", "skipped"})
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default)) or default))
+    except (TypeError, ValueError):
+        return default
+
+
+def iter_lines_reverse(fh: Any, end: int, chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the complete lines of binary file *fh* before offset *end*, newest first.
+
+    Reads backwards in *chunk_size* blocks, so the cost is proportional to the
+    number of lines consumed, not to the size of the file.  *end* must sit on
+    a line boundary (or at EOF).
+    """
+    pos = end
+    carry = b""
+    while pos > 0:
+        step = min(chunk_size, pos)
+        pos -= step
+        fh.seek(pos)
+        block = fh.read(step) + carry
+        lines = block.split(b"\n")
+        # lines[0] may continue in the previous block; keep it for the next read.
+        carry = lines[0]
+        for line in reversed(lines[1:]):
+            if line.strip():
+                yield line
+    if carry.strip():
+        yield carry
+
+
+def tail_lines(path: Union[str, Path], n: int, chunk_size: int = _CHUNK_SIZE) -> List[str]:
+    """Return the last *n* non-empty lines of *path*, oldest first."""
+    out: List[bytes] = []
+    with open(path, "rb") as fh:
+        end = fh.seek(0, os.SEEK_END)
+        for line in iter_lines_reverse(fh, end, chunk_size):
+            out.append(line)
+            if len(out) >= n:
+                break
+    return [line.decode("utf-8", "replace") for line in reversed(out)]
+
+
+def _parse_ts(raw: Any) -> Optional[float]:
+    text = str(raw or "")
+    if not text:
+        return None
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+# (epoch or None, action, reason_code, event)
+_Entry = Tuple[Optional[float], str, str, Dict[str, Any]]
+
+
+class DecisionFeedIndex:
+    """Tail-bootstrapped, incrementally refreshed view of one decision feed."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        capacity: Optional[int] = None,
+        retention_s: Optional[int] = None,
+        max_bootstrap_lines: int = 20000,
+        max_catchup_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        self.path = Path(path)
+        self.capacity = capacity if capacity is not None else _env_int("NIJA_DECISION_FEED_CAPACITY", 1000)
+        self.retention_s = retention_s if retention_s is not None else _env_int("NIJA_DECISION_FEED_RETENTION_S", 3600)
+        self.max_bootstrap_lines = max(self.capacity, max_bootstrap_lines)
+        self.max_catchup_bytes = max_catchup_bytes
+        self._lock = threading.Lock()
+        self.bootstraps = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._events: Deque[_Entry] = deque(maxlen=self.capacity)
+        self._not_taken: Deque[Tuple[float, str]] = deque()
+        self._reason_counts: Counter = Counter()
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._partial = b""
+        self.lines_parsed = 0
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the file; False when the file is missing."""
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                self._reset()
+                return False
+            if (
+                self._inode != st.st_ino
+                or st.st_size < self._offset
+                or st.st_size - self._offset > self.max_catchup_bytes
+            ):
+                self._bootstrap(st)
+            elif st.st_size > self._offset:
+                self._catch_up(st.st_size)
+            self._expire(time.time())
+            return True
+
+    def _bootstrap(self, st: os.stat_result) -> None:
+        self._reset()
+        self.bootstraps += 1
+        self._inode = st.st_ino
+        horizon = time.time() - self.retention_s
+        collected: List[bytes] = []
+        with open(self.path, "rb") as fh:
+            end = st.st_size
+            # Leave an unterminated last line for the incremental reader.
+            if end:
+                fh.seek(end - 1)
+                if fh.read(1) != b"\n":
+                    last_nl = self._last_newline(fh, end)
+                    fh.seek(last_nl)
+                    self._partial = fh.read(end - last_nl)
+                    end = last_nl
+            for line in iter_lines_reverse(fh, end):
+                collected.append(line)
+                if len(collected) >= self.max_bootstrap_lines:
+                    break
+                if len(collected) >= self.capacity:
+                    ts = self._line_ts(line)
+                    if ts is not None and ts < horizon:
+                        break
+        for line in reversed(collected):
+            self._ingest_line(line)
+        self._offset = st.st_size
+
+    @staticmethod
+    def _last_newline(fh: Any, end: int) -> int:
+        """Offset just past the last newline before *end* (0 if none)."""
+        pos = end
+        while pos > 0:
+            step = min(_CHUNK_SIZE, pos)
+            pos -= step
+            fh.seek(pos)
+            idx = fh.read(step).rfind(b"\n")
+            if idx >= 0:
+                return pos + idx + 1
+        return 0
+
+    @staticmethod
+    def _line_ts(line: bytes) -> Optional[float]:
+        try:
+            return _parse_ts(json.loads(line).get("timestamp"))
+        except Exception:
+            return None
+
+    def _catch_up(self, size: int) -> None:
+        with open(self.path, "rb") as fh:
+            fh.seek(self._offset)
+            data = self._partial + fh.read(size - self._offset)
+        self._offset = size
+        lines = data.split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            if line.strip():
+                self._ingest_line(line)
+
+    def _ingest_line(self, line: bytes) -> None:
+        try:
+            event = json.loads(line)
+        except Exception:
+            return
+        if not isinstance(event, dict):
+            return
+        self.lines_parsed += 1
+        action = str(event.get("action") or "")
+        reason = str(event.get("reason_code") or "unknown")
+        ts = _parse_ts(event.get("timestamp"))
+        self._events.append((ts, action, reason, event))
+        if action in NOT_TAKEN_ACTIONS and ts is not None:
+            self._not_taken.append((ts, reason))
+            self._reason_counts[reason] += 1
+
+    def _expire(self, now: float) -> None:
+        horizon = now - self.retention_s
+        while self._not_taken and self._not_taken[0][0] < horizon:
+            _, reason = self._not_taken.popleft()
+            self._reason_counts[reason] -= 1
+            if self._reason_counts[reason] <= 0:
+                del self._reason_counts[reason]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def summary(
+        self,
+        limit: int = 300,
+        window_seconds: int = 300,
+        recent: int = 20,
+        top: int = 10,
+    ) -> Dict[str, Any]:
+        """Not-taken summary over the last *limit* events and the last *window_seconds*.
+
+        ``top_reasons`` counts reasons among the last ``limit`` feed lines
+        (capped at ``capacity``), ``window_reasons`` among not-taken events
+        in the last ``window_seconds`` (capped at the retention window) and
+        ``retention_reasons`` is the rolling count over the whole retention
+        window.
+        """
+        available = self.refresh()
+        now = time.time()
+        with self._lock:
+            last = list(self._events)[-max(1, limit):]
+            counts: Counter = Counter()
+            not_taken_events: Deque[Dict[str, Any]] = deque(maxlen=max(0, recent))
+            for _ts, action, reason, event in last:
+                if action in NOT_TAKEN_ACTIONS:
+                    counts[reason] += 1
+                    not_taken_events.append(event)
+
+            cutoff = now - window_seconds
+            window_counts: Counter = Counter()
+            for ts, reason in reversed(self._not_taken):
+                if ts < cutoff:
+                    break
+                if ts <= now:
+                    window_counts[reason] += 1
+
+            return {
+                "available": available,
+                "path": str(self.path),
+                "not_taken_last_window": sum(window_counts.values()),
+                "window_seconds": window_seconds,
+                "top_reasons": counts.most_common(top),
+                "window_reasons": window_counts.most_common(top),
+                "retention_reasons": self._reason_counts.most_common(top),
+                "recent_not_taken": list(not_taken_events),
+                "lines_parsed": self.lines_parsed,
+            }
+
+
+_indexes: Dict[str, DecisionFeedIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_decision_feed_index(path: Optional[Union[str, Path]] = None) -> DecisionFeedIndex:
+    """Return the shared index for *path* (default ``NIJA_DECISION_FEED_FILE``)."""
+    resolved = Path(path if path is not None else os.getenv("NIJA_DECISION_FEED_FILE", DEFAULT_FEED_PATH))
+    key = str(resolved.absolute())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = DecisionFeedIndex(resolved)
+        return index
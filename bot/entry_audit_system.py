@@ -28,6 +28,11 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 from pathlib import Path
 
+try:
+    from bot.event_log import event_stream
+except ImportError:
+    from event_log import event_stream  # type: ignore[import]
+
 logger = logging.getLogger("nija.entry_audit")
 
 
@@ -237,6 +242,7 @@ class EntryAuditSystem:
         self.data_dir.mkdir(exist_ok=True)
         
         self.audit_file = self.data_dir / "entry_audit_log.jsonl"
+        self._audit_stream = event_stream(self.audit_file)
         self.stats_file = self.data_dir / "entry_audit_stats.json"
         
         # In-memory tracking
@@ -330,10 +336,10 @@ class EntryAuditSystem:
         self._save_stats()
     
     def _append_to_log(self, record: EntryAuditRecord):
-        """Append record to JSONL log file"""
+        """Queue record for the JSONL log file (written by the event-log thread)"""
         try:
-            with open(self.audit_file, 'a') as f:
-                f.write(json.dumps(record.to_dict()) + '\n')
+            if not self._audit_stream.append(record.to_dict()):
+                logger.warning("Entry audit log queue full - record dropped")
         except Exception as e:
             logger.error(f"Could not write to audit log: {e}")
     
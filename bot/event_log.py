@@ -0,0 +1,481 @@
+"""Shared batched JSONL event writer for audit / telemetry logs.
+
+Dozens of modules append their own ``*.jsonl`` files, each reopening the file
+and calling ``json.dumps`` for every event on the trading thread (often while
+holding a lock).  ``EventLogWriter`` moves that work off the hot path:
+
+* **Queue put only** — ``EventStream.append(record)`` puts the record on a
+  bounded per-stream queue and returns.  Serialisation, file I/O, rotation
+  and compression all happen on one background writer thread.
+* **Batched appends** — every ``NIJA_EVENT_LOG_FLUSH_MS`` (or as soon as a
+  stream has ``NIJA_EVENT_LOG_BATCH`` pending records) each stream's queue is
+  drained, serialised and written with a single ``write()`` to a file handle
+  that stays open between batches.
+* **Durability** — per stream: ``none`` (leave it to the OS buffer),
+  ``flush`` (flush the Python buffer after each batch, the default) or
+  ``fsync`` (flush + ``os.fsync`` after each batch).
+* **Rotation** — the active segment is rotated when it exceeds
+  ``rotate_bytes`` and/or has been open for ``rotate_interval_s``.  Rotated
+  segments are renamed ``<stem>.<UTC timestamp><suffix>`` next to the active
+  file, optionally gzip-compressed, and pruned to ``max_segments``.  Readers
+  of the active path keep working unchanged.
+* **Synchronous streams** — a stream created with ``synchronous=True`` skips
+  the queue: ``append`` writes on the caller thread through the same
+  long-lived handle and returns once the record is flushed (or fsync'd).
+* **Backpressure** — when a stream's queue is full: ``block`` waits up to
+  ``NIJA_EVENT_LOG_PUT_TIMEOUT_MS`` for space and then drops the record,
+  ``drop_newest`` drops the incoming record, ``drop_oldest`` evicts the
+  oldest queued one.  Every drop is counted in ``stats()``.
+
+Records are serialised on the writer thread, so callers must not mutate a
+record after appending it (pass a fresh dict, or a pre-serialised ``str``).
+Code that reads a log back right after writing it calls ``stream.flush()``
+first.  Records still queued at interpreter exit are written by an
+``atexit`` hook.
+
+Usage::
+
+    from bot.event_log import get_event_log
+
+    _events = get_event_log().stream("data/my_audit.jsonl")
+    _events.append({"event": "order_submitted", "symbol": "BTC-USD"})
+
+Environment variables (all optional, safe defaults provided)
+------------------------------------------------------------
+NIJA_EVENT_LOG_SYNC            — true = write synchronously on the caller thread (default false)
+NIJA_EVENT_LOG_FLUSH_MS        — writer batch interval in milliseconds (default 200)
+NIJA_EVENT_LOG_BATCH           — pending records that wake the writer early (default 256)
+NIJA_EVENT_LOG_DURABILITY      — none / flush / fsync (default flush)
+NIJA_EVENT_LOG_QUEUE_MAX       — bounded queue length per stream (default 10000)
+NIJA_EVENT_LOG_DROP_POLICY     — block / drop_newest / drop_oldest (default block)
+NIJA_EVENT_LOG_PUT_TIMEOUT_MS  — max wait for queue space under ``block`` (default 50)
+NIJA_EVENT_LOG_ROTATE_MB       — rotate the active segment above this size (default 0 = off)
+NIJA_EVENT_LOG_ROTATE_HOURS    — rotate the active segment after this age (default 0 = off)
+NIJA_EVENT_LOG_COMPRESS        — gzip rotated segments (default false)
+NIJA_EVENT_LOG_MAX_SEGMENTS    — rotated segments kept per stream (default 0 = keep all)
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+logger = logging.getLogger("nija.event_log")
+
+_TRUE = {"1", "true", "yes", "on", "enabled", "y"}
+
+DURABILITY_LEVELS = ("none", "flush", "fsync")
+DROP_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(name, str(default)) or default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, str(default)) or default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_choice(name: str, default: str, choices: tuple) -> str:
+    value = (os.getenv(name) or default).strip().lower()
+    return value if value in choices else default
+
+
+def default_serializer(record: Any) -> str:
+    """Compact one-line JSON; non-JSON values fall back to ``str``."""
+    if isinstance(record, str):
+        return record
+    return json.dumps(record, default=str)
+
+
+@dataclass
+class StreamConfig:
+    """Per-stream settings; unset fields take the ``NIJA_EVENT_LOG_*`` defaults."""
+
+    durability: str = field(default_factory=lambda: _env_choice("NIJA_EVENT_LOG_DURABILITY", "flush", DURABILITY_LEVELS))
+    max_queue: int = field(default_factory=lambda: max(1, _env_int("NIJA_EVENT_LOG_QUEUE_MAX", 10000)))
+    drop_policy: str = field(default_factory=lambda: _env_choice("NIJA_EVENT_LOG_DROP_POLICY", "block", DROP_POLICIES))
+    put_timeout_s: float = field(default_factory=lambda: _env_float("NIJA_EVENT_LOG_PUT_TIMEOUT_MS", 50.0) / 1000.0)
+    rotate_bytes: int = field(default_factory=lambda: int(_env_float("NIJA_EVENT_LOG_ROTATE_MB", 0.0) * 1024 * 1024))
+    rotate_interval_s: float = field(default_factory=lambda: _env_float("NIJA_EVENT_LOG_ROTATE_HOURS", 0.0) * 3600.0)
+    compress: bool = field(default_factory=lambda: (os.getenv("NIJA_EVENT_LOG_COMPRESS") or "").strip().lower() in _TRUE)
+    max_segments: int = field(default_factory=lambda: _env_int("NIJA_EVENT_LOG_MAX_SEGMENTS", 0))
+    # Write each record on the caller thread before append() returns (never
+    # queued, never dropped) — for ledgers that must be on disk when the
+    # caller moves on; durability still picks flush / fsync.
+    synchronous: bool = False
+    serializer: Callable[[Any], str] = default_serializer
+    # Called on the writing thread with the records of a batch that could not
+    # be written, so owners can keep an in-memory fallback.
+    on_error: Optional[Callable[[List[Any], Exception], None]] = None
+
+    def __post_init__(self) -> None:
+        if self.durability not in DURABILITY_LEVELS:
+            raise ValueError(f"unsupported event log durability: {self.durability}")
+        if self.drop_policy not in DROP_POLICIES:
+            raise ValueError(f"unsupported event log drop policy: {self.drop_policy}")
+
+
+class EventStream:
+    """One JSONL file fed through the shared writer thread."""
+
+    def __init__(self, writer: "EventLogWriter", path: Path, config: StreamConfig) -> None:
+        self.path = path
+        self.config = config
+        self._writer = writer
+        self._queue: Deque[Any] = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._io_lock = threading.Lock()
+        self._fh: Optional[Any] = None
+        self._inode: Optional[int] = None
+        self._segment_started = 0.0
+        self._enqueued = 0
+        self._processed = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.rotations = 0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def append(self, record: Any) -> bool:
+        """Queue *record* for writing; returns False when it was dropped."""
+        if self._writer.synchronous or self.config.synchronous:
+            with self._cond:
+                self._enqueued += 1
+            self._write_batch([record])
+            return True
+
+        cfg = self.config
+        with self._cond:
+            if len(self._queue) >= cfg.max_queue:
+                if cfg.drop_policy == "drop_oldest":
+                    self._queue.popleft()
+                    self._processed += 1
+                    self.dropped += 1
+                elif cfg.drop_policy == "block" and cfg.put_timeout_s > 0:
+                    self._writer.wake()
+                    deadline = time.monotonic() + cfg.put_timeout_s
+                    while len(self._queue) >= cfg.max_queue:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not self._cond.wait(remaining):
+                            break
+                if len(self._queue) >= cfg.max_queue:
+                    self.dropped += 1
+                    return False
+            self._queue.append(record)
+            self._enqueued += 1
+            pending = len(self._queue)
+        if pending >= self._writer.batch_size:
+            self._writer.wake()
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every record appended before this call is on disk (or dropped)."""
+        with self._cond:
+            target = self._enqueued
+            if self._processed >= target:
+                return True
+        if self._writer.on_writer_thread():
+            self._drain()
+            return True
+        self._writer.wake()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._processed < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = len(self._queue)
+        return {
+            "path": str(self.path),
+            "pending": pending,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "rotations": self.rotations,
+            "durability": self.config.durability,
+            "drop_policy": self.config.drop_policy,
+        }
+
+    # ------------------------------------------------------------------
+    # Writer side
+    # ------------------------------------------------------------------
+
+    def _drain(self) -> None:
+        with self._cond:
+            if not self._queue:
+                return
+            batch = list(self._queue)
+            self._queue.clear()
+            self._cond.notify_all()  # wake producers blocked on a full queue
+        self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        try:
+            with self._io_lock:
+                lines = []
+                for record in batch:
+                    try:
+                        lines.append(self.config.serializer(record) + "\n")
+                    except Exception as exc:
+                        self.failed += 1
+                        logger.warning("event log %s: dropped unserialisable record: %s", self.path.name, exc)
+                payload = "".join(lines)
+                if payload:
+                    fh = self._ensure_open(len(payload))
+                    fh.write(payload)
+                    if self.config.durability != "none":
+                        fh.flush()
+                        if self.config.durability == "fsync":
+                            os.fsync(fh.fileno())
+                self.written += len(lines)
+                self.batches += 1
+        except Exception as exc:
+            self.failed += len(batch)
+            self._close_file()
+            logger.warning("event log %s: batch of %d records failed: %s", self.path, len(batch), exc)
+            if self.config.on_error is not None:
+                try:
+                    self.config.on_error(batch, exc)
+                except Exception:
+                    logger.debug("event log on_error callback failed", exc_info=True)
+        finally:
+            with self._cond:
+                self._processed += len(batch)
+                self._cond.notify_all()
+
+    def _ensure_open(self, incoming: int) -> Any:
+        """Return the open handle, reopening / rotating as needed (io lock held)."""
+        if self._fh is not None:
+            # Reopen when the file was moved, deleted or replaced underneath us.
+            try:
+                if os.stat(self.path).st_ino != self._inode:
+                    self._close_file()
+            except FileNotFoundError:
+                self._close_file()
+        if self._fh is not None and self._needs_rotation(incoming):
+            self._rotate()
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+            self._inode = os.fstat(self._fh.fileno()).st_ino
+            self._segment_started = time.time()
+            if self._needs_rotation(incoming):
+                self._rotate()
+                return self._ensure_open(incoming)
+        return self._fh
+
+    def _needs_rotation(self, incoming: int) -> bool:
+        cfg = self.config
+        size = self._fh.tell() if self._fh is not None else 0
+        if size == 0:
+            return False
+        if cfg.rotate_bytes and size + incoming > cfg.rotate_bytes:
+            return True
+        return bool(cfg.rotate_interval_s and time.time() - self._segment_started >= cfg.rotate_interval_s)
+
+    def _rotate(self) -> None:
+        self._close_file()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        target = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        os.replace(self.path, target)
+        if self.config.compress:
+            gz_path = target.with_name(target.name + ".gz")
+            with open(target, "rb") as src, gzip.open(gz_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(target)
+        self.rotations += 1
+        self._prune_segments()
+
+    def rotated_segments(self) -> List[Path]:
+        """Rotated segments of this stream, oldest first."""
+        prefix, suffix = f"{self.path.stem}.", self.path.suffix
+        found = []
+        for candidate in self.path.parent.glob(f"{prefix}*{suffix}*"):
+            name = candidate.name
+            if candidate == self.path or not (name.endswith(suffix) or name.endswith(suffix + ".gz")):
+                continue
+            stamp = name[len(prefix):].split(".", 1)[0]
+            if len(stamp) == 21 and stamp[8] == "T" and stamp.replace("T", "").isdigit():
+                found.append(candidate)
+        return sorted(found, key=lambda p: p.name)
+
+    def _prune_segments(self) -> None:
+        keep = self.config.max_segments
+        if keep <= 0:
+            return
+        segments = self.rotated_segments()
+        for old in segments[: max(0, len(segments) - keep)]:
+            try:
+                old.unlink()
+            except OSError as exc:
+                logger.debug("event log: could not prune %s: %s", old, exc)
+
+    def _close_file(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+        self._fh = None
+        self._inode = None
+
+    def _close(self) -> None:
+        self._drain()
+        with self._io_lock:
+            self._close_file()
+
+
+class EventLogWriter:
+    """Owns the background writer thread and the registry of streams."""
+
+    def __init__(
+        self,
+        flush_interval_s: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        synchronous: Optional[bool] = None,
+    ) -> None:
+        self.flush_interval_s = (
+            flush_interval_s if flush_interval_s is not None
+            else _env_float("NIJA_EVENT_LOG_FLUSH_MS", 200.0) / 1000.0
+        )
+        self.batch_size = max(1, batch_size if batch_size is not None else _env_int("NIJA_EVENT_LOG_BATCH", 256))
+        if synchronous is None:
+            synchronous = (os.getenv("NIJA_EVENT_LOG_SYNC") or "").strip().lower() in _TRUE
+        self.synchronous = synchronous
+        self._streams: Dict[str, EventStream] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def stream(self, path: Union[str, Path], config: Optional[StreamConfig] = None, **overrides: Any) -> EventStream:
+        """Return the stream for *path*, creating it on first use.
+
+        *config* / keyword overrides only apply when the stream is created;
+        later callers for the same path share the first configuration.
+        """
+        resolved = Path(path).expanduser().absolute()
+        key = str(resolved)
+        with self._lock:
+            existing = self._streams.get(key)
+            if existing is not None:
+                return existing
+            if config is None:
+                config = StreamConfig(**overrides)
+            elif overrides:
+                raise TypeError("pass either config or keyword overrides, not both")
+            created = EventStream(self, resolved, config)
+            self._streams[key] = created
+            if not self.synchronous and self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name="nija-event-log", daemon=True)
+                self._thread.start()
+        return created
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def on_writer_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            self._drain_all()
+            if self._stopping:
+                return
+
+    def _drain_all(self) -> None:
+        with self._lock:
+            streams = list(self._streams.values())
+        for s in streams:
+            try:
+                s._drain()
+            except Exception:
+                logger.debug("event log drain failed for %s", s.path, exc_info=True)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Flush every stream; returns False if any did not finish in time."""
+        with self._lock:
+            streams = list(self._streams.values())
+        return all([s.flush(timeout) for s in streams])
+
+    def close(self) -> None:
+        """Drain all queues, stop the writer thread and close every file.
+
+        Appends after ``close()`` are written synchronously on the caller thread.
+        """
+        thread = self._thread
+        if thread is not None:
+            self._stopping = True
+            self._wake.set()
+            if thread is not threading.current_thread():
+                thread.join(timeout=10.0)
+            self._thread = None
+        self.synchronous = True
+        with self._lock:
+            streams = list(self._streams.values())
+        for s in streams:
+            s._close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            streams = list(self._streams.values())
+        return {
+            "synchronous": self.synchronous,
+            "flush_interval_ms": round(self.flush_interval_s * 1000.0, 1),
+            "streams": [s.stats() for s in streams],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Singleton
+# ---------------------------------------------------------------------------
+
+_event_log: Optional[EventLogWriter] = None
+_event_log_lock = threading.Lock()
+
+
+def get_event_log() -> EventLogWriter:
+    """Return the process-wide :class:`EventLogWriter`."""
+    global _event_log
+    if _event_log is None:
+        with _event_log_lock:
+            if _event_log is None:
+                _event_log = EventLogWriter()
+                atexit.register(_event_log.close)
+    return _event_log
+
+
+def event_stream(path: Union[str, Path], **overrides: Any) -> EventStream:
+    """Shorthand for ``get_event_log().stream(path, **overrides)``."""
+    return get_event_log().stream(path, **overrides)
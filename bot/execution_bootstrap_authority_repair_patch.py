@@ -293,7 +293,7 @@ def _try_patch_loaded() -> bool:
     for name, module in list(sys.modules.items()):
         if not isinstance(module, ModuleType):
             continue
-        if name in {"bot.execution_engine", "execution_engine"} or hasattr(module, "ExecutionEngine"):
+        if name in {"bot.execution_engine", "execution_engine"} or "ExecutionEngine" in vars(module):
             patched = _install_on_execution_engine(module) or patched
     return patched
 
@@ -66,7 +66,7 @@ def _patch_target_module(module: ModuleType) -> bool:
             try:
                 if not isinstance(loaded_module, ModuleType):
                     continue
-                if name in {"bot.execution_engine", "execution_engine"} or hasattr(loaded_module, "ExecutionEngine"):
+                if name in {"bot.execution_engine", "execution_engine"} or "ExecutionEngine" in vars(loaded_module):
                     patched = original_install(loaded_module) or patched
             except RuntimeError as exc:
                 if "dictionary changed size" in str(exc):
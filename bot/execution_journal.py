@@ -1,5 +1,10 @@
 """
 Minimal append-only execution journal.
+
+Records are written through a synchronous :mod:`event_log` stream: the file
+handle stays open between appends, but each record is written and flushed
+(``NIJA_EXECUTION_JOURNAL_DURABILITY=fsync`` also fsyncs) before ``append``
+returns, and is never queued or dropped.
 """
 
 from __future__ import annotations
@@ -11,6 +16,11 @@ import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+try:
+    from bot.event_log import EventStream, event_stream
+except ImportError:
+    from event_log import EventStream, event_stream  # type: ignore[import]
+
 logger = logging.getLogger("nija.execution.journal")
 
 ALLOWED_EVENT_TYPES = frozenset(
@@ -32,6 +42,16 @@ class ExecutionJournal:
         self._path = str(path if path is not None else os.getenv("NIJA_EXECUTION_JOURNAL_PATH", "")).strip()
         self._lock = threading.Lock()
         self._in_memory_events: List[Dict[str, Any]] = []
+        self._stream: Optional[EventStream] = None
+        if self._path:
+            durability = (os.getenv("NIJA_EXECUTION_JOURNAL_DURABILITY") or "flush").strip().lower()
+            self._stream = event_stream(
+                self._path,
+                synchronous=True,
+                durability=durability if durability in ("flush", "fsync") else "flush",
+                serializer=lambda rec: json.dumps(rec, sort_keys=True),
+                on_error=self._on_write_error,
+            )
 
     def append(
         self,
@@ -51,20 +71,21 @@ class ExecutionJournal:
             "payload": payload or {},
         }
 
-        with self._lock:
-            if self._path:
-                try:
-                    os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
-                    with open(self._path, "a", encoding="utf-8") as fh:
-                        fh.write(json.dumps(record, sort_keys=True) + "\n")
-                except Exception as exc:
-                    logger.warning("ExecutionJournal file append failed; using in-memory fallback: %s", exc)
-                    self._in_memory_events.append(record)
-            else:
+        if self._stream is None or not self._stream.append(record):
+            with self._lock:
                 self._in_memory_events.append(record)
 
         return dict(record)
 
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Kept for callers of the batched journal; appends are already on disk."""
+        return self._stream.flush(timeout) if self._stream is not None else True
+
+    def _on_write_error(self, records: List[Any], exc: Exception) -> None:
+        logger.warning("ExecutionJournal file append failed; using in-memory fallback: %s", exc)
+        with self._lock:
+            self._in_memory_events.extend(records)
+
 
 _journal_singleton: Optional[ExecutionJournal] = None
 _singleton_lock = threading.Lock()
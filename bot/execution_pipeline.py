@@ -57,6 +57,14 @@ Usage
     pipeline = get_execution_pipeline()
     pipeline.run(signal=analysis, account_id="coinbase", account_balance=5000.0)
 
+Asynchronous submission (see ``order_submission_registry``)::
+
+    handle = pipeline.submit(request)            # returns immediately
+    handle.add_done_callback(lambda h: on_fill(h.result()))
+    result = handle.result(timeout=60)           # or: result = await handle
+
+    results = pipeline.execute_many([req_a, req_b, req_c])   # one scan cycle, in parallel
+
 Author: NIJA Trading Systems
 Version: 1.0
 Date: March 2026
@@ -78,6 +86,11 @@ from contextlib import contextmanager
 
 logger = logging.getLogger("nija.execution_pipeline")
 
+try:
+    from bot.order_submission_registry import OrderHandle, OrderRegistry, current_handle
+except ImportError:
+    from order_submission_registry import OrderHandle, OrderRegistry, current_handle  # type: ignore[import]
+
 try:
     from bot.pipeline_request_contract import (
         PipelineRequest,
@@ -908,8 +921,11 @@ class ExecutionPipeline:
         buying_power = ledger_row.get("buying_power_usd") if ledger_row else getattr(request, "buying_power_usd", None)
         available_margin = ledger_row.get("available_margin_usd") if ledger_row else getattr(request, "available_balance_usd", None)
         financial_cap = buying_power if buying_power is not None else available_margin
-        if exposure_required and notional > 0 and financial_cap is not None and float(financial_cap) < notional:
-            return self._deny(request, t_start, "CapitalAuthorization deny: insufficient_buying_power")
+        if exposure_required and notional > 0 and financial_cap is not None:
+            # Entries already dispatched via submit() are not in the ledger yet.
+            committed = self._reserved_notional_usd(request)
+            if float(financial_cap) - committed < notional:
+                return self._deny(request, t_start, "CapitalAuthorization deny: insufficient_buying_power")
 
         leverage = int(getattr(request, "leverage", 1) or 1)
         ledger_leverage = int(ledger_row.get("leverage") or 1) if ledger_row else 1
@@ -2074,9 +2090,188 @@ class ExecutionPipeline:
             }
         return status
 
+    def submit(self, request: PipelineRequest) -> OrderHandle:
+        """Submit an order without blocking the caller.
+
+        The full :meth:`execute` path runs on the shared order worker pool;
+        the returned :class:`OrderHandle` resolves to its ``PipelineResult``
+        (``handle.result()``, ``await handle`` or ``add_done_callback``).
+        ACK timeouts and reconciliation are handled centrally by the
+        pipeline's :class:`OrderRegistry`.
+
+        The pre-dispatch gates of submitted orders run one at a time; only
+        broker dispatch overlaps.  An entry that passed its gates reserves
+        its notional (capital gate) and exposure (pre-trade risk) until its
+        worker has booked the broker result, so the next order's gates see
+        it.
+        """
+        registry = self._get_order_registry()
+        return registry.submit(request, lambda: self._execute_submitted(request))
+
+    def execute_many(
+        self,
+        requests: List[PipelineRequest],
+        timeout: Optional[float] = None,
+    ) -> List[PipelineResult]:
+        """Submit *requests* concurrently and return their results in order.
+
+        Intended for scan loops that produce several entries per cycle: the
+        orders are in flight together instead of each waiting for the
+        previous ACK.  Gates still run in submission order (see
+        :meth:`submit`).  An order still unresolved after *timeout* seconds
+        is returned as a failed result (it stays tracked in the registry);
+        one past its ACK deadline with no confirmed broker status comes back
+        as an ``ack_timeout_pending`` result, not a rejection.
+        """
+        handles = [self.submit(request) for request in requests]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results: List[PipelineResult] = []
+        for handle in handles:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                results.append(handle.result(remaining))
+            except concurrent.futures.TimeoutError:
+                request = handle.request
+                results.append(PipelineResult(
+                    success=False,
+                    symbol=request.symbol,
+                    side=request.side,
+                    size_usd=request.size_usd,
+                    error=f"async_submit_pending_after_{timeout:.0f}s",
+                    latency_ms=(time.monotonic() - handle.created_at) * 1000,
+                ))
+            except Exception as exc:
+                results.append(self._failed_handle_result(handle, exc))
+        return results
+
+    def outstanding_orders(self) -> List[OrderHandle]:
+        """Orders submitted via :meth:`submit` whose execution has not finished."""
+        registry = getattr(self, "_order_registry", None)
+        return registry.outstanding() if registry is not None else []
+
+    def _get_order_registry(self) -> OrderRegistry:
+        with _ORDER_REGISTRY_LOCK:
+            registry = getattr(self, "_order_registry", None)
+            if registry is None:
+                self._gate_lock = threading.Lock()
+                self._in_flight_entries: Dict[int, PipelineRequest] = {}
+                registry = self._order_registry = OrderRegistry(
+                    reconcile=self._reconcile_handle, failed=self._failed_handle_result
+                )
+            return registry
+
+    def _execute_submitted(self, request: PipelineRequest) -> PipelineResult:
+        """Order-worker body for :meth:`submit`: serial gates, parallel dispatch."""
+        self._gate_lock.acquire()
+        _GATE_PHASE.held = True
+        try:
+            return self.execute(request)
+        finally:
+            self._leave_gate_phase()
+            self._release_in_flight(current_handle())
+
+    def _leave_gate_phase(self) -> None:
+        if getattr(_GATE_PHASE, "held", False):
+            _GATE_PHASE.held = False
+            self._gate_lock.release()
+
+    def _reserve_in_flight(self, handle: OrderHandle, request: PipelineRequest) -> None:
+        """Reserve an entry that passed its gates until its worker finishes."""
+        side = str(getattr(request, "side", "")).lower()
+        intent_type = str(getattr(request, "intent_type", "") or "").lower()
+        if side not in ("buy", "long") or intent_type in ("reduce", "exit"):
+            return
+        with _ORDER_REGISTRY_LOCK:
+            if handle._key in self._in_flight_entries:
+                return  # fallback router after a failed first route
+            self._in_flight_entries[handle._key] = request
+        if self._pre_trade_risk_engine is not None:
+            try:
+                self._pre_trade_risk_engine.reserve(
+                    account_id=request.account_id,
+                    symbol=request.symbol,
+                    size_usd=float(request.size_usd or 0.0),
+                )
+            except Exception as exc:
+                logger.warning("ExecutionPipeline: pre-trade risk reservation failed: %s", exc)
+
+    def _release_in_flight(self, handle: Optional[OrderHandle]) -> None:
+        if handle is None:
+            return
+        with _ORDER_REGISTRY_LOCK:
+            request = self._in_flight_entries.pop(handle._key, None)
+        if request is None or self._pre_trade_risk_engine is None:
+            return
+        try:
+            self._pre_trade_risk_engine.release(
+                account_id=request.account_id,
+                symbol=request.symbol,
+                size_usd=float(request.size_usd or 0.0),
+            )
+        except Exception as exc:
+            logger.warning("ExecutionPipeline: pre-trade risk release failed: %s", exc)
+
+    def _reserved_notional_usd(self, request: PipelineRequest) -> float:
+        """Notional of in-flight submitted entries on *request*'s account."""
+        in_flight = getattr(self, "_in_flight_entries", None)
+        if not in_flight:
+            return 0.0
+        account = (
+            str(getattr(request, "preferred_broker", None) or ""),
+            str(getattr(request, "account_id", "default") or "default"),
+            str(getattr(request, "subaccount_id", "") or ""),
+        )
+        with _ORDER_REGISTRY_LOCK:
+            return sum(
+                float(other.notional_usd or other.size_usd or 0.0)
+                for other in in_flight.values()
+                if (
+                    str(other.preferred_broker or ""),
+                    str(other.account_id or "default"),
+                    str(other.subaccount_id or ""),
+                ) == account
+            )
+
+    def _reconcile_handle(self, handle: OrderHandle) -> PipelineResult:
+        """Registry callback: provisional result for an order whose ACK deadline passed.
+
+        A confirmed broker status is returned as-is.  Otherwise the order is
+        reported as pending, not rejected: the worker is still waiting on the
+        broker, and its real answer replaces this result on the handle.
+        """
+        request = handle.request
+        confirmed = self._confirmed_order_status(request, handle.created_at)
+        if confirmed is not None:
+            return confirmed
+        return PipelineResult(
+            success=False,
+            symbol=request.symbol,
+            side=request.side,
+            size_usd=request.size_usd,
+            broker=request.preferred_broker or "",
+            error=f"ack_timeout_pending:no_broker_ack_within_{handle.ack_timeout_s:.0f}s",
+            latency_ms=(time.monotonic() - handle.created_at) * 1000,
+        )
+
+    def _failed_handle_result(self, handle: OrderHandle, exc: BaseException) -> PipelineResult:
+        """Failed result for a submitted order whose worker raised."""
+        request = handle.request
+        return PipelineResult(
+            success=False,
+            symbol=request.symbol,
+            side=request.side,
+            size_usd=request.size_usd,
+            broker=request.preferred_broker or "",
+            error=f"async_submit_error: {exc}",
+            latency_ms=(time.monotonic() - handle.created_at) * 1000,
+        )
+
     def stop_background_tasks(self) -> None:
         """Request graceful stop of background workers."""
         self._ecel_refresh_stop.set()
+        registry = getattr(self, "_order_registry", None)
+        if registry is not None:
+            registry.shutdown(wait=False)
         margin_ledger = getattr(self, "_margin_position_ledger", None)
         if margin_ledger is not None:
             try:
@@ -2150,6 +2345,15 @@ class ExecutionPipeline:
 
         def _run_with_ack_timeout(fn, *args, **kwargs) -> PipelineResult:
             """Execute *fn* in a thread, returning a timeout PipelineResult on expiry."""
+            handle = current_handle()
+            if handle is not None:
+                # Submitted via submit(): the OrderRegistry owns the ACK deadline
+                # and reconciliation, so run inline on the order worker.  Gates
+                # have passed: reserve the entry and let the next order's gates run.
+                self._reserve_in_flight(handle, request)
+                self._leave_gate_phase()
+                handle.mark_submitted(timeout_s)
+                return fn(*args, **kwargs)
             pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             future = pool.submit(fn, *args, **kwargs)
             try:
@@ -2404,6 +2608,24 @@ class ExecutionPipeline:
         *,
         timeout_s: float,
     ) -> PipelineResult:
+        confirmed = self._confirmed_order_status(request, t_start)
+        if confirmed is not None:
+            return confirmed
+        return PipelineResult(
+            success=False,
+            symbol=request.symbol,
+            side=request.side,
+            size_usd=request.size_usd,
+            broker=request.preferred_broker or "",
+            error=(
+                "confirmed_order_rejected:"
+                f"ack_timeout_no_confirmed_fill_within_{timeout_s:.0f}s"
+            ),
+            latency_ms=(time.monotonic() - t_start) * 1000,
+        )
+
+    def _confirmed_order_status(self, request: PipelineRequest, t_start: float) -> Optional[PipelineResult]:
+        """Poll the broker for a terminal order status; None when unknown."""
         broker = self._resolve_reconciliation_broker(request)
         order_id = self._extract_order_id_hint(request)
         if broker is not None and order_id:
@@ -2438,19 +2660,7 @@ class ExecutionPipeline:
                         error=f"confirmed_order_rejected:{status}",
                         latency_ms=(time.monotonic() - t_start) * 1000,
                     )
-
-        return PipelineResult(
-            success=False,
-            symbol=request.symbol,
-            side=request.side,
-            size_usd=request.size_usd,
-            broker=request.preferred_broker or "",
-            error=(
-                "confirmed_order_rejected:"
-                f"ack_timeout_no_confirmed_fill_within_{timeout_s:.0f}s"
-            ),
-            latency_ms=(time.monotonic() - t_start) * 1000,
-        )
+        return None
 
     @staticmethod
     def _normalise_side(side: str) -> str:
@@ -2929,12 +3139,16 @@ class ExecutionPipeline:
         return result
 
     def get_stats(self) -> Dict:
+        registry = getattr(self, "_order_registry", None)
         with self._lock:
-            return {
+            stats = {
                 "run_count": self._run_count,
                 "blocked_count": self._blocked_count,
                 "last_run": self._last_run,
             }
+        if registry is not None:
+            stats["async_orders"] = registry.get_stats()
+        return stats
 
 
 # ---------------------------------------------------------------------------
@@ -2943,6 +3157,9 @@ class ExecutionPipeline:
 
 _PIPELINE: Optional[ExecutionPipeline] = None
 _PIPELINE_LOCK = threading.Lock()
+_ORDER_REGISTRY_LOCK = threading.Lock()
+# Set on an order worker while it holds the pipeline's gate lock.
+_GATE_PHASE = threading.local()
 
 
 def get_execution_pipeline() -> ExecutionPipeline:
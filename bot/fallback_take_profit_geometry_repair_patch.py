@@ -250,9 +250,9 @@ def _try_patch_loaded() -> bool:
     for name, module in list(sys.modules.items()):
         if not isinstance(module, ModuleType):
             continue
-        if name in {"bot.nija_core_loop", "nija_core_loop"} or hasattr(module, "NijaCoreLoop"):
+        if name in {"bot.nija_core_loop", "nija_core_loop"} or "NijaCoreLoop" in vars(module):
             patched = _install_on_module(module) or patched
-        if name in {"bot.market_regime_detector", "market_regime_detector"} or hasattr(module, "RegimeDetector"):
+        if name in {"bot.market_regime_detector", "market_regime_detector"} or "RegimeDetector" in vars(module):
             patched = _install_regime_tp_on_module(module) or patched
     return patched
 
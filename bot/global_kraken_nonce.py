@@ -19,6 +19,9 @@ Rules
    two concurrently-running processes from issuing duplicate or out-of-order nonces
 ✅ Wall-clock guard — auto-advances nonce when it falls behind wall-clock time
    (handles "expiring" nuclear-reset nonces after 30+ minutes in an error loop)
+✅ Optional block reservation (NIJA_KRAKEN_NONCE_BLOCK_SIZE) — one lock + one
+   persist per block of N nonces instead of per nonce; unused ranges are
+   abandoned on restart because the persisted floor is the end of the block
 
 Usage
 ─────
@@ -494,6 +497,20 @@ _FORCE_PERSISTED_NONCE_SOURCE = os.environ.get(
     "NIJA_FORCE_PERSISTED_NONCE_SOURCE", "1"
 ).strip().lower() in {"1", "true", "yes", "on"}
 
+# NIJA_KRAKEN_NONCE_BLOCK_SIZE — file-mode block reservation (default 0 = off).
+#
+#   With N > 1 the manager claims N nonces at a time: under one
+#   _CrossProcessLock it re-reads the state file, persists ``last + N`` as the
+#   new high-water mark, and then hands out ``last+1 … last+N`` from memory
+#   under _LOCK alone — no file lock and no state write per nonce.  A restart
+#   loads the persisted block end, so any unused part of the last block is
+#   simply skipped (abandoned) and can never be replayed.  This relies on the
+#   single-writer rule (ONE API KEY = ONE WRITER, enforced by the PID lock):
+#   within a block the state file is not re-read for other writers.
+_NONCE_BLOCK_SIZE = max(
+    0, int(os.environ.get("NIJA_KRAKEN_NONCE_BLOCK_SIZE", "0") or "0")
+)
+
 # How long (seconds) to retry PID lock acquisition at startup before entering
 # degraded mode.  Handles the Railway rolling deployment window where the old
 # container is still running when the new one starts.  The new container retries
@@ -1146,6 +1163,11 @@ class KrakenNonceManager:
         self._pid_lock_reacquire_interval_s: float = max(1.0, _reacquire_interval_raw)
         # Optional Redis nonce backend (None = use file / timestamp mode).
         self._redis_backend: object = None
+        # Block reservation (file mode): nonces up to _block_end are already
+        # persisted and may be issued from memory.
+        self._block_size: int = _NONCE_BLOCK_SIZE
+        self._block_end: int = 0
+        self._blocks_reserved: int = 0
         os.makedirs(os.path.dirname(os.path.abspath(self._state_file)), exist_ok=True)
         cleanup_legacy_nonce_files()
 
@@ -1511,6 +1533,8 @@ class KrakenNonceManager:
         # floor; strict +1 increments are the correct on-wire behaviour from that
         # point forward.
         with _LOCK:
+            if self._block_size > 1:
+                return self._next_nonce_from_block()
             with _CrossProcessLock(self._lock_file):
                 # ── Cross-process sync ──────────────────────────────────────
                 # Re-read the state file to pick up any nonce advance written
@@ -1537,6 +1561,44 @@ class KrakenNonceManager:
                 self._persist()
                 return self._last_nonce
 
+    def _next_nonce_from_block(self) -> int:
+        """Issue the next nonce from the reserved block, reserving a new one when spent.
+
+        Caller must hold ``_LOCK``.  The fast path is a pure in-memory
+        increment; only a block refill takes ``_CrossProcessLock`` and writes
+        the state file (``_persist`` records ``_block_end``, not the issued
+        nonce).  A ``_last_nonce`` that was moved past the block by a resync or
+        jump simply triggers a refill from the new value.
+        """
+        if self._last_nonce < self._block_end:
+            self._last_nonce += 1
+            return self._last_nonce
+
+        with _CrossProcessLock(self._lock_file):
+            file_nonce = self._read_state_file_raw()
+            if file_nonce > self._last_nonce:
+                _logger.info(
+                    "KrakenNonceManager: cross-proc sync — in-memory nonce "
+                    "(%d) advanced to file value (%d, delta=%+d ms)",
+                    self._last_nonce, file_nonce,
+                    file_nonce - self._last_nonce,
+                )
+                self._last_nonce = file_nonce
+            self._block_end = self._last_nonce + self._block_size
+            self._blocks_reserved += 1
+            self._persist()
+        self._last_nonce += 1
+        return self._last_nonce
+
+    def get_block_stats(self) -> dict:
+        """Return block-reservation state for diagnostics."""
+        with _LOCK:
+            return {
+                "block_size": self._block_size,
+                "blocks_reserved": self._blocks_reserved,
+                "block_remaining": max(0, self._block_end - self._last_nonce),
+            }
+
     def get_nonce(self) -> int:
         """Alias for next_nonce() — backward compatibility."""
         return self.next_nonce()
@@ -2706,16 +2768,20 @@ class KrakenNonceManager:
         Uses an exclusive advisory lock (fcntl.LOCK_EX) on the .tmp file so
         that two processes can never interleave their writes — even if the
         process lock in bot.py is bypassed.
+
+        In block-reservation mode the end of the reserved block is written
+        instead, so a restart never re-issues a nonce handed out from memory.
         """
         # Skip file I/O when an alternative backend owns the nonce state.
         if self._redis_backend is not None or _NONCE_MODE == "timestamp":
             return
         try:
             tmp = self._state_file + ".tmp"
+            high_water = max(self._last_nonce, getattr(self, "_block_end", 0))
             with open(tmp, "w") as fh:
                 if _FCNTL_AVAILABLE:
                     _fcntl.flock(fh, _fcntl.LOCK_EX)
-                fh.write(str(self._last_nonce))
+                fh.write(str(high_water))
                 if _FCNTL_AVAILABLE:
                     _fcntl.flock(fh, _fcntl.LOCK_UN)
             os.chmod(tmp, _PERSISTED_PERMISSIONS)
@@ -3039,6 +3105,7 @@ def get_global_nonce_stats() -> dict:
         "broker_quarantined": _quarantine_triggered,
         "consecutive_rebuild_failures": _consecutive_rebuild_failures,
         "rebuild_cooldown_remaining_s": get_nonce_rebuild_cooldown_remaining_s(),
+        "nonce_block": mgr.get_block_stats(),
     }
 
 
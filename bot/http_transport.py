@@ -0,0 +1,562 @@
+"""Shared keep-alive HTTP transport for broker REST clients.
+
+Broker REST access used to open a fresh connection per call (``urlopen`` in
+the Kraken OHLC patch, ``requests.get`` for the Coinbase v2 probe), so a TLS
+handshake dominated the latency of every small request.  ``HttpTransport``
+gives every venue one :class:`VenueSession` built on ``http.client``:
+
+* **Per-host keep-alive pools** — each host gets a LIFO pool of at most
+  ``pool_size`` persistent connections.  Idle connections older than
+  ``idle_timeout_s`` or already closed by the server are discarded before
+  reuse, so a request is never written to a dead socket.  ``http.client``
+  does not pipeline (and exchange edges do not accept pipelined requests),
+  so concurrency comes from the pool, one in-flight request per connection.
+* **Per-venue policy** (:class:`VenuePolicy`) — timeout, retry count and
+  backoff, retryable status codes and a circuit breaker
+  (:class:`BrokerCircuitBreaker`).  Only idempotent methods are retried
+  after a request has been sent; any method is retried when the connection
+  could not be established, because nothing reached the venue.
+* **Per-endpoint latency histograms** — fixed-bucket
+  :class:`LatencyHistogram` per ``"METHOD /path"`` (or an explicit
+  ``endpoint=`` label), exported by :meth:`HttpTransport.metrics`.
+
+Responses are :class:`HttpResponse` objects exposing the subset of the
+``requests.Response`` API the broker clients use (``status_code``, ``ok``,
+``text``, ``json()``, ``headers``, ``raise_for_status()``), so a
+``VenueSession`` is a drop-in replacement for ``requests.Session`` there.
+
+Environment variables (all optional, safe defaults provided):
+    NIJA_HTTP_<VENUE>_TIMEOUT_S        – per-request timeout (default 10, kraken 15)
+    NIJA_HTTP_<VENUE>_RETRIES          – retries for idempotent requests (default 2, kraken 1)
+    NIJA_HTTP_<VENUE>_POOL_SIZE        – keep-alive connections per host (default 4, kraken 2)
+    NIJA_HTTP_<VENUE>_IDLE_TIMEOUT_S   – drop idle connections older than this (default 30)
+    NIJA_HTTP_<VENUE>_BREAKER_FAILURES – consecutive failures that open the breaker (default 5)
+    NIJA_HTTP_<VENUE>_BREAKER_RESET_S  – seconds before a half-open probe (default 30)
+
+Author: NIJA Trading Systems
+"""
+
+from __future__ import annotations
+
+import http.client
+import json as _json
+import logging
+import os
+import random
+import select
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Deque, Dict, FrozenSet, Mapping, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+try:
+    from bot.broker_circuit_breaker import BrokerCircuitBreaker
+except ImportError:
+    from broker_circuit_breaker import BrokerCircuitBreaker  # type: ignore[import]
+
+logger = logging.getLogger("nija.http_transport")
+
+USER_AGENT = "NIJA-AI-Trading/http-transport"
+_MAX_ENDPOINTS = 256
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, "") or default)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    try:
+        value = int(os.getenv(name, "") or default)
+    except (TypeError, ValueError):
+        return default
+    return value if value >= minimum else default
+
+
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+
+
+class TransportError(Exception):
+    """Base class for transport failures."""
+
+
+class TransportConnectionError(TransportError, ConnectionError):
+    """The connection failed or was dropped mid-request."""
+
+
+class TransportTimeout(TransportError, TimeoutError):
+    """The request (or waiting for a pooled connection) timed out."""
+
+
+class CircuitOpenError(TransportError):
+    """The venue's circuit breaker is open; the request was not sent."""
+
+
+class HttpStatusError(TransportError):
+    """Raised by :meth:`HttpResponse.raise_for_status` for 4xx/5xx responses."""
+
+    def __init__(self, message: str, response: "HttpResponse") -> None:
+        super().__init__(message)
+        self.response = response
+
+
+# ---------------------------------------------------------------------------
+# Policy / response / histogram
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class VenuePolicy:
+    """Timeout, retry, pooling and breaker settings for one venue."""
+
+    timeout_s: float = 10.0
+    retries: int = 2
+    backoff_s: float = 0.25
+    backoff_max_s: float = 4.0
+    pool_size: int = 4
+    idle_timeout_s: float = 30.0
+    breaker_failures: int = 5
+    breaker_reset_s: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    # Order placement is POST; never replay it once it may have reached the venue.
+    retry_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    @classmethod
+    def from_env(cls, venue: str, base: Optional["VenuePolicy"] = None) -> "VenuePolicy":
+        base = base or VENUE_DEFAULTS.get(venue, cls())
+        prefix = f"NIJA_HTTP_{venue.upper()}_"
+        return replace(
+            base,
+            timeout_s=_env_float(prefix + "TIMEOUT_S", base.timeout_s),
+            retries=_env_int(prefix + "RETRIES", base.retries, minimum=0),
+            pool_size=_env_int(prefix + "POOL_SIZE", base.pool_size),
+            idle_timeout_s=_env_float(prefix + "IDLE_TIMEOUT_S", base.idle_timeout_s),
+            breaker_failures=_env_int(prefix + "BREAKER_FAILURES", base.breaker_failures),
+            breaker_reset_s=_env_float(prefix + "BREAKER_RESET_S", base.breaker_reset_s),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max_s, self.backoff_s * (2 ** attempt))
+        return delay + random.uniform(0, 0.3 * delay)
+
+
+VENUE_DEFAULTS: Dict[str, VenuePolicy] = {
+    # Kraken: large OHLC bodies on a slow edge; one retry keeps scans bounded.
+    "kraken": VenuePolicy(timeout_s=15.0, retries=1, pool_size=2),
+}
+
+
+class HttpResponse:
+    """Fully-read response with the ``requests.Response`` subset brokers use."""
+
+    def __init__(self, status_code: int, reason: str, headers: Any, content: bytes, url: str, elapsed_s: float) -> None:
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.elapsed_s = elapsed_s
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return _json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise HttpStatusError(f"{self.status_code} {self.reason} for url: {self.url}", self)
+
+    def __repr__(self) -> str:
+        return f"<HttpResponse [{self.status_code}]>"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    BOUNDS_MS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(self.BOUNDS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float, error: bool = False) -> None:
+        index = 0
+        while index < len(self.BOUNDS_MS) and ms > self.BOUNDS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.errors += int(error)
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the *q* quantile (capped at the max seen)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(q * self.count)))
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                bound = self.BOUNDS_MS[index] if index < len(self.BOUNDS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{b:g}" for b in self.BOUNDS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {label: n for label, n in zip(labels, self.buckets) if n},
+        }
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+
+class _NotSent(Exception):
+    """Connection could not be established; the request never left."""
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        # An idle keep-alive socket is only readable once the server closed it.
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class _HostPool:
+    """LIFO pool of keep-alive connections to one ``scheme://host:port``."""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], size: int, idle_timeout_s: float) -> None:
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.size = size
+        self.idle_timeout_s = idle_timeout_s
+        self._idle: Deque[Tuple[http.client.HTTPConnection, float]] = deque()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        if not self._slots.acquire(timeout=timeout):
+            raise TransportTimeout(f"no free connection to {self.host} within {timeout}s (pool_size={self.size})")
+        now = time.monotonic()
+        with self._lock:
+            self.in_use += 1
+            while self._idle:
+                conn, idle_since = self._idle.pop()
+                if now - idle_since < self.idle_timeout_s and not _is_dropped(conn):
+                    self.reused += 1
+                    return conn, True
+                self.discarded += 1
+                conn.close()
+            self.created += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout), False
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout), False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        with self._lock:
+            self.in_use -= 1
+            if reusable:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                conn.close()
+        self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            while self._idle:
+                self._idle.pop()[0].close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": self.in_use,
+                "created": self.created,
+                "reused": self.reused,
+                "discarded": self.discarded,
+            }
+
+
+# ---------------------------------------------------------------------------
+# Sessions
+# ---------------------------------------------------------------------------
+
+
+class VenueSession:
+    """Pooled, policy-enforcing HTTP client for one venue.
+
+    ``request(method, url, data=..., headers=..., timeout=...)`` mirrors
+    ``requests.Session.request`` for the arguments the broker clients pass.
+    """
+
+    def __init__(
+        self,
+        venue: str,
+        policy: Optional[VenuePolicy] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.venue = venue
+        self.policy = policy or VenuePolicy.from_env(venue)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._pools: Dict[Tuple[str, str, Optional[int]], _HostPool] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self.breaker = BrokerCircuitBreaker(
+            f"http:{venue}",
+            failure_threshold=self.policy.breaker_failures,
+            recovery_timeout=self.policy.breaker_reset_s,
+        )
+
+    # -- requests-compatible API ------------------------------------------
+
+    def get(self, url: str, **kwargs: Any) -> HttpResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> HttpResponse:
+        return self.request("POST", url, **kwargs)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        data: Any = None,
+        json: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        endpoint: Optional[str] = None,
+    ) -> HttpResponse:
+        method = method.upper()
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unsupported URL: {url!r}")
+        target = parts.path or "/"
+        query = parts.query
+        if params:
+            extra = urlencode({k: v for k, v in params.items() if v is not None})
+            query = f"{query}&{extra}" if query and extra else (query or extra)
+        if query:
+            target = f"{target}?{query}"
+
+        send_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity"}
+        body: Optional[bytes] = None
+        if json is not None:
+            body = _json.dumps(json, separators=(",", ":")).encode("utf-8")
+            send_headers["Content-Type"] = "application/json"
+        elif isinstance(data, Mapping):
+            body = urlencode(data).encode("utf-8")
+            send_headers["Content-Type"] = "application/x-www-form-urlencoded"
+        elif data is not None:
+            body = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        send_headers.update(headers or {})
+
+        timeout = float(timeout or self.policy.timeout_s)
+        pool = self._pool(parts.scheme, parts.hostname, parts.port)
+        histogram = self._histogram(endpoint or f"{method} {parts.path or '/'}")
+        retry_sent = method in self.policy.retry_methods
+        attempts = 1 + self.policy.retries
+
+        for attempt in range(attempts):
+            last = attempt + 1 >= attempts
+            with self._lock:
+                allowed = self.breaker.allow_request()
+            if not allowed:
+                raise CircuitOpenError(
+                    f"{self.venue} circuit open; retry in {self.breaker.recovery_time_remaining():.1f}s"
+                )
+            started = time.perf_counter()
+            try:
+                conn, _ = pool.acquire(timeout)
+            except TransportTimeout:
+                raise  # local pool exhaustion says nothing about the venue
+            try:
+                response = self._send(pool, conn, method, target, body, send_headers, timeout, url)
+            except _NotSent as exc:
+                cause = exc.__cause__ or exc
+                self._record(histogram, started, cause)
+                if last:
+                    raise self._wrap(cause) from cause
+                self._sleep(self.policy.backoff(attempt))
+                continue
+            except (OSError, http.client.HTTPException) as exc:
+                self._record(histogram, started, exc)
+                if last or not retry_sent:
+                    raise self._wrap(exc) from exc
+                self._sleep(self.policy.backoff(attempt))
+                continue
+
+            failed = response.status_code >= 500 or response.status_code == 429
+            self._record(histogram, started, HttpStatusError(str(response.status_code), response) if failed else None)
+            if response.status_code in self.policy.retry_statuses and retry_sent and not last:
+                self._sleep(self._retry_delay(response, attempt))
+                continue
+            return response
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    # -- internals ----------------------------------------------------------
+
+    def _send(self, pool, conn, method, target, body, headers, timeout, url) -> HttpResponse:
+        reusable = False
+        try:
+            conn.timeout = timeout
+            if conn.sock is None:
+                try:
+                    conn.connect()
+                except OSError as exc:
+                    raise _NotSent() from exc
+            else:
+                conn.sock.settimeout(timeout)
+            started = time.perf_counter()
+            conn.request(method, target, body=body, headers=headers)
+            raw = conn.getresponse()
+            content = raw.read()
+            reusable = not raw.will_close
+            return HttpResponse(raw.status, raw.reason, raw.headers, content, url, time.perf_counter() - started)
+        finally:
+            pool.release(conn, reusable)
+
+    def _retry_delay(self, response: HttpResponse, attempt: int) -> float:
+        try:
+            retry_after = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return self.policy.backoff(attempt)
+        return min(self.policy.backoff_max_s, max(0.0, retry_after))
+
+    def _record(self, histogram: LatencyHistogram, started: float, error: Optional[Exception]) -> None:
+        ms = 1000.0 * (time.perf_counter() - started)
+        with self._lock:
+            histogram.observe(ms, error=error is not None)
+            if error is None:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure(error)
+
+    @staticmethod
+    def _wrap(exc: BaseException) -> TransportError:
+        if isinstance(exc, TransportError):
+            return exc
+        if isinstance(exc, TimeoutError):
+            return TransportTimeout(str(exc) or "timed out")
+        return TransportConnectionError(f"{type(exc).__name__}: {exc}")
+
+    def _pool(self, scheme: str, host: str, port: Optional[int]) -> _HostPool:
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = _HostPool(
+                    scheme, host, port, self.policy.pool_size, self.policy.idle_timeout_s
+                )
+            return pool
+
+    def _histogram(self, label: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(label)
+            if histogram is None:
+                if len(self._histograms) >= _MAX_ENDPOINTS:
+                    label = "other"
+                histogram = self._histograms.setdefault(label, LatencyHistogram())
+            return histogram
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            pools = dict(self._pools)
+            endpoints = {label: h.snapshot() for label, h in self._histograms.items()}
+            breaker = self.breaker.get_status()
+        policy = asdict(self.policy)
+        policy["retry_statuses"] = sorted(policy["retry_statuses"])
+        policy["retry_methods"] = sorted(policy["retry_methods"])
+        return {
+            "policy": policy,
+            "breaker": breaker,
+            "pools": {f"{s}://{h}" + (f":{p}" if p else ""): pool.stats() for (s, h, p), pool in pools.items()},
+            "endpoints": endpoints,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
+
+
+class HttpTransport:
+    """Registry of one :class:`VenueSession` per venue."""
+
+    def __init__(self, policies: Optional[Mapping[str, VenuePolicy]] = None) -> None:
+        self._policies: Dict[str, VenuePolicy] = dict(policies or {})
+        self._sessions: Dict[str, VenueSession] = {}
+        self._lock = threading.Lock()
+
+    def session(self, venue: str) -> VenueSession:
+        """Return the shared session for *venue* (created on first use)."""
+        venue = str(venue or "default").strip().lower()
+        with self._lock:
+            session = self._sessions.get(venue)
+            if session is None:
+                policy = self._policies.get(venue) or VenuePolicy.from_env(venue)
+                session = self._sessions[venue] = VenueSession(venue, policy)
+        return session
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            sessions = dict(self._sessions)
+        return {venue: session.metrics() for venue, session in sessions.items()}
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            session.close()
+
+
+_TRANSPORT: Optional[HttpTransport] = None
+_TRANSPORT_LOCK = threading.Lock()
+
+
+def get_http_transport() -> HttpTransport:
+    """Process-wide transport singleton."""
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        with _TRANSPORT_LOCK:
+            if _TRANSPORT is None:
+                _TRANSPORT = HttpTransport()
+    return _TRANSPORT
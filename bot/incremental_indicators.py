@@ -0,0 +1,661 @@
+"""Incremental (O(1) per bar) indicator engine.
+
+``indicators.calculate_indicators`` recomputes VWAP, RSI-14, EMA 9/21/50,
+MACD and the 20-bar volume mean over the whole candle window on every scan
+cycle.  Only the newest bar actually changed, so with 100+ symbols per cycle
+almost all of that pandas work is repeated.
+
+``IncrementalIndicators`` keeps the running state for one symbol and folds in
+one closed bar at a time:
+
+* EMA 9/21/50, MACD(12, 26, 9) — recursive ``ewm(adjust=False)`` updates,
+  re-seeded at the first bar of the trailing ``window`` in O(1) when the
+  oldest bar drops out, so they equal the pandas values on that window.
+* RSI-14, ATR-14, ADX-14 / +DI / -DI, 20-bar volume mean — fixed-window
+  running sums with the same ``min_periods`` / NaN / ``ffill`` semantics as
+  the pandas functions in :mod:`indicators` (note: the repo's RSI, ATR and
+  ADX use *simple* rolling means, not Wilder smoothing, and so does this
+  engine — parity with the existing signals matters more than the textbook
+  definition).
+* VWAP — a rolling ``window`` bar sum, which reproduces ``calculate_vwap``
+  on the trailing window.
+
+``window`` defaults to the scan loop's 200-candle window; ``sync`` sets it to
+the length of the frame it is given, so its output matches
+``calculate_indicators`` on that exact frame.  ``window=None`` accumulates
+from the first bar instead (cumulative VWAP, EMAs seeded at the first bar).
+
+``snapshot()`` returns the same dict shape as ``calculate_indicators``.
+Series-valued entries hold only the last ``history`` bars, which is all the
+scan/entry code reads (``.iloc[-1]`` / ``.iloc[-2]``), so building the dict
+costs O(history) rather than O(window).  The rolling-mean series and the
+last ``RESTATED_BARS`` VWAP/EMA/MACD entries equal the pandas values on the
+current window; once the window has slid, older VWAP/EMA/MACD entries are
+the values over the window ending at their own bar.  ``atr``, ``adx``,
+``plus_di`` and ``minus_di`` are included as well, matching the keys the APEX
+strategy adds.
+
+Usage::
+
+    from bot.incremental_indicators import get_incremental_indicators
+
+    engine = get_incremental_indicators("BTC-USD", broker="coinbase")
+    indicators = engine.sync(df)     # feeds only bars newer than last seen
+
+``NijaCoreLoop._phase3_scan_and_enter`` passes the engine for each scanned
+symbol to the strategy's ``calculate_indicators(df, incremental=engine)``.
+
+Environment variables (optional)
+--------------------------------
+NIJA_INCREMENTAL_INDICATOR_HISTORY — bars kept per series (default 64)
+NIJA_INCREMENTAL_INDICATORS_ENABLED — used by the core-loop scan phase (default true)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from bot.indicators import _no_trade_zone_from_values, _score_entry_conditions
+except ImportError:
+    from indicators import _no_trade_zone_from_values, _score_entry_conditions  # type: ignore
+
+logger = logging.getLogger("nija.incremental_indicators")
+
+_NAN = float("nan")
+
+# calculate_indicators refuses to score with fewer bars than this (EMA-50).
+MIN_BARS = 51
+
+# Candles per scan-loop window (nija_core_loop._CANDLE_WINDOW).
+DEFAULT_WINDOW = 200
+
+# Trailing snapshot entries restated on the current window (entry scoring
+# reads up to ``.iloc[-4]``).
+RESTATED_BARS = 8
+
+
+def _default_history() -> int:
+    try:
+        return max(3, int(os.environ.get("NIJA_INCREMENTAL_INDICATOR_HISTORY", "64")))
+    except (TypeError, ValueError):
+        return 64
+
+
+def incremental_indicators_enabled() -> bool:
+    """Whether the scan phase feeds indicators through the per-symbol engines."""
+    value = str(os.environ.get("NIJA_INCREMENTAL_INDICATORS_ENABLED", "true")).strip().lower()
+    return value in {"1", "true", "yes", "on", "enabled", "y"}
+
+
+class _RollingMean:
+    """Fixed-window mean with pandas ``rolling(window, min_periods=window)`` semantics.
+
+    A NaN anywhere in the window yields NaN, exactly as pandas does.  The
+    running sum is rebuilt from the window once per ``window`` evictions so
+    floating-point drift stays bounded without giving up O(1) updates.
+    """
+
+    __slots__ = ("window", "_values", "_sum", "_nan_count", "_since_resum")
+
+    def __init__(self, window: int) -> None:
+        self.window = int(window)
+        self._values: Deque[float] = deque()
+        self._sum = 0.0
+        self._nan_count = 0
+        self._since_resum = 0
+
+    def push(self, value: float) -> float:
+        if math.isnan(value):
+            self._nan_count += 1
+        else:
+            self._sum += value
+        self._values.append(value)
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            if math.isnan(old):
+                self._nan_count -= 1
+            else:
+                self._sum -= old
+            self._since_resum += 1
+            if self._since_resum >= self.window:
+                self._since_resum = 0
+                self._sum = math.fsum(v for v in self._values if not math.isnan(v))
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if len(self._values) < self.window or self._nan_count:
+            return _NAN
+        return self._sum / self.window
+
+
+class _Ema:
+    """``Series.ewm(span=span, adjust=False).mean()`` one value at a time."""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, span: int) -> None:
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = _NAN
+
+    def push(self, x: float) -> float:
+        if math.isnan(self.value):
+            self.value = x
+        else:
+            self.value = self.alpha * x + (1.0 - self.alpha) * self.value
+        return self.value
+
+    def drop(self, dropped: float, first: float, length: int) -> None:
+        """Re-seed at the next bar after the first one (*dropped*) leaves.
+
+        *first* is the new first value and *length* the number of values
+        left in the window; the seed's weight has decayed by ``(1-a)^length``.
+        """
+        self.value += (1.0 - self.alpha) ** length * (first - dropped)
+
+
+def _seed_shift_weight(r: float, q: float, b: float, length: int) -> float:
+    """Effect on an EMA(q) of a unit re-seed shift that decays as ``r^j`` in its input.
+
+    ``q^(L-1)·r + b·Σ_{j=2..L} q^(L-j)·r^j``, in closed form.
+    """
+    if length < 1:
+        return 0.0
+    if abs(q - r) < 1e-12:
+        tail = (length - 1) * q ** (length - 2) * r * r if length >= 2 else 0.0
+    else:
+        tail = r * r * (q ** (length - 1) - r ** (length - 1)) / (q - r)
+    return q ** (length - 1) * r + b * tail
+
+
+class _Ffill:
+    """Forward-fill with an initial fill value (``.ffill().fillna(fill)``)."""
+
+    __slots__ = ("fill", "value")
+
+    def __init__(self, fill: float) -> None:
+        self.fill = fill
+        self.value = fill
+
+    def push(self, x: float) -> float:
+        if not math.isnan(x):
+            self.value = x
+        return self.value
+
+
+class IncrementalIndicators:
+    """Per-symbol running indicator state updated one closed bar at a time."""
+
+    SERIES_KEYS = (
+        "vwap", "rsi", "ema_9", "ema_21", "ema_50",
+        "macd_line", "signal_line", "histogram",
+        "atr", "adx", "plus_di", "minus_di",
+    )
+
+    def __init__(
+        self,
+        rsi_period: int = 14,
+        atr_period: int = 14,
+        adx_period: int = 14,
+        volume_window: int = 20,
+        window: Optional[int] = DEFAULT_WINDOW,
+        history: Optional[int] = None,
+    ) -> None:
+        self.rsi_period = rsi_period
+        self.atr_period = atr_period
+        self.adx_period = adx_period
+        self.volume_window = volume_window
+        self.window = window
+        self.history = history or _default_history()
+        # Serialises sync() — scans of one venue from several accounts share an engine.
+        self._sync_lock = threading.Lock()
+        self.reset()
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def reset(self) -> None:
+        """Drop all state; the next bar is treated as the first one."""
+        self.bar_count = 0
+        self.last_timestamp: Optional[Hashable] = None
+        self._prev_close = _NAN
+        self._prev_high = _NAN
+        self._prev_low = _NAN
+
+        # Trailing window of (timestamp, close, p*q, q) and the VWAP sums over it
+        self._window_bars: Deque[tuple] = deque()
+        self._drops = 0
+        self._cum_pv = 0.0
+        self._cum_v = 0.0
+        self._vwap_ffill = _NAN
+
+        self._gain = _RollingMean(self.rsi_period)
+        self._loss = _RollingMean(self.rsi_period)
+        self._rsi = _Ffill(50.0)
+
+        self._ema_9 = _Ema(9)
+        self._ema_21 = _Ema(21)
+        self._ema_50 = _Ema(50)
+        self._ema_12 = _Ema(12)
+        self._ema_26 = _Ema(26)
+        self._macd_signal = _Ema(9)
+
+        self._atr_tr = _RollingMean(self.atr_period)
+        self._atr = _Ffill(0.0)
+
+        self._adx_tr = _RollingMean(self.adx_period)
+        self._plus_dm = _RollingMean(self.adx_period)
+        self._minus_dm = _RollingMean(self.adx_period)
+        self._dx = _RollingMean(self.adx_period)
+        self._adx = _Ffill(0.0)
+        self._plus_di = _Ffill(0.0)
+        self._minus_di = _Ffill(0.0)
+
+        self._volume_mean = _RollingMean(self.volume_window)
+
+        self._index: Deque[Hashable] = deque(maxlen=self.history)
+        self._series: Dict[str, Deque[float]] = {
+            key: deque(maxlen=self.history) for key in self.SERIES_KEYS
+        }
+        # Raw bars needed by the scoring rules (current/prev close, 3 volumes)
+        self._bars: Deque[tuple] = deque(maxlen=3)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update(
+        self,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        timestamp: Optional[Hashable] = None,
+    ) -> None:
+        """Fold one closed bar into every running indicator."""
+        o, h, l, c, v = float(open_), float(high), float(low), float(close), float(volume)
+        prev_close = self._prev_close
+        first = self.bar_count == 0
+        key = timestamp if timestamp is not None else self.bar_count
+
+        # ── VWAP sums ─────────────────────────────────────────────────
+        typical = (h + l + c) / 3.0
+        self._cum_pv += typical * v
+        self._cum_v += v
+        if self.window:
+            self._window_bars.append((key, c, typical * v, v))
+
+        # ── RSI (simple rolling means of gains / losses) ──────────────
+        if first:
+            gain = loss = _NAN
+        else:
+            delta = c - prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+        avg_gain = self._gain.push(gain)
+        avg_loss = self._loss.push(loss)
+        if math.isnan(avg_gain) or math.isnan(avg_loss):
+            raw_rsi = _NAN
+        elif avg_loss == 0:
+            raw_rsi = _NAN if avg_gain == 0 else 100.0
+        else:
+            raw_rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        rsi = self._rsi.push(raw_rsi)
+
+        # ── EMAs and MACD ─────────────────────────────────────────────
+        self._ema_9.push(c)
+        self._ema_21.push(c)
+        self._ema_50.push(c)
+        self._macd_signal.push(self._ema_12.push(c) - self._ema_26.push(c))
+
+        # ── Trailing window: drop the oldest bar, re-seed at the next ─
+        while self.window and len(self._window_bars) > self.window:
+            self._drop_oldest()
+
+        windowed = self._windowed_values(c)
+
+        # ── ATR / ADX ─────────────────────────────────────────────────
+        if first:
+            tr = _NAN
+            plus_dm = minus_dm = 0.0
+        else:
+            tr = max(h - l, abs(h - prev_close), abs(l - prev_close))
+            up_move = h - self._prev_high
+            down_move = self._prev_low - l
+            plus_dm = up_move if (up_move > 0 and up_move >= down_move) else 0.0
+            minus_dm = down_move if (down_move > 0 and down_move > up_move) else 0.0
+        atr = self._atr.push(self._atr_tr.push(tr))
+
+        adx_atr = self._adx_tr.push(tr)
+        plus_mean = self._plus_dm.push(plus_dm)
+        minus_mean = self._minus_dm.push(minus_dm)
+        raw_plus_di = _safe_div(100.0 * plus_mean, adx_atr)
+        raw_minus_di = _safe_div(100.0 * minus_mean, adx_atr)
+        raw_dx = _safe_div(100.0 * abs(raw_plus_di - raw_minus_di), raw_plus_di + raw_minus_di)
+        adx = self._adx.push(self._dx.push(raw_dx))
+        plus_di = self._plus_di.push(raw_plus_di)
+        minus_di = self._minus_di.push(raw_minus_di)
+
+        self._volume_mean.push(v)
+
+        # ── Bookkeeping ───────────────────────────────────────────────
+        self._prev_close, self._prev_high, self._prev_low = c, h, l
+        self.bar_count += 1
+        self.last_timestamp = key
+        self._index.append(self.last_timestamp)
+        self._bars.append((o, h, l, c, v))
+        for key, value in (
+            *windowed.items(), ("rsi", rsi),
+            ("atr", atr), ("adx", adx), ("plus_di", plus_di), ("minus_di", minus_di),
+        ):
+            self._series[key].append(value)
+
+    def _windowed_values(self, close: float) -> Dict[str, float]:
+        """VWAP, EMA and MACD values over the current window."""
+        raw_vwap = self._cum_pv / self._cum_v if self._cum_v != 0 else _NAN
+        if not math.isnan(raw_vwap) and not math.isinf(raw_vwap):
+            self._vwap_ffill = raw_vwap
+        macd_line = self._ema_12.value - self._ema_26.value
+        return {
+            "vwap": close if math.isnan(self._vwap_ffill) else self._vwap_ffill,
+            "ema_9": self._ema_9.value,
+            "ema_21": self._ema_21.value,
+            "ema_50": self._ema_50.value,
+            "macd_line": macd_line,
+            "signal_line": self._macd_signal.value,
+            "histogram": macd_line - self._macd_signal.value,
+        }
+
+    def _drop_oldest(self) -> None:
+        """Remove the first bar of the window in O(1).
+
+        The EMAs are re-seeded at the new first bar (see :meth:`_Ema.drop`).
+        MACD's signal line is an EMA of the MACD line, whose every value moves
+        by ``d·(r12^j - r26^j)`` when the seed shifts by ``d``; that change is
+        a pair of geometric sums, applied via :func:`_seed_shift_weight`.
+        """
+        _, dropped, old_pv, old_v = self._window_bars.popleft()
+        first = self._window_bars[0][1]
+        length = len(self._window_bars)
+        self._cum_pv -= old_pv
+        self._cum_v -= old_v
+        self._drops += 1
+        if self._drops % self.window == 0:
+            self._cum_pv = math.fsum(bar[2] for bar in self._window_bars)
+            self._cum_v = math.fsum(bar[3] for bar in self._window_bars)
+
+        shift = first - dropped
+        for ema in (self._ema_9, self._ema_21, self._ema_50):
+            ema.drop(dropped, first, length)
+        r_fast = 1.0 - self._ema_12.alpha
+        r_slow = 1.0 - self._ema_26.alpha
+        signal = self._macd_signal
+        q = 1.0 - signal.alpha
+        # Before the shift the line's second value is -(r_fast - r_slow)·shift
+        # (both EMAs start at the dropped close); re-seeding the signal there
+        # and moving the whole line gives:
+        signal.value += (
+            -(q ** length) * (r_fast - r_slow) * shift
+            + shift * (_seed_shift_weight(r_fast, q, signal.alpha, length)
+                       - _seed_shift_weight(r_slow, q, signal.alpha, length))
+        )
+        self._ema_12.drop(dropped, first, length)
+        self._ema_26.drop(dropped, first, length)
+
+    def update_bar(self, bar: Mapping[str, Any], timestamp: Optional[Hashable] = None) -> None:
+        """Convenience wrapper accepting a dict / DataFrame row."""
+        self.update(
+            bar["open"], bar["high"], bar["low"], bar["close"], bar["volume"],
+            timestamp=timestamp if timestamp is not None else bar.get("timestamp"),
+        )
+
+    def sync(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Feed the bars of *df* not yet seen and return :meth:`snapshot`.
+
+        The window is set to ``len(df)``, so the result equals
+        ``calculate_indicators(df)``.  Bars are matched on the frame index (or
+        a ``timestamp``/``time`` column when the index is a plain range); a
+        plain range with no such column is matched on the OHLCV values of the
+        last bars seen.  If the last seen bar is not in *df* — a gap, a
+        restart, or a different symbol — or the window does not start where
+        *df* does, the engine resets and reseeds from the whole frame, so
+        results never silently diverge from the pandas path.
+        """
+        if df is None or len(df) == 0:
+            return self.snapshot()
+        with self._sync_lock:
+            return self._sync(df)
+
+    def _sync(self, df: pd.DataFrame) -> Dict[str, Any]:
+        keys = _frame_keys(df)
+        positional = isinstance(keys, pd.RangeIndex)
+        self.window = len(df)
+        start = 0
+        cols = df[["open", "high", "low", "close", "volume"]].to_numpy(dtype=float)
+        if self.bar_count:
+            if positional:
+                # Positions shift as the window slides — find the bars by value.
+                pos = self._find_last_bars(cols)
+            else:
+                try:
+                    pos = keys.get_loc(self.last_timestamp)
+                except (KeyError, TypeError, ValueError):
+                    pos = None
+            if isinstance(pos, (int, np.integer)):
+                start = int(pos) + 1
+            else:
+                logger.debug("incremental indicators: last bar not in frame — reseeding")
+                self.reset()
+        for i in range(start, len(df)):
+            o, h, l, c, v = cols[i]
+            self.update(o, h, l, c, v, timestamp=keys[i])
+        if len(self._window_bars) > self.window:
+            # Narrower frame than the last one: trim and restate the latest bar.
+            while len(self._window_bars) > self.window:
+                self._drop_oldest()
+            for key, value in self._windowed_values(self._prev_close).items():
+                self._series[key][-1] = value
+        if start and not self._window_starts_at(keys[0], cols[0], positional):
+            logger.debug("incremental indicators: window does not start at the frame — reseeding")
+            self.reset()
+            for i in range(len(df)):
+                o, h, l, c, v = cols[i]
+                self.update(o, h, l, c, v, timestamp=keys[i])
+        if positional:
+            # Label the kept history with this frame's positions.
+            self.last_timestamp = len(df) - 1
+            self._index = deque(range(len(df) - len(self._index), len(df)), maxlen=self.history)
+        return self.snapshot()
+
+    def _find_last_bars(self, cols: np.ndarray) -> Optional[int]:
+        """Position in *cols* of the last bar seen, matching the bars before it too."""
+        seen = np.array(self._bars, dtype=float)
+        n = len(seen)
+        for pos in range(len(cols) - 1, n - 2, -1):
+            if np.array_equal(cols[pos - n + 1:pos + 1], seen):
+                return pos
+        return None
+
+    def _window_starts_at(self, key: Hashable, bar: np.ndarray, positional: bool = False) -> bool:
+        if len(self._window_bars) != self.window:
+            return False
+        first_key, close, _, volume = self._window_bars[0]
+        if positional:
+            return bool(close == bar[3] and volume == bar[4])
+        try:
+            return bool(first_key == key)
+        except (TypeError, ValueError):
+            return False
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def last(self, key: str) -> float:
+        """Latest value of one series (``NaN`` before the first bar)."""
+        values = self._series[key]
+        return values[-1] if values else _NAN
+
+    def _restated_tail(self, depth: int) -> Dict[str, List[float]]:
+        """VWAP, EMA and MACD values of the last *depth* bars on the current window.
+
+        Each EMA step ``e_t = a·x_t + (1-a)·e_{t-1}`` is inverted to walk back
+        from the current state, and the VWAP sums drop one bar at a time.
+        """
+        emas = {"ema_9": self._ema_9, "ema_21": self._ema_21, "ema_50": self._ema_50,
+                "ema_12": self._ema_12, "ema_26": self._ema_26}
+        values = {key: ema.value for key, ema in emas.items()}
+        signal, sig_alpha = self._macd_signal.value, self._macd_signal.alpha
+        cum_pv, cum_v = self._cum_pv, self._cum_v
+        vwap = list(self._series["vwap"])[-depth:] if depth else []
+        tail: Dict[str, List[float]] = {
+            key: [] for key in ("ema_9", "ema_21", "ema_50", "macd_line", "signal_line", "histogram")
+        }
+        bars = list(self._window_bars)[-depth:] if depth else []
+        for step, (_, close, pv, volume) in enumerate(reversed(bars)):
+            macd_line = values["ema_12"] - values["ema_26"]
+            tail["ema_9"].append(values["ema_9"])
+            tail["ema_21"].append(values["ema_21"])
+            tail["ema_50"].append(values["ema_50"])
+            tail["macd_line"].append(macd_line)
+            tail["signal_line"].append(signal)
+            tail["histogram"].append(macd_line - signal)
+            raw_vwap = cum_pv / cum_v if cum_v != 0 else _NAN
+            if math.isfinite(raw_vwap):
+                vwap[-1 - step] = raw_vwap
+            signal = (signal - sig_alpha * macd_line) / (1.0 - sig_alpha)
+            for key, ema in emas.items():
+                values[key] = (values[key] - ema.alpha * close) / (1.0 - ema.alpha)
+            cum_pv -= pv
+            cum_v -= volume
+        restated = {key: column[::-1] for key, column in tail.items()}
+        restated["vwap"] = vwap
+        return restated
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the ``calculate_indicators`` dict for the latest bar."""
+        bars = len(self._window_bars) if self.window else self.bar_count
+        if bars < MIN_BARS:
+            return {
+                "vwap": None,
+                "rsi": None,
+                "rsi_prev": None,
+                "ema_9": None,
+                "ema_21": None,
+                "ema_50": None,
+                "macd_line": None,
+                "signal_line": None,
+                "histogram": None,
+                "buy_signal": False,
+                "sell_signal": False,
+                "no_trade_zone": False,
+                "no_trade_reason": None,
+                "entry_conditions": {}
+            }
+
+        index = pd.Index(list(self._index))
+        columns = {key: np.array(values, dtype=float) for key, values in self._series.items()}
+        if self.window:
+            for key, tail in self._restated_tail(min(RESTATED_BARS, len(index))).items():
+                columns[key][len(index) - len(tail):] = tail
+        series = {key: pd.Series(values, index=index) for key, values in columns.items()}
+        rsi_values = self._series["rsi"]
+        current_rsi, prev_rsi = rsi_values[-1], rsi_values[-2]
+        (_, _, _, prev3_close, prev3_volume), (_, _, _, prev_close, prev_volume), bar = self._bars
+        o, h, l, c, v = bar
+
+        is_no_trade, reason = _no_trade_zone_from_values(
+            current_rsi, v, h, l, o, c, self._volume_mean.value,
+        )
+        signals = _score_entry_conditions(
+            current_price=c,
+            prev_price=prev_close,
+            current_rsi=current_rsi,
+            prev_rsi=prev_rsi,
+            current_volume=v,
+            prev_2_volume=prev_volume + prev3_volume,
+            vwap=self.last("vwap"),
+            ema_9=self.last("ema_9"),
+            ema_21=self.last("ema_21"),
+            ema_50=self.last("ema_50"),
+        )
+        return {
+            **series,
+            "rsi_prev": prev_rsi,
+            "no_trade_zone": is_no_trade,
+            "no_trade_reason": reason,
+            **signals,
+        }
+
+
+def _safe_div(num: float, den: float) -> float:
+    """pandas float division: x/0 → ±inf, 0/0 → NaN, NaN propagates."""
+    if math.isnan(num) or math.isnan(den):
+        return _NAN
+    if den == 0:
+        if num == 0:
+            return _NAN
+        return math.copysign(math.inf, num)
+    return num / den
+
+
+def _frame_keys(df: pd.DataFrame) -> pd.Index:
+    """Stable per-bar keys: a datetime-like index or a timestamp column."""
+    if not isinstance(df.index, pd.RangeIndex):
+        return df.index
+    for col in ("timestamp", "time", "start"):
+        if col in df.columns:
+            return pd.Index(df[col])
+    return df.index
+
+
+# ---------------------------------------------------------------------------
+# Per-symbol registry
+# ---------------------------------------------------------------------------
+
+_ENGINES: Dict[Tuple[str, str], IncrementalIndicators] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def get_incremental_indicators(
+    symbol: str, broker: Optional[str] = None, **kwargs: Any
+) -> IncrementalIndicators:
+    """Return (creating on first use) the engine for *symbol* on *broker*.
+
+    The same symbol on two venues has two candle streams, so engines are
+    keyed by ``(broker, symbol)``.
+    """
+    key = (str(broker or ""), symbol)
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            engine = IncrementalIndicators(**kwargs)
+            _ENGINES[key] = engine
+        return engine
+
+
+def drop_incremental_indicators(
+    symbols: Optional[List[str]] = None, broker: Optional[str] = None
+) -> None:
+    """Forget engines for *symbols* (all symbols when ``None``).
+
+    With *broker*, only that broker's engines are dropped.
+    """
+    with _ENGINES_LOCK:
+        for key in list(_ENGINES):
+            venue, symbol = key
+            if broker is not None and venue != str(broker):
+                continue
+            if symbols is None or symbol in symbols:
+                del _ENGINES[key]
@@ -60,7 +60,7 @@ import random
 import threading
 import traceback
 from contextlib import contextmanager
-from typing import Dict, Iterator, List, Optional, Set
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set
 from datetime import datetime
 
 # Import BrokerType for connection order enforcement
@@ -160,6 +160,16 @@ except ImportError:
     except ImportError:
         get_user_risk_manager = None  # type: ignore
 
+# Bar-close scheduler — scan loops wake when a candle seals, not on fixed sleeps
+try:
+    from bot.bar_close_scheduler import get_bar_close_scheduler, scheduler_enabled
+except ImportError:
+    try:
+        from bar_close_scheduler import get_bar_close_scheduler, scheduler_enabled  # type: ignore
+    except ImportError:
+        get_bar_close_scheduler = None  # type: ignore
+        scheduler_enabled = None  # type: ignore
+
 logger = logging.getLogger("nija.independent_trader")
 
 # Minimum balance required for active trading
@@ -180,6 +190,13 @@ USER_LOOP_SLEEP_S = 150.0
 FATAL_LOOP_BACKOFF_S = 5.0
 USER_FATAL_LOOP_BACKOFF_S = 60.0
 
+
+class PlatformCycleOutcome(NamedTuple):
+    """Result of one platform scan cycle."""
+
+    next_sleep: float
+    completed: bool = False  # True only when the trading cycle itself ran to completion
+
 # Error message truncation length for health status tracking
 MAX_ERROR_MESSAGE_LENGTH = 100  # Maximum length for error messages stored in health status
 KRAKEN_BROKER_TYPE_NAME = "kraken"
@@ -1016,8 +1033,12 @@ class IndependentBrokerTrader:
         logger.info("")
         return True
 
-    def _run_platform_cycle(self, broker_type, broker, broker_name: str, cycle_count: int) -> float:
-        """Run exactly one platform broker scan cycle and return the next sleep interval."""
+    def _run_platform_cycle(self, broker_type, broker, broker_name: str, cycle_count: int) -> PlatformCycleOutcome:
+        """Run exactly one platform broker scan cycle.
+
+        Returns the next sleep interval, flagged ``completed`` only when the
+        trading cycle itself ran (not on a retry / backoff path).
+        """
         authority_ok, authority_reason = self._require_exact_cycle_authority(
             "independent_broker_trader.platform_scan"
         )
@@ -1028,7 +1049,7 @@ class IndependentBrokerTrader:
                 cycle_count,
                 authority_reason,
             )
-            return 5.0
+            return PlatformCycleOutcome(5.0)
 
         with self._scan_guard(broker_name, cycle_count):
             logger.critical(
@@ -1048,7 +1069,7 @@ class IndependentBrokerTrader:
                         f"(errors={error_count}) → retrying in {delay:.0f}s "
                         f"(call failure_manager.revive_broker('{broker_name}') to re-enable)"
                     )
-                    return delay
+                    return PlatformCycleOutcome(delay)
 
                 if self.broker_failure_manager and self.broker_failure_manager.is_dead(broker_name):
                     retry_delay = self.broker_failure_manager.get_retry_delay(broker_name)
@@ -1067,7 +1088,7 @@ class IndependentBrokerTrader:
                             logger.warning(f"⚠️  {broker_name}: reconnect failed — will retry next cycle")
                     except Exception as reconnect_err:
                         logger.warning(f"⚠️  {broker_name}: reconnect raised: {reconnect_err}")
-                    return retry_delay
+                    return PlatformCycleOutcome(retry_delay)
 
                 if self.multi_account_manager and not self.multi_account_manager.is_platform_connected(broker_type):
                     if getattr(broker, 'connected', False):
@@ -1079,8 +1100,8 @@ class IndependentBrokerTrader:
                         self.update_broker_health(broker_name, 'degraded', 'Platform not connected')
                         if self.failure_manager:
                             self.failure_manager.record_error(broker_name, 'Platform not connected')
-                            return self.failure_manager.get_retry_delay(broker_name)
-                        return 30.0
+                            return PlatformCycleOutcome(self.failure_manager.get_retry_delay(broker_name))
+                        return PlatformCycleOutcome(30.0)
 
             with self._phase_marker(broker_name, cycle_count, "PHASE2"):
                 try:
@@ -1099,8 +1120,8 @@ class IndependentBrokerTrader:
                     )
                     if self.failure_manager:
                         self.failure_manager.record_error(broker_name, str(balance_err)[:80])
-                        return self.failure_manager.get_retry_delay(broker_name)
-                    return 30.0
+                        return PlatformCycleOutcome(self.failure_manager.get_retry_delay(broker_name))
+                    return PlatformCycleOutcome(30.0)
 
                 if balance < MINIMUM_FUNDED_BALANCE:
                     logger.warning(
@@ -1108,7 +1129,7 @@ class IndependentBrokerTrader:
                         f"(min: ${MINIMUM_FUNDED_BALANCE:.2f}) — waiting 60s before recheck"
                     )
                     self.update_broker_health(broker_name, 'degraded', f'Underfunded: ${balance:.2f}')
-                    return 60.0
+                    return PlatformCycleOutcome(60.0)
 
             with self._phase_marker(broker_name, cycle_count, "PHASE3"):
                 try:
@@ -1117,17 +1138,17 @@ class IndependentBrokerTrader:
                         broker_type, broker, broker_name, cycle_count, balance
                     )
                     if not executed:
-                        return 5.0
+                        return PlatformCycleOutcome(5.0)
                     elapsed = time.time() - start_time
                     logger.info(f"✅ {broker_name.upper()} cycle completed in {elapsed:.2f}s")
                     if self.failure_manager:
                         self.failure_manager.record_success(broker_name)
                     logger.info(f"   {broker_name}: Next cycle in {PLATFORM_LOOP_SLEEP_S:.0f}s...")
-                    return PLATFORM_LOOP_SLEEP_S
+                    return PlatformCycleOutcome(PLATFORM_LOOP_SLEEP_S, completed=True)
                 except Exception as exc:
                     if self._is_kraken_broker_type(broker_type) and self._is_nonce_error(exc):
                         resync_ok = self._attempt_kraken_nonce_resync(broker_name, broker)
-                        return 5.0 if resync_ok else 15.0
+                        return PlatformCycleOutcome(5.0 if resync_ok else 15.0)
 
                     if self.isolation_manager and FailureType:
                         error_str = str(exc).lower()
@@ -1183,7 +1204,19 @@ class IndependentBrokerTrader:
                         f"[#{error_count}] → {exc} | retry in {delay:.0f}s",
                         exc_info=True,
                     )
-                    return delay
+                    return PlatformCycleOutcome(delay)
+
+    @staticmethod
+    def _get_bar_scheduler():
+        """Bar-close scheduler for the scan loops, or None for fixed sleeps (opt-in: NIJA_BAR_CLOSE_SCHEDULER=1).
+
+        Loops never wait on it longer than their fixed interval: a bar close
+        can pull a scan earlier, but exits and position management keep
+        their usual cadence.
+        """
+        if get_bar_close_scheduler is None or not scheduler_enabled():
+            return None
+        return get_bar_close_scheduler()
 
     def run_broker_trading_loop(self, broker_type, broker, stop_flag: threading.Event):
         """
@@ -1203,11 +1236,18 @@ class IndependentBrokerTrader:
 
         logger.info(f"🚀 Starting independent trading loop for {broker_name}")
 
-        startup_delay = STARTUP_DELAY_MIN + random.uniform(0, STARTUP_DELAY_MAX - STARTUP_DELAY_MIN)
-        logger.info(f"   ⏳ {broker_name}: Waiting {startup_delay:.1f}s before first cycle (prevents rate limiting)...")
-
+        scheduler = self._get_bar_scheduler()
+        tick = None
         try:
-            stop_flag.wait(startup_delay)
+            startup_delay = STARTUP_DELAY_MIN + random.uniform(0, STARTUP_DELAY_MAX - STARTUP_DELAY_MIN)
+            if scheduler is not None:
+                # Lanes get staggered slots after each bar close (prevents rate limiting).
+                scheduler.register(broker_name, broker_name)
+                logger.info(f"   ⏳ {broker_name}: First cycle at the next bar close or in {startup_delay:.1f}s...")
+                tick = scheduler.wait_for_bar(broker_name, stop_flag, timeout=startup_delay)
+            else:
+                logger.info(f"   ⏳ {broker_name}: Waiting {startup_delay:.1f}s before first cycle (prevents rate limiting)...")
+                stop_flag.wait(startup_delay)
             if stop_flag.is_set():
                 logger.info(f"🛑 {broker_name} stopped before first cycle")
                 return
@@ -1225,7 +1265,7 @@ class IndependentBrokerTrader:
                     threading.get_ident(),
                 )
                 try:
-                    next_sleep = self._run_platform_cycle(broker_type, broker, broker_name, cycle_count)
+                    outcome = self._run_platform_cycle(broker_type, broker, broker_name, cycle_count)
                 except Exception as fatal_err:
                     if stop_flag.is_set():
                         break
@@ -1236,13 +1276,24 @@ class IndependentBrokerTrader:
                         fatal_err,
                         exc_info=True,
                     )
-                    next_sleep = FATAL_LOOP_BACKOFF_S
+                    outcome = PlatformCycleOutcome(FATAL_LOOP_BACKOFF_S)
 
+                if tick is not None and outcome.completed:
+                    scheduler.record_decision(tick)
+                tick = None
                 if stop_flag.is_set():
                     break
-                self._log_broker_loop_sleep(broker_name, next_sleep)
-                stop_flag.wait(next_sleep)
+                if scheduler is not None and outcome.completed:
+                    # Completed cycle: next scan on the next sealed bar, or after
+                    # the usual interval if that comes first.  Retries/backoffs
+                    # keep their fixed wait.
+                    tick = scheduler.wait_for_bar(broker_name, stop_flag, timeout=outcome.next_sleep)
+                else:
+                    self._log_broker_loop_sleep(broker_name, outcome.next_sleep)
+                    stop_flag.wait(outcome.next_sleep)
         finally:
+            if scheduler is not None:
+                scheduler.unregister(broker_name)
             self._unregister_broker_loop(broker_name)
             self.broker_threads.pop(broker_name, None)
             logger.info(
@@ -1267,6 +1318,7 @@ class IndependentBrokerTrader:
         if not self._register_broker_loop(broker_name):
             return
 
+        scheduler = self._get_bar_scheduler()
         try:
                 logger.info(f"🚀 {broker_name} (USER) trading loop started")
                 logger.info(
@@ -1295,10 +1347,17 @@ class IndependentBrokerTrader:
                 else:
                     logger.warning(f"   ⚠️  {broker_name}: no platform context — user account has no platform backing")
 
+                tick = None
                 # Random startup delay to prevent all user brokers hitting API at once
                 startup_delay = random.uniform(STARTUP_DELAY_MIN, STARTUP_DELAY_MAX)
-                logger.info(f"   ⏳ {broker_name}: Initial startup delay {startup_delay:.1f}s...")
-                stop_flag.wait(startup_delay)
+                if scheduler is not None:
+                    # Lanes get staggered slots after each bar close.
+                    scheduler.register(broker_name, broker_type.value)
+                    logger.info(f"   ⏳ {broker_name}: First cycle at the next bar close or in {startup_delay:.1f}s...")
+                    tick = scheduler.wait_for_bar(broker_name, stop_flag, timeout=startup_delay)
+                else:
+                    logger.info(f"   ⏳ {broker_name}: Initial startup delay {startup_delay:.1f}s...")
+                    stop_flag.wait(startup_delay)
 
                 if stop_flag.is_set():
                     logger.info(f"🛑 {broker_name} stopped before first cycle")
@@ -1312,6 +1371,7 @@ class IndependentBrokerTrader:
                 while not stop_flag.is_set():
                     try:
                         cycle_count += 1
+                        cycle_completed = False
                         logger.info(f"🔄 {broker_name} (USER) - Cycle #{cycle_count}")
 
                         authority_ok, authority_reason = self._require_exact_cycle_authority(
@@ -1565,6 +1625,7 @@ class IndependentBrokerTrader:
                             }
                             self._log_trading_activity_mismatch_if_needed()
                             logger.info(f"   ✅ {broker_name} (USER) cycle completed successfully")
+                            cycle_completed = True
 
                         except Exception as trading_err:
                             logger.error(f"❌ {broker_name} (USER) trading cycle failed: {trading_err}")
@@ -1617,10 +1678,17 @@ class IndependentBrokerTrader:
                             # Continue to next cycle - don't let one user broker's failure stop everything
                             logger.info(f"   ⚠️  {broker_name} (USER) will retry next cycle")
 
-                        # Wait 150 seconds (2.5 minutes) between cycles
-                        # Use stop_flag.wait() so we can be interrupted for shutdown
-                        logger.info(f"   {broker_name} (USER): Waiting 2.5 minutes until next cycle...")
-                        stop_flag.wait(150)
+                        if tick is not None and cycle_completed:
+                            scheduler.record_decision(tick)
+                        tick = None
+                        if scheduler is not None:
+                            # Next sealed bar, or the usual 150 s if that comes first.
+                            tick = scheduler.wait_for_bar(broker_name, stop_flag, timeout=USER_LOOP_SLEEP_S)
+                        else:
+                            # Wait 150 seconds (2.5 minutes) between cycles
+                            # Use stop_flag.wait() so we can be interrupted for shutdown
+                            logger.info(f"   {broker_name} (USER): Waiting 2.5 minutes until next cycle...")
+                            stop_flag.wait(USER_LOOP_SLEEP_S)
 
                     except Exception as outer_err:
                         # Catch-all for any unexpected errors - ultimate isolation boundary
@@ -1647,6 +1715,8 @@ class IndependentBrokerTrader:
                         # Wait before retry
                         stop_flag.wait(60)
         finally:
+                if scheduler is not None:
+                    scheduler.unregister(broker_name)
                 self._unregister_broker_loop(broker_name)
                 logger.info(f"🛑 {broker_name} (USER) trading loop stopped (total cycles: {locals().get('cycle_count', 0)})")
 
@@ -2352,6 +2422,10 @@ class IndependentBrokerTrader:
                 logger.info(f"   Signaling {broker_name} (USER) to stop...")
                 stop_flag.set()
 
+        scheduler = self._get_bar_scheduler()
+        if scheduler is not None:
+            scheduler.wake()
+
         # Wait for all MASTER threads to finish (with timeout)
         for broker_name, thread in self.broker_threads.items():
             logger.info(f"   Waiting for {broker_name} (PLATFORM) thread to finish...")
@@ -2418,6 +2492,10 @@ class IndependentBrokerTrader:
             summary['active_brokers'] = []
             summary['dead_brokers'] = []
 
+        # Bar close → decision lag per scan loop
+        scheduler = self._get_bar_scheduler()
+        summary['bar_schedule'] = scheduler.metrics() if scheduler is not None else {}
+
         return summary
 
     def log_status_summary(self):
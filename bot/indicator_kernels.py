@@ -0,0 +1,492 @@
+"""
+NIJA Indicator Kernels - Array Implementations
+==============================================
+
+Array kernels behind the pandas wrappers in ``indicators.py``.  Every kernel
+takes float64 NumPy arrays and returns float64 arrays carrying NaN wherever
+the pandas expression it replaces produced NaN (warm-up rows, 0/0); the
+wrappers apply the ``ffill()`` / ``fillna()`` defaults and rebuild the
+Series.  Each indicator used to run 10-25 pandas ``rolling`` / ``ewm`` /
+``shift`` calls, each with its own index alignment and allocation; on the
+200-candle windows the strategies scan, that per-call overhead was most of
+the cost.
+
+Two implementations of every primitive:
+
+* **Numba** — plain loop kernels (``_*_loop``) compiled with ``njit`` when
+  Numba is installed.  This is the only fast path for the Supertrend band
+  recursion, whose branches depend on the previous output.
+* **NumPy** — ``sliding_window_view`` reductions for rolling windows on
+  scan-sized arrays (pandas' own compiled window aggregations, called on
+  the raw array, once ``rows * window`` is large enough that O(rows * window)
+  loses to O(rows)), and a blocked closed form for the ``adjust=False`` EWM
+  recursion.  Supertrend
+  runs its loop over Python floats, which is still ~3x cheaper than the
+  previous per-element NumPy indexing.
+
+Semantics match the pandas code in ``indicators.py``:
+
+* rolling windows use ``min_periods == window`` — any NaN in a window makes
+  that output NaN;
+* rolling std uses ``ddof=1``;
+* ``ewm_mean`` is ``ewm(span=..., adjust=False).mean()``: leading NaNs stay
+  NaN and the recursion is seeded with the first finite value.  Interior
+  NaNs are not expected (``_ensure_numeric`` drops them upstream).
+
+ADX here keeps the repo's SMA smoothing (``rolling().mean()``), not Wilder's
+recursive average, so it vectorises; ``incremental_indicators.py`` matches
+the same convention.
+
+Environment variables (all optional, safe defaults provided):
+    NIJA_INDICATOR_NUMBA   – "0" forces the NumPy kernels even when Numba is
+                             installed (default "1")
+
+Author: NIJA Trading Systems
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger("nija.indicator_kernels")
+
+try:
+    import numba  # type: ignore[import]
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the deployment image
+    numba = None
+    NUMBA_AVAILABLE = False
+
+EPSILON = 1e-6
+
+# Above this many window cells (rows * window) the O(rows * window)
+# sliding-window reductions lose to pandas' O(rows) compiled window
+# aggregations, so the NumPy backend hands long arrays to those instead.
+_PANDAS_WINDOW_CELLS = 262144
+# Likewise for the blocked EWM: past this length the per-block carry chain
+# costs more than pandas' compiled ``ewm``.
+_PANDAS_EWM_ROWS = 65536
+
+
+def _numba_enabled() -> bool:
+    flag = os.getenv("NIJA_INDICATOR_NUMBA", "1").strip().lower()
+    return NUMBA_AVAILABLE and flag not in ("0", "false", "no", "off")
+
+
+def as_array(values) -> np.ndarray:
+    """Return *values* as a contiguous float64 array (no copy when already one)."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+# ---------------------------------------------------------------------------
+# Loop kernels (compiled by Numba when available)
+# ---------------------------------------------------------------------------
+
+
+def _rolling_mean_loop(x, window):
+    n = x.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+    for i in range(window - 1, n):
+        total = 0.0
+        for j in range(i - window + 1, i + 1):
+            total += x[j]
+        out[i] = total / window
+    return out
+
+
+def _rolling_std_loop(x, window):
+    n = x.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+    if window < 2:
+        return out
+    for i in range(window - 1, n):
+        total = 0.0
+        for j in range(i - window + 1, i + 1):
+            total += x[j]
+        mean = total / window
+        ss = 0.0
+        for j in range(i - window + 1, i + 1):
+            ss += (x[j] - mean) * (x[j] - mean)
+        out[i] = math.sqrt(ss / (window - 1))
+    return out
+
+
+def _rolling_min_loop(x, window):
+    n = x.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+    for i in range(window - 1, n):
+        best = x[i]
+        for j in range(i - window + 1, i):
+            v = x[j]
+            if v != v:
+                best = v
+                break
+            if v < best:
+                best = v
+        out[i] = best
+    return out
+
+
+def _rolling_max_loop(x, window):
+    n = x.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+    for i in range(window - 1, n):
+        best = x[i]
+        for j in range(i - window + 1, i):
+            v = x[j]
+            if v != v:
+                best = v
+                break
+            if v > best:
+                best = v
+        out[i] = best
+    return out
+
+
+def _ewm_mean_loop(x, alpha):
+    n = x.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+    start = 0
+    while start < n and x[start] != x[start]:
+        start += 1
+    if start == n:
+        return out
+    prev = x[start]
+    out[start] = prev
+    for i in range(start + 1, n):
+        prev = prev + alpha * (x[i] - prev)
+        out[i] = prev
+    return out
+
+
+def _supertrend_loop(close, raw_upper, raw_lower):
+    n = close.shape[0]
+    fu = raw_upper.copy()
+    fl = raw_lower.copy()
+    for i in range(1, n):
+        # Final upper band only tightens unless price closed above it;
+        # final lower band only rises unless price closed below it.
+        if close[i - 1] <= fu[i - 1]:
+            fu[i] = min(raw_upper[i], fu[i - 1])
+        if close[i - 1] >= fl[i - 1]:
+            fl[i] = max(raw_lower[i], fl[i - 1])
+
+    direction = np.ones(n, dtype=np.int64)
+    line = np.empty(n)
+    if n:
+        line[0] = fl[0]
+    for i in range(1, n):
+        prev = direction[i - 1]
+        if prev == -1 and close[i] > fu[i]:
+            direction[i] = 1
+        elif prev == 1 and close[i] < fl[i]:
+            direction[i] = -1
+        else:
+            direction[i] = prev
+        line[i] = fl[i] if direction[i] == 1 else fu[i]
+    return line, direction
+
+
+# ---------------------------------------------------------------------------
+# NumPy implementations
+# ---------------------------------------------------------------------------
+
+
+def _windowed(x: np.ndarray, window: int, reduce, rolling_method: str) -> np.ndarray:
+    n = x.shape[0]
+    if window < 1 or n < window:
+        return np.full(n, np.nan)
+    if n * window > _PANDAS_WINDOW_CELLS:
+        return getattr(pd.Series(x, copy=False).rolling(window), rolling_method)().to_numpy()
+    out = np.empty(n)
+    out[:window - 1] = np.nan
+    out[window - 1:] = reduce(sliding_window_view(x, window))
+    return out
+
+
+def _rolling_mean_np(x: np.ndarray, window: int) -> np.ndarray:
+    return _windowed(x, window, lambda v: v.mean(axis=1), "mean")
+
+
+def _rolling_std_np(x: np.ndarray, window: int) -> np.ndarray:
+    if window < 2:
+        return np.full(x.shape[0], np.nan)
+    return _windowed(x, window, lambda v: v.std(axis=1, ddof=1), "std")
+
+
+def _rolling_min_np(x: np.ndarray, window: int) -> np.ndarray:
+    return _windowed(x, window, lambda v: v.min(axis=1), "min")
+
+
+def _rolling_max_np(x: np.ndarray, window: int) -> np.ndarray:
+    return _windowed(x, window, lambda v: v.max(axis=1), "max")
+
+
+def _ewm_block_size(decay: float) -> int:
+    # decay**-block must stay far from overflow: keep it below ~1e150.
+    limit = int(345.0 / -math.log(decay))
+    block = 512
+    while block > 8 and block > limit:
+        block //= 2
+    return block
+
+
+def _ewm_mean_np(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Blocked closed form of ``y[i] = y[i-1] + alpha * (x[i] - y[i-1])``.
+
+    Within a block of length B, ``y[k] = d**k * (y0 + alpha * sum_j x[j] * d**-j)``
+    with ``d = 1 - alpha``, so every row of a ``(blocks, B)`` reshape is one
+    cumulative sum.  Only the block carries are chained in Python, one scalar
+    step per B rows.
+    """
+    n = x.shape[0]
+    if n > _PANDAS_EWM_ROWS:
+        return pd.Series(x, copy=False).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    out = np.full(n, np.nan)
+    finite = np.flatnonzero(~np.isnan(x))
+    if finite.size == 0:
+        return out
+    start = int(finite[0])
+    out[start] = x[start]
+    rest = x[start + 1:]
+    m = rest.shape[0]
+    if m == 0:
+        return out
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[start + 1:] = rest
+        return out
+
+    block = _ewm_block_size(decay)
+    blocks = -(-m // block)
+    padded = np.zeros(blocks * block)
+    padded[:m] = rest
+    steps = np.arange(1, block + 1, dtype=np.float64)
+    grow = decay ** -steps
+    shrink = decay ** steps
+    local = padded.reshape(blocks, block)
+    local = np.cumsum(local * grow, axis=1)
+    local *= alpha * shrink
+    # Chain the carries: y_end[b] = decay**B * y_end[b-1] + local[b, -1]
+    tail = local[:, -1].tolist()
+    carry_decay = float(shrink[-1])
+    carries = [0.0] * blocks
+    carry = float(x[start])
+    for b in range(blocks):
+        carries[b] = carry
+        carry = carry_decay * carry + tail[b]
+    local += np.asarray(carries)[:, None] * shrink
+    out[start + 1:] = local.reshape(-1)[:m]
+    return out
+
+
+def _supertrend_py(close: np.ndarray, raw_upper: np.ndarray, raw_lower: np.ndarray):
+    """``_supertrend_loop`` over Python floats (list indexing is far cheaper than ndarray)."""
+    c = close.tolist()
+    ru = raw_upper.tolist()
+    rl = raw_lower.tolist()
+    n = len(c)
+    fu = list(ru)
+    fl = list(rl)
+    for i in range(1, n):
+        if c[i - 1] <= fu[i - 1]:
+            fu[i] = min(ru[i], fu[i - 1])
+        if c[i - 1] >= fl[i - 1]:
+            fl[i] = max(rl[i], fl[i - 1])
+    direction = [1] * n
+    line = [0.0] * n
+    if n:
+        line[0] = fl[0]
+    prev = 1
+    for i in range(1, n):
+        if prev == -1 and c[i] > fu[i]:
+            prev = 1
+        elif prev == 1 and c[i] < fl[i]:
+            prev = -1
+        direction[i] = prev
+        line[i] = fl[i] if prev == 1 else fu[i]
+    return np.asarray(line, dtype=np.float64), np.asarray(direction, dtype=np.int64)
+
+
+# ---------------------------------------------------------------------------
+# Backend selection
+# ---------------------------------------------------------------------------
+
+if _numba_enabled():
+    _jit = numba.njit(cache=True, nogil=True)
+    _rolling_mean = _jit(_rolling_mean_loop)
+    _rolling_std = _jit(_rolling_std_loop)
+    _rolling_min = _jit(_rolling_min_loop)
+    _rolling_max = _jit(_rolling_max_loop)
+    _ewm_mean = _jit(_ewm_mean_loop)
+    _supertrend = _jit(_supertrend_loop)
+    BACKEND = "numba"
+else:
+    _rolling_mean = _rolling_mean_np
+    _rolling_std = _rolling_std_np
+    _rolling_min = _rolling_min_np
+    _rolling_max = _rolling_max_np
+    _ewm_mean = _ewm_mean_np
+    _supertrend = _supertrend_py
+    BACKEND = "numpy"
+
+logger.debug("Indicator kernels backend: %s", BACKEND)
+
+
+# ---------------------------------------------------------------------------
+# Primitives
+# ---------------------------------------------------------------------------
+
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_mean(as_array(x), int(window))
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Sample (ddof=1) rolling standard deviation."""
+    return _rolling_std(as_array(x), int(window))
+
+
+def rolling_min(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_min(as_array(x), int(window))
+
+
+def rolling_max(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_max(as_array(x), int(window))
+
+
+def ewm_mean(x: np.ndarray, span: float) -> np.ndarray:
+    """``Series.ewm(span=span, adjust=False).mean()``."""
+    return _ewm_mean(as_array(x), 2.0 / (float(span) + 1.0))
+
+
+def diff(x: np.ndarray) -> np.ndarray:
+    out = np.empty_like(x)
+    out[:1] = np.nan
+    np.subtract(x[1:], x[:-1], out=out[1:])
+    return out
+
+
+def ffill(x: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs (leading NaNs stay NaN); returns *x* itself when there is nothing to fill."""
+    if x.size == 0:
+        return x
+    mask = np.isnan(x)
+    first = int(mask.argmin())
+    if not mask[first:].any():
+        return x  # no NaN, or only the warm-up rows
+    idx = np.where(mask, 0, np.arange(x.shape[0]))
+    np.maximum.accumulate(idx, out=idx)
+    return x[idx]
+
+
+def fill(x: np.ndarray, value) -> np.ndarray:
+    """``Series.ffill().fillna(value)``; *value* may be a scalar or an array."""
+    out = ffill(x)
+    mask = np.isnan(out)
+    if mask.any():
+        if out is x:
+            out = x.copy()
+        out[mask] = value[mask] if isinstance(value, np.ndarray) else value
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Indicators (raw: NaN where the pandas expression is NaN)
+# ---------------------------------------------------------------------------
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """max(high - low, |high - prev_close|, |low - prev_close|); NaN on the first row."""
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+    tr = high - low
+    np.maximum(tr, np.abs(high - prev_close), out=tr)
+    np.maximum(tr, np.abs(low - prev_close), out=tr)
+    return tr
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    delta = diff(close)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    gain[:1] = np.nan
+    loss[:1] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = rolling_mean(gain, period) / rolling_mean(loss, period)
+        return 100.0 - 100.0 / (1.0 + rs)
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    return rolling_mean(true_range(high, low, close), period)
+
+
+def adx(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return raw ``(adx, plus_di, minus_di)`` with SMA smoothing."""
+    up = diff(high)
+    down = -diff(low)
+    plus_dm = np.where((up > 0) & (up >= down), up, 0.0)
+    minus_dm = np.where((down > 0) & (down > up), down, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_tr = atr(high, low, close, period)
+        plus_di = 100.0 * (rolling_mean(plus_dm, period) / avg_tr)
+        minus_di = 100.0 * (rolling_mean(minus_dm, period) / avg_tr)
+        dx = 100.0 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+    return rolling_mean(dx, period), plus_di, minus_di
+
+
+def bollinger(
+    close: np.ndarray, period: int = 20, std_dev: float = 2
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return raw ``(upper, middle, lower, bandwidth)``."""
+    middle = rolling_mean(close, period)
+    width = rolling_std(close, period) * std_dev
+    upper = middle + width
+    lower = middle - width
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bandwidth = (upper - lower) / middle
+    return upper, middle, lower, bandwidth
+
+
+def stochastic(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, k_period: int = 14, d_period: int = 3
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return raw ``(%K, %D)``."""
+    low_min = rolling_min(low, k_period)
+    high_max = rolling_max(high, k_period)
+    stoch_k = 100.0 * ((close - low_min) / (high_max - low_min + EPSILON))
+    return stoch_k, rolling_mean(stoch_k, d_period)
+
+
+def macd(
+    close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return raw ``(macd_line, signal_line, histogram)``."""
+    line = ewm_mean(close, fast) - ewm_mean(close, slow)
+    signal_line = ewm_mean(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def supertrend(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 10, multiplier: float = 3.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(supertrend_line, direction)``; band width uses the zero-filled ATR."""
+    band = multiplier * fill(atr(high, low, close, period), 0.0)
+    hl2 = (high + low) / 2.0
+    return _supertrend(as_array(close), hl2 + band, hl2 - band)
@@ -2,6 +2,11 @@
 import numpy as np
 import pandas as pd
 
+try:
+    from bot import indicator_kernels as _kernels
+except ImportError:
+    import indicator_kernels as _kernels  # type: ignore[no-redef]
+
 # Division-by-zero guard constant
 # Used throughout to prevent division by zero in indicator calculations
 EPSILON = 1e-6  # Small value to prevent division by zero
@@ -43,7 +48,8 @@ def _ensure_numeric(df: pd.DataFrame, cols) -> pd.DataFrame:
 
     Avoids an unnecessary DataFrame copy when all requested columns are
     already numeric (the common hot path after the APEX strategy normalises
-    candle types to float before computing indicators).
+    candle types to float before computing indicators), and skips the
+    ``dropna`` copy when those columns hold no NaN.
     """
     needs_conversion = any(
         col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
@@ -53,8 +59,17 @@ def _ensure_numeric(df: pd.DataFrame, cols) -> pd.DataFrame:
         df = df.copy()
         for col in cols:
             df[col] = pd.to_numeric(df[col], errors="coerce")
+    elif all(col in df.columns for col in cols) and not any(
+        df[col].isna().to_numpy().any() for col in cols
+    ):
+        return df
     return df.dropna(subset=cols)
 
+
+def _arrays(df: pd.DataFrame, cols):
+    """Columns of an ``_ensure_numeric`` frame as contiguous float64 arrays."""
+    return [_kernels.as_array(df[col].to_numpy(dtype=np.float64)) for col in cols]
+
 def calculate_vwap(df):
     df = _ensure_numeric(df, ['high', 'low', 'close', 'volume'])
     q = df['volume']
@@ -64,16 +79,9 @@ def calculate_vwap(df):
 
 def calculate_rsi(df, period=14):
     df = _ensure_numeric(df, ['close'])
-    delta = df['close'].diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-
-    avg_gain = gain.rolling(window=period, min_periods=period).mean()
-    avg_loss = loss.rolling(window=period, min_periods=period).mean()
-
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi.ffill().fillna(50)
+    close, = _arrays(df, ['close'])
+    rsi = _kernels.rsi(close, period)
+    return pd.Series(_kernels.fill(rsi, 50.0), index=df.index)
 
 
 def calculate_volatility_weighted_rsi_bands(df, rsi_period=14, atr_period=14, adx_period=14,
@@ -112,28 +120,29 @@ def calculate_volatility_weighted_rsi_bands(df, rsi_period=14, atr_period=14, ad
         - normalized_volatility = low → tighter bands (e.g., 68/32 instead of 70/30)
     """
     df = _ensure_numeric(df, ['high', 'low', 'close'])
+    high, low, close = _arrays(df, ['high', 'low', 'close'])
 
     # Calculate base RSI
-    rsi = calculate_rsi(df, period=rsi_period)
+    rsi = _kernels.fill(_kernels.rsi(close, rsi_period), 50.0)
 
     # Calculate ATR for volatility measure
-    atr = calculate_atr(df, period=atr_period)
+    atr = _kernels.fill(_kernels.atr(high, low, close, atr_period), 0.0)
 
     # Calculate ADX for trend strength
-    adx, _, _ = calculate_adx(df, period=adx_period)
+    adx = _kernels.fill(_kernels.adx(high, low, close, adx_period)[0], 0.0)
 
     # Calculate ATR as percentage of price (normalized volatility)
-    current_price = df['close']
-    atr_pct = (atr / current_price) * 100  # Convert to percentage
+    with np.errstate(divide='ignore', invalid='ignore'):
+        atr_pct = (atr / close) * 100  # Convert to percentage
 
     # Normalize ATR percentage to 0-1 range (capping at 10% for extreme cases)
     # Typical crypto ATR%: 1-5%, so we use 5% as midpoint
-    normalized_atr = (atr_pct / 5.0).clip(upper=2.0)  # Normalize around 5% ATR
+    normalized_atr = np.minimum(atr_pct / 5.0, 2.0)  # Normalize around 5% ATR
 
     # Normalize ADX to 0-1 range (inverse - higher ADX = tighter bands)
     # ADX range typically 0-50, we use 25 as midpoint
     # Inverse because strong trend (high ADX) should have TIGHTER bands
-    normalized_adx_inverse = (1.0 - (adx / 50.0).clip(upper=1.0))
+    normalized_adx_inverse = 1.0 - np.minimum(adx / 50.0, 1.0)
 
     # Combine ATR and ADX for composite volatility metric
     # Weight: 60% ATR (volatility), 40% inverse ADX (trend strength)
@@ -141,7 +150,7 @@ def calculate_volatility_weighted_rsi_bands(df, rsi_period=14, atr_period=14, ad
     composite_volatility = (0.6 * normalized_atr + 0.4 * normalized_adx_inverse)
 
     # Ensure minimum volatility to prevent division issues
-    composite_volatility = composite_volatility.clip(lower=EPSILON)
+    composite_volatility = np.maximum(composite_volatility, EPSILON)
 
     # Calculate dynamic band width: rsi_width = base_width * (1 / normalized_volatility)
     # Low volatility (0.5) → narrow bands (base_width * 2.0)
@@ -149,7 +158,7 @@ def calculate_volatility_weighted_rsi_bands(df, rsi_period=14, atr_period=14, ad
     band_width = base_width / composite_volatility
 
     # Clip band width to reasonable range (5-20 points from centerline)
-    band_width = band_width.clip(lower=5, upper=20)
+    band_width = np.clip(band_width, 5, 20)
 
     # Calculate dynamic bands centered at 50
     # Standard: 70/30, but we adjust based on volatility
@@ -158,41 +167,32 @@ def calculate_volatility_weighted_rsi_bands(df, rsi_period=14, atr_period=14, ad
     lower_band = center - band_width
 
     # Ensure bands stay within RSI range (0-100)
-    upper_band = upper_band.clip(upper=95)
-    lower_band = lower_band.clip(lower=5)
+    upper_band = np.minimum(upper_band, 95)
+    lower_band = np.maximum(lower_band, 5)
 
     return (
-        rsi.ffill().fillna(50),
-        upper_band.ffill().fillna(70),
-        lower_band.ffill().fillna(30),
-        band_width.ffill().fillna(base_width)
+        pd.Series(rsi, index=df.index),
+        pd.Series(_kernels.fill(upper_band, 70.0), index=df.index),
+        pd.Series(_kernels.fill(lower_band, 30.0), index=df.index),
+        pd.Series(_kernels.fill(band_width, float(base_width)), index=df.index)
     )
 
 
 def calculate_ema(df, period):
     """Calculate EMA for given period"""
     df = _ensure_numeric(df, ['close'])
-    return df['close'].ewm(span=period, adjust=False).mean().ffill()
+    close, = _arrays(df, ['close'])
+    return pd.Series(_kernels.ffill(_kernels.ewm_mean(close, period)), index=df.index)
 
 def calculate_macd(df, fast=12, slow=26, signal=9):
     df = _ensure_numeric(df, ['close'])
-    exp1 = df['close'].ewm(span=fast, adjust=False).mean()
-    exp2 = df['close'].ewm(span=slow, adjust=False).mean()
-    macd_line = exp1 - exp2
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    histogram = macd_line - signal_line
-    return macd_line.ffill(), signal_line.ffill(), histogram.ffill()
-
-def _true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
-    """Compute True Range using element-wise np.maximum (avoids a temporary DataFrame).
-
-    TR = max(high - low, |high - prev_close|, |low - prev_close|)
-    """
-    prev_close = close.shift()
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
-    return np.maximum(np.maximum(tr1, tr2), tr3)
+    close, = _arrays(df, ['close'])
+    macd_line, signal_line, histogram = _kernels.macd(close, fast, slow, signal)
+    return (
+        pd.Series(_kernels.ffill(macd_line), index=df.index),
+        pd.Series(_kernels.ffill(signal_line), index=df.index),
+        pd.Series(_kernels.ffill(histogram), index=df.index)
+    )
 
 
 def calculate_atr(df, period=14):
@@ -207,9 +207,9 @@ def calculate_atr(df, period=14):
         pandas.Series: ATR values
     """
     df = _ensure_numeric(df, ['high', 'low', 'close'])
-    tr = _true_range(df['high'], df['low'], df['close'])
-    atr = tr.rolling(window=period, min_periods=period).mean()
-    return atr.ffill().fillna(0)
+    high, low, close = _arrays(df, ['high', 'low', 'close'])
+    atr = _kernels.atr(high, low, close, period)
+    return pd.Series(_kernels.fill(atr, 0.0), index=df.index)
 
 def calculate_adx(df, period=14):
     """
@@ -223,33 +223,18 @@ def calculate_adx(df, period=14):
         tuple: (adx, plus_di, minus_di)
     """
     df = _ensure_numeric(df, ['high', 'low', 'close'])
-    high = df['high']
-    low = df['low']
-    close = df['close']
+    high, low, close = _arrays(df, ['high', 'low', 'close'])
 
-    # Calculate raw directional movement
-    up_move = high.diff()
-    down_move = -low.diff()
+    # +DM when the up-move is positive and >= the down-move, -DM when the
+    # down-move is positive and strictly greater; both SMA-smoothed over
+    # `period` and divided by the SMA of True Range (see indicator_kernels.adx).
+    adx, plus_di, minus_di = _kernels.adx(high, low, close, period)
 
-    # Keep +DM only when up-move is positive AND greater than down-move;
-    # keep -DM only when down-move is positive AND strictly greater than up-move.
-    # Using .where() avoids chained boolean-index mutations (SettingWithCopyWarning).
-    plus_dm = up_move.where((up_move > 0) & (up_move >= down_move), other=0.0)
-    minus_dm = down_move.where((down_move > 0) & (down_move > up_move), other=0.0)
-
-    # True Range (reuse shared helper to avoid a temporary DataFrame)
-    tr = _true_range(high, low, close)
-
-    # Smooth the indicators
-    atr = tr.rolling(window=period, min_periods=period).mean()
-    plus_di = 100 * (plus_dm.rolling(window=period, min_periods=period).mean() / atr)
-    minus_di = 100 * (minus_dm.rolling(window=period, min_periods=period).mean() / atr)
-
-    # Calculate DX and ADX
-    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-    adx = dx.rolling(window=period, min_periods=period).mean()
-
-    return adx.ffill().fillna(0), plus_di.ffill().fillna(0), minus_di.ffill().fillna(0)
+    return (
+        pd.Series(_kernels.fill(adx, 0.0), index=df.index),
+        pd.Series(_kernels.fill(plus_di, 0.0), index=df.index),
+        pd.Series(_kernels.fill(minus_di, 0.0), index=df.index)
+    )
 
 def calculate_bollinger_bands(df, period=20, std_dev=2):
     """
@@ -280,26 +265,17 @@ def calculate_bollinger_bands(df, period=20, std_dev=2):
     - Wide bandwidth (> 0.15) indicates high volatility = reduce position size
     """
     df = _ensure_numeric(df, ['close'])
+    close, = _arrays(df, ['close'])
 
-    # Calculate middle band (SMA)
-    middle_band = df['close'].rolling(window=period, min_periods=period).mean()
-
-    # Calculate standard deviation
-    std = df['close'].rolling(window=period, min_periods=period).std()
-
-    # Calculate upper and lower bands
-    upper_band = middle_band + (std * std_dev)
-    lower_band = middle_band - (std * std_dev)
-
-    # Calculate bandwidth (normalized volatility measure)
-    # Bandwidth = (Upper - Lower) / Middle
-    bandwidth = (upper_band - lower_band) / middle_band
+    # Middle band = SMA, upper/lower = SMA +/- std * std_dev (sample std),
+    # bandwidth = (Upper - Lower) / Middle (normalized volatility measure)
+    upper_band, middle_band, lower_band, bandwidth = _kernels.bollinger(close, period, std_dev)
 
     return (
-        upper_band.ffill().fillna(df['close']),
-        middle_band.ffill().fillna(df['close']),
-        lower_band.ffill().fillna(df['close']),
-        bandwidth.ffill().fillna(0)
+        pd.Series(_kernels.fill(upper_band, close), index=df.index),
+        pd.Series(_kernels.fill(middle_band, close), index=df.index),
+        pd.Series(_kernels.fill(lower_band, close), index=df.index),
+        pd.Series(_kernels.fill(bandwidth, 0.0), index=df.index)
     )
 
 def calculate_stochastic(df, k_period=14, d_period=3):
@@ -332,21 +308,16 @@ def calculate_stochastic(df, k_period=14, d_period=3):
     - Works best combined with RSI and Bollinger Bands for confirmation
     """
     df = _ensure_numeric(df, ['high', 'low', 'close'])
+    high, low, close = _arrays(df, ['high', 'low', 'close'])
 
-    # Get rolling highs and lows
-    low_min = df['low'].rolling(window=k_period, min_periods=k_period).min()
-    high_max = df['high'].rolling(window=k_period, min_periods=k_period).max()
-
-    # Calculate %K (fast stochastic)
-    # %K = 100 * (Current Close - Lowest Low) / (Highest High - Lowest Low)
-    # Add EPSILON to denominator to prevent division by zero when range is 0
-    range_diff = high_max - low_min
-    stoch_k = 100 * ((df['close'] - low_min) / (range_diff + EPSILON))
-
-    # Calculate %D (slow stochastic - SMA of %K)
-    stoch_d = stoch_k.rolling(window=d_period, min_periods=d_period).mean()
+    # %K = 100 * (Current Close - Lowest Low) / (Highest High - Lowest Low + EPSILON)
+    # %D = SMA of %K over d_period
+    stoch_k, stoch_d = _kernels.stochastic(high, low, close, k_period, d_period)
 
-    return stoch_k.ffill().fillna(50), stoch_d.ffill().fillna(50)
+    return (
+        pd.Series(_kernels.fill(stoch_k, 50.0), index=df.index),
+        pd.Series(_kernels.fill(stoch_d, 50.0), index=df.index)
+    )
 
 def calculate_vwap_bands(df, std_dev=2):
     """
@@ -436,18 +407,22 @@ def detect_market_regime(df):
             'confidence': 0.0
         }
 
+    # Only the last value of each indicator is needed: run the kernels on the
+    # arrays directly instead of building intermediate Series.
+    hlc = _ensure_numeric(df, ['high', 'low', 'close'])
+    high, low, close_hlc = _arrays(hlc, ['high', 'low', 'close'])
+    close, = _arrays(_ensure_numeric(df, ['close']), ['close'])
+
     # Calculate ADX for trend strength
-    adx, plus_di, minus_di = calculate_adx(df)
-    current_adx = adx.iloc[-1]
+    current_adx = _kernels.fill(_kernels.adx(high, low, close_hlc)[0], 0.0)[-1]
 
     # Calculate Bollinger Bands for volatility
-    bb_upper, bb_middle, bb_lower, bb_width = calculate_bollinger_bands(df)
-    current_bandwidth = bb_width.iloc[-1]
+    current_bandwidth = _kernels.fill(_kernels.bollinger(close)[3], 0.0)[-1]
 
     # Calculate EMAs for trend direction
-    ema_9 = calculate_ema(df, 9)
-    ema_21 = calculate_ema(df, 21)
-    ema_50 = calculate_ema(df, 50)
+    ema_9 = _kernels.ffill(_kernels.ewm_mean(close, 9))[-1]
+    ema_21 = _kernels.ffill(_kernels.ewm_mean(close, 21))[-1]
+    ema_50 = _kernels.ffill(_kernels.ewm_mean(close, 50))[-1]
 
     current_price = df['close'].iloc[-1]
 
@@ -474,9 +449,9 @@ def detect_market_regime(df):
         volatility = 'MEDIUM'
 
     # Determine trend direction
-    if ema_9.iloc[-1] > ema_21.iloc[-1] > ema_50.iloc[-1] and current_price > ema_9.iloc[-1]:
+    if ema_9 > ema_21 > ema_50 and current_price > ema_9:
         trend_direction = 'BULLISH'
-    elif ema_9.iloc[-1] < ema_21.iloc[-1] < ema_50.iloc[-1] and current_price < ema_9.iloc[-1]:
+    elif ema_9 < ema_21 < ema_50 and current_price < ema_9:
         trend_direction = 'BEARISH'
     else:
         trend_direction = 'NEUTRAL'
@@ -735,14 +710,26 @@ def check_no_trade_zones(df, rsi, avg_volume=None):
     current_rsi = rsi.iloc[-1]
     # Batch all last-row column accesses into a single row lookup
     last_row = df.iloc[-1]
-    current_volume = last_row['volume']
-    high = last_row['high']
-    low = last_row['low']
-    open_ = last_row['open']
-    close = last_row['close']
     # Compute avg_volume only when the caller hasn't already done so
     if avg_volume is None:
         avg_volume = df['volume'].rolling(window=20).mean().iloc[-1]
+    return _no_trade_zone_from_values(
+        current_rsi,
+        last_row['volume'],
+        last_row['high'],
+        last_row['low'],
+        last_row['open'],
+        last_row['close'],
+        avg_volume,
+    )
+
+
+def _no_trade_zone_from_values(current_rsi, current_volume, high, low, open_, close, avg_volume):
+    """Scalar core of :func:`check_no_trade_zones`.
+
+    Shared with :mod:`incremental_indicators`, which holds the last bar and
+    the 20-bar volume mean as plain floats rather than a DataFrame.
+    """
     wick_size = max(high - close, close - low)
     body_size = abs(close - open_)
     # Prevent division by zero when candle has no body
@@ -808,14 +795,54 @@ def calculate_indicators(df):
     # Check no-trade zones, passing pre-computed avg_volume to avoid recomputation
     is_no_trade, reason = check_no_trade_zones(df, rsi, avg_volume=avg_volume)
 
+    signals = _score_entry_conditions(
+        current_price=current_price,
+        prev_price=prev_price,
+        current_rsi=current_rsi,
+        prev_rsi=prev_rsi,
+        current_volume=current_volume,
+        prev_2_volume=prev_2_volume,
+        vwap=vwap.iloc[-1],
+        ema_9=ema_9.iloc[-1],
+        ema_21=ema_21.iloc[-1],
+        ema_50=ema_50.iloc[-1],
+    )
+
+    return {
+        "vwap": vwap,
+        "rsi": rsi,
+        "rsi_prev": prev_rsi,
+        "ema_9": ema_9,
+        "ema_21": ema_21,
+        "ema_50": ema_50,
+        "macd_line": macd_line,
+        "signal_line": signal_line,
+        "histogram": hist,
+        "no_trade_zone": is_no_trade,
+        "no_trade_reason": reason,
+        **signals,
+    }
+
+
+def _score_entry_conditions(current_price, prev_price, current_rsi, prev_rsi,
+                            current_volume, prev_2_volume, vwap, ema_9, ema_21, ema_50):
+    """Score the NIJA long/short entry conditions from last-bar scalars.
+
+    Factored out of :func:`calculate_indicators` so the incremental engine in
+    :mod:`incremental_indicators` produces byte-identical signals.
+
+    Returns:
+        dict with buy_signal, sell_signal, long_score, short_score and
+        entry_conditions ({"long": {...}, "short": {...}}).
+    """
     # ═══════════════════════════════════════════════════════════
     # NIJA LONG ENTRY CONDITIONS (Scored 1-5, need 2+ for entry)
     # Multi-Strategy: Momentum Breakout OR Pullback/Mean Reversion
     # ═══════════════════════════════════════════════════════════
 
     # Core trend conditions (must have these for quality)
-    price_above_vwap = current_price > vwap.iloc[-1]
-    ema_bullish = ema_9.iloc[-1] > ema_21.iloc[-1] > ema_50.iloc[-1]
+    price_above_vwap = current_price > vwap
+    ema_bullish = ema_9 > ema_21 > ema_50
 
     # RSI Strategy 1: Momentum (rising RSI)
     rsi_momentum_rising = current_rsi > prev_rsi and current_rsi < 80
@@ -845,8 +872,8 @@ def calculate_indicators(df):
     # ═══════════════════════════════════════════════════════════
 
     # Core trend conditions
-    price_below_vwap = current_price < vwap.iloc[-1]
-    ema_bearish = ema_9.iloc[-1] < ema_21.iloc[-1] < ema_50.iloc[-1]
+    price_below_vwap = current_price < vwap
+    ema_bearish = ema_9 < ema_21 < ema_50
 
     # RSI Strategy 1: Momentum (falling RSI)
     rsi_momentum_falling = current_rsi < prev_rsi and current_rsi > 20
@@ -870,21 +897,10 @@ def calculate_indicators(df):
     sell_signal = short_score >= 3
 
     return {
-        "vwap": vwap,
-        "rsi": rsi,
-        "rsi_prev": prev_rsi,
-        "ema_9": ema_9,
-        "ema_21": ema_21,
-        "ema_50": ema_50,
-        "macd_line": macd_line,
-        "signal_line": signal_line,
-        "histogram": hist,
         "buy_signal": buy_signal,
         "sell_signal": sell_signal,
         "long_score": long_score,
         "short_score": short_score,
-        "no_trade_zone": is_no_trade,
-        "no_trade_reason": reason,
         "entry_conditions": {
             "long": long_conditions,
             "short": short_conditions
@@ -922,10 +938,37 @@ def resample_to_higher_timeframe(df, target_timeframe='5min'):
     return resampled
 
 
+def _cached_multi_timeframe_rsis(df, symbol, current_timeframe, higher_timeframes, rsi_period):
+    """RSI lookups from the shared MultiTimeframeAggregator, or None to fall back to resampling.
+
+    Returns (current_rsi, {htf: rsi or None}); None marks a timeframe with
+    fewer than ``rsi_period + 5`` bars inside *df*, which the resampling
+    path skips as well.
+    """
+    try:
+        from bot.multi_timeframe_aggregator import get_multi_timeframe_aggregator
+    except ImportError:
+        from multi_timeframe_aggregator import get_multi_timeframe_aggregator  # type: ignore[import]
+
+    aggregator = get_multi_timeframe_aggregator()
+    if (aggregator.rsi_period != rsi_period
+            or current_timeframe not in aggregator.timeframes
+            or any(htf not in aggregator.timeframes for htf in higher_timeframes)
+            or not aggregator.sync(symbol, df)):
+        return None
+    first_ts = df.index[0].value / 1e9
+    higher = {}
+    for htf in higher_timeframes:
+        enough = aggregator.bars_since(symbol, htf, first_ts) >= rsi_period + 5
+        higher[htf] = aggregator.rsi(symbol, htf) if enough else None
+    return aggregator.rsi(symbol, current_timeframe), higher
+
+
 def check_multi_timeframe_rsi_agreement(df, current_timeframe='1min',
                                        higher_timeframes=['5min', '15min'],
                                        rsi_period=14,
-                                       agreement_threshold=10):
+                                       agreement_threshold=10,
+                                       symbol=None):
     """
     Check Multi-Timeframe RSI Agreement (GOD MODE+)
 
@@ -943,6 +986,10 @@ def check_multi_timeframe_rsi_agreement(df, current_timeframe='1min',
         higher_timeframes: List of higher timeframes to check (e.g., ['5min', '15min'])
         rsi_period: RSI calculation period (default 14)
         agreement_threshold: RSI difference threshold for alignment (default 10)
+        symbol: Optional symbol key. When given, RSI values come from the shared
+                MultiTimeframeAggregator, which rolls each higher-timeframe bar
+                forward from the new rows of df instead of resampling the whole
+                frame on every call.
 
     Returns:
         dict: {
@@ -964,8 +1011,15 @@ def check_multi_timeframe_rsi_agreement(df, current_timeframe='1min',
         Higher TF (5m): RSI = 65 (overbought, bearish)
         Result: AGREEMENT = False, NO TRADE ALLOWED
     """
+    cached = None
+    if symbol is not None:
+        cached = _cached_multi_timeframe_rsis(df, symbol, current_timeframe, higher_timeframes, rsi_period)
+
     # Calculate RSI for current timeframe
-    current_rsi = calculate_rsi(df, period=rsi_period).iloc[-1]
+    if cached is not None:
+        current_rsi = cached[0]
+    else:
+        current_rsi = calculate_rsi(df, period=rsi_period).iloc[-1]
 
     # Determine current timeframe direction
     # Bullish: RSI < 50 and potentially rising (oversold to neutral)
@@ -983,16 +1037,22 @@ def check_multi_timeframe_rsi_agreement(df, current_timeframe='1min',
 
     for htf in higher_timeframes:
         try:
-            # Resample to higher timeframe
-            htf_df = resample_to_higher_timeframe(df, htf)
+            if cached is not None:
+                # Incremental bar/RSI state: a lookup, None if not enough bars yet
+                htf_rsi = cached[1][htf]
+                if htf_rsi is None:
+                    continue
+            else:
+                # Resample to higher timeframe
+                htf_df = resample_to_higher_timeframe(df, htf)
 
-            # Need enough data for RSI calculation
-            if len(htf_df) < rsi_period + 5:
-                # Not enough data, skip this timeframe
-                continue
+                # Need enough data for RSI calculation
+                if len(htf_df) < rsi_period + 5:
+                    # Not enough data, skip this timeframe
+                    continue
 
-            # Calculate RSI for higher timeframe
-            htf_rsi = calculate_rsi(htf_df, period=rsi_period).iloc[-1]
+                # Calculate RSI for higher timeframe
+                htf_rsi = calculate_rsi(htf_df, period=rsi_period).iloc[-1]
             higher_rsis[htf] = htf_rsi
 
             # Determine higher timeframe direction
@@ -1093,48 +1153,12 @@ def calculate_supertrend(df, period=10, multiplier=3.0):
         - Combine with VWAP below and RSI 40-60 for high-quality short entries
     """
     df = _ensure_numeric(df, ['high', 'low', 'close'])
+    high, low, close = _arrays(df, ['high', 'low', 'close'])
 
-    # Midpoint price (HL/2)
-    hl2 = (df['high'] + df['low']) / 2.0
-
-    # ATR for band width
-    atr = calculate_atr(df, period=period)
-
-    # Raw upper and lower bands
-    raw_upper = hl2 + multiplier * atr
-    raw_lower = hl2 - multiplier * atr
-
-    # Initialise mutable numpy arrays for the iterative band computation
-    n = len(df)
-    close = df['close'].to_numpy(dtype=float)
-    ru = raw_upper.to_numpy(dtype=float)
-    rl = raw_lower.to_numpy(dtype=float)
-    fu = ru.copy()   # writable final upper band
-    fl = rl.copy()   # writable final lower band
-
-    for i in range(1, n):
-        # Final upper band: only tighten (decrease) unless price closes above it
-        fu[i] = min(ru[i], fu[i - 1]) if close[i - 1] <= fu[i - 1] else ru[i]
-        # Final lower band: only rise (increase) unless price closes below it
-        fl[i] = max(rl[i], fl[i - 1]) if close[i - 1] >= fl[i - 1] else rl[i]
-
-    # Determine direction and active supertrend line
-    dir_vals = np.ones(n, dtype=int)
-    st_vals = np.zeros(n, dtype=float)
-
-    for i in range(1, n):
-        prev_dir = dir_vals[i - 1]
-        if prev_dir == -1 and close[i] > fu[i]:
-            dir_vals[i] = 1   # Flip to bullish
-        elif prev_dir == 1 and close[i] < fl[i]:
-            dir_vals[i] = -1  # Flip to bearish
-        else:
-            dir_vals[i] = prev_dir
-
-        st_vals[i] = fl[i] if dir_vals[i] == 1 else fu[i]
-
-    # Seed first value
-    st_vals[0] = fl[0] if dir_vals[0] == 1 else fu[0]
+    # Raw bands = HL/2 +/- multiplier * ATR; the final bands only move with
+    # the trend and the direction flips when close crosses the opposite band.
+    # The recursion is the Numba-compiled loop when Numba is installed.
+    st_vals, dir_vals = _kernels.supertrend(high, low, close, period, multiplier)
 
     supertrend_series = pd.Series(st_vals, index=df.index).ffill()
     direction_series = pd.Series(dir_vals, index=df.index)
@@ -0,0 +1,212 @@
+"""
+NIJA KPI Journal
+
+Append-only storage for KPI history plus the O(1) running risk statistics
+the KPI tracker needs, so an update costs one appended JSON line instead of
+re-serialising the whole account history.
+
+Layout (per data directory):
+    kpi_trades.jsonl      one closed trade per line          (append-only, full history)
+    kpi_equity.jsonl      one balance/equity point per line  (append-only, full history)
+    kpi_snapshots.jsonl   one KPI snapshot per line          (append-only, full history)
+    kpi_checkpoint.json   compact aggregate state + in-RAM windows + the byte
+                          offset of each log it covers (atomic replace)
+
+Loading = read the checkpoint, then replay only the log lines written after
+its offsets.  A torn last line (crash mid-write) is dropped on open.
+
+Environment variables (all optional, safe defaults provided):
+    NIJA_KPI_STORAGE            – "journal" (default) or "json" (legacy full dump per update)
+    NIJA_KPI_WINDOW             – trades / equity points / snapshots kept in RAM (default 1000)
+    NIJA_KPI_CHECKPOINT_EVERY   – appended records between checkpoints (default 500)
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger("nija.kpi_journal")
+
+DEFAULT_WINDOW = 1000
+DEFAULT_CHECKPOINT_EVERY = 500
+KINDS = ("trades", "equity", "snapshots")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, "") or default)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def storage_mode() -> str:
+    """Configured KPI storage mode: ``"journal"`` or ``"json"``."""
+    mode = os.getenv("NIJA_KPI_STORAGE", "journal").strip().lower()
+    return mode if mode in ("journal", "json") else "journal"
+
+
+def window_size() -> int:
+    return _env_int("NIJA_KPI_WINDOW", DEFAULT_WINDOW)
+
+
+def checkpoint_every() -> int:
+    return _env_int("NIJA_KPI_CHECKPOINT_EVERY", DEFAULT_CHECKPOINT_EVERY)
+
+
+class RunningRiskStats:
+    """
+    Incremental Sharpe / Sortino / max-drawdown over an equity stream.
+
+    Matches the full-list formulas in ``KPITracker.calculate_kpis``: per-update
+    returns, sample standard deviation (Welford), Sortino over the sample
+    deviation of negative returns, drawdown from the running peak starting at
+    the first equity point.
+    """
+
+    __slots__ = ("count", "mean", "m2", "down_count", "down_mean", "down_m2",
+                 "last_equity", "peak", "max_drawdown_pct")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.down_count = 0
+        self.down_mean = 0.0
+        self.down_m2 = 0.0
+        self.last_equity: Optional[float] = None
+        self.peak: Optional[float] = None
+        self.max_drawdown_pct = 0.0
+
+    def add_equity(self, equity: float) -> Optional[float]:
+        """Fold in one equity point; returns the period return (None for the first point)."""
+        period_return = None
+        if self.last_equity is not None and self.last_equity != 0:
+            period_return = (equity - self.last_equity) / self.last_equity
+            self.add_return(period_return)
+        self.last_equity = equity
+        if self.peak is None or equity > self.peak:
+            self.peak = equity
+        if self.peak > 0:
+            self.max_drawdown_pct = max(self.max_drawdown_pct, (self.peak - equity) / self.peak * 100)
+        return period_return
+
+    def add_return(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < 0:
+            self.down_count += 1
+            delta = value - self.down_mean
+            self.down_mean += delta / self.down_count
+            self.down_m2 += delta * (value - self.down_mean)
+
+    def sharpe(self, periods_per_year: int = 252) -> float:
+        if self.count < 2:
+            return 0.0
+        std = math.sqrt(self.m2 / (self.count - 1))
+        return self.mean / std * math.sqrt(periods_per_year) if std > 0 else 0.0
+
+    def sortino(self, periods_per_year: int = 252) -> float:
+        if self.count < 2 or self.down_count < 2:
+            return 0.0
+        downside_dev = math.sqrt(self.down_m2 / (self.down_count - 1))
+        return self.mean / downside_dev * math.sqrt(periods_per_year) if downside_dev > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunningRiskStats":
+        stats = cls()
+        for name in cls.__slots__:
+            if name in data:
+                setattr(stats, name, data[name])
+        return stats
+
+
+class KPIJournal:
+    """Append-only JSONL logs plus an atomic compact checkpoint."""
+
+    def __init__(self, data_dir: Path, prefix: str = "kpi") -> None:
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.paths = {kind: self.data_dir / f"{prefix}_{kind}.jsonl" for kind in KINDS}
+        self.checkpoint_path = self.data_dir / f"{prefix}_checkpoint.json"
+        self.pending = 0  # records appended since the last checkpoint
+        self._files: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        for path in self.paths.values():
+            self._drop_torn_tail(path)
+
+    @staticmethod
+    def _drop_torn_tail(path: Path) -> None:
+        """Cut a partially written last line so the next append starts clean."""
+        if not path.exists() or path.stat().st_size == 0:
+            return
+        with open(path, "rb+") as fh:
+            data = fh.read()
+            if data.endswith(b"\n"):
+                return
+            keep = data.rfind(b"\n") + 1
+            fh.truncate(keep)
+        logger.warning(f"KPI journal: dropped torn record at end of {path.name}")
+
+    def exists(self) -> bool:
+        return self.checkpoint_path.exists() or any(p.exists() and p.stat().st_size for p in self.paths.values())
+
+    def append(self, kind: str, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            fh = self._files.get(kind)
+            if fh is None:
+                fh = self._files[kind] = open(self.paths[kind], "a", encoding="utf-8")
+            fh.write(line)
+            fh.flush()
+            self.pending += 1
+
+    def offsets(self) -> Dict[str, int]:
+        with self._lock:
+            for fh in self._files.values():
+                fh.flush()
+            return {kind: (path.stat().st_size if path.exists() else 0) for kind, path in self.paths.items()}
+
+    def read(self, kind: str, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Yield records of *kind* starting at byte *offset*."""
+        path = self.paths[kind]
+        if not path.exists():
+            return
+        with open(path, "rb") as fh:
+            fh.seek(offset)
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break  # being written right now
+                try:
+                    yield json.loads(raw)
+                except ValueError:
+                    logger.warning(f"KPI journal: skipping unreadable record in {path.name}")
+
+    def write_checkpoint(self, state: Dict[str, Any]) -> None:
+        state = dict(state, offsets=self.offsets())
+        tmp = self.checkpoint_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(state, fh, separators=(",", ":"), default=str)
+        os.replace(tmp, self.checkpoint_path)
+        self.pending = 0
+
+    def read_checkpoint(self) -> Optional[Dict[str, Any]]:
+        if not self.checkpoint_path.exists():
+            return None
+        with open(self.checkpoint_path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def close(self) -> None:
+        with self._lock:
+            for fh in self._files.values():
+                fh.close()
+            self._files.clear()
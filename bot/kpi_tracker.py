@@ -47,6 +47,11 @@ import statistics
 from collections import deque
 import threading
 
+try:
+    from bot.kpi_journal import KPIJournal, RunningRiskStats, checkpoint_every, storage_mode, window_size
+except ImportError:
+    from kpi_journal import KPIJournal, RunningRiskStats, checkpoint_every, storage_mode, window_size
+
 logger = logging.getLogger(__name__)
 
 
@@ -101,39 +106,39 @@ class KPISnapshot:
     timestamp: str
     
     # Return metrics
-    total_return_pct: float
-    daily_return_pct: float
-    weekly_return_pct: float
-    monthly_return_pct: float
+    total_return_pct: float = 0.0
+    daily_return_pct: float = 0.0
+    weekly_return_pct: float = 0.0
+    monthly_return_pct: float = 0.0
     
     # Risk metrics
     sharpe_ratio: float
     sortino_ratio: float
-    max_drawdown_pct: float
-    current_drawdown_pct: float
+    max_drawdown_pct: float = 0.0
+    current_drawdown_pct: float = 0.0
     
     # Trade statistics
     total_trades: int
     winning_trades: int
     losing_trades: int
-    win_rate_pct: float
+    win_rate_pct: float = 0.0
     profit_factor: float
-    avg_win: float
-    avg_loss: float
+    avg_win: float = 0.0
+    avg_loss: float = 0.0
     
     # Position metrics
-    active_positions: int
-    total_exposure_pct: float
+    active_positions: int = 0
+    total_exposure_pct: float = 0.0
     
     # Time metrics
     trades_per_day: float
-    avg_hold_time_hours: float
+    avg_hold_time_hours: float = 0.0
     
     # Account metrics
-    account_value: float
-    cash_balance: float
-    unrealized_pnl: float
-    realized_pnl_total: float
+    account_value: float = 0.0
+    cash_balance: float = 0.0
+    unrealized_pnl: float = 0.0
+    realized_pnl_total: float = 0.0
 
 
 class KPITracker:
@@ -146,15 +151,28 @@ class KPITracker:
     - Drawdown metrics
     - Trading activity metrics
     - Portfolio growth metrics
+    
+    Storage modes (``storage`` / NIJA_KPI_STORAGE):
+    - ``journal`` (default): trades, equity points and snapshots are appended
+      to JSONL logs with a compact checkpoint every ``checkpoint_every``
+      records (see kpi_journal.py).  Only the last ``window`` entries of each
+      series stay in RAM; totals, Sharpe, Sortino and max drawdown are kept
+      as running aggregates, so an update is O(1) regardless of account age.
+    - ``json``: legacy single-file dump of everything on every snapshot.
     """
     
-    def __init__(self, data_dir: str = "/tmp/nija_kpis", initial_capital: float = 1000.0):
+    def __init__(self, data_dir: str = "/tmp/nija_kpis", initial_capital: float = 1000.0,
+                 storage: Optional[str] = None, window: Optional[int] = None,
+                 checkpoint_interval: Optional[int] = None):
         """
         Initialize KPI tracker.
         
         Args:
             data_dir: Directory to store KPI data
             initial_capital: Starting capital amount
+            storage: "journal" or "json" (default: NIJA_KPI_STORAGE, else journal)
+            window: In-RAM history per series in journal mode (default: NIJA_KPI_WINDOW)
+            checkpoint_interval: Appended records between checkpoints (default: NIJA_KPI_CHECKPOINT_EVERY)
             
         Raises:
             ValueError: If initial_capital is zero or negative
@@ -171,11 +189,20 @@ class KPITracker:
         self.initial_capital = initial_capital
         self.start_time = datetime.now()
         
-        # KPI data storage
-        self.snapshots: List[KPISnapshot] = []
-        self.trade_history: List[Dict] = []
-        self.daily_returns: List[float] = []
-        self.equity_curve: List[float] = []
+        self.storage = storage or storage_mode()
+        self.checkpoint_interval = checkpoint_interval or checkpoint_every()
+        self.journal: Optional[KPIJournal] = KPIJournal(self.data_dir) if self.storage == "journal" else None
+        
+        # KPI data storage (bounded windows in journal mode; full history stays on disk)
+        maxlen = (window or window_size()) if self.journal else None
+        self.snapshots = deque(maxlen=maxlen)
+        self.trade_history = deque(maxlen=maxlen)
+        self.daily_returns = deque(maxlen=maxlen)
+        self.equity_curve = deque(maxlen=maxlen)
+        
+        # Running aggregates (O(1) per trade / equity update)
+        self.totals = self._empty_totals()
+        self.risk_stats = RunningRiskStats()
         
         # Strategy performance tracking
         self.strategy_performance: Dict[str, Dict] = defaultdict(lambda: {
@@ -195,32 +222,122 @@ class KPITracker:
         
         logger.info(f"✅ KPI Tracker initialized with ${initial_capital:,.2f}")
     
+    @staticmethod
+    def _empty_totals() -> Dict[str, Any]:
+        return {
+            'trades': 0,
+            'wins': 0,
+            'total_profit': 0.0,
+            'total_loss': 0.0,
+            'total_fees': 0.0,
+            'net_profit': 0.0,
+        }
+    
     def _load_data(self):
         """Load KPI data from disk"""
         try:
-            if self.kpi_file.exists():
+            if self.journal is not None and self.journal.exists():
+                self._load_journal()
+            elif self.kpi_file.exists():
                 with open(self.kpi_file, 'r') as f:
                     data = json.load(f)
-                    self.snapshots = [KPISnapshot(**s) for s in data.get('snapshots', [])]
-                    self.trade_history = data.get('trade_history', [])
-                    self.daily_returns = data.get('daily_returns', [])
-                    self.equity_curve = data.get('equity_curve', [])
-                    # Convert loaded dict back to defaultdict
-                    loaded_perf = data.get('strategy_performance', {})
-                    for strategy, perf in loaded_perf.items():
-                        self.strategy_performance[strategy] = perf
-                    logger.info(f"📊 Loaded {len(self.snapshots)} KPI snapshots")
+                # Legacy file: replay through the same paths as live updates
+                for trade in data.get('trade_history', []):
+                    self._apply_trade(trade)
+                for equity in data.get('equity_curve', []):
+                    self._apply_equity({'equity': equity})
+                for snapshot in data.get('snapshots', []):
+                    self.snapshots.append(KPISnapshot(**snapshot))
+                # Convert loaded dict back to defaultdict
+                loaded_perf = data.get('strategy_performance', {})
+                for strategy, perf in loaded_perf.items():
+                    self.strategy_performance[strategy] = perf
+                if self.journal is not None:
+                    self._import_legacy(data)
+                logger.info(f"📊 Loaded {len(self.snapshots)} KPI snapshots")
         except Exception as e:
             logger.warning(f"Could not load KPI data: {e}")
     
+    def _load_journal(self):
+        """Checkpoint + replay of the log tail written after it"""
+        state = self.journal.read_checkpoint() or {}
+        offsets = state.get('offsets', {})
+        if state:
+            self.peak_balance = state.get('peak_balance', self.peak_balance)
+            self.peak_equity = state.get('peak_equity', self.peak_equity)
+            self.totals.update(state.get('totals', {}))
+            self.risk_stats = RunningRiskStats.from_dict(state.get('risk_stats', {}))
+            for strategy, perf in state.get('strategy_performance', {}).items():
+                self.strategy_performance[strategy] = perf
+            windows = state.get('windows', {})
+            self.trade_history.extend(windows.get('trades', []))
+            self.equity_curve.extend(windows.get('equity', []))
+            self.daily_returns.extend(windows.get('daily_returns', []))
+            self.snapshots.extend(KPISnapshot(**s) for s in windows.get('snapshots', []))
+        
+        replayed = 0
+        for trade in self.journal.read('trades', offsets.get('trades', 0)):
+            self._apply_trade(trade)
+            replayed += 1
+        for point in self.journal.read('equity', offsets.get('equity', 0)):
+            self._apply_equity(point)
+            replayed += 1
+        for snapshot in self.journal.read('snapshots', offsets.get('snapshots', 0)):
+            self.snapshots.append(KPISnapshot(**snapshot))
+            replayed += 1
+        self.journal.pending = replayed
+        logger.info(f"📊 Loaded KPI journal: {self.totals['trades']} trades, "
+                    f"{replayed} record(s) replayed after checkpoint")
+    
+    def _import_legacy(self, data: Dict):
+        """Move a legacy kpi_snapshots.json into the journal (full history on disk, then checkpoint)"""
+        for trade in data.get('trade_history', []):
+            self.journal.append('trades', trade)
+        for equity in data.get('equity_curve', []):
+            self.journal.append('equity', {'equity': equity})
+        for snapshot in data.get('snapshots', []):
+            self.journal.append('snapshots', snapshot)
+        self.checkpoint()
+        self.kpi_file.rename(self.kpi_file.with_suffix('.json.migrated'))
+        logger.info(f"📦 Migrated {self.kpi_file.name} to the KPI journal")
+    
+    def checkpoint(self):
+        """Write a compact checkpoint (aggregates + in-RAM windows) covering the logs so far"""
+        if self.journal is None:
+            self._save_data()
+            return
+        try:
+            self.journal.write_checkpoint({
+                'version': 1,
+                'initial_capital': self.initial_capital,
+                'peak_balance': self.peak_balance,
+                'peak_equity': self.peak_equity,
+                'totals': self.totals,
+                'risk_stats': self.risk_stats.to_dict(),
+                'strategy_performance': dict(self.strategy_performance),
+                'windows': {
+                    'trades': list(self.trade_history),
+                    'equity': list(self.equity_curve),
+                    'daily_returns': list(self.daily_returns),
+                    'snapshots': [asdict(s) for s in self.snapshots],
+                },
+                'last_updated': datetime.now().isoformat()
+            })
+        except Exception as e:
+            logger.error(f"Could not write KPI checkpoint: {e}")
+    
     def _save_data(self):
-        """Save KPI data to disk"""
+        """Save KPI data to disk (journal mode: checkpoint once enough records were appended)"""
+        if self.journal is not None:
+            if self.journal.pending >= self.checkpoint_interval:
+                self.checkpoint()
+            return
         try:
             data = {
                 'snapshots': [asdict(s) for s in self.snapshots],
-                'trade_history': self.trade_history,
-                'daily_returns': self.daily_returns,
-                'equity_curve': self.equity_curve,
+                'trade_history': list(self.trade_history),
+                'daily_returns': list(self.daily_returns),
+                'equity_curve': list(self.equity_curve),
                 'strategy_performance': dict(self.strategy_performance),
                 'last_updated': datetime.now().isoformat()
             }
@@ -229,6 +346,52 @@ class KPITracker:
         except Exception as e:
             logger.error(f"Could not save KPI data: {e}")
     
+    def _journal_append(self, kind: str, record: Dict):
+        if self.journal is None:
+            return
+        try:
+            self.journal.append(kind, record)
+            self._save_data()
+        except Exception as e:
+            logger.error(f"Could not append KPI {kind} record: {e}")
+    
+    def _apply_trade(self, trade: Dict):
+        """Fold one trade record into the window, totals and strategy performance"""
+        self.trade_history.append(trade)
+        totals = self.totals
+        totals['trades'] += 1
+        totals['total_fees'] += trade['fees']
+        totals['net_profit'] += trade['net_profit']
+        
+        perf = self.strategy_performance[trade['strategy']]
+        perf['trades'] += 1
+        if trade['is_win']:
+            totals['wins'] += 1
+            totals['total_profit'] += trade['profit']
+            perf['wins'] += 1
+            perf['total_profit'] += trade['profit']
+        else:
+            totals['total_loss'] += abs(trade['profit'])
+            perf['losses'] += 1
+            perf['total_loss'] += abs(trade['profit'])
+    
+    def _apply_equity(self, point: Dict):
+        """Fold one balance/equity point into the window, peaks and running risk stats"""
+        equity = point['equity']
+        balance = point.get('balance')
+        self.equity_curve.append(equity)
+        
+        # Update peaks
+        if equity > self.peak_equity:
+            self.peak_equity = equity
+        if balance is not None and balance > self.peak_balance:
+            self.peak_balance = balance
+        
+        # Calculate daily return
+        daily_return = self.risk_stats.add_equity(equity)
+        if daily_return is not None:
+            self.daily_returns.append(daily_return)
+    
     def record_trade(self, symbol: str, strategy: str, profit: float, fees: float, 
                      is_win: bool, entry_price: float, exit_price: float,
                      position_size: float):
@@ -258,16 +421,9 @@ class KPITracker:
             'position_size': position_size
         }
         
-        self.trade_history.append(trade)
-        
-        # Update strategy performance
-        self.strategy_performance[strategy]['trades'] += 1
-        if is_win:
-            self.strategy_performance[strategy]['wins'] += 1
-            self.strategy_performance[strategy]['total_profit'] += profit
-        else:
-            self.strategy_performance[strategy]['losses'] += 1
-            self.strategy_performance[strategy]['total_loss'] += abs(profit)
+        # Update window, totals and strategy performance
+        self._apply_trade(trade)
+        self._journal_append('trades', trade)
         
         logger.info(f"📝 Trade recorded: {symbol} {strategy} {'WIN' if is_win else 'LOSS'} ${profit:.2f}")
     
@@ -279,18 +435,9 @@ class KPITracker:
             balance: Current account balance
             equity: Current account equity
         """
-        self.equity_curve.append(equity)
-        
-        # Update peaks
-        if equity > self.peak_equity:
-            self.peak_equity = equity
-        if balance > self.peak_balance:
-            self.peak_balance = balance
-        
-        # Calculate daily return
-        if len(self.equity_curve) > 1:
-            daily_return = (equity - self.equity_curve[-2]) / self.equity_curve[-2]
-            self.daily_returns.append(daily_return)
+        point = {'timestamp': datetime.now().isoformat(), 'balance': balance, 'equity': equity}
+        self._apply_equity(point)
+        self._journal_append('equity', point)
     
     def calculate_kpis(self, current_balance: float, current_equity: float) -> KPISnapshot:
         """
@@ -303,18 +450,19 @@ class KPITracker:
         Returns:
             KPISnapshot with calculated KPIs
         """
-        # Basic trade statistics
-        total_trades = len(self.trade_history)
-        winning_trades = sum(1 for t in self.trade_history if t['is_win'])
+        # Basic trade statistics (running totals, not a scan of the history)
+        totals = self.totals
+        total_trades = totals['trades']
+        winning_trades = totals['wins']
         losing_trades = total_trades - winning_trades
         
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
         
         # Profit/loss calculations
-        total_profit = sum(t['profit'] for t in self.trade_history if t['is_win'])
-        total_loss = sum(abs(t['profit']) for t in self.trade_history if not t['is_win'])
-        total_fees = sum(t['fees'] for t in self.trade_history)
-        net_profit = sum(t['net_profit'] for t in self.trade_history)
+        total_profit = totals['total_profit']
+        total_loss = totals['total_loss']
+        total_fees = totals['total_fees']
+        net_profit = totals['net_profit']
         
         average_win = total_profit / winning_trades if winning_trades > 0 else 0.0
         average_loss = total_loss / losing_trades if losing_trades > 0 else 0.0
@@ -324,21 +472,9 @@ class KPITracker:
         risk_reward_ratio = average_win / average_loss if average_loss > 0 else 0.0
         expectancy = (win_rate/100 * average_win) - ((100-win_rate)/100 * average_loss)
         
-        # Sharpe ratio (simplified)
-        sharpe_ratio = 0.0
-        if self.daily_returns and len(self.daily_returns) > 1:
-            avg_return = statistics.mean(self.daily_returns)
-            std_return = statistics.stdev(self.daily_returns)
-            sharpe_ratio = (avg_return / std_return * (252 ** 0.5)) if std_return > 0 else 0.0
-        
-        # Sortino ratio (simplified - using downside deviation)
-        sortino_ratio = 0.0
-        if self.daily_returns and len(self.daily_returns) > 1:
-            downside_returns = [r for r in self.daily_returns if r < 0]
-            if downside_returns and len(downside_returns) > 1:
-                downside_dev = statistics.stdev(downside_returns)
-                avg_return = statistics.mean(self.daily_returns)
-                sortino_ratio = (avg_return / downside_dev * (252 ** 0.5)) if downside_dev > 0 else 0.0
+        # Sharpe / Sortino ratios (simplified; maintained incrementally over all returns)
+        sharpe_ratio = self.risk_stats.sharpe()
+        sortino_ratio = self.risk_stats.sortino()
         
         # Drawdown calculations
         current_drawdown = ((self.peak_equity - current_equity) / self.peak_equity * 100) if self.peak_equity > 0 else 0.0
@@ -397,7 +533,10 @@ class KPITracker:
         )
         
         self.snapshots.append(snapshot)
-        self._save_data()
+        if self.journal is not None:
+            self._journal_append('snapshots', asdict(snapshot))
+        else:
+            self._save_data()
         
         return snapshot
     
@@ -439,8 +578,11 @@ class KPITracker:
         if not self.equity_curve or len(self.equity_curve) < 2:
             return 0.0
         
-        # Use specified lookback or all data
-        equity_data = self.equity_curve[-lookback:] if lookback else self.equity_curve
+        if not lookback:
+            return self.risk_stats.max_drawdown_pct
+        
+        # Lookback is served from the in-RAM window
+        equity_data = list(self.equity_curve)[-lookback:]
         
         if not equity_data:
             return 0.0
@@ -505,8 +647,13 @@ class KPITracker:
             Dictionary with KPI time series
         """
         cutoff = datetime.now() - timedelta(days=days)
+        snapshots = self.snapshots
+        if (self.journal is not None and len(snapshots) == snapshots.maxlen
+                and datetime.fromisoformat(snapshots[0].timestamp) >= cutoff):
+            # Window does not reach back far enough: read the spilled history
+            snapshots = (KPISnapshot(**s) for s in self.journal.read('snapshots'))
         recent_snapshots = [
-            s for s in self.snapshots
+            s for s in snapshots
             if datetime.fromisoformat(s.timestamp) >= cutoff
         ]
         
@@ -541,9 +688,10 @@ class KPITracker:
             'export_date': datetime.now().isoformat(),
             'initial_capital': self.initial_capital,
             'current_kpis': self.get_kpi_summary(),
-            'kpi_history': [asdict(s) for s in self.snapshots],
+            'kpi_history': (list(self.journal.read('snapshots')) if self.journal is not None
+                            else [asdict(s) for s in self.snapshots]),
             'strategy_performance': dict(self.strategy_performance),
-            'trade_count': len(self.trade_history)
+            'trade_count': self.totals['trades']
         }
         
         with open(output_file, 'w') as f:
@@ -12,7 +12,11 @@ Responsibilities
 3. **Normalisation** — converts raw exchange payloads to a common
    :class:`NormalisedBar` schema (OHLCV + mid + spread + volume_usd).
 4. **Rolling Window** — keeps a configurable in-memory ring-buffer of recent
-   bars per symbol for fast indicator computation.
+   bars per symbol for fast indicator computation.  Each symbol owns a
+   preallocated columnar NumPy block (see :data:`BAR_COLUMNS`); ingesting a
+   bar is a single row write, and :meth:`MarketDataEngine.get_bars_as_dataframe`
+   copies one contiguous block (or, with ``view=True``, returns a zero-copy
+   view) instead of building a frame from per-bar dicts.
 5. **Fan-Out** — notifies registered subscribers (strategies, scanners,
    monitors) whenever a new bar is sealed.
 6. **Health Tracking** — records feed latency, staleness, and gap counts;
@@ -43,8 +47,9 @@ Public API
 
     engine.subscribe(on_bar)
 
-    # Retrieve recent bars as pandas DataFrame
-    df = engine.get_bars("BTC-USD", n=100)
+    # Retrieve recent bars as NormalisedBar objects or a pandas DataFrame
+    bars = engine.get_bars("BTC-USD", n=100)
+    df = engine.get_bars_as_dataframe("BTC-USD", n=100)
 
     # Feed a live quote (for MIS / spread tracking)
     engine.ingest_quote("BTC-USD", exchange="coinbase",
@@ -60,10 +65,11 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Deque, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger("nija.market_data_engine")
 
@@ -75,6 +81,13 @@ DEFAULT_BAR_WINDOW: int = 500      # bars kept per symbol
 STALE_BAR_SECONDS: float = 300.0  # bar older than this flagged as stale
 MAX_SUBSCRIBERS: int = 50
 
+# Column layout of the per-symbol bar ring (all float64).
+BAR_COLUMNS: Tuple[str, ...] = (
+    "timestamp", "open", "high", "low", "close",
+    "volume", "volume_usd", "mid", "spread_bps",
+)
+_TS_COL = 0
+
 
 # ---------------------------------------------------------------------------
 # Data Structures
@@ -153,6 +166,57 @@ class FeedHealth:
         }
 
 
+class _BarRing:
+    """
+    Fixed-capacity ring of bars for one symbol.
+
+    ``data`` is a ``(capacity, len(BAR_COLUMNS))`` float64 block written one
+    row per bar; ``exchange`` holds the per-row exchange label.  Nothing is
+    allocated after construction.
+    """
+
+    __slots__ = ("data", "exchange", "capacity", "head", "size")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, int(capacity))
+        self.data = np.empty((self.capacity, len(BAR_COLUMNS)), dtype=np.float64)
+        self.exchange = np.empty(self.capacity, dtype=object)
+        self.head = 0    # next write index
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def last_timestamp(self) -> float:
+        return float(self.data[self.head - 1, _TS_COL])
+
+    def append(self, row: Tuple[float, ...], exchange: str) -> None:
+        i = self.head
+        self.data[i] = row
+        self.exchange[i] = exchange
+        self.head = (i + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def window(self, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``(rows, exchanges)`` for the *n* newest bars, oldest first.
+
+        The result is a view into the ring when the window is contiguous and
+        an unrolled copy only when it wraps past the end of the buffer.
+        """
+        n = self.size if not n or n > self.size or n < 0 else n
+        start = (self.head - n) % self.capacity
+        stop = start + n
+        if stop <= self.capacity:
+            return self.data[start:stop], self.exchange[start:stop]
+        return (
+            np.concatenate((self.data[start:], self.data[:self.head])),
+            np.concatenate((self.exchange[start:], self.exchange[:self.head])),
+        )
+
+
 # ---------------------------------------------------------------------------
 # Market Data Engine
 # ---------------------------------------------------------------------------
@@ -165,9 +229,7 @@ class MarketDataEngine:
 
     def __init__(self, bar_window: int = DEFAULT_BAR_WINDOW) -> None:
         self._bar_window = bar_window
-        self._bars: Dict[str, Deque[NormalisedBar]] = defaultdict(
-            lambda: deque(maxlen=self._bar_window)
-        )
+        self._bars: Dict[str, _BarRing] = {}
         self._latest_quote: Dict[str, Dict[str, Any]] = {}   # symbol → quote
         self._health: Dict[str, FeedHealth] = {}
         self._symbols: set = set()
@@ -268,10 +330,12 @@ class MarketDataEngine:
         self.register_symbol(symbol)
 
         with self._lock:
+            existing = self._bars.get(symbol)
+            if existing is None:
+                existing = self._bars[symbol] = _BarRing(self._bar_window)
             # Detect gaps
-            existing = self._bars[symbol]
-            if existing and ts > 0:
-                prev_ts = existing[-1].timestamp
+            if existing.size and ts > 0:
+                prev_ts = existing.last_timestamp
                 expected_gap = ingest_ts - prev_ts   # rough
                 if ts < prev_ts:
                     # Out-of-order — skip
@@ -279,7 +343,10 @@ class MarketDataEngine:
                 if ts - prev_ts > expected_gap * 2 and prev_ts > 0:
                     self._health[symbol].gap_count += 1
 
-            existing.append(bar)
+            existing.append(
+                (bar.timestamp, o, h, lo, c, v, bar.volume_usd, bar.mid, bar.spread_bps),
+                exchange,
+            )
             self._health[symbol].last_bar_ts = bar.timestamp
             self._health[symbol].total_bars_received += 1
             self._health[symbol].update_latency(latency_ms)
@@ -352,13 +419,36 @@ class MarketDataEngine:
     def get_bars(self, symbol: str, n: Optional[int] = None) -> List[NormalisedBar]:
         """Return the *n* most recent bars for *symbol* (all if n is None)."""
         with self._lock:
-            bars = list(self._bars.get(symbol, []))
-        if n is not None:
-            bars = bars[-n:]
-        return bars
+            ring = self._bars.get(symbol)
+            if ring is None:
+                return []
+            rows, exchanges = ring.window(n)
+            rows = rows.tolist()
+            exchanges = exchanges.tolist()
+        return [
+            NormalisedBar(
+                symbol=symbol,
+                timestamp=r[0], open=r[1], high=r[2], low=r[3], close=r[4],
+                volume=r[5], volume_usd=r[6], mid=r[7], spread_bps=r[8],
+                exchange=ex,
+            )
+            for r, ex in zip(rows, exchanges)
+        ]
+
+    def get_bars_as_dataframe(self, symbol: str, n: Optional[int] = None, view: bool = False):
+        """
+        Return the *n* most recent bars as a ``pandas.DataFrame`` (requires pandas).
+
+        By default the frame is a snapshot copied under the engine lock, with
+        the :meth:`NormalisedBar.to_dict` columns (``symbol``, ``timestamp``,
+        ``datetime``, OHLCV, ``volume_usd``, ``mid``, ``spread_bps``,
+        ``exchange``), oldest bar first; it is safe to keep or mutate.
 
-    def get_bars_as_dataframe(self, symbol: str, n: Optional[int] = None):
-        """Return bars as a ``pandas.DataFrame`` (requires pandas)."""
+        ``view=True`` opts in to a read-only zero-copy view over the symbol's
+        ring buffer with the numeric :data:`BAR_COLUMNS` only.  It allocates
+        nothing unless the window wraps, but its rows change as soon as newer
+        bars overwrite them — use it only for an immediate read.
+        """
         try:
             import pandas as pd
         except ImportError:
@@ -366,10 +456,28 @@ class MarketDataEngine:
             "pandas is required for get_bars_as_dataframe(). "
             "Install with: pip install pandas"
         )
-        bars = self.get_bars(symbol, n)
-        if not bars:
-            return None
-        return pd.DataFrame([b.to_dict() for b in bars])
+        with self._lock:
+            ring = self._bars.get(symbol)
+            if ring is None or not ring.size:
+                return None
+            rows, exchanges = ring.window(n)
+            if view:
+                rows = rows.view()
+                rows.flags.writeable = False
+            else:
+                rows = rows.copy()
+                exchanges = exchanges.tolist()
+        if view:
+            return pd.DataFrame(rows, columns=list(BAR_COLUMNS), copy=False)
+        df = pd.DataFrame(rows, columns=list(BAR_COLUMNS), copy=False)
+        df.insert(0, "symbol", symbol)
+        df.insert(
+            2,
+            "datetime",
+            [datetime.fromtimestamp(ts, tz=timezone.utc).isoformat() for ts in rows[:, _TS_COL].tolist()],
+        )
+        df["exchange"] = exchanges
+        return df
 
     def get_latest_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Return the most recent quote for *symbol*, or None."""
@@ -442,7 +550,7 @@ class MarketDataEngine:
     def get_summary(self) -> Dict[str, Any]:
         """Return a concise summary of engine state."""
         with self._lock:
-            total_bars = sum(len(q) for q in self._bars.values())
+            total_bars = sum(len(r) for r in self._bars.values())
         return {
             "registered_symbols": len(self._symbols),
             "total_bars_in_memory": total_bars,
@@ -15,6 +15,7 @@ Date: January 2026
 """
 
 from .genetic_evolution import GeneticEvolution
+from .population_evaluator import PopulationEvaluator
 from .reinforcement_learning import RLStrategySelector
 from .strategy_swarm import StrategySwarm
 from .strategy_breeder import StrategyBreeder
@@ -23,6 +24,7 @@ from .evolution_engine import MetaAIEvolutionEngine
 
 __all__ = [
     'GeneticEvolution',
+    'PopulationEvaluator',
     'RLStrategySelector',
     'StrategySwarm',
     'StrategyBreeder',
@@ -19,6 +19,7 @@ import logging
 import json
 
 from .genetic_evolution import GeneticEvolution, StrategyGenome
+from .population_evaluator import PopulationEvaluator
 from .reinforcement_learning import RLStrategySelector, MarketState
 from .strategy_swarm import StrategySwarm
 from .strategy_breeder import StrategyBreeder
@@ -147,18 +148,34 @@ class MetaAIEvolutionEngine:
 
         return hours_since_eval >= self.config['evaluation_frequency']
 
-    def evaluate_population(self, backtest_results: Dict[str, Dict]):
+    def evaluate_population(
+        self,
+        backtest_results: Optional[Dict[str, Dict]] = None,
+        evaluator: Optional[PopulationEvaluator] = None,
+    ):
         """
         Evaluate population fitness using backtest results
 
         Args:
             backtest_results: Dict mapping strategy_id to performance metrics
+            evaluator: PopulationEvaluator that backtests the whole population
+                in one batch (used instead of backtest_results when given)
         """
         if not self.genetic_engine:
             return
 
         logger.info(f"📊 Evaluating population fitness...")
 
+        if evaluator is not None:
+            fitness = evaluator.evaluate(self.genetic_engine)
+            if len(fitness):
+                logger.info(
+                    f"📊 Scored {len(fitness)} strategies: "
+                    f"best={fitness.max():.4f}, avg={fitness.mean():.4f}"
+                )
+            return
+        backtest_results = backtest_results or {}
+
         for genome in self.genetic_engine.population:
             if genome.id in backtest_results:
                 metrics = backtest_results[genome.id]
@@ -27,6 +27,11 @@ from .evolution_config import (
 
 logger = logging.getLogger("nija.meta_ai.genetic")
 
+PARAMETER_NAMES: List[str] = list(PARAMETER_SEARCH_SPACE.keys())
+_PARAM_MIN = np.array([PARAMETER_SEARCH_SPACE[p][0] for p in PARAMETER_NAMES], dtype=np.float64)
+_PARAM_RANGE = np.array([PARAMETER_SEARCH_SPACE[p][1] - PARAMETER_SEARCH_SPACE[p][0]
+                         for p in PARAMETER_NAMES], dtype=np.float64)
+
 
 @dataclass
 class StrategyGenome:
@@ -49,6 +54,43 @@ class StrategyGenome:
             self.created_at = datetime.utcnow()
 
 
+def parameter_matrix(genomes: List["StrategyGenome"]) -> np.ndarray:
+    """
+    Stack genome parameters into a (population, parameters) float64 matrix
+
+    Columns follow PARAMETER_NAMES (PARAMETER_SEARCH_SPACE order).
+    """
+    return np.array(
+        [[genome.parameters[name] for name in PARAMETER_NAMES] for genome in genomes],
+        dtype=np.float64,
+    ).reshape(len(genomes), len(PARAMETER_NAMES))
+
+
+def population_diversity(matrix: np.ndarray) -> float:
+    """
+    Mean normalized pairwise parameter distance of a population
+
+    Equal to averaging |x_i - x_j| / range over every pair i < j and every
+    parameter, but computed per column from the sorted values:
+    sum_{i<j} |a_i - a_j| = sum_k a_(k) * (2k - n + 1), i.e. O(P log P)
+    instead of an O(P^2) pair loop.
+
+    Args:
+        matrix: Output of parameter_matrix
+
+    Returns:
+        Diversity score (0-1, higher = more diverse)
+    """
+    n = matrix.shape[0]
+    if n < 2:
+        return 0.0
+    normalized = np.sort((matrix - _PARAM_MIN) / _PARAM_RANGE, axis=0)
+    weights = 2.0 * np.arange(n) - n + 1
+    pair_sums = weights @ normalized
+    pairs = n * (n - 1) / 2
+    return float(pair_sums.sum() / (pairs * matrix.shape[1]))
+
+
 class GeneticEvolution:
     """
     Genetic Algorithm for Strategy Evolution
@@ -351,30 +393,7 @@ class GeneticEvolution:
         """
         if len(self.population) < 2:
             return 0.0
-
-        # Calculate pairwise parameter differences
-        params = list(PARAMETER_SEARCH_SPACE.keys())
-        differences = []
-
-        for i in range(len(self.population)):
-            for j in range(i + 1, len(self.population)):
-                genome1 = self.population[i]
-                genome2 = self.population[j]
-
-                # Normalized difference for each parameter
-                param_diffs = []
-                for param in params:
-                    min_val, max_val = PARAMETER_SEARCH_SPACE[param]
-                    range_val = max_val - min_val
-                    diff = abs(genome1.parameters[param] - genome2.parameters[param])
-                    param_diffs.append(diff / range_val)
-
-                # Average difference for this pair
-                differences.append(np.mean(param_diffs))
-
-        # Overall diversity is average pairwise difference
-        diversity = np.mean(differences) if differences else 0.0
-        return diversity
+        return population_diversity(parameter_matrix(self.population))
 
     def export_genome(self, genome: StrategyGenome) -> Dict:
         """
@@ -0,0 +1,229 @@
+"""
+Batched Population Fitness Evaluation
+======================================
+
+Scores a whole GeneticEvolution population per call instead of one
+``evaluate_fitness`` at a time:
+
+- The population is stacked into a (population, parameters) matrix
+  (``parameter_matrix``); each row is hashed so identical genomes - elites
+  carried over by ``evolve_generation``, clones that escaped mutation,
+  duplicates inside one generation - are backtested once and then served
+  from an LRU cache.
+- Unscored rows are split into blocks and backtested in a process pool.
+  The market data is published once into shared memory
+  (``walk_forward_parallel.SharedPriceFrame``) and every worker attaches a
+  read-only, zero-copy DataFrame, so nothing but parameter blocks and
+  metric dicts crosses the process boundary.
+- Metrics are turned into fitness with the engine's own ``evaluate_fitness``
+  so scoring rules stay in one place.
+
+``backtest_fn(block, names, data) -> List[Dict]`` receives a block of
+parameter rows (float64 ndarray, columns in ``names`` order) and returns one
+metrics dict per row, which lets a vectorized backtest score many genomes in
+one pass.  Wrap a per-genome ``fn(params_dict, data) -> Dict`` in
+:class:`PerGenome`.  Both must be picklable (module-level) when
+``workers > 1``.
+
+Environment variables (all optional, safe defaults provided):
+    NIJA_GA_EVAL_WORKERS      – process pool size (default 1 = in-process)
+    NIJA_GA_EVAL_CACHE_SIZE   – genome results kept in the LRU cache (default 10000)
+
+Author: NIJA Trading Systems
+"""
+
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .genetic_evolution import PARAMETER_NAMES, GeneticEvolution, StrategyGenome, parameter_matrix
+
+try:
+    from bot.walk_forward_parallel import SharedPriceFrame, attach_shared_frame
+except ImportError:
+    from walk_forward_parallel import SharedPriceFrame, attach_shared_frame
+
+logger = logging.getLogger("nija.meta_ai.population")
+
+BatchBacktestFn = Callable[[np.ndarray, List[str], pd.DataFrame], Sequence[Dict[str, Any]]]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def genome_hash(row: np.ndarray) -> str:
+    """Stable identity of one parameter row (exact float64 bytes)."""
+    return hashlib.blake2b(np.ascontiguousarray(row, dtype=np.float64).tobytes(), digest_size=16).hexdigest()
+
+
+class PerGenome:
+    """Adapt a per-genome ``fn(params_dict, data) -> metrics`` to the block interface."""
+
+    def __init__(self, fn: Callable[[Dict[str, float], pd.DataFrame], Dict[str, Any]]) -> None:
+        self.fn = fn
+
+    def __call__(self, block: np.ndarray, names: List[str], data: pd.DataFrame) -> List[Dict[str, Any]]:
+        return [self.fn(dict(zip(names, row.tolist())), data) for row in block]
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(spec: Dict[str, Any], backtest_fn: BatchBacktestFn, names: List[str]) -> None:
+    shm, frame = attach_shared_frame(spec)
+    _WORKER.update(shm=shm, frame=frame, backtest_fn=backtest_fn, names=names)
+
+
+def _score_block(block: np.ndarray) -> List[Optional[Dict[str, Any]]]:
+    return _run_block(_WORKER["backtest_fn"], block, _WORKER["names"], _WORKER["frame"])
+
+
+def _run_block(backtest_fn: BatchBacktestFn, block: np.ndarray, names: List[str],
+               data: pd.DataFrame) -> List[Optional[Dict[str, Any]]]:
+    """Score a block; if the batch call fails, retry row by row so one bad genome only loses itself."""
+    try:
+        metrics = list(backtest_fn(block, names, data))
+        if len(metrics) == len(block):
+            return metrics
+        raise ValueError(f"backtest returned {len(metrics)} results for {len(block)} genomes")
+    except Exception as exc:
+        if len(block) == 1:
+            logger.warning(f"Backtest failed for genome {genome_hash(block[0])[:12]}: {exc}")
+            return [None]
+    return [m for i in range(len(block)) for m in _run_block(backtest_fn, block[i:i + 1], names, data)]
+
+
+# ---------------------------------------------------------------------------
+# Evaluator
+# ---------------------------------------------------------------------------
+
+class PopulationEvaluator:
+    """
+    Batched, cached fitness evaluation for a GeneticEvolution population.
+
+    Use as a context manager when ``workers > 1`` so the pool and the shared
+    memory segment are released; with one worker blocks run in-process.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        backtest_fn: BatchBacktestFn,
+        workers: Optional[int] = None,
+        cache_size: Optional[int] = None,
+        block_size: int = 0,
+        mp_context: Optional[str] = None,
+    ) -> None:
+        self.data = data
+        self.backtest_fn = backtest_fn
+        self.workers = max(1, int(workers or _env_int("NIJA_GA_EVAL_WORKERS", 1)))
+        self.cache_size = int(cache_size or _env_int("NIJA_GA_EVAL_CACHE_SIZE", 10000))
+        self.block_size = int(block_size)
+        self.mp_context = mp_context
+        self._cache: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+        self._shared: Optional[SharedPriceFrame] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.stats = {'evaluated': 0, 'cache_hits': 0, 'failed': 0}
+
+    def __enter__(self) -> "PopulationEvaluator":
+        if self.workers > 1 and self._pool is None:
+            self._shared = SharedPriceFrame(self.data)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context(self.mp_context) if self.mp_context else None,
+                initializer=_init_worker,
+                initargs=(self._shared.spec, self.backtest_fn, PARAMETER_NAMES),
+            )
+            logger.info(f"🧬 Population evaluator pool: {self.workers} workers")
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def backtest(self, matrix: np.ndarray) -> List[Optional[Dict[str, Any]]]:
+        """
+        Metrics for every row of *matrix* (None where the backtest failed).
+
+        Rows already in the cache, or repeated within *matrix*, are not re-run.
+        Failed rows are not cached.
+        """
+        keys = [genome_hash(row) for row in matrix]
+        found: Dict[str, Optional[Dict[str, Any]]] = {}
+        todo: Dict[str, int] = {}
+        for i, key in enumerate(keys):
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                found[key] = self._cache[key]
+                self.stats['cache_hits'] += 1
+            elif key not in todo:
+                todo[key] = i
+
+        if todo:
+            pending = matrix[list(todo.values())]
+            for key, metrics in zip(todo, self._run(pending)):
+                found[key] = metrics
+                self.stats['evaluated'] += 1
+                if metrics is None:
+                    self.stats['failed'] += 1  # not cached: retried next generation
+                else:
+                    self._cache[key] = metrics
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return [found[key] for key in keys]
+
+    def _run(self, pending: np.ndarray) -> List[Optional[Dict[str, Any]]]:
+        if self._pool is None:
+            return _run_block(self.backtest_fn, pending, PARAMETER_NAMES, self.data)
+        size = self.block_size or max(1, -(-len(pending) // (self.workers * 4)))
+        blocks = [pending[n:n + size] for n in range(0, len(pending), size)]
+        return [m for block_metrics in self._pool.map(_score_block, blocks) for m in block_metrics]
+
+    def evaluate(self, engine: GeneticEvolution,
+                 population: Optional[List[StrategyGenome]] = None) -> np.ndarray:
+        """
+        Score *population* (default: ``engine.population``) in one batch
+
+        Fitness and metrics are written onto each genome through
+        ``engine.evaluate_fitness``; genomes whose backtest failed get 0.0.
+
+        Returns:
+            Fitness array in population order
+        """
+        population = engine.population if population is None else population
+        if not population:
+            return np.zeros(0)
+        fitness = np.zeros(len(population))
+        for i, (genome, metrics) in enumerate(zip(population, self.backtest(parameter_matrix(population)))):
+            if metrics is None:
+                genome.fitness = 0.0
+            else:
+                fitness[i] = engine.evaluate_fitness(genome, metrics)
+        logger.debug(
+            f"🧬 Scored {len(population)} genomes "
+            f"(evaluated={self.stats['evaluated']}, cache_hits={self.stats['cache_hits']})"
+        )
+        return fitness
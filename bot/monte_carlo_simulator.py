@@ -9,13 +9,22 @@ Validates structural survivability through randomization of:
 
 This is fund discipline testing.
 
+``MonteCarloPortfolioSimulator`` is the per-path reference implementation.
+``BatchedMonteCarloSimulator`` generates whole chunks of paths at once as a
+(paths x days x strategies) array from a seeded ``np.random.Generator``, with
+regime shifts and volatility spikes applied as vectorised masks; chunks are
+sized to a memory cap and can be spread over a process pool for very large
+path counts.  Both return the same ``SimulationResults``.
+
 Author: NIJA Trading Systems
 Version: 1.0
 Date: January 29, 2026
 """
 
 import logging
+import os
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -282,9 +291,21 @@ class MonteCarloPortfolioSimulator:
             max_drawdowns.append(max_dd)
             equity_curves.append(equity_curve)
 
+        results = self._build_results(final_capitals, max_drawdowns, equity_curves[:10])
+
+        logger.info(f"✅ Monte Carlo Simulation Complete")
+        self._log_results(results)
+
+        return results
+
+    def _build_results(self,
+                       final_capitals: List[float],
+                       max_drawdowns: List[float],
+                       equity_curves: List[List[float]]) -> SimulationResults:
+        """Summarise per-path outcomes into SimulationResults"""
         # Calculate statistics
-        final_capitals_array = np.array(final_capitals)
-        max_drawdowns_array = np.array(max_drawdowns)
+        final_capitals_array = np.asarray(final_capitals, dtype=float)
+        max_drawdowns_array = np.asarray(max_drawdowns, dtype=float)
 
         mean_final = np.mean(final_capitals_array)
         median_final = np.median(final_capitals_array)
@@ -299,7 +320,7 @@ class MonteCarloPortfolioSimulator:
         ruin_threshold = self.params.initial_capital * 0.5
         probability_of_ruin = np.sum(final_capitals_array < ruin_threshold) / len(final_capitals_array)
 
-        results = SimulationResults(
+        return SimulationResults(
             mean_final_capital=mean_final,
             median_final_capital=median_final,
             std_final_capital=std_final,
@@ -308,16 +329,11 @@ class MonteCarloPortfolioSimulator:
             max_drawdown_mean=max_dd_mean,
             max_drawdown_worst=max_dd_worst,
             probability_of_ruin=probability_of_ruin,
-            all_final_capitals=final_capitals,
-            all_max_drawdowns=max_drawdowns,
-            equity_curves=equity_curves[:10]  # Store only first 10 for visualization
+            all_final_capitals=list(final_capitals),
+            all_max_drawdowns=list(max_drawdowns),
+            equity_curves=equity_curves  # Only the first few paths, for visualization
         )
 
-        logger.info(f"✅ Monte Carlo Simulation Complete")
-        self._log_results(results)
-
-        return results
-
     def _log_results(self, results: SimulationResults) -> None:
         """Log simulation results"""
         logger.info(f"\n📊 Monte Carlo Results:")
@@ -380,16 +396,156 @@ class MonteCarloPortfolioSimulator:
         return str(filepath)
 
 
+def _simulate_path_chunk(params: SimulationParameters,
+                         num_strategies: int,
+                         num_paths: int,
+                         seed: np.random.SeedSequence,
+                         keep_curves: int = 0) -> Tuple[np.ndarray, np.ndarray, List[List[float]]]:
+    """
+    Simulate *num_paths* portfolio paths at once (module-level so it pickles)
+
+    Mirrors ``MonteCarloPortfolioSimulator.run_single_simulation`` path by
+    path: a random correlation matrix per path, Cholesky-correlated returns,
+    volatility-spike and crisis-regime multipliers, equal-weight equity curve.
+
+    Returns:
+        Tuple of (final capitals, max drawdowns %, first *keep_curves* equity curves)
+    """
+    rng = np.random.default_rng(seed)
+    paths, days, size = num_paths, params.num_days, num_strategies
+
+    # Random correlation matrix per path (batched _generate_random_correlation_matrix)
+    correlations = rng.uniform(params.min_correlation, params.max_correlation, (paths, size, size))
+    correlations = (correlations + correlations.transpose(0, 2, 1)) / 2
+    diag = np.arange(size)
+    correlations[:, diag, diag] = 1.0
+    eigenvalues, eigenvectors = np.linalg.eigh(correlations)
+    eigenvalues = np.maximum(eigenvalues, 0.01)
+    correlations = (eigenvectors * eigenvalues[:, None, :]) @ eigenvectors.transpose(0, 2, 1)
+    d = np.sqrt(np.diagonal(correlations, axis1=1, axis2=2))
+    correlations /= d[:, :, None] * d[:, None, :]
+    cholesky = np.linalg.cholesky(correlations)
+
+    # Correlated returns: (paths x days x strategies)
+    returns = rng.normal(params.mean_return_daily, params.volatility_daily, (paths, days, size))
+    returns = returns @ cholesky.transpose(0, 2, 1)
+
+    # Volatility spikes and crisis regime (regime 4) as day masks; both scale
+    # every strategy equally, so they are applied to the equal-weight mean.
+    spikes = rng.random((paths, days)) < params.vol_spike_probability
+    shifts = rng.random((paths, days)) < params.regime_shift_probability
+    shifts[:, 0] = False  # Start in regime 0
+    targets = np.where(shifts, rng.integers(0, 5, (paths, days)), 0)
+    last_shift = np.maximum.accumulate(np.where(shifts, np.arange(days), 0), axis=1)
+    crisis = np.take_along_axis(targets, last_shift, axis=1) == 4
+
+    daily = returns.mean(axis=2)
+    daily *= np.where(spikes, params.vol_spike_multiplier, 1.0)
+    daily[crisis] *= 0.5
+
+    equity = np.empty((paths, days + 1))
+    equity[:, 0] = params.initial_capital
+    equity[:, 1:] = params.initial_capital * np.cumprod(1.0 + daily, axis=1)
+    peak = np.maximum.accumulate(equity, axis=1)
+    max_drawdowns = ((peak - equity) / peak * 100).max(axis=1)
+
+    return equity[:, -1], max_drawdowns, equity[:keep_curves].tolist()
+
+
+class BatchedMonteCarloSimulator(MonteCarloPortfolioSimulator):
+    """
+    Vectorized Monte Carlo simulator
+
+    Same model and ``SimulationResults`` as ``MonteCarloPortfolioSimulator``,
+    but paths are generated in chunks of (paths x days x strategies) arrays.
+    Each chunk draws from its own child of ``SeedSequence(seed)``, so results
+    depend only on the seed and the chunk size — not on whether a process
+    pool was used.
+    """
+
+    def __init__(self,
+                 params: Optional[SimulationParameters] = None,
+                 seed: Optional[int] = None,
+                 max_chunk_mb: float = 256.0,
+                 processes: Optional[int] = None,
+                 process_threshold: int = 50_000):
+        """
+        Initialize batched simulator
+
+        Args:
+            params: Simulation parameters (uses defaults if not provided)
+            seed: Seed for the random generator (None = fresh entropy)
+            max_chunk_mb: Approximate memory cap per chunk of paths
+            processes: Worker processes for large runs (None = CPU count, 0/1 = in-process)
+            process_threshold: Minimum number of simulations before a process pool is used
+        """
+        super().__init__(params)
+        self.seed = seed
+        self.max_chunk_mb = max_chunk_mb
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.process_threshold = process_threshold
+
+    def chunk_size(self, num_strategies: int) -> int:
+        """Paths per chunk that fit in ``max_chunk_mb``"""
+        # Two (days x strategies) float arrays per path plus a handful of per-day ones
+        bytes_per_path = 8 * (self.params.num_days + 1) * (2 * num_strategies + 8)
+        return max(1, int(self.max_chunk_mb * 1024 * 1024 // bytes_per_path))
+
+    def run_simulations(self, num_strategies: int = 3) -> SimulationResults:
+        """
+        Run full Monte Carlo simulation in vectorized chunks
+
+        Args:
+            num_strategies: Number of strategies
+
+        Returns:
+            SimulationResults with all metrics
+        """
+        total = self.params.num_simulations
+        chunk = self.chunk_size(num_strategies)
+        sizes = [min(chunk, total - start) for start in range(0, total, chunk)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        jobs = []
+        offset = 0
+        for size, seed in zip(sizes, seeds):
+            jobs.append((self.params, num_strategies, size, seed, max(0, 10 - offset)))
+            offset += size
+
+        use_pool = self.processes > 1 and total >= self.process_threshold and len(jobs) > 1
+        logger.info(
+            f"🎲 Running {total} Monte Carlo simulations "
+            f"({len(jobs)} chunk(s) of ≤{chunk} paths{', process pool' if use_pool else ''})..."
+        )
+        if use_pool:
+            with ProcessPoolExecutor(max_workers=min(self.processes, len(jobs))) as pool:
+                outputs = list(pool.map(_simulate_path_chunk, *zip(*jobs)))
+        else:
+            outputs = [_simulate_path_chunk(*job) for job in jobs]
+
+        final_capitals = np.concatenate([out[0] for out in outputs])
+        max_drawdowns = np.concatenate([out[1] for out in outputs])
+        equity_curves = [curve for out in outputs for curve in out[2]]
+
+        results = self._build_results(final_capitals.tolist(), max_drawdowns.tolist(), equity_curves)
+
+        logger.info(f"✅ Monte Carlo Simulation Complete")
+        self._log_results(results)
+
+        return results
+
+
 def run_monte_carlo_test(num_simulations: int = 1000,
                          num_days: int = 252,
-                         initial_capital: float = 100000.0) -> SimulationResults:
+                         initial_capital: float = 100000.0,
+                         seed: Optional[int] = None) -> SimulationResults:
     """
-    Convenience function to run Monte Carlo test
+    Convenience function to run Monte Carlo test (batched engine)
 
     Args:
         num_simulations: Number of simulations
         num_days: Trading days to simulate
         initial_capital: Starting capital
+        seed: Optional seed for reproducible runs
 
     Returns:
         SimulationResults
@@ -400,7 +556,7 @@ def run_monte_carlo_test(num_simulations: int = 1000,
         initial_capital=initial_capital
     )
 
-    simulator = MonteCarloPortfolioSimulator(params)
+    simulator = BatchedMonteCarloSimulator(params, seed=seed)
     results = simulator.run_simulations(num_strategies=3)
     simulator.export_results(results)
 
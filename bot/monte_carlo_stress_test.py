@@ -25,6 +25,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import copy
 
+try:
+    from bot.monte_carlo_simulator import BatchedMonteCarloSimulator, SimulationParameters, SimulationResults
+except ImportError:
+    from monte_carlo_simulator import BatchedMonteCarloSimulator, SimulationParameters, SimulationResults
+
 logger = logging.getLogger("nija.monte_carlo")
 
 
@@ -610,6 +615,28 @@ class MonteCarloStressTestEngine:
 
         return result
 
+    def run_portfolio_survivability(
+        self,
+        params: Optional[SimulationParameters] = None,
+        num_strategies: int = 3
+    ) -> SimulationResults:
+        """
+        Portfolio-level survivability check with the batched Monte Carlo engine
+
+        Uses ``num_simulations`` paths (unless *params* says otherwise) and the
+        engine's ``random_seed`` so stress runs are reproducible.
+
+        Args:
+            params: Optional portfolio simulation parameters
+            num_strategies: Number of strategies in the portfolio
+
+        Returns:
+            SimulationResults (same fields as the per-path simulator)
+        """
+        params = params or SimulationParameters(num_simulations=self.num_simulations)
+        simulator = BatchedMonteCarloSimulator(params, seed=self.random_seed)
+        return simulator.run_simulations(num_strategies=num_strategies)
+
     def _generate_summary(
         self,
         ideal_pnl: float,
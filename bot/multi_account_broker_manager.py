@@ -16,7 +16,6 @@ Each account trades independently with its own:
 import importlib
 import logging
 import os
-import queue
 import sys
 import threading
 import time
@@ -84,6 +83,12 @@ except ImportError:
         _BFM_AVAILABLE = False
         logger.debug("broker_failure_manager not importable — per-broker circuit breaker disabled")
 
+# Pooled, rate-limited balance fetching (replaces per-call threads + sleeps)
+try:
+    from bot.balance_fetch_service import BalanceFetchService
+except ImportError:
+    from balance_fetch_service import BalanceFetchService
+
 # Import account mode manager for hierarchy-driven mode enforcement
 try:
     from bot.account_mode_manager import get_account_mode_manager, AccountMode
@@ -456,11 +461,11 @@ class MultiAccountBrokerManager:
         self._all_user_brokers: Dict[Tuple[str, BrokerType], BaseBroker] = {}
 
         # CRITICAL FIX (Jan 19, 2026): Balance cache to prevent repeated Kraken API calls
-        # Structure: {(account_type, account_id, broker_type): (balance, timestamp)}
-        # This prevents calling get_account_balance() multiple times per cycle for same user
-        self._balance_cache: Dict[Tuple[str, str, BrokerType], Tuple[float, float]] = {}
-        # Track last Kraken balance API call time for rate limiting
-        self._last_kraken_balance_call: float = 0.0
+        # Keyed by (account_type, account_id, broker_type); prevents calling
+        # get_account_balance() multiple times per cycle for the same account.
+        # Balances are cached and fetched by a BalanceFetchService (fixed worker
+        # pool, per-venue token buckets, stale-while-revalidate reads).
+        self._balance_service = self._create_balance_service()
 
         # Sticky connection: track last time each platform broker was seen connected.
         # Within STICKY_CONNECTION_WINDOW seconds of a confirmed connection, treat
@@ -4369,6 +4374,23 @@ class MultiAccountBrokerManager:
         # This is the safe default: if we don't know, assume no credentials
         return False
 
+    def _create_balance_service(self) -> BalanceFetchService:
+        return BalanceFetchService(
+            ttl=self.BALANCE_CACHE_TTL,
+            fetch_timeout=self.BALANCE_FETCH_TIMEOUT,
+            stale_max_age=self.BALANCE_STALE_FALLBACK_AGE,
+            venue_limits={BrokerType.KRAKEN.value: (1.0 / self.KRAKEN_BALANCE_CALL_DELAY, 1)},
+        )
+
+    def _get_balance_service(self) -> BalanceFetchService:
+        service = getattr(self, "_balance_service", None)
+        if service is None:
+            service = self._balance_service = self._create_balance_service()
+        return service
+
+    def _balance_fetcher(self, broker: BaseBroker) -> Callable[[], float]:
+        return lambda: self._normalize_balance_value(broker.get_account_balance())
+
     def _get_cached_balance(self, account_type: str, account_id: str, broker_type: BrokerType, broker: BaseBroker) -> float:
         """
         Get balance with caching for Kraken to prevent repeated API calls.
@@ -4377,6 +4399,13 @@ class MultiAccountBrokerManager:
         Problem: Users not appearing funded because balance calls are sequential (1-1.2s delay each)
         Solution: Cache balances per trading cycle, add 1-1.2s delay between calls
 
+        Fetches run on the BalanceFetchService worker pool: Kraken calls are
+        paced by a token bucket (KRAKEN_BALANCE_CALL_DELAY) on the worker,
+        not by sleeping here.  A stale cached balance is returned immediately
+        while a background refresh runs; only a missing, cleared or very old
+        (> BALANCE_STALE_FALLBACK_AGE) entry waits for the API, bounded by
+        BALANCE_FETCH_TIMEOUT, falling back to the stale value (0.0 if none).
+
         Args:
             account_type: 'platform' or 'user'
             account_id: Account identifier (e.g., 'platform', 'tania_gilbert')
@@ -4386,112 +4415,46 @@ class MultiAccountBrokerManager:
         Returns:
             Balance in USD
         """
-        cache_key = (account_type, account_id, broker_type)
-        current_time = time.time()
-
-        # Check if we have a valid cached balance
-        if cache_key in self._balance_cache:
-            cached_balance, cache_time = self._balance_cache[cache_key]
-            age = current_time - cache_time
-
-            if age < self.BALANCE_CACHE_TTL:
-                logger.debug(f"Using cached balance for {account_type} {account_id} on {broker_type.value}: ${cached_balance:.2f} (age: {age:.1f}s)")
-                return cached_balance
-
-        # Need to fetch fresh balance from API
-        # For Kraken, add delay between sequential calls to prevent rate limiting
-        # NOTE: time.sleep() is intentional (Railway Golden Rule #3)
-        # Kraken requires sequential API calls with delay to prevent nonce conflicts
-        # This blocking operation is necessary for Railway deployment stability
-        if broker_type == BrokerType.KRAKEN:
-            time_since_last_call = current_time - self._last_kraken_balance_call
-            if time_since_last_call < self.KRAKEN_BALANCE_CALL_DELAY:
-                delay = self.KRAKEN_BALANCE_CALL_DELAY - time_since_last_call
-                logger.debug(f"Kraken rate limit: waiting {delay:.2f}s before balance call")
-                time.sleep(delay)  # Intentional blocking for Kraken rate limiting
-
-            self._last_kraken_balance_call = time.time()
-
-        # Fetch balance from broker API with a hard timeout so a slow or hung
-        # Kraken connection never blocks the entire trading cycle.
-        # Non-daemon thread so the API call can complete cleanly on shutdown.
-        result_queue: queue.Queue = queue.Queue()
+        return self._get_balance_service().get(
+            (account_type, account_id, broker_type.value),
+            broker_type.value,
+            self._balance_fetcher(broker),
+        )
 
-        def _fetch():
-            try:
-                result_queue.put((True, broker.get_account_balance()))
-            except Exception as _e:
-                result_queue.put((False, _e))
-
-        fetch_thread = threading.Thread(target=_fetch, daemon=False)
-        fetch_thread.start()
-        fetch_thread.join(self.BALANCE_FETCH_TIMEOUT)
-
-        if fetch_thread.is_alive():
-            # Timed out — use any cached balance (stale or otherwise) as fallback.
-            # The conditional only controls which warning message is emitted;
-            # the balance is returned unconditionally.  Only return 0.0 if no cache exists.
-            logger.warning(
-                f"Balance fetch timed out after {self.BALANCE_FETCH_TIMEOUT:.0f}s "
-                f"for {account_type} {account_id} on {broker_type.value}"
-            )
-            if cache_key in self._balance_cache:
-                _stale_bal, _stale_ts = self._balance_cache[cache_key]
-                _stale_age = current_time - _stale_ts
-                if _stale_age <= self.BALANCE_STALE_FALLBACK_AGE:
-                    logger.warning(
-                        f"Using stale cached balance ${_stale_bal:.2f} "
-                        f"(age {_stale_age:.0f}s) for {account_type} {account_id}"
-                    )
-                else:
-                    logger.warning(
-                        f"Cached balance is very old ({_stale_age:.0f}s > "
-                        f"{self.BALANCE_STALE_FALLBACK_AGE:.0f}s) for {account_type} {account_id}"
-                        f" — using stale balance as last resort (grace mode)"
-                    )
-                return _stale_bal  # Always return cached value — 0.0 only if no cache
-            # No cache at all — nothing to fall back to
-            logger.error(
-                f"No cached balance available for {account_type} {account_id} on "
-                f"{broker_type.value}; returning 0"
-            )
-            return 0.0
+    def refresh_all_balances(
+        self,
+        include_users: bool = True,
+        timeout: Optional[float] = None,
+        max_age: Optional[float] = None,
+    ) -> Dict[Tuple[str, str, str], Optional[float]]:
+        """
+        Refresh every connected platform (and optionally user) balance in parallel.
 
-        try:
-            success, value = result_queue.get_nowait()
-        except queue.Empty:
-            success, value = False, Exception("No result in queue after thread join")
+        Venues are fetched concurrently; each venue keeps its own rate limit,
+        so Kraken accounts are still paced KRAKEN_BALANCE_CALL_DELAY apart.
+        With max_age, balances fetched more recently than that are reused;
+        timeout=0 only queues the refresh (pre-warm) and returns at once.
 
-        if not success:
-            logger.error(
-                f"Balance fetch raised exception for {account_type} {account_id}: {value}"
+        Returns:
+            {(account_type, account_id, broker): balance or None if never fetched}
+        """
+        items = [
+            (("platform", "platform", broker_type.value), broker_type.value, self._balance_fetcher(broker))
+            for broker_type, broker in self._platform_brokers.items()
+            if broker.connected
+        ]
+        if include_users:
+            items.extend(
+                (("user", user_id, broker_type.value), broker_type.value, self._balance_fetcher(broker))
+                for user_id, user_broker_dict in self.user_brokers.items()
+                for broker_type, broker in user_broker_dict.items()
+                if broker.connected
             )
-            # Fall back to stale cache on exception too.  Any cached value is
-            # returned unconditionally — the conditional only controls whether an
-            # extra "very old" warning is emitted.  Only return 0.0 if no cache exists.
-            if cache_key in self._balance_cache:
-                _stale_bal, _stale_ts = self._balance_cache[cache_key]
-                _stale_age = current_time - _stale_ts
-                if _stale_age > self.BALANCE_STALE_FALLBACK_AGE:
-                    logger.warning(
-                        f"Cached balance is very old ({_stale_age:.0f}s) for "
-                        f"{account_type} {account_id} — using stale balance as last resort (grace mode)"
-                    )
-                else:
-                    logger.warning(
-                        f"Using stale cached balance ${_stale_bal:.2f} "
-                        f"(age {_stale_age:.0f}s) for {account_type} {account_id}"
-                    )
-                return _stale_bal  # Always return cached value — 0.0 only if no cache
-            return 0.0
+        return self._get_balance_service().refresh_all(items, timeout=timeout, max_age=max_age)
 
-        balance = self._normalize_balance_value(value)
-
-        # Cache the result
-        self._balance_cache[cache_key] = (balance, time.time())
-        logger.debug(f"Cached fresh balance for {account_type} {account_id} on {broker_type.value}: ${balance:.2f}")
-
-        return balance
+    def get_balance_freshness(self) -> Dict[str, Any]:
+        """Per-account balance freshness / fetch latency and per-venue latency percentiles."""
+        return self._get_balance_service().metrics()
 
     def clear_balance_cache(self):
         """
@@ -4499,8 +4462,13 @@ class MultiAccountBrokerManager:
 
         Call this at the start of each trading cycle to force fresh balance fetches.
         This ensures balances are updated once per cycle but not more frequently.
+        Cached values are kept only as the fallback if the fresh fetch fails.
+        The refresh of every connected account is queued on the pool right
+        away, so later reads wait on those parallel fetches instead of each
+        starting its own.
         """
-        self._balance_cache.clear()
+        self._get_balance_service().invalidate()
+        self.refresh_all_balances(timeout=0)
         logger.debug("Balance cache cleared for new trading cycle")
 
     def try_reconnect_platform_broker(self, broker_type: BrokerType) -> bool:
@@ -4605,7 +4573,14 @@ class MultiAccountBrokerManager:
         return total
 
     def get_aggregated_balance_breakdown(self, include_all_subaccounts: bool = True) -> Dict[str, Any]:
-        """Return cross-broker aggregated balance details for diagnostics and risk gates."""
+        """
+        Return cross-broker aggregated balance details for diagnostics and risk gates.
+
+        All accounts are read from one refresh_all_balances() pass: balances
+        older than BALANCE_CACHE_TTL are refetched in parallel across venues
+        (bounded by BALANCE_FETCH_TIMEOUT), the rest come from the cache.
+        An account with no balance yet counts as 0.0.
+        """
         breakdown: Dict[str, Any] = {
             "mode": BALANCE_MODE,
             "account_mode": ACCOUNT_MODE_SETTING,
@@ -4634,19 +4609,13 @@ class MultiAccountBrokerManager:
             else:
                 breakdown["other"] += amount
 
+        balances = self.refresh_all_balances(
+            include_users=include_all_subaccounts, max_age=self.BALANCE_CACHE_TTL
+        )
         for broker_type, broker in self._platform_brokers.items():
             if not broker.connected:
                 continue
-            try:
-                if broker_type == BrokerType.KRAKEN:
-                    balance = self._normalize_balance_value(
-                        self._get_cached_balance('platform', 'platform', broker_type, broker)
-                    )
-                else:
-                    balance = self._normalize_balance_value(broker.get_account_balance())
-            except Exception as exc:
-                logger.debug("Failed platform balance for %s: %s", broker_type.value, exc)
-                balance = 0.0
+            balance = balances.get(('platform', 'platform', broker_type.value)) or 0.0
 
             breakdown["platform_total"] += balance
             _add_bucket(broker_type, balance, is_user=False)
@@ -4661,16 +4630,7 @@ class MultiAccountBrokerManager:
                 for broker_type, broker in user_broker_dict.items():
                     if not broker.connected:
                         continue
-                    try:
-                        if broker_type == BrokerType.KRAKEN:
-                            balance = self._normalize_balance_value(
-                                self._get_cached_balance('user', user_id, broker_type, broker)
-                            )
-                        else:
-                            balance = self._normalize_balance_value(broker.get_account_balance())
-                    except Exception as exc:
-                        logger.debug("Failed user balance for %s/%s: %s", user_id, broker_type.value, exc)
-                        balance = 0.0
+                    balance = balances.get(('user', user_id, broker_type.value)) or 0.0
 
                     breakdown["user_total"] += balance
                     _add_bucket(broker_type, balance, is_user=True)
@@ -4684,6 +4644,7 @@ class MultiAccountBrokerManager:
         breakdown["total_balance"] = breakdown["platform_total"] + (
             breakdown["user_total"] if include_all_subaccounts else 0.0
         )
+        breakdown["balance_freshness"] = self.get_balance_freshness()
         return breakdown
 
     def get_platform_total_balance(self, include_all_subaccounts: bool = True) -> float:
@@ -0,0 +1,338 @@
+"""Incremental multi-timeframe bar aggregator.
+
+``check_multi_timeframe_rsi_agreement`` used to ``resample`` the whole 1m
+frame to every higher timeframe and recompute RSI from scratch on every
+scan, although only the last 1m bar had changed.  ``MultiTimeframeAggregator``
+keeps, per symbol and timeframe:
+
+* the **open bar** — aggregated from the 1m bars seen so far in the current
+  bucket; the newest 1m bar stays replaceable, so re-reading an in-progress
+  candle on the next scan updates it instead of double-counting it;
+* the **sealed bars** — closed when a 1m bar from the next bucket arrives;
+* **RSI and EMA state** — the last ``rsi_period`` close-to-close deltas and
+  the sealed EMA values.  The value for the open bar is derived from that
+  state and the open bar's close in O(period), matching what
+  ``calculate_rsi`` / ``ewm(adjust=False)`` return for the last row of the
+  resampled frame.
+
+A multi-timeframe check is then a dictionary lookup (:meth:`snapshot`)
+after :meth:`sync` has fed the one or two new rows of the scan's frame.
+
+RSI follows ``indicators.calculate_rsi`` (simple moving averages of gains
+and losses, forward-filled, 50 before warm-up), so its last value depends
+only on the last ``rsi_period + 1`` bars and is identical to the resampled
+computation whenever the frame spans that many bars.  EMA depends on the
+whole history and is seeded by the first bar this aggregator saw for the
+symbol.  Buckets are aligned to the Unix epoch, which matches pandas'
+``resample`` bins for timeframes that divide a day (1m … 4h, 1d).
+
+Environment variables (all optional, safe defaults provided):
+    NIJA_MTF_MAX_SYMBOLS   – symbols kept before the least recently synced is
+                             evicted (default 500)
+
+Author: NIJA Trading Systems
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("nija.multi_timeframe_aggregator")
+
+DEFAULT_TIMEFRAMES = ("1min", "5min", "15min")
+DEFAULT_EMA_SPANS = (9, 21)
+# Sealed bar start times kept per timeframe (bar counting for warm-up checks).
+_START_HISTORY = 64
+
+_OHLCV = ["open", "high", "low", "close", "volume"]
+
+
+def _timeframe_seconds(timeframe: str) -> float:
+    seconds = pd.Timedelta(timeframe).total_seconds()
+    if seconds <= 0:
+        raise ValueError(f"invalid timeframe: {timeframe!r}")
+    return seconds
+
+
+def _rsi_from_deltas(deltas: Sequence[float], period: int) -> float:
+    """``calculate_rsi`` for the bar whose *period* trailing deltas are given (NaN when undefined)."""
+    if len(deltas) < period:
+        return math.nan
+    gain = sum(d for d in deltas if d > 0) / period
+    loss = -sum(d for d in deltas if d < 0) / period
+    if loss == 0.0:
+        return math.nan if gain == 0.0 else 100.0
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+class _TimeframeState:
+    """Open bar plus rolling RSI/EMA state for one symbol on one timeframe."""
+
+    __slots__ = (
+        "seconds", "period", "alphas", "open_start", "base", "latest",
+        "last_close", "deltas", "rsi", "ema", "starts", "sealed",
+    )
+
+    def __init__(self, seconds: float, period: int, spans: Iterable[int]) -> None:
+        self.seconds = seconds
+        self.period = period
+        self.alphas = {span: 2.0 / (span + 1.0) for span in spans}
+        self.open_start: Optional[float] = None
+        self.base: Optional[List[float]] = None     # folded 1m bars of the open bar
+        self.latest: Optional[List[float]] = None   # newest 1m bar (replaceable)
+        self.last_close: Optional[float] = None     # close of the last sealed bar
+        self.deltas: Deque[float] = deque(maxlen=period)
+        self.rsi: Optional[float] = None            # forward-filled RSI of the last sealed bar
+        self.ema: Dict[int, float] = {}
+        self.starts: Deque[float] = deque(maxlen=_START_HISTORY)
+        self.sealed = 0
+
+    def open_bar(self) -> Optional[List[float]]:
+        if self.latest is None:
+            return None
+        if self.base is None:
+            return list(self.latest)
+        o, h, l, _, v = self.base
+        lo, lh, ll, lc, lv = self.latest
+        return [o, max(h, lh), min(l, ll), lc, v + lv]
+
+    def add(self, ts: float, row: List[float], replace: bool) -> None:
+        start = math.floor(ts / self.seconds) * self.seconds
+        if replace:
+            self.latest = row
+            return
+        if self.open_start is not None and start != self.open_start:
+            self._seal()
+        elif self.latest is not None:
+            self.base = self.open_bar()
+        if self.open_start is None or start != self.open_start:
+            self.open_start = start
+            self.base = None
+        self.latest = row
+
+    def _seal(self) -> None:
+        close = self.open_bar()[3]
+        if self.last_close is not None:
+            self.deltas.append(close - self.last_close)
+            value = _rsi_from_deltas(self.deltas, self.period)
+            if not math.isnan(value):
+                self.rsi = value
+        for span, alpha in self.alphas.items():
+            prev = self.ema.get(span)
+            self.ema[span] = close if prev is None else prev + alpha * (close - prev)
+        self.last_close = close
+        self.starts.append(self.open_start)
+        self.sealed += 1
+
+    def current_rsi(self) -> float:
+        if self.latest is None:
+            return 50.0
+        value = math.nan
+        if self.last_close is not None:
+            window = list(self.deltas)[1:] if len(self.deltas) == self.period else list(self.deltas)
+            window.append(self.latest[3] - self.last_close)
+            value = _rsi_from_deltas(window, self.period)
+        if math.isnan(value):
+            return self.rsi if self.rsi is not None else 50.0
+        return value
+
+    def current_ema(self, span: int) -> Optional[float]:
+        if self.latest is None:
+            return None
+        prev = self.ema.get(span)
+        close = self.latest[3]
+        return close if prev is None else prev + self.alphas[span] * (close - prev)
+
+    def bars_since(self, ts: float) -> int:
+        """Bars (sealed + open) whose bucket starts at or after the bucket of *ts*."""
+        if self.latest is None:
+            return 0
+        first = math.floor(ts / self.seconds) * self.seconds
+        count = 1
+        for start in reversed(self.starts):
+            if start < first:
+                break
+            count += 1
+        return count
+
+
+class _SymbolState:
+    __slots__ = ("last_ts", "frames")
+
+    def __init__(self, frames: Dict[str, _TimeframeState]) -> None:
+        self.last_ts: Optional[float] = None
+        self.frames = frames
+
+
+class MultiTimeframeAggregator:
+    """Per-symbol open/sealed higher-timeframe bars with cached RSI and EMA."""
+
+    def __init__(
+        self,
+        timeframes: Sequence[str] = DEFAULT_TIMEFRAMES,
+        rsi_period: int = 14,
+        ema_spans: Sequence[int] = DEFAULT_EMA_SPANS,
+        max_symbols: Optional[int] = None,
+    ) -> None:
+        self.timeframes = tuple(timeframes)
+        self.rsi_period = int(rsi_period)
+        self.ema_spans = tuple(int(s) for s in ema_spans)
+        if max_symbols is None:
+            try:
+                max_symbols = int(os.getenv("NIJA_MTF_MAX_SYMBOLS", "500"))
+            except ValueError:
+                max_symbols = 500
+        self.max_symbols = max(1, max_symbols)
+        self._seconds = {tf: _timeframe_seconds(tf) for tf in self.timeframes}
+        self._symbols: "OrderedDict[str, _SymbolState]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {"rows": 0, "resets": 0, "evictions": 0}
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    def _new_symbol(self, symbol: str) -> _SymbolState:
+        state = _SymbolState({
+            tf: _TimeframeState(seconds, self.rsi_period, self.ema_spans)
+            for tf, seconds in self._seconds.items()
+        })
+        self._symbols[symbol] = state
+        while len(self._symbols) > self.max_symbols:
+            self._symbols.popitem(last=False)
+            self._stats["evictions"] += 1
+        return state
+
+    def _ingest(self, state: _SymbolState, ts: float, row: List[float]) -> bool:
+        if state.last_ts is not None and ts < state.last_ts:
+            return False
+        replace = state.last_ts is not None and ts == state.last_ts
+        for frame in state.frames.values():
+            frame.add(ts, row, replace)
+        state.last_ts = ts
+        self._stats["rows"] += 1
+        return True
+
+    def update(self, symbol: str, timestamp: float, open_: float, high: float,
+               low: float, close: float, volume: float = 0.0) -> bool:
+        """Feed one base (1m) bar; a repeated *timestamp* replaces the previous bar.
+
+        Returns False (and ignores the bar) when it is older than the last one.
+        """
+        with self._lock:
+            state = self._symbols.get(symbol) or self._new_symbol(symbol)
+            self._symbols.move_to_end(symbol)
+            return self._ingest(state, float(timestamp),
+                                [float(open_), float(high), float(low), float(close), float(volume)])
+
+    def on_bar(self, bar) -> None:
+        """``MarketDataEngine`` subscriber for a 1m bar feed."""
+        self.update(bar.symbol, bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume)
+
+    def sync(self, symbol: str, df: pd.DataFrame) -> bool:
+        """Bring *symbol* up to date with a base-timeframe OHLCV frame.
+
+        Only rows at or after the last ingested timestamp are fed (the last
+        one may be an in-progress candle that changed since the previous
+        scan).  A frame that ends before the ingested history rebuilds the
+        symbol from the frame.  Returns False when *df* cannot be used
+        (no DatetimeIndex, missing columns, empty).
+        """
+        if not isinstance(df.index, pd.DatetimeIndex) or len(df) == 0:
+            return False
+        if any(col not in df.columns for col in _OHLCV):
+            return False
+        stamps = df.index.asi8 / 1e9
+        with self._lock:
+            state = self._symbols.get(symbol)
+            if state is not None and state.last_ts is not None and stamps[-1] < state.last_ts:
+                state = None
+                self._stats["resets"] += 1
+            if state is None:
+                state = self._new_symbol(symbol)
+                first = 0
+            else:
+                first = int(np.searchsorted(stamps, state.last_ts, side="left")) if state.last_ts is not None else 0
+            self._symbols.move_to_end(symbol)
+            if first >= len(stamps):
+                return True
+            rows = df[_OHLCV].iloc[first:]
+            if any(not pd.api.types.is_numeric_dtype(rows[col]) for col in _OHLCV):
+                rows = rows.apply(pd.to_numeric, errors="coerce")
+            values = rows.to_numpy(dtype=np.float64)
+            for ts, row in zip(stamps[first:].tolist(), values.tolist()):
+                if math.isnan(row[3]):
+                    continue
+                self._ingest(state, ts, row)
+            return True
+
+    def reset(self, symbol: Optional[str] = None) -> None:
+        with self._lock:
+            if symbol is None:
+                self._symbols.clear()
+            else:
+                self._symbols.pop(symbol, None)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _frame(self, symbol: str, timeframe: str) -> Optional[_TimeframeState]:
+        state = self._symbols.get(symbol)
+        return None if state is None else state.frames.get(timeframe)
+
+    def rsi(self, symbol: str, timeframe: str) -> Optional[float]:
+        with self._lock:
+            frame = self._frame(symbol, timeframe)
+            return None if frame is None or frame.latest is None else frame.current_rsi()
+
+    def ema(self, symbol: str, timeframe: str, span: int) -> Optional[float]:
+        with self._lock:
+            frame = self._frame(symbol, timeframe)
+            return None if frame is None or span not in frame.alphas else frame.current_ema(span)
+
+    def bars_since(self, symbol: str, timeframe: str, timestamp: float) -> int:
+        with self._lock:
+            frame = self._frame(symbol, timeframe)
+            return 0 if frame is None else frame.bars_since(timestamp)
+
+    def snapshot(self, symbol: str, timeframe: str) -> Optional[Dict[str, object]]:
+        """Open bar, RSI and EMAs for *symbol* on *timeframe* (None if unknown)."""
+        with self._lock:
+            frame = self._frame(symbol, timeframe)
+            if frame is None or frame.latest is None:
+                return None
+            o, h, l, c, v = frame.open_bar()
+            return {
+                "bar_start": frame.open_start,
+                "open": o, "high": h, "low": l, "close": c, "volume": v,
+                "sealed_bars": frame.sealed,
+                "rsi": frame.current_rsi(),
+                "ema": {span: frame.current_ema(span) for span in frame.alphas},
+            }
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {"symbols": len(self._symbols), **self._stats}
+
+
+_AGGREGATOR: Optional[MultiTimeframeAggregator] = None
+_AGGREGATOR_LOCK = threading.Lock()
+
+
+def get_multi_timeframe_aggregator() -> MultiTimeframeAggregator:
+    """Process-wide aggregator (1m base; 1m/5m/15m, RSI 14, EMA 9/21)."""
+    global _AGGREGATOR
+    if _AGGREGATOR is None:
+        with _AGGREGATOR_LOCK:
+            if _AGGREGATOR is None:
+                _AGGREGATOR = MultiTimeframeAggregator()
+    return _AGGREGATOR
@@ -2882,12 +2882,16 @@ class NIJAApexStrategyV71:
 
         return False, 'No exit conditions met'
 
-    def calculate_indicators(self, df: pd.DataFrame) -> Dict:
+    def calculate_indicators(self, df: pd.DataFrame, incremental: Any = None) -> Dict:
         """
         Calculate all required indicators
 
         Args:
             df: Price DataFrame with columns: open, high, low, close, volume
+            incremental: Optional per-symbol ``IncrementalIndicators`` engine.
+                When given, VWAP, EMA 9/21/50, RSI-14, MACD, ATR and ADX come
+                from ``incremental.sync(df)``, which folds in only the bars not
+                seen on the previous call.
 
         Returns:
             Dictionary of indicators
@@ -2907,25 +2911,41 @@ class NIJAApexStrategyV71:
         except Exception as e:
             logger.warning(f"Failed to normalize candle types before indicators: {e}")
             return {}
-        indicators = {
-            'vwap': calculate_vwap(df),
-            'ema_9': calculate_ema(df, 9),
-            'ema_21': calculate_ema(df, 21),
-            'ema_50': calculate_ema(df, 50),
-            'rsi': calculate_rsi(df, 14),
-            'rsi_9': calculate_rsi(df, 9),   # short-term momentum pulse for dual-RSI scoring
-        }
+        snapshot = None
+        if incremental is not None and not df[required_cols].isna().to_numpy().any():
+            # The pandas path drops NaN rows first, so only clean frames are fed.
+            try:
+                snapshot = incremental.sync(df)
+            except Exception as e:
+                logger.debug(f"Incremental indicators failed, recomputing: {e}")
+        if snapshot is not None and snapshot.get('rsi') is not None:
+            indicators = {
+                key: snapshot[key]
+                for key in ('vwap', 'ema_9', 'ema_21', 'ema_50', 'rsi',
+                            'macd_line', 'signal_line', 'histogram',
+                            'atr', 'adx', 'plus_di', 'minus_di')
+            }
+            indicators['rsi_9'] = calculate_rsi(df, 9)
+        else:
+            indicators = {
+                'vwap': calculate_vwap(df),
+                'ema_9': calculate_ema(df, 9),
+                'ema_21': calculate_ema(df, 21),
+                'ema_50': calculate_ema(df, 50),
+                'rsi': calculate_rsi(df, 14),
+                'rsi_9': calculate_rsi(df, 9),   # short-term momentum pulse for dual-RSI scoring
+            }
 
-        macd_line, signal_line, histogram = calculate_macd(df)
-        indicators['macd_line'] = macd_line
-        indicators['signal_line'] = signal_line
-        indicators['histogram'] = histogram
+            macd_line, signal_line, histogram = calculate_macd(df)
+            indicators['macd_line'] = macd_line
+            indicators['signal_line'] = signal_line
+            indicators['histogram'] = histogram
 
-        indicators['atr'] = calculate_atr(df, 14)
-        adx, plus_di, minus_di = calculate_adx(df, 14)
-        indicators['adx'] = adx
-        indicators['plus_di'] = plus_di
-        indicators['minus_di'] = minus_di
+            indicators['atr'] = calculate_atr(df, 14)
+            adx, plus_di, minus_di = calculate_adx(df, 14)
+            indicators['adx'] = adx
+            indicators['plus_di'] = plus_di
+            indicators['minus_di'] = minus_di
 
         # Calculate Bollinger Bands for volatility-based adaptive profit targets.
         # AGGRESSIVE: std_dev reduced from 2.0 (conventional 95%-capture) → 1.4 so the
@@ -28,6 +28,10 @@ Design goals
   each cycle; the loop caller reads ``next_interval`` to sleep appropriately
 - **Drop-in** — ``NijaCoreLoop`` wraps the existing ``NIJAApexStrategyV71``
   and ``TradingStrategy`` objects; no existing logic is deleted
+- **Profiled** — every ``run_scan_phase`` call is a cycle on
+  :mod:`cycle_profiler` with spans for each phase, phase-3 stage
+  (fetch / indicators / AI scoring / gates / execution) and broker candle
+  call; p50/p95/p99 are served at ``/api/cycle-profile``
 
 Usage
 -----
@@ -49,6 +53,9 @@ Date: March 2026
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import inspect
 import logging
 import os
 import queue
@@ -111,6 +118,133 @@ except ImportError:
         BrokerScanTask = None  # type: ignore[assignment,misc]
         _get_broker_worker_pool = None  # type: ignore[assignment]
 
+# ── Shared candle cache (same-cycle reuse + delta fetching for _fetch_df) ─────
+try:
+    from bot.candle_cache import (
+        broker_cache_key as _broker_cache_key,
+        candle_cache_enabled as _candle_cache_enabled,
+        get_candle_cache as _get_candle_cache,
+    )
+    _CANDLE_CACHE_AVAILABLE = True
+except ImportError:
+    try:
+        from candle_cache import (  # type: ignore[import]
+            broker_cache_key as _broker_cache_key,
+            candle_cache_enabled as _candle_cache_enabled,
+            get_candle_cache as _get_candle_cache,
+        )
+        _CANDLE_CACHE_AVAILABLE = True
+    except ImportError:
+        _CANDLE_CACHE_AVAILABLE = False
+        _broker_cache_key = None  # type: ignore[assignment]
+        _candle_cache_enabled = None  # type: ignore[assignment]
+        _get_candle_cache = None  # type: ignore[assignment]
+
+# Candle window requested per symbol by _fetch_df.
+_CANDLE_WINDOW = 200
+
+# ── Incremental per-(broker, symbol) indicators for the phase-3 scan ──────────
+try:
+    from bot.incremental_indicators import (
+        get_incremental_indicators as _get_incremental_indicators,
+        incremental_indicators_enabled as _incremental_indicators_enabled,
+    )
+    _INCREMENTAL_INDICATORS_AVAILABLE = True
+except ImportError:
+    try:
+        from incremental_indicators import (  # type: ignore[import]
+            get_incremental_indicators as _get_incremental_indicators,
+            incremental_indicators_enabled as _incremental_indicators_enabled,
+        )
+        _INCREMENTAL_INDICATORS_AVAILABLE = True
+    except ImportError:
+        _INCREMENTAL_INDICATORS_AVAILABLE = False
+        _get_incremental_indicators = None  # type: ignore[assignment]
+        _incremental_indicators_enabled = None  # type: ignore[assignment]
+
+# ── Pipelined phase-3 scan (prefetch candles on the OHLC worker pool) ─────────
+try:
+    from bot.pipelined_scan import (
+        PipelinedScan,
+        pipelined_scan_enabled as _pipelined_scan_enabled,
+    )
+    _PIPELINED_SCAN_AVAILABLE = True
+except ImportError:
+    try:
+        from pipelined_scan import (  # type: ignore[import]
+            PipelinedScan,
+            pipelined_scan_enabled as _pipelined_scan_enabled,
+        )
+        _PIPELINED_SCAN_AVAILABLE = True
+    except ImportError:
+        _PIPELINED_SCAN_AVAILABLE = False
+        PipelinedScan = None  # type: ignore[assignment,misc]
+        _pipelined_scan_enabled = None  # type: ignore[assignment]
+
+# ── Per-cycle span profiler (phase / broker-call timings for the dashboard) ───
+try:
+    from bot.cycle_profiler import get_cycle_profiler as _get_cycle_profiler
+except ImportError:
+    try:
+        from cycle_profiler import get_cycle_profiler as _get_cycle_profiler  # type: ignore[import]
+    except ImportError:
+        _get_cycle_profiler = None  # type: ignore[assignment]
+
+
+def _profile_span(name: str) -> Any:
+    """Time a block under *name* on the cycle profiler (no-op when unavailable)."""
+    if _get_cycle_profiler is None:
+        return contextlib.nullcontext()
+    return _get_cycle_profiler().span(name)
+
+
+def _profiled_cycle(fn: Any) -> Any:
+    """Record every call of *fn* as one cycle on the cycle profiler."""
+    @functools.wraps(fn)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _get_cycle_profiler is None:
+            return fn(*args, **kwargs)
+        with _get_cycle_profiler().cycle():
+            return fn(*args, **kwargs)
+    return _wrapper
+
+
+def _candle_cache_cycle(fn: Any) -> Any:
+    """Run *fn* (``run_scan_phase``) inside one candle-cache cycle for its venue.
+
+    Every ``_fetch_df`` call during the scan (phase 2, phase 3, selection
+    re-fetch, forced entry) shares one fetch per symbol.  The cycle is closed
+    when the scan returns or raises, so fetches made between scans fall back
+    to the cache's short TTL instead of the last scan's candles.
+    """
+    @functools.wraps(fn)
+    def _wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        broker = kwargs["broker"] if "broker" in kwargs else (args[0] if args else None)
+        if broker is None:
+            broker = getattr(getattr(self, "apex", None), "broker_client", None)
+        if not _CANDLE_CACHE_AVAILABLE or broker is None:
+            return fn(self, *args, **kwargs)
+        try:
+            cache = _get_candle_cache()
+            cache_key = _broker_cache_key(broker)
+            token = cache.begin_cycle(cache_key)
+        except Exception as _cc_err:
+            logger.debug("candle cache begin_cycle failed: %s", _cc_err)
+            return fn(self, *args, **kwargs)
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            cache.end_cycle(cache_key, token)
+    return _wrapper
+
+
+def _accepts_incremental(calculate: Any) -> bool:
+    """Whether a strategy's ``calculate_indicators`` takes an ``incremental`` engine."""
+    try:
+        return "incremental" in inspect.signature(calculate).parameters
+    except (TypeError, ValueError):
+        return False
+
 
 def _extract_cached_balance_for_log(broker: Any) -> float:
     """Return a broker balance for diagnostics without making exchange API calls."""
@@ -1048,6 +1182,10 @@ class NijaCoreLoop:
         Hard cap on concurrent open positions.
     """
 
+    # _fetch_df goes through bot/candle_cache.py; external TTL wrappers
+    # (phase3_execution_handoff_repair_patch) check this and stand down.
+    _FETCH_DF_NATIVE_CANDLE_CACHE = True
+
     def __init__(self, apex_strategy: Any, max_positions: int = 5) -> None:
         self.apex = apex_strategy
         self.max_positions = max_positions
@@ -1060,6 +1198,10 @@ class NijaCoreLoop:
         # the progressive relaxation mechanism — see FORCED_ENTRY_STREAK_THRESHOLD).
         self._zero_signal_streak: int = 0
 
+        # PipelinedScan.stats() of the most recent pipelined phase-3 scan
+        # (None until NIJA_PIPELINED_SCAN_ENABLED has been used).
+        self._last_scan_pipeline_stats: Optional[Dict[str, Any]] = None
+
         # ── Session-level execution KPI counters ─────────────────────────────
         # Incremented at each emit_cycle_trace call so the periodic summary
         # reflects exact outcome distribution since startup.
@@ -1378,6 +1520,8 @@ class NijaCoreLoop:
     # Public API
     # ------------------------------------------------------------------
 
+    @_profiled_cycle
+    @_candle_cache_cycle
     def run_scan_phase(
         self,
         broker: Any,
@@ -1405,6 +1549,9 @@ class NijaCoreLoop:
         Returns
         -------
         CoreLoopResult with entries taken, next recommended interval, etc.
+
+        The whole call is recorded as one cycle on the cycle profiler (see
+        :mod:`cycle_profiler`), with per-phase and per-broker-call spans.
         """
         _authority_ok, _authority_reason = _require_exact_runtime_cycle_authority(
             "nija_core_loop.run_scan_phase"
@@ -1722,7 +1869,8 @@ class NijaCoreLoop:
 
         # ── Phase 1: Safety gate ──────────────────────────────────────────
         _stage_start = time.time()
-        can_enter, safety_reason = self._phase1_safety(broker, snapshot)
+        with _profile_span("phase1.safety"):
+            can_enter, safety_reason = self._phase1_safety(broker, snapshot)
         self._log_pipeline_stage(
             "risk_governor",
             "passed" if can_enter else "failed",
@@ -1735,7 +1883,8 @@ class NijaCoreLoop:
 
         # ── Phase 2: Position management ─────────────────────────────────
         _stage_start = time.time()
-        exits = self._phase2_manage_positions(broker, snapshot)
+        with _profile_span("phase2.positions"):
+            exits = self._phase2_manage_positions(broker, snapshot)
         self._log_pipeline_stage(
             "position_monitor",
             "passed",
@@ -1876,13 +2025,14 @@ class NijaCoreLoop:
                     user_mode, not can_enter, _md_healthy,
                 )
                 _stage_start = time.time()
-                entries, blocked, scored, _gate_rejections = self._phase3_scan_and_enter(
-                    broker=broker,
-                    snapshot=snapshot,
-                    symbols=symbols,
-                    available_slots=available_slots,
-                    zero_signal_streak=self._zero_signal_streak,
-                )
+                with _profile_span("phase3"):
+                    entries, blocked, scored, _gate_rejections = self._phase3_scan_and_enter(
+                        broker=broker,
+                        snapshot=snapshot,
+                        symbols=symbols,
+                        available_slots=available_slots,
+                        zero_signal_streak=self._zero_signal_streak,
+                    )
                 self._log_pipeline_stage(
                     "signal_generator",
                     "passed" if scored > 0 else "failed",
@@ -2467,6 +2617,26 @@ class NijaCoreLoop:
     # Phase 3: Scan, score, rank, enter
     # ------------------------------------------------------------------
 
+    def _scan_indicators(self, broker: Any, symbol: str, df: pd.DataFrame) -> Dict:
+        """Indicators for one scanned symbol.
+
+        The strategy is handed the symbol's incremental engine, keyed by
+        ``(broker, symbol)``, so only bars added since the previous scan are
+        folded in.  Strategies without an ``incremental`` parameter, or with
+        ``NIJA_INCREMENTAL_INDICATORS_ENABLED=false``, get the full pandas
+        computation as before.
+        """
+        calculate = self.apex.calculate_indicators
+        if not (
+            _INCREMENTAL_INDICATORS_AVAILABLE
+            and _incremental_indicators_enabled()
+            and _accepts_incremental(calculate)
+        ):
+            return calculate(df)
+        venue = _broker_cache_key(broker) if _CANDLE_CACHE_AVAILABLE else type(broker).__name__.lower()
+        engine = _get_incremental_indicators(symbol, broker=venue, window=_CANDLE_WINDOW)
+        return calculate(df, incremental=engine)
+
     def _phase3_scan_and_enter(
         self,
         broker: Any,
@@ -2694,7 +2864,10 @@ class NijaCoreLoop:
             flush=True,
         )
         funnel_traces: Dict[str, Dict[str, Tuple[str, str]]] = {}
-        for _symbol_idx, symbol in enumerate(symbols):
+        # When enabled, candle fetches run ahead on the OHLC worker pool and
+        # symbols arrive in completion order; ranking below is the barrier.
+        _scan_pipeline = self._build_scan_pipeline(broker, symbols)
+        for _symbol_idx, symbol in enumerate(_scan_pipeline if _scan_pipeline is not None else symbols):
             _funnel = funnel_traces.setdefault(symbol, {})
             # ── Per-symbol progress heartbeat (every 10 symbols) ─────────
             if _symbol_idx % 10 == 0:
@@ -2728,7 +2901,12 @@ class NijaCoreLoop:
                 if _sdd is not None:
                     _sdd.record_skip(symbol, "cap_reached")
                 _funnel.setdefault("signal", ("FAIL", "CAP_REACHED"))
-                for _remaining_symbol in symbols[_symbol_idx + 1:]:
+                _remaining_symbols = (
+                    _scan_pipeline.pending_symbols()
+                    if _scan_pipeline is not None
+                    else symbols[_symbol_idx + 1:]
+                )
+                for _remaining_symbol in _remaining_symbols:
                     _remaining_funnel = funnel_traces.setdefault(_remaining_symbol, {})
                     _remaining_funnel.setdefault("signal", ("FAIL", "CAP_REACHED"))
                 break
@@ -2749,7 +2927,11 @@ class NijaCoreLoop:
                     _liquidity_rejected += 1
                     self._record_reject("DATA_TIMEOUT_OR_EMPTY")
                     continue
-                df = self._fetch_df(broker, symbol)
+                with _profile_span("phase3.fetch"):
+                    if _scan_pipeline is not None and _scan_pipeline.has_frame(symbol):
+                        df = _scan_pipeline.pop(symbol)
+                    else:
+                        df = self._fetch_df(broker, symbol)
                 _df_len = len(df) if df is not None else 0
                 # Minimum candle requirement: lowered from 100 → 50 so symbols
                 # with shorter history still get scored.  Indicators need at
@@ -2957,7 +3139,8 @@ class NijaCoreLoop:
                     except Exception:
                         pass
 
-                indicators = self.apex.calculate_indicators(df)
+                with _profile_span("phase3.indicators"):
+                    indicators = self._scan_indicators(broker, symbol, df)
                 if not indicators:
                     if _sdd is not None:
                         _sdd.record_skip(symbol, "indicators_failed")
@@ -2974,10 +3157,11 @@ class NijaCoreLoop:
 
                 # Determine trend from apex market filter
                 try:
-                    allow, trend, market_reason = self.apex.check_market_filter(df, indicators)
-                    allow, trend, market_reason, *_market_filter_extra = self.apex.check_market_filter(
-                        df, indicators
-                    )
+                    with _profile_span("phase3.gates.market_filter"):
+                        allow, trend, market_reason = self.apex.check_market_filter(df, indicators)
+                        allow, trend, market_reason, *_market_filter_extra = self.apex.check_market_filter(
+                            df, indicators
+                        )
                     _market_filter_checks += 1
                     if not allow:
                         blocked += 1
@@ -3061,15 +3245,16 @@ class NijaCoreLoop:
                         _symbol_idx + 1,
                         len(symbols),
                     )
-                    sig = ai.evaluate_symbol(
-                        df=df,
-                        indicators=indicators,
-                        side=side,
-                        regime=snapshot.current_regime,
-                        broker=broker_name,
-                        entry_type=entry_type,
-                        symbol=symbol,
-                    )
+                    with _profile_span("phase3.ai_scoring"):
+                        sig = ai.evaluate_symbol(
+                            df=df,
+                            indicators=indicators,
+                            side=side,
+                            regime=snapshot.current_regime,
+                            broker=broker_name,
+                            entry_type=entry_type,
+                            symbol=symbol,
+                        )
                     if sig is not None:
                         self._log_pipeline_stage(
                             "ai_confidence",
@@ -3188,7 +3373,8 @@ class NijaCoreLoop:
                         "fallback for symbol=%s (ai=None, _AISignal=available)",
                         symbol,
                     )
-                    analysis = self.apex.analyze_market(df, symbol, snapshot.balance)
+                    with _profile_span("phase3.ai_scoring"):
+                        analysis = self.apex.analyze_market(df, symbol, snapshot.balance)
                     if analysis.get("action") in ("enter_long", "enter_short"):
                         _funnel["signal"] = ("PASS", "")
                         sig = _AISignal(
@@ -3270,6 +3456,25 @@ class NijaCoreLoop:
                 _funnel["signal"] = ("FAIL", f"SCORING_EXCEPTION:{sym_err}")
 
         # ── Signal generation loop complete ───────────────────────────────
+        _scan_deadline_missed = 0
+        if _scan_pipeline is not None:
+            _scan_pipeline.close()
+            _scan_deadline_missed = _scan_pipeline.deadline_missed
+            for _missed_symbol in _scan_pipeline.missed_symbols:
+                funnel_traces.setdefault(_missed_symbol, {}).setdefault(
+                    "market_data", ("FAIL", "SCAN_DEADLINE_MISSED")
+                )
+            _gate_rejections["scan_deadline_missed"] = _scan_deadline_missed
+            self._last_scan_pipeline_stats = _scan_pipeline.stats()
+            if _scan_deadline_missed:
+                logger.warning(
+                    "⏱️ [Phase3] SCAN_DEADLINE_MISSED — %d/%d symbols not fetched within %.0fs "
+                    "(they are skipped this cycle) | first=%s",
+                    _scan_deadline_missed,
+                    len(symbols),
+                    self._last_scan_pipeline_stats["deadline_s"],
+                    _scan_pipeline.missed_symbols[:5],
+                )
         _data_insuff_end = _gate_rejections.get("data_insufficient", 0)
         _indic_fail_end  = _gate_rejections.get("indicators_failed", 0)
         logger.critical(
@@ -3277,7 +3482,7 @@ class NijaCoreLoop:
             "symbols_total=%d scored=%d candidates=%d momentum_candidates=%d "
             "blocked=%d scoring_errors=%d data_insufficient=%d indicators_failed=%d "
             "data_attempts=%d data_successes=%d timeout_skipped=%d "
-            "liquidity_qualified=%d liquidity_rejected=%d",
+            "liquidity_qualified=%d liquidity_rejected=%d scan_deadline_missed=%d",
             len(symbols),
             scored,
             len(candidates),
@@ -3291,6 +3496,7 @@ class NijaCoreLoop:
             _data_skipped_timeout,
             _liquidity_qualified,
             _liquidity_rejected,
+            _scan_deadline_missed,
         )
         print(
             f"[NIJA-PRINT] SIGNAL_LOOP_END | symbols={len(symbols)} scored={scored} "
@@ -3299,7 +3505,8 @@ class NijaCoreLoop:
             f"data_insufficient={_data_insuff_end} indicators_failed={_indic_fail_end} "
             f"data_attempts={_data_attempts} data_successes={_data_successes} "
             f"timeout_skipped={_data_skipped_timeout} "
-            f"liquidity_qualified={_liquidity_qualified} liquidity_rejected={_liquidity_rejected}",
+            f"liquidity_qualified={_liquidity_qualified} liquidity_rejected={_liquidity_rejected} "
+            f"scan_deadline_missed={_scan_deadline_missed}",
             flush=True,
         )
         # Diagnose timeout-skipped symbols — visible even when some symbols scored OK
@@ -3878,31 +4085,32 @@ class NijaCoreLoop:
                 if _TPE_AVAILABLE and _get_tpe is not None:
                     _risk_stage_start = time.time()
                     try:
-                        _perm = _get_tpe().evaluate(
-                            symbol=sig.symbol,
-                            side=sig.side,
-                            ai_score=sig.composite_score,
-                            ai_threshold=sig.threshold_used,
-                            balance=snapshot.balance,
-                            regime=snapshot.current_regime,
-                            zero_signal_streak=zero_signal_streak,
-                            df=df,
-                            entry_type=getattr(sig, "entry_type", "swing"),
-                            broker=(
-                                self.apex._get_broker_name()
-                                if hasattr(self.apex, "_get_broker_name")
-                                else "coinbase"
-                            ),
-                            force_next_cycle=_force_this_cycle,
-                            dead_zone=_dead_zone,
-                            hard_bypass=(
-                                zero_signal_streak >= _effective_bypass_threshold
-                            ),
-                            volume_fallback=bool(
-                                sig.metadata.get("volume_fallback")
-                            ),
-                            metadata=sig.metadata,
-                        )
+                        with _profile_span("phase3.gates.trade_permission"):
+                            _perm = _get_tpe().evaluate(
+                                symbol=sig.symbol,
+                                side=sig.side,
+                                ai_score=sig.composite_score,
+                                ai_threshold=sig.threshold_used,
+                                balance=snapshot.balance,
+                                regime=snapshot.current_regime,
+                                zero_signal_streak=zero_signal_streak,
+                                df=df,
+                                entry_type=getattr(sig, "entry_type", "swing"),
+                                broker=(
+                                    self.apex._get_broker_name()
+                                    if hasattr(self.apex, "_get_broker_name")
+                                    else "coinbase"
+                                ),
+                                force_next_cycle=_force_this_cycle,
+                                dead_zone=_dead_zone,
+                                hard_bypass=(
+                                    zero_signal_streak >= _effective_bypass_threshold
+                                ),
+                                volume_fallback=bool(
+                                    sig.metadata.get("volume_fallback")
+                                ),
+                                metadata=sig.metadata,
+                            )
                         logger.info(
                             "🔑 [TPE_RESULT] symbol=%s decision=%s reason=%s",
                             sig.symbol,
@@ -4021,7 +4229,8 @@ class NijaCoreLoop:
                 )
                 _am_worker.start()
                 try:
-                    _am_kind, _am_payload = _am_result_q.get(timeout=_analysis_timeout)
+                    with _profile_span("phase3.analyze"):
+                        _am_kind, _am_payload = _am_result_q.get(timeout=_analysis_timeout)
                 except queue.Empty:
                     logger.warning(
                         "⏱️ [Phase3] analyze_market timed out after %.1fs for %s — "
@@ -4579,7 +4788,8 @@ class NijaCoreLoop:
                     f"side={sig.side} venue={_broker_name}",
                     flush=True,
                 )
-                success = self.apex.execute_action(analysis, sig.symbol)
+                with _profile_span("phase3.execution"):
+                    success = self.apex.execute_action(analysis, sig.symbol)
                 # Record orders_submitted AFTER execute_action returns so the counter
                 # only reflects exchange requests that were actually dispatched, not
                 # signals that were merely ready to submit.
@@ -5240,7 +5450,78 @@ class NijaCoreLoop:
             "competitive_profitability_policy": True,
         }
 
+    def _build_scan_pipeline(self, broker: Any, symbols: List[str]) -> Optional["PipelinedScan"]:
+        """
+        Return a :class:`PipelinedScan` prefetching *symbols* on the OHLC
+        worker pool, or ``None`` to keep the serial fetch-then-score loop.
+
+        Opt-in via ``NIJA_PIPELINED_SCAN_ENABLED``.  Quarantined symbols are
+        yielded without a fetch so the loop's quarantine branch still sees them.
+        """
+        if not _PIPELINED_SCAN_AVAILABLE or not _pipelined_scan_enabled() or len(symbols) < 2:
+            return None
+        try:
+            try:
+                from bot.ohlc_worker_pool import get_pool as _get_ohlc_pool  # type: ignore
+            except ImportError:
+                from ohlc_worker_pool import get_pool as _get_ohlc_pool  # type: ignore
+            pool = _get_ohlc_pool()
+        except Exception as exc:
+            logger.warning("⚠️ [Phase3] pipelined scan unavailable (%s) — scanning serially", exc)
+            return None
+
+        venue = str(getattr(getattr(broker, "broker_type", None), "value", "") or "").lower()
+        with _DATA_FAILURE_QUARANTINE_LOCK:
+            quarantined = {
+                sym for sym in symbols
+                if _DATA_FAILURE_QUARANTINE.get(f"{venue}:{sym}", 0) >= _DATA_FAILURE_QUARANTINE_THRESHOLD
+            }
+        return PipelinedScan(
+            pool,
+            symbols,
+            lambda sym: self._fetch_df(broker, sym),
+            key_prefix=f"scan:{venue or 'default'}:",
+            skip=quarantined,
+        )
+
     def _fetch_df(self, broker: Any, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Fetch the 1m OHLCV window for *symbol* through the shared candle cache.
+
+        Repeat calls for the same symbol within one ``run_scan_phase`` cycle
+        (position management, scan, selection re-fetch, forced entry) return
+        the same DataFrame without broker I/O; the next cycle only requests
+        the bars newer than the cached window (see :mod:`candle_cache`).
+        With ``NIJA_CANDLE_CACHE_ENABLED=false`` every call goes straight to
+        :meth:`_fetch_df_from_broker`.
+        """
+        _broker = broker if broker is not None else getattr(self.apex, "broker_client", None)
+        if not _CANDLE_CACHE_AVAILABLE or _broker is None or not _candle_cache_enabled():
+            return self._fetch_df_from_broker(broker, symbol)
+
+        def _fetch(count: int, min_rows: int) -> Optional[pd.DataFrame]:
+            if count >= _CANDLE_WINDOW:
+                return self._fetch_df_from_broker(_broker, symbol)
+            # Delta fetches fall back to a full window on failure, so a
+            # single attempt is enough.
+            return self._fetch_df_from_broker(
+                _broker, symbol, limit=count, min_rows=min_rows, max_retries=1
+            )
+
+        try:
+            return _get_candle_cache().get(_broker_cache_key(_broker), symbol, "1m", _fetch)
+        except Exception as exc:
+            logger.warning("⚠️ [_fetch_df] candle cache error for %s: %s — fetching directly", symbol, exc)
+            return self._fetch_df_from_broker(_broker, symbol)
+
+    def _fetch_df_from_broker(
+        self,
+        broker: Any,
+        symbol: str,
+        limit: int = _CANDLE_WINDOW,
+        min_rows: int = 10,
+        max_retries: Optional[int] = None,
+    ) -> Optional[pd.DataFrame]:
         """
         Fetch OHLCV DataFrame from the broker.
 
@@ -5265,6 +5546,8 @@ class NijaCoreLoop:
         except (TypeError, ValueError):
             _max_retries = 2
             _retry_delay_s = 1.0
+        if max_retries is not None:
+            _max_retries = max(1, int(max_retries))
 
         for _attempt in range(1, _max_retries + 1):
             try:
@@ -5279,11 +5562,11 @@ class NijaCoreLoop:
                     )
                     return None
                 call_plan = (
-                    ("get_candles", ((symbol,), {"limit": 200}), ((symbol, "1m", 200), {})),
-                    ("fetch_ohlcv", ((symbol,), {"limit": 200}), ((symbol, "1m", 200), {})),
-                    ("get_ohlcv", ((symbol,), {"limit": 200}), ((symbol, "1m", 200), {})),
-                    ("get_historical_data", ((symbol,), {"limit": 200}), ((symbol, "1m", 200), {})),
-                    ("get_market_data", ((symbol,), {"limit": 200}), ((symbol, "1m", 200), {})),
+                    ("get_candles", ((symbol,), {"limit": limit}), ((symbol, "1m", limit), {})),
+                    ("fetch_ohlcv", ((symbol,), {"limit": limit}), ((symbol, "1m", limit), {})),
+                    ("get_ohlcv", ((symbol,), {"limit": limit}), ((symbol, "1m", limit), {})),
+                    ("get_historical_data", ((symbol,), {"limit": limit}), ((symbol, "1m", limit), {})),
+                    ("get_market_data", ((symbol,), {"limit": limit}), ((symbol, "1m", limit), {})),
                 )
                 _tried_methods = []
                 for method_name, primary_call, fallback_call in call_plan:
@@ -5292,9 +5575,10 @@ class NijaCoreLoop:
                         continue
                     _tried_methods.append(method_name)
                     try:
-                        result = self._call_market_data_method(method, primary_call, fallback_call)
+                        with _profile_span(f"broker.{method_name}"):
+                            result = self._call_market_data_method(method, primary_call, fallback_call)
                         df = self._coerce_market_data_frame(result)
-                        if df is not None and len(df) >= 10:
+                        if df is not None and len(df) >= min_rows:
                             if _attempt > 1:
                                 logger.info(
                                     "✅ [_fetch_df] symbol=%s recovered on attempt %d/%d "
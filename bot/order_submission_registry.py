@@ -0,0 +1,337 @@
+"""
+NIJA Order Submission Registry
+===============================
+
+Future-based order submission for :class:`ExecutionPipeline`.
+
+``ExecutionPipeline.submit(request)`` returns an :class:`OrderHandle`
+immediately; the full ``execute`` path (gates, ECEL, dispatch, journal,
+ledger hooks) runs on a shared worker pool.  The handle resolves to the
+``PipelineResult`` and can be waited on (``handle.result(timeout)``),
+awaited from asyncio (``await handle``) or observed with callbacks
+(``add_done_callback`` / ``add_late_callback``).
+
+Every in-flight order lives in one :class:`OrderRegistry`:
+
+* When a worker reaches broker dispatch it marks its handle *submitted*
+  with an ACK deadline, instead of spawning a per-order timeout thread.
+* A single reaper thread watches all deadlines.  An order that is not
+  acknowledged in time is reconciled (the pipeline polls the broker's
+  order status) and its handle is resolved, state ``timed_out``, with
+  that provisional result: a confirmed fill / rejection, otherwise an
+  explicit *pending* result — never a rejection of an order that may
+  still fill.
+* If the broker answers after the deadline, the real result is kept as
+  ``handle.late_result``, counted as a late ACK and passed to the late
+  callbacks.  The handle moves to ``completed`` and ``result()`` /
+  ``await handle`` return the real result from then on, so the caller
+  ends up with the same answer the pipeline's bookkeeping ran on.
+  A worker that raises after the deadline is a late outcome too: the
+  registry's ``failed`` callback turns the exception into a result
+  (without one, ``result()`` re-raises it) and the late callbacks fire.
+
+Environment variables (all optional, safe defaults provided):
+    NIJA_ASYNC_SUBMIT_WORKERS   – concurrent orders in flight (default 8)
+
+Author: NIJA Trading Systems
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("nija.order_registry")
+
+PENDING = "pending"        # queued / running pre-dispatch gates
+SUBMITTED = "submitted"    # handed to the broker, waiting for ACK
+COMPLETED = "completed"    # result arrived (filled, rejected or gated)
+TIMED_OUT = "timed_out"    # provisionally resolved by reconciliation after the ACK deadline
+
+_CURRENT = threading.local()
+_IDS = itertools.count(1)
+
+
+def current_handle() -> Optional["OrderHandle"]:
+    """Handle of the order running on this worker thread (None outside the registry)."""
+    return getattr(_CURRENT, "handle", None)
+
+
+class OrderHandle:
+    """Future-like view of one asynchronously submitted order."""
+
+    def __init__(self, request: Any, registry: "OrderRegistry") -> None:
+        self.request = request
+        self._key = next(_IDS)  # registry key; request_id may repeat across retries
+        self.handle_id = str(getattr(request, "request_id", None) or f"order-{self._key}")
+        self.state = PENDING
+        self.created_at = time.monotonic()
+        self.submitted_at: Optional[float] = None
+        self.ack_deadline: Optional[float] = None
+        self.ack_timeout_s: float = 0.0
+        self.late_result: Any = None
+        self._registry = registry
+        self._future: concurrent.futures.Future = concurrent.futures.Future()
+        self._resolved = False
+        self._late_callbacks: List[Callable[["OrderHandle"], None]] = []
+        self._lock = threading.Lock()
+
+    # -- waiting -----------------------------------------------------------
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Block until the order resolves and return its ``PipelineResult``.
+
+        After an ACK timeout this is the reconciliation result until the
+        broker's late answer arrives, and that answer afterwards.
+        """
+        result = self._future.result(timeout)
+        return self._final(result)
+
+    def __await__(self):
+        return self._await().__await__()
+
+    async def _await(self) -> Any:
+        return self._final(await asyncio.wrap_future(self._future))
+
+    def _final(self, result: Any) -> Any:
+        with self._lock:
+            late = self.late_result
+        if late is None:
+            return result
+        if isinstance(late, BaseException):
+            raise late
+        return late
+
+    def add_done_callback(self, fn: Callable[["OrderHandle"], None]) -> None:
+        """Call ``fn(handle)`` once the order resolves (immediately if it already has)."""
+        self._future.add_done_callback(lambda _f: self._safe_call(fn))
+
+    def add_late_callback(self, fn: Callable[["OrderHandle"], None]) -> None:
+        """Call ``fn(handle)`` if the broker acknowledges after the ACK deadline."""
+        with self._lock:
+            if self.late_result is None:
+                self._late_callbacks.append(fn)
+                return
+        self._safe_call(fn)
+
+    def _safe_call(self, fn: Callable[["OrderHandle"], None]) -> None:
+        try:
+            fn(self)
+        except Exception as exc:
+            logger.warning("OrderHandle %s: callback failed: %s", self.handle_id, exc)
+
+    # -- worker side -------------------------------------------------------
+
+    def mark_submitted(self, ack_timeout_s: float) -> None:
+        """Start the ACK clock; called by the worker right before broker dispatch."""
+        self.submitted_at = time.monotonic()
+        self.ack_timeout_s = ack_timeout_s
+        self.ack_deadline = self.submitted_at + ack_timeout_s
+        self.state = SUBMITTED
+        self._registry._watch(self)
+
+    def _claim(self, state: str) -> bool:
+        """First resolver wins (worker result vs. reaper reconciliation)."""
+        with self._lock:
+            if self._resolved:
+                return False
+            self._resolved = True
+            self.state = state
+            return True
+
+    def _resolve(self, result: Any, state: str) -> bool:
+        if not self._claim(state):
+            return False
+        self._future.set_result(result)
+        return True
+
+    def _fail(self, exc: BaseException, state: str) -> bool:
+        if not self._claim(state):
+            return False
+        self._future.set_exception(exc)
+        return True
+
+    def _resolve_late(self, result: Any) -> None:
+        with self._lock:
+            self.late_result = result
+            self.state = COMPLETED
+            callbacks, self._late_callbacks = self._late_callbacks, []
+        for fn in callbacks:
+            self._safe_call(fn)
+
+    def __repr__(self) -> str:
+        return f"OrderHandle({self.handle_id!r}, state={self.state})"
+
+
+class OrderRegistry:
+    """
+    Worker pool, ACK deadlines and reconciliation for all in-flight orders.
+
+    ``reconcile(handle)`` is called on the reaper thread for every order
+    whose ACK deadline passes and must return the provisional result to
+    resolve the handle with; the worker's real result supersedes it.
+    ``failed(handle, exc)``, if given, builds the late result of an order
+    whose worker raised after reconciliation had already resolved it.
+    """
+
+    def __init__(
+        self,
+        reconcile: Callable[[OrderHandle], Any],
+        max_workers: Optional[int] = None,
+        failed: Optional[Callable[[OrderHandle, BaseException], Any]] = None,
+    ) -> None:
+        self._reconcile = reconcile
+        self._failed = failed
+        if max_workers is None:
+            try:
+                max_workers = int(os.getenv("NIJA_ASYNC_SUBMIT_WORKERS", "8"))
+            except ValueError:
+                max_workers = 8
+        self.max_workers = max(1, max_workers)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="nija-order"
+        )
+        self._outstanding: Dict[int, OrderHandle] = {}
+        self._watching: Dict[int, OrderHandle] = {}
+        self._cond = threading.Condition()
+        self._reaper: Optional[threading.Thread] = None
+        self._stopped = False
+        self._stats = {"submitted": 0, "completed": 0, "timed_out": 0, "late_acks": 0, "failed": 0}
+
+    # -- submission --------------------------------------------------------
+
+    def submit(self, request: Any, fn: Callable[[], Any]) -> OrderHandle:
+        """Run ``fn()`` for *request* on the pool and return its handle immediately."""
+        handle = OrderHandle(request, self)
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("OrderRegistry is shut down")
+            self._outstanding[handle._key] = handle
+            self._stats["submitted"] += 1
+        ctx = contextvars.copy_context()  # carry runtime correlation into the worker
+        self._executor.submit(ctx.run, self._run, handle, fn)
+        return handle
+
+    def _run(self, handle: OrderHandle, fn: Callable[[], Any]) -> None:
+        _CURRENT.handle = handle
+        error: Optional[Exception] = None
+        try:
+            result = fn()
+        except Exception as exc:
+            error, result = exc, None
+        finally:
+            _CURRENT.handle = None
+            with self._cond:
+                self._outstanding.pop(handle._key, None)
+                self._watching.pop(handle._key, None)
+
+        if error is not None:
+            logger.error("OrderRegistry: order %s raised: %s", handle.handle_id, error)
+            with self._cond:
+                self._stats["failed"] += 1
+            if not handle._fail(error, COMPLETED):
+                # Reconciliation answered first; the failure is the late outcome.
+                handle._resolve_late(self._failed_result(handle, error))
+            return
+
+        if handle._resolve(result, COMPLETED):
+            with self._cond:
+                self._stats["completed"] += 1
+            return
+        # Already resolved by reconciliation: the broker answered after the deadline.
+        with self._cond:
+            self._stats["late_acks"] += 1
+        logger.warning(
+            "OrderRegistry: late ACK for %s %.0fs after submit (deadline %.0fs) | success=%s",
+            handle.handle_id,
+            time.monotonic() - (handle.submitted_at or handle.created_at),
+            handle.ack_timeout_s,
+            getattr(result, "success", None),
+        )
+        handle._resolve_late(result)
+
+    def _failed_result(self, handle: OrderHandle, exc: Exception) -> Any:
+        if self._failed is None:
+            return exc
+        try:
+            return self._failed(handle, exc)
+        except Exception as cb_exc:
+            logger.warning("OrderRegistry: failed-result callback for %s raised: %s", handle.handle_id, cb_exc)
+            return exc
+
+    # -- deadlines ---------------------------------------------------------
+
+    def _watch(self, handle: OrderHandle) -> None:
+        with self._cond:
+            self._watching[handle._key] = handle
+            if self._reaper is None:
+                self._reaper = threading.Thread(
+                    target=self._reap_loop, name="nija-order-reaper", daemon=True
+                )
+                self._reaper.start()
+            self._cond.notify()
+
+    def _reap_loop(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                expired = [h for h in self._watching.values() if h.ack_deadline <= now]
+                for handle in expired:
+                    del self._watching[handle._key]
+                if not expired:
+                    deadlines = [h.ack_deadline for h in self._watching.values()]
+                    self._cond.wait(min(deadlines) - now if deadlines else None)
+                    continue
+            for handle in expired:
+                self._expire(handle)
+
+    def _expire(self, handle: OrderHandle) -> None:
+        logger.error(
+            "OrderRegistry: ACK timeout after %.0fs | order=%s symbol=%s",
+            handle.ack_timeout_s,
+            handle.handle_id,
+            getattr(handle.request, "symbol", "?"),
+        )
+        try:
+            result = self._reconcile(handle)
+        except Exception as exc:
+            logger.error("OrderRegistry: reconciliation of %s failed: %s", handle.handle_id, exc)
+            handle._fail(exc, TIMED_OUT)
+            return
+        if handle._resolve(result, TIMED_OUT):
+            with self._cond:
+                self._stats["timed_out"] += 1
+
+    # -- introspection / lifecycle -----------------------------------------
+
+    def outstanding(self) -> List[OrderHandle]:
+        """Orders whose worker has not finished (including timed-out ones still waiting on the broker)."""
+        with self._cond:
+            return list(self._outstanding.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                **self._stats,
+                "outstanding": len(self._outstanding),
+                "awaiting_ack": len(self._watching),
+                "max_workers": self.max_workers,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+NIJA Runtime Patch Registry
+===========================
+
+Declarative, lazy installation of the runtime patch modules requested by
+``sitecustomize.py``.
+
+Each patch declares the module(s) it modifies (``PatchSpec.targets``).  A
+patch with no targets — or one whose side effects must happen at interpreter
+start (writer authority, environment defaults, monitors that watch *any*
+module) — is installed immediately.  A patch with targets is installed only
+when the first of its targets finishes importing, so a process that never
+imports ``bot.nija_core_loop`` never pays for the core-loop repairs.
+
+One ``MetaPathFinder`` is placed at the front of ``sys.meta_path``.  For a
+pending target it delegates the lookup to the remaining finders and wraps the
+loader so that, once the target module body has executed, the pending
+callbacks run.  Every other import costs a single dict lookup.  Targets that
+are already in ``sys.modules`` at registration time fire immediately.
+
+Every install is timed; ``format_report()`` lists each patch with its
+trigger and duration.
+
+Environment variables (all optional, safe defaults provided):
+    NIJA_LAZY_RUNTIME_PATCHES   – "0" installs every patch eagerly at startup
+                                  (previous behaviour; default "1")
+    NIJA_PATCH_TIMING_REPORT    – "1" prints the patch timing report to stderr
+                                  at interpreter exit (default off)
+
+Startup profiling:
+    python bot/patch_registry.py --startup-profile
+    python bot/patch_registry.py --startup-profile -c "import bot.trading_strategy" --min-ms 10
+    python bot/patch_registry.py --startup-profile --eager   # compare with eager installs
+
+The profile runs a child interpreter with ``-X importtime`` and the repository
+on ``PYTHONPATH`` (so ``sitecustomize`` runs as in production), prints the
+import tree filtered to modules above ``--min-ms`` cumulative, and the patch
+timing report.
+
+Author: NIJA Trading Systems
+"""
+
+import argparse
+import atexit
+import importlib.abc
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("nija.patch_registry")
+
+_TRUTHY = {"1", "true", "yes", "on", "y", "enabled"}
+_FALSY = {"0", "false", "no", "off", "n", "disabled"}
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = str(os.environ.get(name, "") or "").strip().lower()
+    if raw in _TRUTHY:
+        return True
+    if raw in _FALSY:
+        return False
+    return default
+
+
+@dataclass(frozen=True)
+class PatchSpec:
+    """A runtime patch and the modules it modifies.
+
+    ``installer`` loads and installs the patch.  ``targets`` lists every import
+    name of the modified module(s) (``bot.x`` and the flat ``x`` form); an
+    empty tuple means the patch is installed eagerly.  ``refresh`` (optional)
+    re-applies an installed patch when a further target is imported.
+    """
+
+    name: str
+    installer: Callable[[], None]
+    targets: Tuple[str, ...] = ()
+    refresh: Optional[Callable[[], None]] = None
+
+    @property
+    def eager(self) -> bool:
+        return not self.targets
+
+
+@dataclass
+class PatchTiming:
+    """Install record for one patch."""
+
+    name: str
+    targets: Tuple[str, ...]
+    trigger: str = "pending"
+    offset_ms: float = 0.0
+    duration_ms: float = 0.0
+    error: str = ""
+    refreshed_by: List[str] = field(default_factory=list)
+
+    @property
+    def installed(self) -> bool:
+        return self.trigger != "pending"
+
+
+@dataclass(eq=False)
+class _Pending:
+    timing: PatchTiming
+    callback: Callable[[], None]
+    refresh: Optional[Callable[[], None]] = None
+    fired: bool = False
+    installing: bool = False
+    deferred: List[str] = field(default_factory=list)
+
+
+class _NotifyingLoader(importlib.abc.Loader):
+    """Delegating loader that reports a successful ``exec_module``."""
+
+    def __init__(self, loader, registry: "PatchRegistry", fullname: str) -> None:
+        self._loader = loader
+        self._registry = registry
+        self._fullname = fullname
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        # Hand the module its real loader before its body runs.
+        spec = getattr(module, "__spec__", None)
+        if spec is not None and spec.loader is self:
+            spec.loader = self._loader
+        if getattr(module, "__loader__", None) is self:
+            module.__loader__ = self._loader
+        self._loader.exec_module(module)
+        self._registry._fire(self._fullname)
+
+
+class _TargetFinder(importlib.abc.MetaPathFinder):
+    """Front-of-path finder that only reacts to pending target names."""
+
+    def __init__(self, registry: "PatchRegistry") -> None:
+        self._registry = registry
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in self._registry._waiting:
+            return None
+        busy = getattr(self._local, "busy", None)
+        if busy is None:
+            busy = self._local.busy = set()
+        if fullname in busy:
+            return None
+        busy.add(fullname)
+        try:
+            for finder in list(sys.meta_path):
+                if finder is self:
+                    continue
+                find = getattr(finder, "find_spec", None)
+                if find is None:
+                    continue
+                spec = find(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            busy.discard(fullname)
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _NotifyingLoader(spec.loader, self._registry, fullname)
+        return spec
+
+
+class PatchRegistry:
+    """Installs patches eagerly or on first import of their target module."""
+
+    def __init__(self, lazy: Optional[bool] = None) -> None:
+        self.lazy = _env_flag("NIJA_LAZY_RUNTIME_PATCHES", True) if lazy is None else bool(lazy)
+        self._lock = threading.RLock()
+        self._created = time.perf_counter()
+        self._timings: List[PatchTiming] = []
+        # target module name -> callbacks waiting for it
+        self._waiting: Dict[str, List[_Pending]] = {}
+        self._finder: Optional[_TargetFinder] = None
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def register(self, spec: PatchSpec) -> PatchTiming:
+        """Install *spec* now (eager / lazy disabled) or when a target loads."""
+        if not self.lazy:
+            return self.when_imported((), spec.installer, name=spec.name)
+        return self.when_imported(spec.targets, spec.installer, name=spec.name, refresh=spec.refresh)
+
+    def when_imported(
+        self,
+        targets: Sequence[str],
+        callback: Callable[[], None],
+        name: Optional[str] = None,
+        refresh: Optional[Callable[[], None]] = None,
+    ) -> PatchTiming:
+        """Run *callback* once, after the first of *targets* has been imported.
+
+        Runs immediately if *targets* is empty or one of them is already in
+        ``sys.modules``.  With *refresh*, each remaining target that loads
+        afterwards calls ``refresh()``.
+        """
+        targets = tuple(targets)
+        timing = PatchTiming(name=name or getattr(callback, "__name__", "patch"), targets=targets)
+        entry = _Pending(timing=timing, callback=callback, refresh=refresh)
+        with self._lock:
+            self._timings.append(timing)
+            loaded = [t for t in targets if sys.modules.get(t) is not None]
+            waiting = [t for t in targets if t not in loaded] if (refresh or not loaded) else []
+            for target in waiting:
+                self._waiting.setdefault(target, []).append(entry)
+            if waiting:
+                self._ensure_finder()
+            if targets and not loaded:
+                return timing
+            entry.fired = entry.installing = True
+        self._run(entry, loaded[0] if loaded else "eager")
+        return timing
+
+    def _ensure_finder(self) -> None:
+        if self._finder is None:
+            self._finder = _TargetFinder(self)
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        """Remove the import finder; pending patches stay pending."""
+        with self._lock:
+            if self._finder is not None and self._finder in sys.meta_path:
+                sys.meta_path.remove(self._finder)
+
+    # ------------------------------------------------------------------
+    # Triggering
+    # ------------------------------------------------------------------
+
+    def _fire(self, fullname: str) -> None:
+        with self._lock:
+            entries = self._waiting.pop(fullname, [])
+            first = [e for e in entries if not e.fired]
+            for entry in first:
+                entry.fired = entry.installing = True
+                if entry.refresh is None:
+                    self._forget(entry)
+            # The installer may be waiting on this module's import lock from
+            # another thread; leave the refresh to that thread instead of
+            # blocking on the patch's own install lock here.
+            busy = [e for e in entries if e not in first and e.installing]
+            for entry in busy:
+                entry.deferred.append(fullname)
+        for entry in entries:
+            if entry in first:
+                self._run(entry, fullname)
+            elif entry not in busy:
+                self._refresh(entry, fullname)
+
+    def _forget(self, entry: _Pending) -> None:
+        for target in entry.timing.targets:
+            remaining = [e for e in self._waiting.get(target, []) if e is not entry]
+            if remaining:
+                self._waiting[target] = remaining
+            else:
+                self._waiting.pop(target, None)
+
+    def _run(self, entry: _Pending, trigger: str) -> None:
+        timing = entry.timing
+        started = time.perf_counter()
+        timing.offset_ms = 1000.0 * (started - self._created)
+        try:
+            entry.callback()
+        except Exception as exc:
+            timing.error = f"{type(exc).__name__}: {exc}"
+            logger.warning("PATCH_REGISTRY_INSTALL_FAILED patch=%s trigger=%s err=%s", timing.name, trigger, exc)
+        finally:
+            timing.duration_ms = 1000.0 * (time.perf_counter() - started)
+            timing.trigger = trigger
+        logger.debug("PATCH_REGISTRY_INSTALLED patch=%s trigger=%s ms=%.1f", timing.name, trigger, timing.duration_ms)
+        while True:
+            with self._lock:
+                deferred, entry.deferred = entry.deferred, []
+                if not deferred:
+                    entry.installing = False
+                    return
+            for target in deferred:
+                self._refresh(entry, target)
+
+    def _refresh(self, entry: _Pending, trigger: str) -> None:
+        timing = entry.timing
+        started = time.perf_counter()
+        try:
+            entry.refresh()
+        except Exception as exc:
+            logger.warning("PATCH_REGISTRY_REFRESH_FAILED patch=%s trigger=%s err=%s", timing.name, trigger, exc)
+        finally:
+            timing.duration_ms += 1000.0 * (time.perf_counter() - started)
+            timing.refreshed_by.append(trigger)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def timings(self) -> List[PatchTiming]:
+        with self._lock:
+            return list(self._timings)
+
+    def pending(self) -> List[str]:
+        """Names of patches still waiting for a target import."""
+        return [t.name for t in self.timings() if not t.installed]
+
+    def format_report(self) -> str:
+        rows = self.timings()
+        installed = [t for t in rows if t.installed]
+        deferred = sum(1 for t in installed if t.trigger != "eager")
+        lines = [
+            f"NIJA runtime patches: {len(installed)} installed ({deferred} on import), "
+            f"{len(rows) - len(installed)} pending, {sum(t.duration_ms for t in installed):.1f} ms total"
+            f" [lazy={'on' if self.lazy else 'off'}]",
+            f"{'ms':>9} {'at_ms':>9}  {'trigger':<32} patch",
+        ]
+        for t in sorted(installed, key=lambda t: -t.duration_ms):
+            suffix = f"  (+{', '.join(t.refreshed_by)})" if t.refreshed_by else ""
+            suffix += f"  ERROR {t.error}" if t.error else ""
+            lines.append(f"{t.duration_ms:>9.1f} {t.offset_ms:>9.1f}  {t.trigger:<32} {t.name}{suffix}")
+        for t in rows:
+            if not t.installed:
+                lines.append(f"{'-':>9} {'-':>9}  {'pending':<32} {t.name} (targets: {', '.join(t.targets)})")
+        return "\n".join(lines)
+
+
+_REGISTRY: Optional[PatchRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_patch_registry() -> PatchRegistry:
+    """Process-wide registry singleton."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = PatchRegistry()
+                if _env_flag("NIJA_PATCH_TIMING_REPORT", False):
+                    atexit.register(_print_report)
+    return _REGISTRY
+
+
+def _print_report() -> None:
+    if _REGISTRY is not None:
+        print(_REGISTRY.format_report(), file=sys.stderr, flush=True)
+
+
+# sitecustomize loads this file by path (without importing the bot package);
+# alias it so `bot.patch_registry` / `patch_registry` share one singleton.
+if __name__ != "__main__":
+    for _alias in ("nija_patch_registry", "bot.patch_registry", "patch_registry"):
+        sys.modules.setdefault(_alias, sys.modules[__name__])
+
+
+# ----------------------------------------------------------------------
+# --startup-profile
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class _ImportNode:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    children: List["_ImportNode"] = field(default_factory=list)
+
+
+def parse_importtime(stderr: str) -> Tuple[List[_ImportNode], List[str]]:
+    """Parse ``-X importtime`` output into root nodes; other lines are returned as-is."""
+    other: List[str] = []
+    # importtime prints children before their parent, and imports made during
+    # site initialisation do not start at depth 0, so a node adopts every
+    # preceding unclaimed node that is deeper than itself.
+    stack: List[_ImportNode] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header row
+        raw = parts[2].rstrip()
+        stripped = raw.lstrip()
+        depth = (len(raw) - len(stripped) - 1) // 2
+        node = _ImportNode(stripped, self_us, cumulative_us, depth)
+        start = len(stack)
+        while start and stack[start - 1].depth > depth:
+            start -= 1
+        node.children, stack[start:] = stack[start:], [node]
+    return stack, other
+
+
+def format_import_tree(roots: Sequence[_ImportNode], min_ms: float = 5.0) -> str:
+    lines = [f"{'cumul_ms':>9} {'self_ms':>8}  module"]
+
+    def walk(node: _ImportNode, level: int) -> None:
+        if node.cumulative_us / 1000.0 < min_ms:
+            return
+        lines.append(f"{node.cumulative_us / 1000.0:>9.1f} {node.self_us / 1000.0:>8.1f}  {'  ' * level}{node.name}")
+        for child in sorted(node.children, key=lambda c: -c.cumulative_us):
+            walk(child, level + 1)
+
+    for root in sorted(roots, key=lambda r: -r.cumulative_us):
+        walk(root, 0)
+    return "\n".join(lines)
+
+
+def startup_profile(code: str = "pass", min_ms: float = 5.0, eager: bool = False) -> int:
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (repo_root, env.get("PYTHONPATH", "")) if p)
+    env["NIJA_PATCH_TIMING_REPORT"] = "1"
+    env["NIJA_LAZY_RUNTIME_PATCHES"] = "0" if eager else "1"
+    env.pop("NIJA_DEFER_RUNTIME_SITE_HOOKS", None)
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=repo_root,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = 1000.0 * (time.perf_counter() - started)
+    roots, other = parse_importtime(proc.stderr)
+
+    print(f"Startup profile: {sys.executable} -c {code!r} (lazy={'off' if eager else 'on'})")
+    print(f"wall {wall_ms:.0f} ms, exit {proc.returncode}")
+    print()
+    print(format_import_tree(roots, min_ms=min_ms))
+    print()
+    report_at = next((i for i, line in enumerate(other) if line.startswith("NIJA runtime patches:")), None)
+    if report_at is None:
+        print("(no patch timing report: sitecustomize did not run or hooks are deferred)")
+    else:
+        print("\n".join(other[report_at:]))
+    return proc.returncode
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="NIJA runtime patch registry tools")
+    parser.add_argument("--startup-profile", action="store_true", help="Profile interpreter start-up imports and patches")
+    parser.add_argument("-c", "--code", default="pass", help="Code the profiled interpreter runs (default: pass)")
+    parser.add_argument("--min-ms", type=float, default=5.0, help="Hide imports below this cumulative time")
+    parser.add_argument("--eager", action="store_true", help="Profile with NIJA_LAZY_RUNTIME_PATCHES=0")
+    args = parser.parse_args()
+    if not args.startup_profile:
+        parser.print_help()
+        return 2
+    return startup_profile(code=args.code, min_ms=args.min_ms, eager=args.eager)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -47,7 +47,6 @@ from __future__ import annotations
 import logging
 import json
 import os
-from collections import Counter, deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
@@ -133,6 +132,18 @@ except ImportError:
         get_multi_broker_router = None  # type: ignore
         logger.warning("MultiBrokerExecutionRouter not available — routing visibility disabled")
 
+try:
+    from decision_feed_index import get_decision_feed_index
+    _DECISION_FEED_AVAILABLE = True
+except ImportError:
+    try:
+        from bot.decision_feed_index import get_decision_feed_index
+        _DECISION_FEED_AVAILABLE = True
+    except ImportError:
+        _DECISION_FEED_AVAILABLE = False
+        get_decision_feed_index = None  # type: ignore
+        logger.warning("decision_feed_index not available — trade decision status disabled")
+
 
 # ---------------------------------------------------------------------------
 # Data helpers
@@ -248,46 +259,23 @@ def _safe_get_trade_decision_status() -> Dict[str, Any]:
             "reason": f"Decision feed not found: {decision_path}",
             "path": str(decision_path),
         }
-
-    reason_counts: Counter[str] = Counter()
-    recent_events = deque(maxlen=50)
-    now = datetime.utcnow()
-    not_taken_5m = 0
+    if not _DECISION_FEED_AVAILABLE:
+        return {
+            "available": False,
+            "reason": "decision_feed_index not available",
+            "path": str(decision_path),
+        }
 
     try:
-        with decision_path.open("r", encoding="utf-8") as handle:
-            rows = handle.readlines()[-500:]
-
-        for raw in rows:
-            line = raw.strip()
-            if not line:
-                continue
-            try:
-                event = json.loads(line)
-            except Exception:
-                continue
-
-            action = str(event.get("action") or "")
-            reason_code = str(event.get("reason_code") or "unknown")
-            timestamp = str(event.get("timestamp") or "")
-
-            if action in {"vetoed", "rejected", "skipped"}:
-                reason_counts[reason_code] += 1
-                recent_events.append(event)
-                try:
-                    ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                    delta = (now - ts.replace(tzinfo=None)).total_seconds()
-                    if 0 <= delta <= 300:
-                        not_taken_5m += 1
-                except Exception:
-                    pass
-
+        summary = get_decision_feed_index(decision_path).summary(
+            limit=500, window_seconds=300, recent=50, top=10,
+        )
         return {
             "available": True,
             "path": str(decision_path),
-            "not_taken_last_5m": not_taken_5m,
-            "top_not_taken_reasons": dict(reason_counts.most_common(10)),
-            "recent_not_taken": list(recent_events),
+            "not_taken_last_5m": summary["not_taken_last_window"],
+            "top_not_taken_reasons": dict(summary["top_reasons"]),
+            "recent_not_taken": summary["recent_not_taken"],
         }
     except Exception as exc:
         logger.debug("trade decision status error: %s", exc)
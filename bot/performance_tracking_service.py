@@ -320,7 +320,7 @@ class PerformanceTrackingService:
                 }
                 for a in self.alarm_system.get_active_alarms()
             ],
-            'trade_count': len(self.kpi_tracker.trade_history),
+            'trade_count': self.kpi_tracker.totals['trades'],
             'strategy_performance': dict(self.kpi_tracker.strategy_performance)
         }
         
@@ -182,6 +182,10 @@ def _wrap_fetch_df_cache(cls: type) -> bool:
         return False
     if getattr(original, _FETCH_PATCH_ATTR, False):
         return True
+    if getattr(cls, "_FETCH_DF_NATIVE_CANDLE_CACHE", False):
+        # The core loop now caches per cycle and delta-fetches itself
+        # (bot/candle_cache.py); a TTL wrapper on top would serve stale frames.
+        return True
 
     @wraps(original)
     def _cached_fetch(self: Any, broker: Any, symbol: Any, *args: Any, **kwargs: Any):
@@ -0,0 +1,216 @@
+"""Pipelined candle prefetch for the phase-3 symbol scan.
+
+``NijaCoreLoop._phase3_scan_and_enter`` historically fetched and scored each
+symbol strictly one after another, so one slow venue response delayed every
+symbol behind it.  ``PipelinedScan`` hands the candle fetches for the whole
+symbol list to the shared :class:`ohlc_worker_pool.OHLCWorkerPool` and yields
+symbols back to the scoring loop **in completion order**:
+
+* fetches run on the bounded pool (at most ``max_inflight`` submitted at a
+  time, so the pool's backpressure queue never overflows);
+* the scoring loop consumes each frame as soon as it lands;
+* ranking and execution stay after the loop, which only ends once every
+  symbol has been yielded or the per-cycle deadline passes — that is the
+  barrier;
+* symbols whose frame has not arrived by the deadline are *not* scored and
+  are reported in :attr:`PipelinedScan.missed_symbols`.  Their fetches are
+  left to finish on the pool (cancelling a queued pool future would leak its
+  backpressure slot) and simply warm the candle cache for the next cycle.
+
+Symbols the pool refuses (dedupe / backpressure) are yielded without a
+prefetched frame; ``pop()`` then returns ``None`` and the caller fetches
+inline, so the pipelined mode never scores fewer symbols than the serial one
+except for deadline misses.
+
+Environment variables (all optional, safe defaults provided)
+------------------------------------------------------------
+NIJA_PIPELINED_SCAN_ENABLED   — opt in to the pipelined scan (default false)
+NIJA_SCAN_CYCLE_DEADLINE_S    — per-cycle fetch deadline in seconds (default 60)
+NIJA_PIPELINED_SCAN_INFLIGHT  — max concurrently submitted fetches (default: pool queue size)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger("nija.pipelined_scan")
+
+_TRUE = {"1", "true", "yes", "on", "enabled", "y"}
+
+
+def pipelined_scan_enabled() -> bool:
+    return str(os.environ.get("NIJA_PIPELINED_SCAN_ENABLED", "false")).strip().lower() in _TRUE
+
+
+def scan_deadline_s() -> float:
+    try:
+        return max(1.0, float(os.environ.get("NIJA_SCAN_CYCLE_DEADLINE_S", "60")))
+    except (TypeError, ValueError):
+        return 60.0
+
+
+class PipelinedScan:
+    """Prefetch candle frames for *symbols* on *pool* and yield them as they land.
+
+    Args:
+        pool:        An :class:`OHLCWorkerPool` (anything with ``submit(key, fn)``).
+        symbols:     Symbols in priority order; submission follows this order.
+        fetch_fn:    ``fetch_fn(symbol) -> Optional[DataFrame]``, run on the pool.
+        deadline_s:  Wall-clock budget for the whole prefetch.
+        key_prefix:  Prepended to pool dedupe keys (e.g. the venue) so two
+                     brokers scanning the same symbol do not dedupe each other.
+        skip:        Symbols yielded immediately without fetching (quarantine).
+        max_inflight: Cap on submitted-but-unfinished fetches.
+    """
+
+    def __init__(
+        self,
+        pool: Any,
+        symbols: Iterable[str],
+        fetch_fn: Callable[[str], Any],
+        deadline_s: Optional[float] = None,
+        key_prefix: str = "",
+        skip: Optional[Iterable[str]] = None,
+        max_inflight: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._pool = pool
+        self._symbols: List[str] = list(symbols)
+        self._fetch_fn = fetch_fn
+        self._deadline_s = scan_deadline_s() if deadline_s is None else float(deadline_s)
+        self._key_prefix = key_prefix
+        self._skip = set(skip or ())
+        self._clock = clock
+        if max_inflight is None:
+            try:
+                max_inflight = int(os.environ.get("NIJA_PIPELINED_SCAN_INFLIGHT", "0")) or None
+            except (TypeError, ValueError):
+                max_inflight = None
+        if max_inflight is None:
+            queue_obj = getattr(pool, "_queue", None)
+            max_inflight = getattr(queue_obj, "maxsize", 0) or 32
+        self._max_inflight = max(1, int(max_inflight))
+
+        self._frames: Dict[str, Any] = {}
+        self._yielded: List[str] = []
+        self._pending: Dict[Future, str] = {}
+        self._unsubmitted: Deque[str] = deque()
+        self.missed_symbols: List[str] = []
+        self.inline_symbols: List[str] = []
+        self.prefetched = 0
+        self.deadline_hit = False
+        self._finished = False
+        self.started_at = 0.0
+        self.elapsed_s = 0.0
+
+    # ------------------------------------------------------------------
+    # Iteration
+    # ------------------------------------------------------------------
+
+    def __iter__(self) -> Iterator[str]:
+        self.started_at = self._clock()
+        deadline = self.started_at + self._deadline_s
+        self._unsubmitted = deque(s for s in self._symbols if s not in self._skip)
+        try:
+            for symbol in self._symbols:
+                if symbol in self._skip:
+                    yield self._mark(symbol)
+
+            while self._unsubmitted or self._pending:
+                for symbol in self._fill():
+                    yield self._mark(symbol)
+                if not self._pending:
+                    continue
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    self.deadline_hit = True
+                    break
+                done, _ = wait(list(self._pending), timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    symbol = self._pending.pop(future)
+                    try:
+                        self._frames[symbol] = future.result()
+                    except Exception as exc:  # pool wrapper already logs
+                        logger.debug("pipelined scan fetch failed for %s: %s", symbol, exc)
+                        self._frames[symbol] = None
+                    self.prefetched += 1
+                    yield self._mark(symbol)
+        finally:
+            self._finish()
+
+    def _fill(self) -> List[str]:
+        """Submit until ``max_inflight``; return symbols the pool refused."""
+        refused: List[str] = []
+        while self._unsubmitted and len(self._pending) < self._max_inflight:
+            symbol = self._unsubmitted.popleft()
+            future = self._pool.submit(
+                f"{self._key_prefix}{symbol}", self._fetch_fn, symbol
+            )
+            if future is None:
+                refused.append(symbol)
+                self.inline_symbols.append(symbol)
+            else:
+                self._pending[future] = symbol
+        return refused
+
+    def _mark(self, symbol: str) -> str:
+        self._yielded.append(symbol)
+        return symbol
+
+    def _finish(self) -> None:
+        """Stop tracking outstanding work; record misses if the deadline hit.
+
+        Runs when the iterator is exhausted, when the deadline passes, or when
+        the consumer stops early (``break`` / :meth:`close`).  Only the
+        deadline case counts the leftovers as missed — an early ``break`` is
+        the caller's own decision (e.g. the candidate cap).
+        """
+        if self._finished:
+            return
+        self._finished = True
+        if self.started_at:
+            self.elapsed_s = self._clock() - self.started_at
+        if self.deadline_hit:
+            self.missed_symbols = list(self._pending.values()) + list(self._unsubmitted)
+        self._pending.clear()
+        self._unsubmitted.clear()
+
+    # ------------------------------------------------------------------
+    # Consumer helpers
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Release outstanding futures; safe to call more than once."""
+        self._finish()
+
+    def pop(self, symbol: str) -> Any:
+        """Return (and forget) the prefetched frame, or ``None`` to fetch inline."""
+        return self._frames.pop(symbol, None)
+
+    def has_frame(self, symbol: str) -> bool:
+        return symbol in self._frames
+
+    def pending_symbols(self) -> List[str]:
+        """Symbols not yet handed to the scoring loop."""
+        yielded = set(self._yielded)
+        return [s for s in self._symbols if s not in yielded]
+
+    @property
+    def deadline_missed(self) -> int:
+        return len(self.missed_symbols)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "symbols": len(self._symbols),
+            "prefetched": self.prefetched,
+            "inline": len(self.inline_symbols),
+            "skipped": len(self._skip),
+            "deadline_missed": self.deadline_missed,
+            "deadline_s": self._deadline_s,
+            "elapsed_s": round(self.elapsed_s, 3),
+        }
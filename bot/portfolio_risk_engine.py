@@ -24,6 +24,11 @@ from datetime import datetime, timedelta
 import logging
 from collections import defaultdict
 
+try:
+    from bot.streaming_correlation import StreamingCorrelation
+except ImportError:
+    from streaming_correlation import StreamingCorrelation
+
 logger = logging.getLogger("nija.portfolio_risk")
 
 # ---------------------------------------------------------------------------
@@ -174,6 +179,11 @@ class PortfolioRiskEngine:
         self.correlation_groups: Dict[str, Set[str]] = {}  # group_name -> {symbols}
         self.price_history: Dict[str, pd.Series] = {}  # symbol -> price series
         self.last_correlation_update = None
+        # Incremental correlation over the last `correlation_lookback` prices
+        # (lookback - 1 returns per symbol), fed one new return per bar
+        self._streaming_corr = StreamingCorrelation(window=max(2, self.correlation_lookback - 1))
+        self._last_return_label: Dict[str, object] = {}  # symbol -> last ingested bar label
+        self._positional_prices: Dict[str, np.ndarray] = {}  # symbol -> last tail without timestamps
         
         # Sector exposure tracking (GLOBAL - across all brokers)
         self.sector_exposure: Dict[str, float] = {}  # sector_name -> total_usd_exposure
@@ -288,11 +298,16 @@ class PortfolioRiskEngine:
         """
         Update price history for correlation calculations
         
+        Only returns for bars newer than the last one seen for this symbol
+        are added to the streaming correlation estimator (O(N) per return);
+        the matrix and correlation groups are refreshed on the usual interval.
+        
         Args:
             symbol: Trading pair symbol
             price_series: Series of historical prices
         """
         self.price_history[symbol] = price_series
+        self._ingest_returns(symbol, price_series)
         
         # Check if we should update correlations
         now = datetime.now()
@@ -300,46 +315,89 @@ class PortfolioRiskEngine:
             (now - self.last_correlation_update).total_seconds() >= self.correlation_update_interval):
             self._calculate_correlations()
     
-    def _calculate_correlations(self) -> None:
-        """Calculate correlation matrix for all assets with price history"""
-        if len(self.price_history) < 2:
+    def _ingest_returns(self, symbol: str, price_series: pd.Series) -> None:
+        """Feed returns for bars not yet seen into the streaming estimator"""
+        tail = price_series.iloc[-(self._streaming_corr.window + 1):]
+        if len(tail) < 2:
+            return
+        prices = tail.to_numpy(dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = prices[1:] / prices[:-1] - 1.0
+        
+        if isinstance(tail.index, pd.DatetimeIndex):
+            labels = tail.index[1:]
+            last = self._last_return_label.get(symbol)
+            if last is not None:
+                try:
+                    new = np.asarray(labels > last)
+                except TypeError:
+                    new = np.ones(len(labels), dtype=bool)
+                labels, returns = labels[new], returns[new]
+        else:
+            labels, returns = self._positional_labels(symbol, prices, returns)
+        if len(labels) == 0:
             return
         
-        symbols = list(self.price_history.keys())
-        
-        # Build DataFrame of returns
-        returns_data = {}
+        self._streaming_corr.extend(symbol, zip(labels, returns))
+        self._last_return_label[symbol] = labels[-1]
+    
+    def _positional_labels(self, symbol: str, prices: np.ndarray,
+                           returns: np.ndarray) -> Tuple[List[int], np.ndarray]:
+        """
+        Bar labels for a series without timestamps (e.g. a RangeIndex window)
         
-        # Use consistent lookback period across all symbols
-        max_lookback = min(
-            min(len(series) for series in self.price_history.values()),
-            self.correlation_lookback
-        )
+        Index values of a sliding window repeat from call to call, so bars are
+        numbered on an engine-wide sequence instead. The new window is aligned
+        on its overlap with the previous one for this symbol to find how many
+        bars it advanced; without an overlap the symbol is reseeded,
+        right-aligned to the newest bar.
         
-        if max_lookback < 20:  # Need at least 20 periods
-            logger.debug("Not enough price history for correlation calculation")
-            return
+        Returns:
+            Tuple of (labels, returns) for the bars not yet ingested
+        """
+        previous = self._positional_prices.get(symbol)
+        self._positional_prices[symbol] = prices
+        last = self._last_return_label.get(symbol)
+        
+        advanced = None
+        if previous is not None and isinstance(last, (int, np.integer)):
+            for shift in range(len(prices) - 1):
+                overlap = min(len(previous), len(prices) - shift)
+                if overlap >= 2 and np.array_equal(
+                        prices[len(prices) - shift - overlap:len(prices) - shift],
+                        previous[-overlap:]):
+                    advanced = shift
+                    break
         
-        for symbol, series in self.price_history.items():
-            # Use last N periods (same for all symbols)
-            recent_prices = series.iloc[-max_lookback:]
-            returns = recent_prices.pct_change().dropna()
-            returns_data[symbol] = returns
+        if advanced is None:
+            # No overlap with what was ingested: reseed this symbol
+            self._streaming_corr.discard(symbol)
+            newest = self._streaming_corr.last_label
+            end = newest if isinstance(newest, (int, np.integer)) else len(returns) - 1
+            return list(range(end - len(returns) + 1, end + 1)), returns
         
-        # Create DataFrame
-        returns_df = pd.DataFrame(returns_data)
+        if advanced == 0:
+            return [], returns[:0]
+        return list(range(last + 1, last + advanced + 1)), returns[-advanced:]
+    
+    def _calculate_correlations(self) -> None:
+        """Publish the streaming correlation matrix and refresh correlation groups"""
+        symbols = self._streaming_corr.symbols
+        if len(symbols) < 2:
+            return
         
-        # Calculate correlation matrix
-        corr_matrix = returns_df.corr().values
+        sample_size = self._streaming_corr.num_bars
+        if sample_size < 20:  # Need at least 20 periods
+            logger.debug("Not enough price history for correlation calculation")
+            return
         
         # Calculate confidence based on sample size
-        sample_size = len(returns_df)
         confidence = min(1.0, sample_size / self.correlation_lookback)
         
         # Store correlation matrix
         self.correlation_matrix = CorrelationMatrix(
             symbols=symbols,
-            matrix=corr_matrix,
+            matrix=self._streaming_corr.matrix(),
             timestamp=datetime.now(),
             lookback_periods=sample_size,
             confidence=confidence
@@ -352,6 +410,21 @@ class PortfolioRiskEngine:
         # Update correlation groups
         self._update_correlation_groups()
     
+    def max_correlation_to_open_book(self, symbol: str) -> Tuple[Optional[str], float]:
+        """
+        Most correlated open position for a candidate symbol (O(open positions))
+        
+        Reads the live streaming estimator, so it reflects every ingested bar
+        even between matrix refreshes.
+        
+        Args:
+            symbol: Candidate symbol
+            
+        Returns:
+            Tuple of (most correlated open symbol or None, its correlation)
+        """
+        return self._streaming_corr.max_correlation(symbol, list(self.positions.keys()))
+    
     def _update_correlation_groups(self) -> None:
         """Detect and update correlation groups"""
         if self.correlation_matrix is None:
@@ -929,6 +1002,7 @@ class PortfolioRiskEngine:
             'num_correlation_groups': len(self.correlation_groups),
             'correlation_matrix_size': len(self.correlation_matrix.symbols) if self.correlation_matrix else 0,
             'last_correlation_update': self.last_correlation_update.isoformat() if self.last_correlation_update else None,
+            'correlation_bars': self._streaming_corr.num_bars,
             'metrics_history_size': len(self.risk_metrics_history),
         }
 
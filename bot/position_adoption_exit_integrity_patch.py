@@ -9,6 +9,7 @@ calls ``PositionTracker.track_entry(..., position_source='broker_existing')``.
 from __future__ import annotations
 
 import logging
+import sys
 import threading
 import time
 from typing import Any
@@ -17,7 +18,9 @@ logger = logging.getLogger("nija.position_adoption_exit_integrity")
 _MARKER = "20260716-position-adoption-exit-integrity-v1"
 _PATCHED = False
 _MONITOR_STARTED = False
+_STRATEGY_DEFERRED = False
 _LOCK = threading.Lock()
+_STRATEGY_MODULES = ("bot.trading_strategy", "trading_strategy")
 
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
@@ -137,14 +140,50 @@ def _patch_position_tracker() -> bool:
     return True
 
 
+def _lazy_patch_registry() -> Any:
+    registry = sys.modules.get("nija_patch_registry")
+    if registry is None:
+        return None
+    patch_registry = registry.get_patch_registry()
+    return patch_registry if patch_registry.lazy else None
+
+
+def _defer_trading_strategy_verification(patch_registry: Any) -> None:
+    """Patch TradingStrategy when it is imported instead of importing it here.
+
+    This patch is chained from sitecustomize; importing bot.trading_strategy
+    from here pulled most of the bot into every interpreter start.
+    """
+    global _STRATEGY_DEFERRED
+    if _STRATEGY_DEFERRED:
+        return
+    _STRATEGY_DEFERRED = True
+    patch_registry.when_imported(
+        _STRATEGY_MODULES,
+        _patch_trading_strategy_verification,
+        name="nija_position_adoption_verification_guard",
+    )
+
+
 def _patch_trading_strategy_verification() -> bool:
-    try:
+    patch_registry = _lazy_patch_registry()
+    if patch_registry is not None:
+        TradingStrategy = None
+        for name in _STRATEGY_MODULES:
+            TradingStrategy = getattr(sys.modules.get(name), "TradingStrategy", None)
+            if TradingStrategy is not None:
+                break
+        if TradingStrategy is None:
+            _defer_trading_strategy_verification(patch_registry)
+            return False
+    else:
         try:
-            from bot.trading_strategy import TradingStrategy
-        except ImportError:
-            from trading_strategy import TradingStrategy  # type: ignore[import]
-    except Exception:
-        return False
+            try:
+                from bot.trading_strategy import TradingStrategy
+            except ImportError:
+                from trading_strategy import TradingStrategy  # type: ignore[import]
+        except Exception:
+            return False
 
     current = getattr(TradingStrategy, "verify_position_adoption_status", None)
     if not callable(current):
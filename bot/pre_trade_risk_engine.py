@@ -42,6 +42,8 @@ class PreTradeRiskEngine:
         self.max_total_exposure_pct = float(max_total_exposure_pct)
         self._lock = threading.RLock()
         self._symbol_exposure_usd: Dict[str, Dict[str, float]] = {}
+        # Entries dispatched but not yet booked by record_execution().
+        self._reserved_exposure_usd: Dict[str, Dict[str, float]] = {}
         self._correlation_filter = self._load_correlation_filter()
         self._global_risk_engine = self._load_global_risk_engine()
         logger.info(
@@ -169,6 +171,12 @@ class PreTradeRiskEngine:
         with self._lock:
             account_key = self._account_key(account_id)
             exposures = self._symbol_exposure_usd.setdefault(account_key, {})
+            reserved = self._reserved_exposure_usd.get(account_key)
+            if reserved:
+                exposures = {
+                    s: float(exposures.get(s, 0.0)) + reserved.get(s, 0.0)
+                    for s in {*exposures, *reserved}
+                }
             current_symbol_exposure = float(exposures.get(symbol, 0.0))
             current_total_exposure = float(sum(exposures.values()))
             available = float(available_balance_usd or 0.0)
@@ -303,6 +311,29 @@ class PreTradeRiskEngine:
                 },
             )
 
+    def reserve(self, *, account_id: str, symbol: str, size_usd: float) -> None:
+        """Count an in-flight entry towards exposure until :meth:`release`.
+
+        Lets concurrently submitted orders see each other in :meth:`assess`
+        before any of them has been booked by :meth:`record_execution`.
+        """
+        with self._lock:
+            reserved = self._reserved_exposure_usd.setdefault(self._account_key(account_id), {})
+            reserved[symbol] = reserved.get(symbol, 0.0) + float(size_usd)
+
+    def release(self, *, account_id: str, symbol: str, size_usd: float) -> None:
+        """Drop a reservation made by :meth:`reserve`."""
+        with self._lock:
+            account_key = self._account_key(account_id)
+            reserved = self._reserved_exposure_usd.get(account_key, {})
+            remaining = reserved.get(symbol, 0.0) - float(size_usd)
+            if remaining > 1e-9:
+                reserved[symbol] = remaining
+            else:
+                reserved.pop(symbol, None)
+            if not reserved:
+                self._reserved_exposure_usd.pop(account_key, None)
+
     def record_execution(
         self,
         *,
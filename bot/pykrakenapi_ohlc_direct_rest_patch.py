@@ -23,16 +23,31 @@ def _pair_text(value: Any) -> str:
     return str(value or "").strip().upper().replace("/", "").replace("-", "")
 
 
+def _kraken_session() -> Any:
+    try:
+        from bot.http_transport import get_http_transport
+    except ImportError:
+        try:
+            from http_transport import get_http_transport  # type: ignore[import]
+        except ImportError:
+            return None
+    return get_http_transport().session("kraken")
+
+
 def _request_public_ohlc(pair: str, interval: int, timeout_s: float) -> tuple[list[list[Any]], Any]:
     params = {"pair": pair, "interval": interval}
     url = "https://api.kraken.com/0/public/OHLC?" + urllib.parse.urlencode(params)
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": "NIJA-AI-Trading/pykrakenapi-ohlc-direct-rest-20260708a"},
-        method="GET",
-    )
-    with urllib.request.urlopen(req, timeout=timeout_s) as resp:  # nosec: public market-data endpoint
-        payload = json.loads(resp.read().decode("utf-8"))
+    headers = {"User-Agent": "NIJA-AI-Trading/pykrakenapi-ohlc-direct-rest-20260708a"}
+    session = _kraken_session()
+    if session is not None:
+        # Keep-alive pool shared with the other Kraken REST callers.
+        resp = session.get(url, headers=headers, timeout=timeout_s, endpoint="GET /0/public/OHLC")
+        resp.raise_for_status()
+        payload = resp.json()
+    else:
+        req = urllib.request.Request(url, headers=headers, method="GET")
+        with urllib.request.urlopen(req, timeout=timeout_s) as raw:  # nosec: public market-data endpoint
+            payload = json.loads(raw.read().decode("utf-8"))
     errors = payload.get("error") or []
     if errors:
         raise RuntimeError("Kraken public OHLC error: " + ", ".join(map(str, errors)))
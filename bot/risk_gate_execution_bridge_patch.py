@@ -18,12 +18,15 @@ from __future__ import annotations
 import builtins
 import logging
 import os
+import weakref
 from functools import wraps
 from typing import Any, Dict, Iterable, Optional
 
 logger = logging.getLogger("nija.risk_gate_execution_bridge")
 
 _PATCHED_ATTR = "__nija_risk_gate_execution_bridge_patch__"
+# Modules whose targets are already wrapped; the import hook skips them.
+_PATCHED_MODULES: "weakref.WeakSet[Any]" = weakref.WeakSet()
 _TRUTHY = {"1", "true", "yes", "on", "y", "enabled"}
 
 
@@ -298,13 +301,17 @@ def _patch_startup_position_sync(module: Any) -> bool:
 
 
 def _patch_module(name: str, module: Any) -> None:
-    if module is None:
+    if module is None or module in _PATCHED_MODULES:
         return
     try:
+        patched = False
         if name.endswith("nija_apex_strategy_v71") or name.endswith("apex_strategy"):
-            _patch_apex_strategy(module)
+            patched = _patch_apex_strategy(module)
         if name.endswith("startup_position_sync"):
-            _patch_startup_position_sync(module)
+            patched = _patch_startup_position_sync(module)
+        # A module still executing its body may define more classes later.
+        if patched and not getattr(getattr(module, "__spec__", None), "_initializing", False):
+            _PATCHED_MODULES.add(module)
     except Exception as exc:
         logger.warning("Risk gate execution bridge patch failed for %s: %s", name, exc)
 
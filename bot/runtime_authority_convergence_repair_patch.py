@@ -679,7 +679,7 @@ def _patch_core_loop_module(module: ModuleType) -> bool:
 def _try_patch_loaded() -> bool:
     patched = False
     for name, module in list(sys.modules.items()):
-        if isinstance(module, ModuleType) and (name.endswith("nija_core_loop") or hasattr(module, "NijaCoreLoop")):
+        if isinstance(module, ModuleType) and (name.endswith("nija_core_loop") or "NijaCoreLoop" in vars(module)):
             try:
                 patched = _patch_core_loop_module(module) or patched
             except Exception as exc:
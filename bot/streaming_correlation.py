@@ -0,0 +1,258 @@
+"""
+NIJA Streaming Correlation
+==========================
+
+Fixed-window Pearson correlation matrix maintained incrementally, used by
+``PortfolioRiskEngine`` instead of rebuilding a returns DataFrame and calling
+``DataFrame.corr()`` on every recalculation (O(N²·L) per refresh).
+
+The last ``window`` bars are kept in a ring buffer; each bar is a row keyed
+by its label (the price series index value), with one return per symbol and
+a presence mask.  Four N×N pairwise sums are kept in place:
+
+    n[i, j]   = Σ m_i m_j           (bars where both symbols have a return)
+    sx[i, j]  = Σ x_i m_j
+    sxx[i, j] = Σ x_i x_j
+    sx2[i, j] = Σ x_i² m_j
+
+* Adding one symbol's return to a bar touches only row/column *i* — O(N).
+  A full bar of N symbols therefore costs O(N²), the same as a rank-1
+  update of the whole matrix.
+* Evicting the oldest bar is a rank-1 downdate — O(N²).
+* Any single correlation (or one symbol's row) is read straight from the
+  sums, so "max correlation of a candidate vs. the open book" is O(N).
+* The full matrix is materialised lazily (vectorised O(N²)) and cached until
+  the next update.
+
+Because the sums are pairwise-complete, the result matches
+``pd.DataFrame(returns).corr()`` over the same aligned window.  Sums are
+rebuilt exactly from the ring buffer every ``window`` evictions to keep
+floating-point drift bounded.
+
+Author: NIJA Trading Systems
+"""
+
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("nija.streaming_correlation")
+
+_INITIAL_CAPACITY = 16
+
+
+class StreamingCorrelation:
+    """Incremental fixed-window correlation over bar-aligned returns."""
+
+    def __init__(self, window: int = 100, min_periods: int = 2) -> None:
+        self.window = max(2, int(window))
+        self.min_periods = max(2, int(min_periods))
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._cap = 0
+        # Ring buffer of bars: values / presence per slot, label per slot.
+        self._x = np.zeros((self.window, 0))
+        self._m = np.zeros((self.window, 0))
+        self._slot_of: Dict[Hashable, int] = {}
+        self._labels: Deque[Hashable] = deque()
+        self._free: List[int] = list(range(self.window - 1, -1, -1))
+        self._n = np.zeros((0, 0))
+        self._sx = np.zeros((0, 0))
+        self._sxx = np.zeros((0, 0))
+        self._sx2 = np.zeros((0, 0))
+        self._evictions = 0
+        self._cached: Optional[np.ndarray] = None
+        self._grow(_INITIAL_CAPACITY)
+
+    # ------------------------------------------------------------------
+    # Shape management
+    # ------------------------------------------------------------------
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    @property
+    def num_bars(self) -> int:
+        return len(self._labels)
+
+    @property
+    def last_label(self) -> Optional[Hashable]:
+        return self._labels[-1] if self._labels else None
+
+    def _grow(self, capacity: int) -> None:
+        old = self._cap
+        pad = capacity - old
+
+        def widen(a: np.ndarray) -> np.ndarray:
+            return np.pad(a, ((0, pad), (0, pad)))
+
+        self._x = np.pad(self._x, ((0, 0), (0, pad)))
+        self._m = np.pad(self._m, ((0, 0), (0, pad)))
+        self._n, self._sx, self._sxx, self._sx2 = (
+            widen(self._n), widen(self._sx), widen(self._sxx), widen(self._sx2)
+        )
+        self._cap = capacity
+
+    def _symbol_index(self, symbol: str) -> int:
+        idx = self._index.get(symbol)
+        if idx is None:
+            idx = len(self._symbols)
+            if idx >= self._cap:
+                self._grow(self._cap * 2)
+            self._index[symbol] = idx
+            self._symbols.append(symbol)
+        return idx
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _slot_for(self, label: Hashable) -> Optional[int]:
+        """Slot holding bar *label*, opening a new newest bar if needed."""
+        slot = self._slot_of.get(label)
+        if slot is not None:
+            return slot
+        if self._labels:
+            try:
+                if not label > self._labels[-1]:
+                    # Older than the newest bar and not in the window: drop.
+                    return None
+            except TypeError:
+                logger.debug("Unorderable bar label %r; ignored", label)
+                return None
+        if len(self._labels) >= self.window:
+            self._evict_oldest()
+        slot = self._free.pop()
+        self._slot_of[label] = slot
+        self._labels.append(label)
+        return slot
+
+    def _evict_oldest(self) -> None:
+        label = self._labels.popleft()
+        slot = self._slot_of.pop(label)
+        x, m = self._x[slot], self._m[slot]
+        if m.any():
+            self._n -= np.outer(m, m)
+            self._sx -= np.outer(x, m)
+            self._sxx -= np.outer(x, x)
+            self._sx2 -= np.outer(x * x, m)
+        x[:] = 0.0
+        m[:] = 0.0
+        self._free.append(slot)
+        self._evictions += 1
+        if self._evictions % self.window == 0:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Recompute the sums exactly from the ring buffer."""
+        x, m = self._x, self._m
+        self._n = m.T @ m
+        self._sx = x.T @ m
+        self._sxx = x.T @ x
+        self._sx2 = (x * x).T @ m
+
+    def add(self, symbol: str, label: Hashable, value: float) -> bool:
+        """Record *symbol*'s return for bar *label*; O(N).
+
+        Returns False when the value is ignored: non-finite, already set for
+        that bar, or older than the window.
+        """
+        if value is None or not np.isfinite(value):
+            return False
+        j = self._symbol_index(symbol)
+        slot = self._slot_for(label)
+        if slot is None or self._m[slot, j]:
+            return False
+        v = float(value)
+        x, m = self._x[slot], self._m[slot]
+        x[j] = v
+        m[j] = 1.0
+        # Only pairs involving j change; (j, j) is counted by both row and column.
+        self._n[j, :] += m
+        self._n[:, j] += m
+        self._n[j, j] -= 1.0
+        self._sx[j, :] += v * m
+        self._sx[:, j] += x
+        self._sx[j, j] -= v
+        self._sxx[j, :] += v * x
+        self._sxx[:, j] += v * x
+        self._sxx[j, j] -= v * v
+        self._sx2[j, :] += v * v * m
+        self._sx2[:, j] += x * x
+        self._sx2[j, j] -= v * v
+        self._cached = None
+        return True
+
+    def discard(self, symbol: str) -> None:
+        """Drop every return recorded for *symbol*, keeping the bars; O(window + N)."""
+        j = self._index.get(symbol)
+        if j is None:
+            return
+        self._x[:, j] = 0.0
+        self._m[:, j] = 0.0
+        for sums in (self._n, self._sx, self._sxx, self._sx2):
+            sums[j, :] = 0.0
+            sums[:, j] = 0.0
+        self._cached = None
+
+    def add_bar(self, label: Hashable, returns: Dict[str, float]) -> int:
+        """Record one bar of returns (``{symbol: return}``); returns values accepted."""
+        return sum(self.add(symbol, label, value) for symbol, value in returns.items())
+
+    def extend(self, symbol: str, labelled_returns: Iterable[Tuple[Hashable, float]]) -> int:
+        """Record ``(label, return)`` pairs for one symbol, oldest first."""
+        return sum(self.add(symbol, label, value) for label, value in labelled_returns)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _corr_from_sums(self, rows: Any, cols: Any) -> np.ndarray:
+        n = self._n[rows, cols]
+        sx = self._sx[rows, cols]
+        sy = self._sx.T[rows, cols]
+        num = n * self._sxx[rows, cols] - sx * sy
+        var_x = n * self._sx2[rows, cols] - sx * sx
+        var_y = n * self._sx2.T[rows, cols] - sy * sy
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = num / np.sqrt(var_x * var_y)
+        valid = (n >= self.min_periods) & (var_x > 1e-18 * n * n) & (var_y > 1e-18 * n * n)
+        return np.where(valid, np.clip(corr, -1.0, 1.0), np.nan)
+
+    def matrix(self) -> np.ndarray:
+        """Full correlation matrix in ``symbols`` order (NaN where undefined)."""
+        if self._cached is None:
+            k = len(self._symbols)
+            corr = self._corr_from_sums(slice(0, k), slice(0, k))
+            diag = np.arange(k)
+            corr[diag, diag] = np.where(np.isnan(corr[diag, diag]), np.nan, 1.0)
+            self._cached = corr
+        return self._cached
+
+    def correlation(self, symbol1: str, symbol2: str) -> Optional[float]:
+        """Correlation of two symbols, or None if unknown / undefined; O(1)."""
+        i, j = self._index.get(symbol1), self._index.get(symbol2)
+        if i is None or j is None:
+            return None
+        value = float(self._corr_from_sums(i, j))
+        return None if np.isnan(value) else value
+
+    def correlations_to(self, symbol: str, others: Sequence[str]) -> Dict[str, float]:
+        """Correlation of *symbol* against each of *others* (defined values only); O(len(others))."""
+        i = self._index.get(symbol)
+        cols = [(s, self._index[s]) for s in others if s in self._index and s != symbol]
+        if i is None or not cols:
+            return {}
+        values = self._corr_from_sums(i, np.array([c for _, c in cols]))
+        return {s: float(v) for (s, _), v in zip(cols, values) if not np.isnan(v)}
+
+    def max_correlation(self, symbol: str, others: Sequence[str]) -> Tuple[Optional[str], float]:
+        """Most correlated (by absolute value) of *others* vs *symbol*: ``(symbol, corr)``."""
+        corrs = self.correlations_to(symbol, others)
+        if not corrs:
+            return None, 0.0
+        best = max(corrs, key=lambda s: abs(corrs[s]))
+        return best, corrs[best]
@@ -0,0 +1,68 @@
+"""
+Parity tests for the precomputed replay in ApexBacktest.run_backtest.
+
+The vectorized replay must produce exactly the trades, equity curve and
+statistics of the original per-candle loop (``vectorized=False``).
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from apex_backtest import ApexBacktest  # noqa: E402
+from apex_strategy_v7 import ApexStrategyV7  # noqa: E402
+
+
+def _make_ohlcv(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    # Alternate drift regimes so both long and short setups appear.
+    drift = np.repeat(rng.choice([-0.08, 0.0, 0.08], size=n // 200 + 1), 200)[:n]
+    close = np.maximum(100.0 + np.cumsum(drift + rng.normal(0, 0.5, n)), 1.0)
+    open_ = np.r_[close[0], close[:-1]] + rng.normal(0, 0.05, n)
+    high = np.maximum(open_, close) + rng.uniform(0, 0.3, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 0.3, n)
+    volume = rng.uniform(10, 1000, n)
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=pd.date_range("2026-01-01", periods=n, freq="1min"),
+    )
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_vectorized_replay_matches_legacy_loop(seed):
+    df = _make_ohlcv(600, seed)
+
+    legacy = ApexBacktest().run_backtest(df, "BTC-USD", vectorized=False)
+    fast = ApexBacktest().run_backtest(df, "BTC-USD")
+
+    assert legacy["total_trades"] > 0
+    assert fast["trades"] == legacy["trades"]
+    assert fast["equity_curve"] == legacy["equity_curve"]
+    for key, value in legacy.items():
+        if key not in ("trades", "equity_curve"):
+            assert fast[key] == value, key
+
+
+def test_indicators_at_matches_calculate_all_indicators():
+    df = _make_ohlcv(400, 3)
+    strategy = ApexStrategyV7(10000.0)
+    precomputed = strategy.precompute_indicators(df)
+
+    for i in (99, 150, 399):
+        expected = strategy.calculate_all_indicators(df.iloc[:i + 1])
+        actual = strategy.indicators_at(precomputed, i)
+        for key, value in expected.items():
+            assert actual[key] == value, (i, key)
+
+    assert strategy.indicators_at(precomputed, 50) is None
+
+
+def test_insufficient_data_returns_empty_results():
+    results = ApexBacktest().run_backtest(_make_ohlcv(50, 1), "BTC-USD")
+    assert results["total_trades"] == 0
+    assert results["equity_curve"] == []
@@ -0,0 +1,159 @@
+"""Tests for the pooled, rate-limited balance fetch service."""
+from __future__ import annotations
+
+import threading
+import time
+
+from bot.balance_fetch_service import BalanceFetchService, TokenBucket
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _service(**kwargs) -> BalanceFetchService:
+    kwargs.setdefault("max_workers", 4)
+    kwargs.setdefault("fetch_timeout", 2.0)
+    kwargs.setdefault("venue_limits", {"kraken": (100.0, 1)})
+    return BalanceFetchService(**kwargs)
+
+
+def test_token_bucket_paces_after_burst():
+    clock = _Clock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.5
+    clock.now = 0.5
+    assert bucket.try_acquire() == 0.0
+
+
+def test_stale_while_revalidate_returns_cached_value_immediately():
+    svc = _service(ttl=0.05, stale_max_age=60.0)
+    release = threading.Event()
+    values = iter([100.0, 200.0])
+
+    def fetch():
+        value = next(values)
+        if value == 200.0:
+            release.wait(2.0)
+        return value
+
+    key = ("user", "alice", "kraken")
+    assert svc.get(key, "kraken", fetch) == 100.0  # cold: waits for the fetch
+    time.sleep(0.06)
+    started = time.perf_counter()
+    assert svc.get(key, "kraken", fetch) == 100.0  # stale: served without blocking
+    assert time.perf_counter() - started < 0.05
+    assert svc.metrics()["accounts"]["user/alice/kraken"]["in_flight"] is True
+    release.set()
+    deadline = time.monotonic() + 2.0
+    while svc.metrics()["accounts"]["user/alice/kraken"]["in_flight"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert svc.get(key, "kraken", fetch) == 200.0
+    svc.shutdown()
+
+
+def test_failures_fall_back_to_stale_value_or_zero():
+    svc = _service(ttl=30.0)
+
+    def boom():
+        raise RuntimeError("api down")
+
+    assert svc.get(("user", "bob", "kraken"), "kraken", boom) == 0.0
+    assert svc.get(("user", "carol", "kraken"), "kraken", lambda: 50.0) == 50.0
+    svc.invalidate()  # forces a blocking refresh, keeps 50.0 as fallback
+    assert svc.get(("user", "carol", "kraken"), "kraken", boom) == 50.0
+    carol = svc.metrics()["accounts"]["user/carol/kraken"]
+    assert carol["failures"] == 1 and "api down" in carol["last_error"]
+    svc.shutdown()
+
+
+def test_refresh_all_parallel_across_venues_but_rate_limited_per_venue():
+    svc = _service(venue_limits={"kraken": (20.0, 1), "coinbase": (1000.0, 4)})
+    calls = {"kraken": [], "coinbase": []}
+    lock = threading.Lock()
+
+    def fetcher(venue, value):
+        def fetch():
+            with lock:
+                calls[venue].append(time.monotonic())
+            time.sleep(0.02)
+            return value
+        return fetch
+
+    items = [(("user", f"k{i}", "kraken"), "kraken", fetcher("kraken", i)) for i in range(5)]
+    items += [(("user", f"c{i}", "coinbase"), "coinbase", fetcher("coinbase", i)) for i in range(8)]
+    started = time.monotonic()
+    result = svc.refresh_all(items, timeout=5.0)
+
+    assert result[("user", "k4", "kraken")] == 4 and result[("user", "c7", "coinbase")] == 7
+    # Kraken: one at a time, >= 1/20s apart (burst of 1).
+    gaps = [b - a for a, b in zip(calls["kraken"], calls["kraken"][1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+    # Coinbase ran concurrently with Kraken instead of waiting behind it.
+    assert calls["coinbase"][-1] - started < calls["kraken"][-1] - started
+    venues = svc.metrics()["venues"]
+    assert venues["kraken"]["samples"] == 5 and venues["kraken"]["throttled_s"] > 0
+    assert venues["coinbase"]["p95_ms"] >= venues["coinbase"]["p50_ms"] > 0
+    svc.shutdown()
+
+
+def test_hung_call_times_out_for_callers_but_holds_its_lane_slot():
+    svc = _service(call_timeout=0.1)
+    release = threading.Event()
+    calls = []
+
+    def hung():
+        calls.append("slow")
+        release.wait(2.0)
+        return 75.0
+
+    def quick():
+        calls.append("next")
+        return 10.0
+
+    slow_key, next_key = ("user", "slow", "kraken"), ("user", "next", "kraken")
+    started = time.monotonic()
+    assert svc.get(slow_key, "kraken", hung) == 0.0  # released at the call timeout
+    assert time.monotonic() - started < 0.5
+    slow = svc.metrics()["accounts"]["user/slow/kraken"]
+    assert slow["failures"] == 1 and "no response" in slow["last_error"]
+
+    # The next Kraken call must not overlap the abandoned one (nonces).
+    assert svc.refresh_all([(next_key, "kraken", quick)], timeout=0.2) == {next_key: None}
+    assert calls == ["slow"] and svc.metrics()["venues"]["kraken"]["stalled_calls"] == 1
+
+    release.set()  # the late answer lands in the cache, then the lane moves on
+    assert svc.refresh_all([(next_key, "kraken", quick)], timeout=2.0) == {next_key: 10.0}
+    assert calls == ["slow", "next"]
+    metrics = svc.metrics()
+    assert metrics["accounts"]["user/slow/kraken"]["balance"] == 75.0
+    assert metrics["venues"]["kraken"]["stalled_calls"] == 0
+    svc.shutdown()
+
+
+def test_refresh_all_max_age_only_refetches_old_entries():
+    svc = _service()
+    calls = []
+
+    def fetcher(value):
+        def fetch():
+            calls.append(value)
+            return value
+        return fetch
+
+    svc.get(("user", "fresh", "kraken"), "kraken", lambda: 5.0)
+    items = [
+        (("user", "fresh", "kraken"), "kraken", fetcher(50.0)),
+        (("user", "cold", "kraken"), "kraken", fetcher(7.0)),
+    ]
+    result = svc.refresh_all(items, timeout=2.0, max_age=30.0)
+
+    assert result == {("user", "fresh", "kraken"): 5.0, ("user", "cold", "kraken"): 7.0}
+    assert calls == [7.0]
+    svc.shutdown()
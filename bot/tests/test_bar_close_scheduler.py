@@ -0,0 +1,151 @@
+"""Tests for the bar-close scheduler that drives the broker scan loops."""
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from bot.bar_close_scheduler import BarCloseScheduler
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_clock_trigger_fires_once_per_bar_with_lane_slots():
+    clock = _Clock(1000.0)  # mid-bar for a 300 s timeframe (bar 900-1200)
+    sched = BarCloseScheduler(timeframe_s=300, settle_s=2, spread_s=3, clock=clock)
+    sched.register("kraken", "kraken")
+    sched.register("alice_kraken", "kraken")
+
+    assert sched.wait_for_bar("kraken", timeout=0) is None  # partial bar is never delivered
+
+    clock.now = 1202.0
+    tick = sched.wait_for_bar("kraken", timeout=0)
+    assert (tick.bar_close, tick.source) == (1200.0, "clock")
+    assert sched.wait_for_bar("alice_kraken", timeout=0) is None  # slot 3 s later
+    clock.now = 1205.0
+    assert sched.wait_for_bar("alice_kraken", timeout=0).bar_close == 1200.0
+    assert sched.wait_for_bar("kraken", timeout=0) is None  # same bar is not re-delivered
+
+    clock.now = 1210.0
+    assert sched.record_decision(tick) == pytest.approx(10.0)
+    stats = sched.metrics()["kraken"]
+    assert stats["ticks"] == {"event": 0, "clock": 1} and stats["lag_max_ms"] == 10000.0
+
+
+def test_market_data_event_seals_bar_before_settle_and_counts_skips():
+    clock = _Clock(1000.0)
+    sched = BarCloseScheduler(timeframe_s=300, settle_s=30, spread_s=3, clock=clock)
+    sched.register("coinbase", "coinbase")
+    sched.register("kraken", "kraken")
+
+    clock.now = 1200.5
+    sched.on_bar(SimpleNamespace(exchange="coinbase", timestamp=1200.0))  # new bar opened → 1200 sealed
+    tick = sched.wait_for_bar("coinbase", timeout=0)
+    assert (tick.bar_close, tick.source) == (1200.0, "event")
+    assert sched.wait_for_bar("kraken", timeout=0) is None  # other venue waits for its clock
+
+    # A long scan: the lane wakes late and reports the bars it missed.
+    clock.now = 2135.0
+    tick = sched.wait_for_bar("coinbase", timeout=0)
+    assert tick.bar_close == 2100.0 and sched.metrics()["coinbase"]["skipped_bars"] == 2
+
+
+def test_wait_blocks_until_event_and_returns_on_stop():
+    clock = _Clock(1000.0)
+    sched = BarCloseScheduler(timeframe_s=300, settle_s=0, spread_s=0, clock=clock)
+    sched.register("okx", "okx")
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(sched.wait_for_bar("okx", timeout=5)))
+    waiter.start()
+    time.sleep(0.05)
+    clock.now = 1200.2  # bar 900-1200 arrives complete, before the clock trigger is checked
+    sched.on_bar(SimpleNamespace(exchange="okx", timestamp=900.0, close=1.0))
+    waiter.join(2)
+    assert got and (got[0].bar_close, got[0].source) == (1200.0, "event")
+
+    stop = threading.Event()
+    stopper = threading.Thread(target=lambda: got.append(sched.wait_for_bar("okx", stop)))
+    stopper.start()
+    stop.set()
+    sched.wake()
+    stopper.join(2)
+    assert not stopper.is_alive() and got[-1] is None
+
+
+def _run_platform_loop(monkeypatch, cycle_outcome, cycles):
+    """Drive run_broker_trading_loop on simulated time; returns (scheduler, [(now, decisions)])."""
+    import bot.independent_broker_trader as ibt
+
+    clock = _Clock(1000.0)
+
+    class _FastCondition(threading.Condition):
+        def wait(self, timeout=None):
+            clock.now += timeout  # advance simulated time instead of sleeping
+            return False
+
+    sched = BarCloseScheduler(timeframe_s=300, settle_s=0, spread_s=0, clock=clock)
+    sched._cond = _FastCondition()
+    monkeypatch.setattr(ibt.IndependentBrokerTrader, "_get_bar_scheduler", staticmethod(lambda: sched))
+    monkeypatch.setattr(ibt, "STARTUP_DELAY_MIN", 250.0)
+    monkeypatch.setattr(ibt, "STARTUP_DELAY_MAX", 250.0)
+    trader = ibt.IndependentBrokerTrader.__new__(ibt.IndependentBrokerTrader)
+    trader.broker_threads = {}
+    trader._register_broker_loop = lambda name: True
+    trader._unregister_broker_loop = lambda name: None
+    trader._display_capital_scaling_banner = lambda: None
+    trader._log_broker_loop_sleep = lambda name, delay: None
+
+    class _Stop(threading.Event):
+        def wait(self, timeout=None):
+            clock.now += timeout or 0.0
+            return self.is_set()
+
+    stop = _Stop()
+    seen = []
+
+    def cycle(broker_type, broker, name, count):
+        seen.append((round(clock.now), sched.metrics()["kraken"]["decisions"]))
+        if count == cycles:
+            stop.set()
+        return cycle_outcome
+
+    trader._run_platform_cycle = cycle
+    trader.run_broker_trading_loop(SimpleNamespace(value="kraken"), object(), stop)
+    assert "kraken" not in sched.metrics()
+    return seen
+
+
+def test_platform_loop_scans_on_bar_close_without_slowing_its_cadence(monkeypatch):
+    import bot.independent_broker_trader as ibt
+
+    seen = _run_platform_loop(
+        monkeypatch, ibt.PlatformCycleOutcome(ibt.PLATFORM_LOOP_SLEEP_S, completed=True), cycles=6
+    )
+    # Bar closes at 1200 and 1500; in between the loop still scans every 90 s.
+    assert [now for now, _ in seen] == [1200, 1290, 1380, 1470, 1500, 1590]
+    assert [decisions for _, decisions in seen] == [0, 1, 1, 1, 1, 2]
+
+
+def test_platform_loop_retry_is_not_taken_for_a_completed_cycle(monkeypatch):
+    import bot.independent_broker_trader as ibt
+
+    # A retry delay that happens to equal the normal interval is still a retry.
+    seen = _run_platform_loop(monkeypatch, ibt.PlatformCycleOutcome(ibt.PLATFORM_LOOP_SLEEP_S), cycles=3)
+    assert seen == [(1200, 0), (1290, 0), (1380, 0)]
+
+
+def test_scheduler_is_opt_in(monkeypatch):
+    from bot.bar_close_scheduler import scheduler_enabled
+
+    monkeypatch.delenv("NIJA_BAR_CLOSE_SCHEDULER", raising=False)
+    assert scheduler_enabled() is False
+    monkeypatch.setenv("NIJA_BAR_CLOSE_SCHEDULER", "1")
+    assert scheduler_enabled() is True
@@ -0,0 +1,128 @@
+"""Tests for BaseBroker.get_candles_batch and the venue-specific overrides."""
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from bot.broker_manager import AlpacaBroker, BinanceBroker, BrokerType, CoinbaseBroker, OKXBroker
+
+
+def _bars(n=3):
+    return [
+        SimpleNamespace(timestamp=i, open=100, high=101, low=99, close=100.5 + i, volume=1000)
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def alpaca_sdk(monkeypatch):
+    calls = SimpleNamespace(clients=0, requests=[], fail=False)
+
+    class StockHistoricalDataClient:
+        def __init__(self, api_key, api_secret):
+            calls.clients += 1
+
+        def get_stock_bars(self, request):
+            calls.requests.append(request.symbol_or_symbols)
+            symbols = request.symbol_or_symbols
+            if isinstance(symbols, str):
+                return {symbols: _bars()}
+            if calls.fail:
+                raise RuntimeError("invalid symbol: ZZZZ")
+            return SimpleNamespace(data={s: _bars() for s in symbols if s != "NODATA"})
+
+    class StockBarsRequest:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+    class TimeFrame:
+        Minute, Hour, Day = "minute", "hour", "day"
+
+        def __init__(self, amount, unit):
+            self.amount, self.unit = amount, unit
+
+    for name, attr, obj in (
+        ("alpaca.data.historical", "StockHistoricalDataClient", StockHistoricalDataClient),
+        ("alpaca.data.requests", "StockBarsRequest", StockBarsRequest),
+        ("alpaca.data.timeframe", "TimeFrame", TimeFrame),
+    ):
+        module = types.ModuleType(name)
+        setattr(module, attr, obj)
+        monkeypatch.setitem(sys.modules, name, module)
+    return calls
+
+
+def _alpaca():
+    broker = object.__new__(AlpacaBroker)
+    broker.broker_type = BrokerType.ALPACA
+    broker.account_identifier = "PLATFORM"
+    broker._api_key = "key"
+    broker._api_secret = "secret"
+    return broker
+
+
+def test_alpaca_batch_uses_one_request_and_reuses_client(alpaca_sdk):
+    broker = _alpaca()
+
+    result = broker.get_candles_batch(["AAPL", "MSFT", "NODATA", "AAPL"], "5m", 2)
+
+    assert list(result) == ["AAPL", "MSFT", "NODATA"]
+    assert [c["close"] for c in result["AAPL"]] == [101.5, 102.5]
+    assert result["NODATA"] == []
+    assert alpaca_sdk.requests == [["AAPL", "MSFT", "NODATA"]]
+
+    broker.get_candles("TSLA", count=5)
+    assert alpaca_sdk.clients == 1
+
+
+def test_alpaca_batch_falls_back_to_single_symbol_fetches(alpaca_sdk):
+    alpaca_sdk.fail = True
+    result = _alpaca().get_candles_batch(["AAPL", "MSFT"], "5m", 10)
+
+    assert sorted(alpaca_sdk.requests[1:]) == ["AAPL", "MSFT"]
+    assert all(len(v) == 3 for v in result.values())
+
+
+def test_default_fan_out_preserves_order_and_isolates_failures(monkeypatch):
+    broker = object.__new__(CoinbaseBroker)
+    broker.broker_type = BrokerType.COINBASE
+
+    def get_candles(symbol, timeframe, count):
+        if symbol == "BAD-USD":
+            raise RuntimeError("boom")
+        return [{"close": float(len(symbol))}] * count
+
+    monkeypatch.setattr(broker, "get_candles", get_candles)
+    result = broker.get_candles_batch(["ETH-USD", "BAD-USD", "BTC-USD"], "5m", 2)
+
+    assert list(result) == ["ETH-USD", "BAD-USD", "BTC-USD"]
+    assert result["BAD-USD"] == []
+    assert len(result["BTC-USD"]) == 2
+    assert broker._candle_batch_executor() is broker._candle_batch_executor()
+
+
+def test_binance_and_okx_fan_out_klines_without_a_ticker_call():
+    kline_calls = []
+
+    def no_ticker(*args, **kwargs):
+        raise AssertionError("no all-symbols ticker request expected")
+
+    binance = object.__new__(BinanceBroker)
+    binance.broker_type = BrokerType.BINANCE
+    binance.client = SimpleNamespace(
+        get_symbol_ticker=no_ticker,
+        get_klines=lambda symbol, interval, limit: kline_calls.append(symbol) or [[1, 1, 1, 1, 1, 1]],
+    )
+    result = binance.get_candles_batch(["BTC-USD"], "5m", 1)
+    assert kline_calls == ["BTCUSDT"]
+    assert result == {"BTC-USD": [{"time": 1, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0}]}
+
+    okx = object.__new__(OKXBroker)
+    okx.broker_type = BrokerType.OKX
+    okx.market_api = SimpleNamespace(
+        get_tickers=no_ticker,
+        get_candles=lambda instId, bar, limit: kline_calls.append(instId) or {"code": "0", "data": []},
+    )
+    assert okx.get_candles_batch(["ETH-USD", "NOPE-USD"], "1h", 5) == {"ETH-USD": [], "NOPE-USD": []}
+    assert sorted(kline_calls[1:]) == ["ETH-USDT", "NOPE-USDT"]
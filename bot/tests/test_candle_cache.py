@@ -0,0 +1,263 @@
+"""Tests for the shared candle cache in front of NijaCoreLoop._fetch_df.
+
+Covers same-cycle reuse (one broker call per symbol per cycle), delta
+fetching across cycles, the full-fetch fallbacks and the hit/miss/bytes
+counters.
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pandas as pd
+import pytest
+
+from bot.candle_cache import CandleCache, bar_timestamps, broker_cache_key
+
+_T0 = 1_760_000_000  # epoch seconds, minute-aligned
+
+
+def _bars(start_minute: int, count: int) -> pd.DataFrame:
+    minutes = range(start_minute, start_minute + count)
+    return pd.DataFrame(
+        {
+            "time": [_T0 + 60 * m for m in minutes],
+            "open": [100.0 + m for m in minutes],
+            "high": [101.0 + m for m in minutes],
+            "low": [99.0 + m for m in minutes],
+            "close": [100.5 + m for m in minutes],
+            "volume": [1000.0 + m for m in minutes],
+        }
+    )
+
+
+class _Venue:
+    """Synthetic venue whose newest bar is ``now_minute`` (open / partial)."""
+
+    def __init__(self, now_minute: int) -> None:
+        self.now_minute = now_minute
+        self.requests: List[int] = []
+
+    def fetch(self, count: int, min_rows: int) -> Optional[pd.DataFrame]:
+        self.requests.append(count)
+        return _bars(self.now_minute - count + 1, count)
+
+
+def _cache(clock_minute: List[int], **kwargs) -> CandleCache:
+    kwargs.setdefault("overlap", 2)
+    kwargs.setdefault("reuse_ttl_s", 5.0)
+    return CandleCache(window=200, clock=lambda: _T0 + 60 * clock_minute[0] + 1, **kwargs)
+
+
+def test_same_cycle_returns_private_copies_without_io():
+    now = [500]
+    cache = _cache(now)
+    venue = _Venue(500)
+
+    cache.begin_cycle("kraken")
+    first = cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+    first.loc[first.index[-1], "close"] = -1.0
+    second = cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+
+    assert first is not second
+    assert second["close"].iloc[-1] == 100.5 + 500
+    assert len(first) == 200
+    assert venue.requests == [200]
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["bytes_saved"] > 0
+
+
+def test_next_cycle_fetches_only_new_bars():
+    now = [500]
+    cache = _cache(now)
+    venue = _Venue(500)
+    cache.begin_cycle("kraken")
+    cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+
+    # Three minutes later: three new bars plus the refreshed open bar.
+    now[0] = 503
+    venue.now_minute = 503
+    cache.begin_cycle("kraken")
+    frame = cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+
+    assert venue.requests == [200, 6]
+    assert len(frame) == 200
+    expected = _bars(304, 200).reset_index(drop=True)
+    pd.testing.assert_frame_equal(frame, expected, check_dtype=False)
+    stats = cache.stats()
+    assert stats["delta_fetches"] == 1
+    assert stats["rows_saved"] == 194
+
+
+def test_refreshed_open_bar_replaces_cached_copy():
+    now = [500]
+    cache = _cache(now)
+    venue = _Venue(500)
+    cache.begin_cycle("okx")
+    cache.get("okx", "ETH-USD", "1m", venue.fetch)
+
+    def _fetch_with_updated_close(count, min_rows):
+        frame = _bars(500 - count + 1, count)
+        frame.loc[frame.index[-1], "close"] = 9999.0
+        return frame
+
+    cache.begin_cycle("okx")
+    frame = cache.get("okx", "ETH-USD", "1m", _fetch_with_updated_close)
+    assert frame["close"].iloc[-1] == 9999.0
+    assert frame["time"].is_unique
+
+
+def test_gap_larger_than_window_triggers_full_fetch():
+    now = [500]
+    cache = _cache(now)
+    venue = _Venue(500)
+    cache.begin_cycle("kraken")
+    cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+
+    now[0] = venue.now_minute = 900
+    cache.begin_cycle("kraken")
+    frame = cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+    assert venue.requests == [200, 200]
+    assert frame["time"].iloc[-1] == _T0 + 60 * 900
+
+
+def test_delta_gap_falls_back_to_full_fetch():
+    now = [500]
+    cache = _cache(now)
+    venue = _Venue(500)
+    cache.begin_cycle("kraken")
+    cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+
+    calls = []
+
+    def _short_delta(count, min_rows):
+        calls.append(count)
+        if count < 200:
+            return _bars(510, 2)  # starts after the cached bar → gap
+        return _bars(311, 200)
+
+    now[0] = 510
+    cache.begin_cycle("kraken")
+    frame = cache.get("kraken", "BTC-USD", "1m", _short_delta)
+    assert calls == [13, 200]
+    assert len(frame) == 200
+    assert cache.stats()["delta_fallbacks"] == 1
+
+
+def test_frames_without_timestamps_always_refetch_across_cycles():
+    cache = CandleCache(window=200, reuse_ttl_s=0.0)
+    fetches = []
+
+    def _fetch(count, min_rows):
+        fetches.append(count)
+        return _bars(0, 200).drop(columns=["time"])
+
+    cache.begin_cycle("x")
+    cache.get("x", "S", "1m", _fetch)
+    cache.get("x", "S", "1m", _fetch)
+    cache.begin_cycle("x")
+    cache.get("x", "S", "1m", _fetch)
+    assert fetches == [200, 200]
+
+
+def test_ttl_reuse_outside_explicit_cycle():
+    now = [500]
+    cache = _cache(now, reuse_ttl_s=30.0)
+    venue = _Venue(500)
+    a = cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+    b = cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+    pd.testing.assert_frame_equal(a, b)
+    assert venue.requests == [200]
+
+
+def test_end_cycle_restores_ttl_reuse_and_keeps_newer_cycles():
+    now = [500]
+    cache = _cache(now, reuse_ttl_s=30.0)
+    venue = _Venue(500)
+    token = cache.begin_cycle("kraken")
+    cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+    cache.end_cycle("kraken", token)
+
+    # Ten minutes on, outside any cycle: the old window is past its TTL.
+    now[0] = venue.now_minute = 510
+    cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+    assert venue.requests == [200, 13]
+
+    newer = cache.begin_cycle("kraken")
+    cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+    cache.end_cycle("kraken", token)  # a stale token does not close the newer cycle
+    now[0] = 600
+    cache.get("kraken", "BTC-USD", "1m", venue.fetch)
+    assert venue.requests == [200, 13, 3]
+    cache.end_cycle("kraken", newer)
+
+
+def test_fetch_locks_are_a_fixed_stripe_pool():
+    cache = _cache([500], max_entries=2)
+    locks = cache._key_locks
+    for i in range(10):
+        cache.get("kraken", f"S{i}", "1m", _Venue(500).fetch)
+    assert cache._key_locks is locks and cache.stats()["entries"] == 2
+
+
+def test_bar_timestamps_accepts_ms_and_iso():
+    ms = pd.DataFrame({"timestamp": [1_700_000_000_000, 1_700_000_060_000]})
+    iso = pd.DataFrame({"start": ["2026-01-01T00:00:00Z", "2026-01-01T00:01:00Z"]})
+    assert bar_timestamps(ms).iloc[1] - bar_timestamps(ms).iloc[0] == pd.Timedelta(minutes=1)
+    assert bar_timestamps(iso).iloc[0] == pd.Timestamp("2026-01-01", tz="UTC")
+    assert bar_timestamps(pd.DataFrame({"close": [1.0]})) is None
+
+
+def test_broker_cache_key_shares_venue_and_isolates_unknown_objects():
+    venue_a = SimpleNamespace(broker_type=SimpleNamespace(value="KRAKEN"))
+    venue_b = SimpleNamespace(broker_type=SimpleNamespace(value="kraken"))
+    assert broker_cache_key(venue_a) == broker_cache_key(venue_b) == "kraken"
+    assert broker_cache_key(object()) != broker_cache_key(object())
+
+
+def test_core_loop_fetch_df_shares_one_fetch_per_cycle(monkeypatch):
+    from bot import nija_core_loop as ncl
+    from bot.nija_core_loop import NijaCoreLoop
+
+    monkeypatch.setattr(ncl, "_get_candle_cache", lambda: cache)
+    cache = CandleCache(window=200)
+    calls = []
+
+    class Broker:
+        broker_type = SimpleNamespace(value="coinbase")
+
+        def get_candles(self, symbol, limit=200):
+            calls.append(limit)
+            return _bars(0, limit).to_dict("records")
+
+    broker = Broker()
+    loop = NijaCoreLoop(SimpleNamespace(broker_client=broker), max_positions=1)
+    cache.begin_cycle("coinbase")
+    first = loop._fetch_df(broker, "BTC-USD")
+    second = loop._fetch_df(broker, "BTC-USD")
+    pd.testing.assert_frame_equal(first, second)
+    assert calls == [200]
+
+    monkeypatch.setenv("NIJA_CANDLE_CACHE_ENABLED", "false")
+    loop._fetch_df(broker, "BTC-USD")
+    assert calls == [200, 200]
+
+
+def test_scan_phase_cycle_is_closed_when_the_scan_raises(monkeypatch):
+    from bot import nija_core_loop as ncl
+
+    cache = CandleCache(window=200)
+    monkeypatch.setattr(ncl, "_get_candle_cache", lambda: cache)
+    seen = []
+
+    @ncl._candle_cache_cycle
+    def scan(self, broker, balance):
+        seen.append(dict(cache._cycles))
+        raise RuntimeError("scan failed")
+
+    broker = SimpleNamespace(broker_type=SimpleNamespace(value="coinbase"))
+    with pytest.raises(RuntimeError):
+        scan(SimpleNamespace(apex=None), broker, 10.0)
+    assert list(seen[0]) == ["coinbase"]
+    assert cache._cycles == {}
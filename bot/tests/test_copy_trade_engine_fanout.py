@@ -0,0 +1,176 @@
+"""Tests for the parallel copy-trade fan-out: venue limits, deadline, batched ledger, latency."""
+from __future__ import annotations
+
+import enum
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import bot.copy_trade_engine as cte
+
+
+class _Exchange(enum.Enum):
+    KRAKEN = "kraken"
+
+
+class _Ledger:
+    def __init__(self):
+        self.batches = []
+        self.single = 0
+
+    def record_copy_trades(self, rows):
+        self.batches.append(list(rows))
+        return len(rows)
+
+    def record_copy_trade(self, **row):
+        self.single += 1
+
+
+class _Allocator:
+    def refresh_balances(self, _mgr):
+        pass
+
+    def compute_user_size(self, user_id, platform_size_usd, exchange):
+        approved = user_id != "u-poor"
+        return SimpleNamespace(approved=approved, reason="" if approved else "below minimum",
+                               allocated_size_usd=platform_size_usd / 2)
+
+
+def _engine(monkeypatch, users, submit, **env):
+    for key, value in env.items():
+        monkeypatch.setenv(key, str(value))
+    monkeypatch.setattr(cte, "submit_market_order_via_pipeline", submit)
+    monkeypatch.setattr(cte.CopyTradeEngine, "_load_dependencies", lambda self: None)
+    engine = cte.CopyTradeEngine()
+    engine._allocator = _Allocator()
+    engine._ledger = _Ledger()
+    engine.attach(SimpleNamespace(user_brokers={
+        uid: {_Exchange.KRAKEN: SimpleNamespace(connected=uid != "u-offline", name=uid)} for uid in users
+    }))
+    return engine
+
+
+def _signal():
+    return cte.CopySignal(platform_trade_id="T1", symbol="BTC-USD", side="buy",
+                          platform_size_usd=100.0, exchange="KRAKEN")
+
+
+def test_fan_out_is_parallel_capped_per_venue_and_batched(monkeypatch):
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def submit(broker, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        if broker.name == "u-3":
+            raise RuntimeError("exchange said no")
+        return {"status": "filled", "order_id": f"o-{broker.name}"}
+
+    users = ["u-offline", "u-poor"] + [f"u-{i}" for i in range(8)]
+    engine = _engine(monkeypatch, users, submit, NIJA_COPY_MAX_WORKERS=8,
+                     NIJA_COPY_VENUE_CONCURRENCY_KRAKEN=3, NIJA_COPY_VENUE_RATE=1000)
+    started = time.monotonic()
+    results = engine.broadcast(_signal())
+    elapsed = time.monotonic() - started
+
+    assert [r.user_id for r in results] == users
+    assert results[0].skip_reason == "broker not connected"
+    assert results[1].skip_reason == "below minimum"
+    assert results[5].error == "exchange said no" and not results[5].success
+    filled = [r for r in results if r.success]
+    assert len(filled) == 7 and all(r.filled_usd == 50.0 for r in filled)
+    assert peak[0] == 3          # per-venue cap, not the 8-worker pool
+    assert elapsed < 8 * 0.05    # ceil(8 / 3) waves, not sequential
+
+    for r in results[2:]:
+        assert r.signal_to_submit_ms is not None and r.submit_to_ack_ms >= 40.0
+    assert len(engine._ledger.batches) == 1 and engine._ledger.single == 0
+    assert sorted(row["user_status"] for row in engine._ledger.batches[0]) == ["failed"] + ["filled"] * 7 + ["skipped"]
+    stats = engine.get_stats()
+    assert stats["filled"] == 7 and stats["followers"] == 8
+    assert stats["submit_to_ack_p95_ms"] >= stats["submit_to_ack_p50_ms"] >= 40.0
+
+
+def test_deadline_skips_followers_not_yet_submitted(monkeypatch):
+    release = threading.Event()
+
+    def submit(broker, **kwargs):
+        if broker.name == "u-0":
+            release.wait(2.0)
+        return {"status": "filled", "order_id": broker.name}
+
+    engine = _engine(monkeypatch, ["u-0", "u-1", "u-2"], submit, NIJA_COPY_VENUE_CONCURRENCY=1,
+                     NIJA_COPY_BROADCAST_DEADLINE_S=0.2, NIJA_COPY_ACK_GRACE_S=0.05)
+    results = engine.broadcast(_signal())
+
+    assert not results[0].success and "no ack" in results[0].error
+    assert [r.skipped for r in results[1:]] == [True, True]
+    assert all("deadline" in r.skip_reason for r in results[1:])
+    assert [row["user_id"] for row in engine._ledger.batches[0]] == ["u-1", "u-2"]
+
+    release.set()  # the slow order lands later and is recorded on its own
+    for _ in range(100):
+        if len(engine._ledger.batches) == 2:
+            break
+        time.sleep(0.01)
+    assert engine._ledger.batches[1][0]["user_status"] == "filled"
+
+
+def test_venue_rate_limit_paces_submissions(monkeypatch):
+    times = []
+
+    def submit(broker, **kwargs):
+        times.append(time.monotonic())
+        return {"status": "filled"}
+
+    engine = _engine(monkeypatch, [f"u-{i}" for i in range(4)], submit,
+                     NIJA_COPY_VENUE_CONCURRENCY=2, NIJA_COPY_VENUE_RATE=20)
+    results = engine.broadcast(_signal())
+    assert all(r.success for r in results)
+    times.sort()
+    # Bucket holds 2 tokens (= concurrency); the remaining two wait ~50 ms each.
+    assert times[-1] - times[0] == pytest.approx(0.1, abs=0.04)
+
+
+def test_exits_are_never_skipped_at_the_deadline(monkeypatch):
+    release = threading.Event()
+    submitted = []
+
+    def submit(broker, **kwargs):
+        if broker.name == "u-0":
+            release.wait(2.0)
+        submitted.append((broker.name, kwargs["side"]))
+        return {"status": "filled", "order_id": broker.name}
+
+    engine = _engine(monkeypatch, ["u-0", "u-1", "u-2"], submit, NIJA_COPY_VENUE_CONCURRENCY=1,
+                     NIJA_COPY_BROADCAST_DEADLINE_S=0.2, NIJA_COPY_ACK_GRACE_S=0.05)
+    exit_signal = cte.CopySignal(platform_trade_id="T2", symbol="BTC-USD", side="sell",
+                                 platform_size_usd=100.0, exchange="KRAKEN")
+    results = engine.broadcast(exit_signal)
+
+    # Past the deadline the closes are reported as pending, not skipped.
+    assert not any(r.skipped for r in results)
+    assert all("exit pending" in r.error for r in results)
+    release.set()
+    for _ in range(200):
+        if sum(len(batch) for batch in engine._ledger.batches) == 3:
+            break
+        time.sleep(0.01)
+    assert sorted(name for name, _ in submitted) == ["u-0", "u-1", "u-2"]
+    assert all(side == "sell" for _, side in submitted)
+    rows = [row for batch in engine._ledger.batches for row in batch]
+    assert sorted(row["user_status"] for row in rows) == ["filled"] * 3
+
+
+def test_exit_flag_from_metadata():
+    entry = cte.CopySignal(platform_trade_id="T", symbol="BTC-USD", side="buy", platform_size_usd=1.0)
+    assert not entry.is_exit
+    cover = cte.CopySignal(platform_trade_id="T", symbol="BTC-USD", side="buy", platform_size_usd=1.0,
+                           metadata={"reduce_only": True})
+    assert cover.is_exit
@@ -0,0 +1,120 @@
+"""Tests for the per-cycle span profiler in bot.cycle_profiler."""
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from bot.cycle_profiler import (
+    SLOWEST_FILE,
+    SLOWEST_FOLDED_FILE,
+    SNAPSHOT_FILE,
+    CycleProfiler,
+    create_cycle_profile_blueprint,
+)
+
+
+def _profiler(tmp_path, **kwargs) -> CycleProfiler:
+    kwargs.setdefault("enabled", True)
+    kwargs.setdefault("sampling", False)
+    kwargs.setdefault("flush_interval_s", 0.0)
+    return CycleProfiler(window=50, data_dir=tmp_path, **kwargs)
+
+
+def test_nested_spans_track_percentiles_and_self_time(tmp_path):
+    prof = _profiler(tmp_path)
+    for _ in range(20):
+        with prof.span("phase3"):
+            with prof.span("phase3.fetch"):
+                time.sleep(0.002)
+            time.sleep(0.001)
+
+    spans = prof.snapshot()["spans"]
+    assert spans["phase3"]["count"] == spans["phase3.fetch"]["count"] == 20
+    assert spans["phase3.fetch"]["p50_ms"] >= 2.0
+    assert spans["phase3"]["p50_ms"] >= spans["phase3.fetch"]["p50_ms"]
+    assert spans["phase3"]["p50_ms"] <= spans["phase3"]["p95_ms"] <= spans["phase3"]["p99_ms"] <= spans["phase3"]["max_ms"]
+    # Self time of the parent excludes the child span.
+    assert spans["phase3"]["self_mean_ms"] < spans["phase3"]["mean_ms"] - 1.5
+    assert spans["phase3.fetch"]["self_mean_ms"] == pytest.approx(spans["phase3.fetch"]["mean_ms"])
+
+
+def test_cycle_breakdown_flush_and_worker_thread_spans(tmp_path):
+    prof = _profiler(tmp_path)
+
+    def worker():
+        with prof.span("broker.get_candles"):
+            pass
+
+    with prof.cycle():
+        with prof.span("phase1.safety"):
+            pass
+        for _ in range(3):
+            with prof.span("broker.get_candles"):
+                pass
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+    snap = prof.snapshot()
+    assert snap["cycles"] == 1
+    cycle = snap["last_cycle"]
+    assert cycle["spans"]["broker.get_candles"]["calls"] == 3
+    assert "phase1.safety" in cycle["spans"]
+    # The worker-thread span feeds the rolling stats but not the cycle breakdown.
+    assert snap["spans"]["broker.get_candles"]["count"] == 4
+    on_disk = json.loads((tmp_path / SNAPSHOT_FILE).read_text())
+    assert on_disk["cycles"] == 1 and "phase1.safety" in on_disk["spans"]
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    prof = _profiler(tmp_path, enabled=False)
+    with prof.cycle():
+        with prof.span("phase2.positions"):
+            pass
+    assert prof.snapshot()["spans"] == {}
+    assert prof.snapshot()["cycles"] == 0
+
+
+def test_sampling_dumps_slowest_cycle_stacks(tmp_path):
+    prof = _profiler(tmp_path, sampling=True, sample_interval_ms=1.0)
+
+    def slow_gate():
+        deadline = time.perf_counter() + 0.06
+        while time.perf_counter() < deadline:
+            pass
+
+    with prof.cycle():
+        slow_gate()
+    with prof.cycle():
+        pass  # faster cycle must not overwrite the dump
+
+    dump = json.loads((tmp_path / SLOWEST_FILE).read_text())
+    assert dump["samples"] > 0
+    assert any("slow_gate" in s["stack"] for s in dump["stacks"])
+    assert dump["cycle"]["total_ms"] >= 60
+    folded = (tmp_path / SLOWEST_FOLDED_FILE).read_text().splitlines()
+    assert folded and all(line.rsplit(" ", 1)[1].isdigit() for line in folded)
+    assert prof.snapshot()["slowest_cycle"]["total_ms"] == dump["cycle"]["total_ms"]
+
+
+def test_dashboard_route_serves_flushed_snapshot(tmp_path, monkeypatch):
+    flask = pytest.importorskip("flask")
+    from bot import cycle_profiler
+
+    writer = _profiler(tmp_path)
+    with writer.cycle():
+        with writer.span("phase3.indicators"):
+            pass
+    # The dashboard process has its own (idle) profiler and reads the file.
+    monkeypatch.setattr(cycle_profiler, "_profiler", _profiler(tmp_path))
+    app = flask.Flask(__name__)
+    app.register_blueprint(create_cycle_profile_blueprint())
+    client = app.test_client()
+
+    body = client.get("/api/cycle-profile").get_json()
+    assert body["cycles"] == 1
+    assert "phase3.indicators" in body["spans"]
+    assert client.get("/api/cycle-profile/slowest").status_code == 404
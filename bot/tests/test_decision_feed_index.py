@@ -0,0 +1,85 @@
+"""Tests for the reverse tail reader / incremental decision-feed index."""
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from bot.decision_feed_index import DecisionFeedIndex, tail_lines
+
+
+def _event(action, reason, age_s=0.0, **extra):
+    ts = datetime.now(timezone.utc) - timedelta(seconds=age_s)
+    return json.dumps({"action": action, "reason_code": reason, "timestamp": ts.isoformat(), **extra})
+
+
+def test_tail_lines_reads_backwards_across_chunks(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    path.write_text("".join(f"line-{i}\n" for i in range(1000)) + "\n")
+    assert tail_lines(path, 3, chunk_size=7) == ["line-997", "line-998", "line-999"]
+    assert tail_lines(path, 5000, chunk_size=64)[0] == "line-0"
+
+
+def test_bootstrap_reads_only_the_tail(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    old = [_event("vetoed", "old_reason", age_s=7200) for _ in range(5000)]
+    new = [_event("skipped", "low_score", age_s=10, i=i) for i in range(30)]
+    path.write_text("\n".join(old + new) + "\n")
+
+    index = DecisionFeedIndex(path, capacity=100, retention_s=3600)
+    summary = index.summary(limit=50, window_seconds=300, recent=5)
+
+    # Only the last `capacity` lines (plus the one that crossed the horizon) were parsed.
+    assert index.lines_parsed <= 101
+    assert summary["not_taken_last_window"] == 30
+    assert dict(summary["window_reasons"]) == {"low_score": 30}
+    assert dict(summary["top_reasons"]) == {"old_reason": 20, "low_score": 30}
+    assert [e["i"] for e in summary["recent_not_taken"]] == [25, 26, 27, 28, 29]
+
+
+def test_incremental_refresh_parses_only_appended_lines(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    path.write_text(_event("executed", "ok") + "\n" + _event("rejected", "spread") + "\n")
+    index = DecisionFeedIndex(path, capacity=100, retention_s=600)
+    assert index.summary()["not_taken_last_window"] == 1
+    assert index.lines_parsed == 2
+
+    # A writer caught mid-line: the partial record is held until its newline lands.
+    partial = _event("vetoed", "risk")
+    with open(path, "a") as fh:
+        fh.write(_event("vetoed", "risk") + "\n" + partial[:15])
+    assert index.summary()["not_taken_last_window"] == 2
+    with open(path, "a") as fh:
+        fh.write(partial[15:] + "\n")
+    summary = index.summary()
+    assert summary["not_taken_last_window"] == 3
+    assert dict(summary["retention_reasons"]) == {"spread": 1, "risk": 2}
+    assert index.lines_parsed == 4
+    assert index.bootstraps == 1
+
+
+def test_truncation_and_replacement_trigger_rebootstrap(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    path.write_text("\n".join(_event("skipped", "a") for _ in range(10)) + "\n")
+    index = DecisionFeedIndex(path, capacity=50)
+    assert index.summary()["not_taken_last_window"] == 10
+
+    replacement = tmp_path / "feed.new"
+    replacement.write_text(_event("skipped", "b") + "\n")
+    os.replace(replacement, path)
+    summary = index.summary()
+    assert dict(summary["top_reasons"]) == {"b": 1}
+    assert index.bootstraps == 2
+
+    path.unlink()
+    assert index.summary()["available"] is False
+
+
+def test_rolling_counts_expire_with_retention(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    path.write_text(_event("vetoed", "stale", age_s=90) + "\n" + _event("vetoed", "fresh", age_s=1) + "\n")
+    summary = DecisionFeedIndex(path, retention_s=60).summary(window_seconds=30)
+    assert dict(summary["retention_reasons"]) == {"fresh": 1}
+    assert summary["not_taken_last_window"] == 1
+    # Line-based counts still see both events.
+    assert dict(summary["top_reasons"]) == {"stale": 1, "fresh": 1}
@@ -0,0 +1,125 @@
+"""Tests for the shared batched JSONL writer in bot.event_log."""
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+
+import pytest
+
+from bot.event_log import EventLogWriter, StreamConfig
+
+
+@pytest.fixture
+def writer():
+    w = EventLogWriter(flush_interval_s=0.05, batch_size=64, synchronous=False)
+    yield w
+    w.close()
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_batched_appends_keep_order_across_threads(tmp_path, writer):
+    stream = writer.stream(tmp_path / "events.jsonl")
+
+    def produce(tid):
+        for i in range(250):
+            assert stream.append({"tid": tid, "i": i})
+
+    threads = [threading.Thread(target=produce, args=(t,)) for t in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert stream.flush()
+
+    rows = _lines(tmp_path / "events.jsonl")
+    assert len(rows) == 1000
+    for tid in range(4):
+        assert [r["i"] for r in rows if r["tid"] == tid] == list(range(250))
+    stats = stream.stats()
+    assert stats["written"] == 1000 and stats["dropped"] == 0
+    assert stats["batches"] < 1000
+    assert writer.stream(str(tmp_path / "events.jsonl")) is stream
+
+
+@pytest.mark.parametrize("policy, kept", [("drop_newest", [0, 1, 2]), ("drop_oldest", [2, 3, 4])])
+def test_full_queue_applies_drop_policy(tmp_path, policy, kept):
+    # Long interval + large batch: nothing drains until flush().
+    w = EventLogWriter(flush_interval_s=60.0, batch_size=1000, synchronous=False)
+    try:
+        stream = w.stream(tmp_path / "q.jsonl", max_queue=3, drop_policy=policy)
+        accepted = [stream.append({"i": i}) for i in range(5)]
+        assert stream.stats()["dropped"] == 2
+        assert accepted == ([True] * 3 + [False] * 2 if policy == "drop_newest" else [True] * 5)
+        assert stream.flush()
+        assert [r["i"] for r in _lines(tmp_path / "q.jsonl")] == kept
+    finally:
+        w.close()
+
+
+def test_block_policy_waits_for_writer_instead_of_dropping(tmp_path, writer):
+    stream = writer.stream(tmp_path / "b.jsonl", max_queue=4, drop_policy="block", put_timeout_s=2.0)
+    assert all(stream.append({"i": i}) for i in range(50))
+    assert stream.flush()
+    assert len(_lines(tmp_path / "b.jsonl")) == 50
+    assert stream.stats()["dropped"] == 0
+
+
+def test_size_rotation_compresses_and_prunes_segments(tmp_path, writer):
+    path = tmp_path / "audit.jsonl"
+    stream = writer.stream(path, rotate_bytes=200, compress=True, max_segments=2, durability="fsync")
+    for i in range(40):
+        stream.append({"i": i, "pad": "x" * 20})
+        stream.flush()
+
+    segments = stream.rotated_segments()
+    assert len(segments) == 2
+    assert all(p.name.endswith(".jsonl.gz") for p in segments)
+    assert stream.stats()["rotations"] > 2
+    rotated = [json.loads(l) for p in segments for l in gzip.open(p, "rt").read().splitlines()]
+    active = _lines(path)
+    # Newest records are contiguous across the kept segments and the active file.
+    tail = [r["i"] for r in rotated + active]
+    assert tail == list(range(40 - len(tail), 40))
+    assert path.stat().st_size <= 200
+
+
+def test_write_failures_reach_on_error_callback(tmp_path, writer):
+    failed = []
+    stream = writer.stream(tmp_path, config=StreamConfig(on_error=lambda recs, exc: failed.extend(recs)))
+    stream.append({"i": 1})
+    assert stream.flush()
+    assert failed == [{"i": 1}]
+    assert stream.stats()["failed"] == 1
+
+
+def test_synchronous_mode_and_close_write_through(tmp_path):
+    w = EventLogWriter(synchronous=True)
+    stream = w.stream(tmp_path / "sync.jsonl")
+    stream.append("pre-serialised")
+    assert (tmp_path / "sync.jsonl").read_text() == "pre-serialised\n"
+
+    w2 = EventLogWriter(flush_interval_s=60.0, batch_size=1000, synchronous=False)
+    s2 = w2.stream(tmp_path / "closing.jsonl")
+    s2.append({"i": 0})
+    w2.close()  # drains pending records
+    s2.append({"i": 1})  # after close: written on the caller thread
+    assert [r["i"] for r in _lines(tmp_path / "closing.jsonl")] == [0, 1]
+
+
+def test_synchronous_stream_writes_before_append_returns(tmp_path):
+    w = EventLogWriter(flush_interval_s=60.0, batch_size=1000, synchronous=False)
+    try:
+        ledger = w.stream(tmp_path / "ledger.jsonl", synchronous=True, max_queue=1, drop_policy="drop_newest")
+        telemetry = w.stream(tmp_path / "telemetry.jsonl")
+        for i in range(5):
+            assert ledger.append({"i": i})
+            telemetry.append({"i": i})
+            assert [r["i"] for r in _lines(tmp_path / "ledger.jsonl")] == list(range(i + 1))
+        assert not (tmp_path / "telemetry.jsonl").exists()
+        assert ledger.stats()["dropped"] == 0 and ledger.stats()["pending"] == 0
+    finally:
+        w.close()
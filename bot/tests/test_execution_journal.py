@@ -28,6 +28,7 @@ class TestExecutionJournal(unittest.TestCase):
             self.assertEqual(first["event_type"], "intent_created")
             self.assertEqual(second["event_type"], "order_submitted")
 
+            # Written and flushed before append() returned.
             with open(journal_path, "r", encoding="utf-8") as fh:
                 lines = [json.loads(line) for line in fh if line.strip()]
             self.assertEqual(len(lines), 2)
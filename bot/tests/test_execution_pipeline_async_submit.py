@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import unittest
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from bot.execution_broker_capabilities import BrokerCapabilityRegistry
+from bot.execution_pipeline import ExecutionPipeline, PipelineRequest
+from bot.runtime_correlation import get_runtime_correlation, runtime_correlation_scope
+
+
+class _SlowMultiRouter:
+    """Acknowledges after ``delays[symbol]`` seconds; records peak concurrency."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def route(self, route_req):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delays.get(route_req.symbol, 0.05))
+        with self._lock:
+            self.in_flight -= 1
+        return SimpleNamespace(success=True, fill_price=101.0, filled_size_usd=route_req.size_usd,
+                               broker="kraken", error="")
+
+
+class _StatusBroker:
+    def __init__(self, status):
+        self.status = status
+
+    def get_order_status(self, order_id):
+        return {"status": self.status, "filled_price": 99.0, "filled_size_usd": 100.0}
+
+
+class ExecutionPipelineAsyncSubmitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._stack = ExitStack()
+        self._stack.enter_context(patch.dict(os.environ, {"LIVE_CAPITAL_VERIFIED": "false", "NIJA_WRITER_FENCING_TOKEN": ""}, clear=False))
+        self._stack.enter_context(patch("bot.execution_pipeline.assert_distributed_writer_authority", return_value=None))
+        self._stack.enter_context(patch("bot.execution_pipeline.assert_execution_dispatch_permitted", return_value=None))
+        self._stack.enter_context(patch("bot.execution_pipeline.runtime_authority_snapshot", return_value=SimpleNamespace(ready=True)))
+        self._stack.enter_context(patch("bot.execution_pipeline.get_seak", return_value=SimpleNamespace(is_halted=False)))
+        self._stack.enter_context(patch("bot.execution_pipeline.append_execution_journal_event", return_value=None))
+        self._stack.enter_context(patch("bot.execution_pipeline._get_pipeline_cycle_snapshot", return_value=SimpleNamespace(cycle_id="")))
+        self.pipelines = []
+
+    def tearDown(self) -> None:
+        for pipeline in self.pipelines:
+            pipeline.stop_background_tasks()
+        self._stack.close()
+
+    def _make_pipeline(self, router, ack_timeout_s=5.0) -> ExecutionPipeline:
+        pipeline = ExecutionPipeline.__new__(ExecutionPipeline)
+        pipeline._lock = threading.Lock()
+        pipeline._ecel_refresh_stop = threading.Event()
+        pipeline._execution_observer = None
+        pipeline._allocation_clamp = None
+        pipeline._exchange_normalizer = None
+        pipeline._pre_trade_risk_engine = None
+        pipeline._ecel = None
+        pipeline._ecel_required = False
+        pipeline._ecel_fail_closed = False
+        pipeline._throttler = None
+        pipeline._router = None
+        pipeline._multi_router = router
+        pipeline._downstream_guard = None
+        pipeline._margin_position_ledger = None
+        pipeline._broker_capability_registry = BrokerCapabilityRegistry()
+        pipeline._enforce_execution_gate = lambda request, t_start: None
+        pipeline._emit_execution_rejection_telemetry = lambda **kwargs: None
+        pipeline._ack_timeout_s = ack_timeout_s
+        pipeline._run_count = pipeline._blocked_count = 0
+        pipeline._last_run = None
+        self.pipelines.append(pipeline)
+        return pipeline
+
+    @staticmethod
+    def _request(symbol="BTC-USD", **overrides) -> PipelineRequest:
+        payload = {
+            "request_id": f"req-{symbol}",
+            "strategy": "test_strategy",
+            "symbol": symbol,
+            "side": "buy",
+            "size_usd": 100.0,
+            "asset_class": "crypto",
+            "preferred_broker": "kraken",
+            "account_id": "acc-1",
+        }
+        payload.update(overrides)
+        return PipelineRequest(**payload)
+
+    def test_submit_returns_immediately_and_resolves_via_callback_and_await(self):
+        pipeline = self._make_pipeline(_SlowMultiRouter({"BTC-USD": 0.3}))
+        done = threading.Event()
+        started = time.monotonic()
+        handle = pipeline.submit(self._request())
+        self.assertLess(time.monotonic() - started, 0.1)
+        self.assertFalse(handle.done())
+        handle.add_done_callback(lambda h: done.set())
+
+        result = asyncio.run(asyncio.wait_for(_await(handle), 5))
+        self.assertTrue(done.wait(1))
+        self.assertTrue(result.success)
+        self.assertEqual(result.fill_price, 101.0)
+        self.assertEqual(handle.state, "completed")
+        self.assertEqual(pipeline.outstanding_orders(), [])
+
+    def test_execute_many_dispatches_a_scan_cycle_in_parallel(self):
+        router = _SlowMultiRouter({s: 0.2 for s in ("BTC-USD", "ETH-USD", "SOL-USD", "ADA-USD")})
+        pipeline = self._make_pipeline(router)
+        started = time.monotonic()
+        results = pipeline.execute_many([self._request(s) for s in ("BTC-USD", "ETH-USD", "SOL-USD", "ADA-USD")])
+        elapsed = time.monotonic() - started
+
+        self.assertEqual([r.symbol for r in results], ["BTC-USD", "ETH-USD", "SOL-USD", "ADA-USD"])
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(router.peak, 4)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(pipeline.get_stats()["async_orders"]["completed"], 4)
+
+    def test_ack_timeout_is_reconciled_centrally_and_late_ack_reported(self):
+        pipeline = self._make_pipeline(_SlowMultiRouter({"BTC-USD": 1.5}), ack_timeout_s=1.0)
+        late = threading.Event()
+        handle = pipeline.submit(self._request(metadata={"broker_client": _StatusBroker("filled")}))
+        handle.add_late_callback(lambda h: late.set())
+
+        result = handle.result(timeout=3)
+        self.assertEqual(handle.state, "timed_out")
+        self.assertTrue(result.success)           # reconciliation found the fill
+        self.assertEqual(result.fill_price, 99.0)
+        self.assertEqual(len(pipeline.outstanding_orders()), 1)
+
+        self.assertTrue(late.wait(3))
+        self.assertTrue(handle.late_result.success)
+        self.assertEqual(handle.late_result.fill_price, 101.0)
+        self.assertEqual(handle.state, "completed")
+        self.assertEqual(handle.result().fill_price, 101.0)
+        stats = pipeline.get_stats()["async_orders"]
+        self.assertEqual((stats["timed_out"], stats["late_acks"], stats["outstanding"]), (1, 1, 0))
+
+    def test_unconfirmed_timeout_and_correlation_context(self):
+        seen = {}
+
+        class _Router(_SlowMultiRouter):
+            def route(self, route_req):
+                seen.update(get_runtime_correlation())
+                return super().route(route_req)
+
+        pipeline = self._make_pipeline(_Router({"BTC-USD": 1.3}), ack_timeout_s=1.0)
+        with runtime_correlation_scope(intent_id="i-1", cycle_id="c-9"):
+            handle = pipeline.submit(self._request())
+        result = handle.result(timeout=3)
+        self.assertFalse(result.success)
+        self.assertEqual(handle.state, "timed_out")
+        # Unknown broker status: pending, not a rejection of an order that may fill.
+        self.assertEqual(result.error, "ack_timeout_pending:no_broker_ack_within_1s")
+        for _ in range(200):
+            if not pipeline.outstanding_orders():
+                break
+            time.sleep(0.01)
+        self.assertEqual(seen.get("cycle_id"), "c-9")
+        # The late fill is what the pipeline booked, and what the handle now reports.
+        self.assertEqual(handle.state, "completed")
+        self.assertTrue(handle.result().success)
+        self.assertTrue(asyncio.run(_await(handle)).success)
+
+    def test_worker_failure_after_ack_timeout_is_the_late_outcome(self):
+        from bot.order_submission_registry import current_handle
+
+        def _dispatch():
+            current_handle().mark_submitted(0.2)
+            time.sleep(0.5)
+            raise RuntimeError("socket reset")
+
+        pipeline = self._make_pipeline(None)
+        late = threading.Event()
+        handle = pipeline._get_order_registry().submit(self._request(), _dispatch)
+        handle.add_late_callback(lambda h: late.set())
+
+        self.assertEqual(handle.result(timeout=3).error, "ack_timeout_pending:no_broker_ack_within_0s")
+        self.assertTrue(late.wait(3))
+        self.assertEqual(handle.state, "completed")
+        self.assertFalse(handle.result().success)
+        self.assertEqual(handle.result().error, "async_submit_error: socket reset")
+        stats = pipeline.get_stats()["async_orders"]
+        self.assertEqual((stats["timed_out"], stats["failed"], stats["outstanding"]), (1, 1, 0))
+
+    def test_execute_many_gates_see_in_flight_entries(self):
+        router = _SlowMultiRouter({s: 0.2 for s in ("BTC-USD", "ETH-USD", "SOL-USD")})
+        pipeline = self._make_pipeline(router)
+        requests = [self._request(s, buying_power_usd=250.0) for s in ("BTC-USD", "ETH-USD", "SOL-USD")]
+        results = pipeline.execute_many(requests)
+
+        self.assertEqual([r.success for r in results], [True, True, False])
+        self.assertIn("insufficient_buying_power", results[2].error)
+        self.assertEqual(router.peak, 2)  # the two approved entries still dispatched together
+        self.assertEqual(pipeline._reserved_notional_usd(requests[0]), 0.0)
+
+    def test_execute_many_reserves_pre_trade_risk_exposure(self):
+        from bot.pre_trade_risk_engine import PreTradeRiskEngine
+
+        pipeline = self._make_pipeline(_SlowMultiRouter({"BTC-USD": 0.2}))
+        engine = PreTradeRiskEngine(max_symbol_exposure_pct=0.35, max_total_exposure_pct=1.0)
+        engine._correlation_filter = engine._global_risk_engine = None
+        pipeline._pre_trade_risk_engine = engine
+        with patch.object(PreTradeRiskEngine, "_live_capital_equity_usd", return_value=0.0):
+            results = pipeline.execute_many([
+                self._request("BTC-USD", request_id="a", available_balance_usd=1000.0, size_usd=300.0),
+                self._request("BTC-USD", request_id="b", available_balance_usd=1000.0, size_usd=300.0),
+            ])
+
+        self.assertTrue(results[0].success)
+        self.assertFalse(results[1].success)
+        self.assertIn("SYMBOL_AGGREGATION_CAP", results[1].error)
+        self.assertEqual(engine._reserved_exposure_usd, {})
+        self.assertEqual(engine._symbol_exposure_usd["acc-1"]["BTC-USD"], 300.0)
+
+
+async def _await(handle):
+    return await handle
+
+
+if __name__ == "__main__":
+    unittest.main()
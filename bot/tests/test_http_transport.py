@@ -0,0 +1,141 @@
+"""Tests for the shared keep-alive HTTP transport, against a local stub server."""
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bot.http_transport import (
+    CircuitOpenError,
+    LatencyHistogram,
+    TransportConnectionError,
+    VenuePolicy,
+    VenueSession,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        server.hits.append((self.path, self.client_address[1]))
+        script = server.script.get(self.path.split("?")[0])
+        status = script.pop(0) if script else 200
+        self._reply(status, {"path": self.path})
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        server.hits.append((self.path, self.client_address[1]))
+        script = server.script.get(self.path)
+        status = script.pop(0) if script else 200
+        self._reply(status, {"echo": json.loads(body or b"null")})
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.hits = []
+    httpd.script = {}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _session(**policy):
+    return VenueSession("stub", VenuePolicy(**{"backoff_s": 0.0, **policy}), sleep=lambda s: None)
+
+
+def test_keep_alive_connection_is_reused(server):
+    session = _session()
+    for _ in range(5):
+        response = session.get(server.url + "/ticker", params={"pair": "XBTUSD"})
+        assert response.ok and response.json() == {"path": "/ticker?pair=XBTUSD"}
+
+    assert len({port for _, port in server.hits}) == 1
+    pool = session.metrics()["pools"][f"http://127.0.0.1:{server.server_address[1]}"]
+    assert pool["created"] == 1 and pool["reused"] == 4 and pool["idle"] == 1
+
+
+def test_idempotent_requests_retry_on_503_but_posts_do_not(server):
+    session = _session(retries=2)
+    server.script["/flaky"] = [503, 503]
+    assert session.get(server.url + "/flaky").status_code == 200
+    assert [p for p, _ in server.hits] == ["/flaky"] * 3
+
+    server.script["/order"] = [503]
+    response = session.post(server.url + "/order", json={"side": "buy"})
+    assert response.status_code == 503 and not response.ok
+    assert [p for p, _ in server.hits].count("/order") == 1
+    with pytest.raises(Exception, match="503"):
+        response.raise_for_status()
+
+
+def test_breaker_opens_after_consecutive_failures_and_recovers(server):
+    session = _session(retries=0, breaker_failures=2, breaker_reset_s=0.05)
+    server.script["/down"] = [500, 500]
+    session.get(server.url + "/down")
+    session.get(server.url + "/down")
+    with pytest.raises(CircuitOpenError):
+        session.get(server.url + "/down")
+    assert len(server.hits) == 2
+
+    threading.Event().wait(0.06)
+    assert session.get(server.url + "/down").ok  # half-open probe succeeds
+
+
+def test_connection_refused_is_retried_for_any_method_then_raised():
+    import socket
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    session = _session(retries=1, breaker_failures=10)
+    with pytest.raises(TransportConnectionError):
+        session.post(f"http://127.0.0.1:{port}/order", json={})
+    assert session.metrics()["endpoints"]["POST /order"]["errors"] == 2
+
+
+def test_latency_histograms_per_endpoint(server):
+    session = _session()
+    session.get(server.url + "/a")
+    session.get(server.url + "/a")
+    session.get(server.url + "/b", endpoint="balance")
+    endpoints = session.metrics()["endpoints"]
+    assert endpoints["GET /a"]["count"] == 2 and endpoints["balance"]["count"] == 1
+
+    hist = LatencyHistogram()
+    for ms in (0.5, 3, 3, 40, 7000):
+        hist.observe(ms)
+    assert hist.percentile(0.5) == 5 and hist.percentile(1.0) == 7000
+    assert hist.snapshot()["buckets"] == {"le_1": 1, "le_5": 2, "le_50": 1, "le_10000": 1}
+
+
+def test_okx_rest_client_uses_shared_session(server, monkeypatch):
+    from bot.broker_manager import _OKXRestClient
+    from bot.http_transport import get_http_transport
+
+    monkeypatch.setenv("OKX_BASE_URL", server.url)
+    client = _OKXRestClient("key", "secret", "pass")
+    assert client.session is get_http_transport().session("okx")
+    body = client.session.request("POST", f"{client.BASE_URL}/api/v5/trade/order", data='{"sz":"1"}',
+                                  headers={"Content-Type": "application/json"}, timeout=client.timeout)
+    assert body.json() == {"echo": {"sz": "1"}}
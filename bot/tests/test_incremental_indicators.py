@@ -0,0 +1,239 @@
+"""Parity tests: IncrementalIndicators vs the pandas functions in bot.indicators.
+
+Every series the incremental engine maintains is compared bar-by-bar against
+the corresponding full-frame pandas computation, and the scored signal dict
+is compared against ``calculate_indicators`` on the same frame.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot import indicators as ind
+from bot.incremental_indicators import (
+    RESTATED_BARS,
+    IncrementalIndicators,
+    drop_incremental_indicators,
+    get_incremental_indicators,
+)
+
+
+def _make_ohlcv(n: int, seed: int = 7, flat_from: int | None = None) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0, 0.6, n))
+    if flat_from is not None:
+        close[flat_from:] = close[flat_from]
+    open_ = np.concatenate([[close[0]], close[:-1]]) + rng.normal(0, 0.05, n)
+    high = np.maximum(open_, close) + rng.uniform(0, 0.4, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 0.4, n)
+    volume = rng.uniform(10, 1000, n)
+    index = pd.date_range("2026-01-01", periods=n, freq="1min")
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=index,
+    )
+
+
+def _feed(df: pd.DataFrame, **kwargs) -> IncrementalIndicators:
+    engine = IncrementalIndicators(history=len(df), **kwargs)
+    for ts, row in df.iterrows():
+        engine.update(row["open"], row["high"], row["low"], row["close"], row["volume"], timestamp=ts)
+    return engine
+
+
+def _assert_series_close(actual: pd.Series, expected: pd.Series) -> None:
+    assert len(actual) == len(expected)
+    np.testing.assert_allclose(
+        actual.to_numpy(dtype=float), expected.to_numpy(dtype=float), rtol=1e-9, atol=1e-9
+    )
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return _make_ohlcv(300)
+
+
+def test_series_match_pandas_functions(frame):
+    snap = _feed(frame, window=None).snapshot()
+
+    _assert_series_close(snap["vwap"], ind.calculate_vwap(frame))
+    _assert_series_close(snap["rsi"], ind.calculate_rsi(frame, period=14))
+    _assert_series_close(snap["ema_9"], ind.calculate_ema(frame, 9))
+    _assert_series_close(snap["ema_21"], ind.calculate_ema(frame, 21))
+    _assert_series_close(snap["ema_50"], ind.calculate_ema(frame, 50))
+    macd_line, signal_line, hist = ind.calculate_macd(frame)
+    _assert_series_close(snap["macd_line"], macd_line)
+    _assert_series_close(snap["signal_line"], signal_line)
+    _assert_series_close(snap["histogram"], hist)
+    _assert_series_close(snap["atr"], ind.calculate_atr(frame, 14))
+    adx, plus_di, minus_di = ind.calculate_adx(frame, 14)
+    _assert_series_close(snap["adx"], adx)
+    _assert_series_close(snap["plus_di"], plus_di)
+    _assert_series_close(snap["minus_di"], minus_di)
+
+
+def test_flat_prices_match_nan_and_ffill_semantics():
+    # A flat tail drives avg_gain and avg_loss to zero (RSI 0/0 → ffill).
+    frame = _make_ohlcv(200, seed=3, flat_from=120)
+    snap = _feed(frame, window=None).snapshot()
+    _assert_series_close(snap["rsi"], ind.calculate_rsi(frame, period=14))
+    adx, _, _ = ind.calculate_adx(frame, 14)
+    _assert_series_close(snap["adx"], adx)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 4, 5])
+def test_signal_dict_matches_calculate_indicators(seed):
+    frame = _make_ohlcv(200, seed=seed)
+    expected = ind.calculate_indicators(frame)
+    actual = _feed(frame).snapshot()
+
+    assert set(expected) <= set(actual)
+    for key in ("buy_signal", "sell_signal", "long_score", "short_score",
+                "no_trade_zone", "no_trade_reason", "entry_conditions"):
+        assert actual[key] == expected[key], key
+    assert math.isclose(actual["rsi_prev"], expected["rsi_prev"], rel_tol=1e-9, abs_tol=1e-9)
+    for key in ("vwap", "rsi", "ema_9", "ema_21", "ema_50", "macd_line", "signal_line", "histogram"):
+        assert actual[key].iloc[-1] == pytest.approx(expected[key].iloc[-1], rel=1e-9, abs=1e-9)
+
+
+def test_short_history_returns_empty_shape(frame):
+    engine = _feed(frame.iloc[:50])
+    snap = engine.snapshot()
+    assert snap == ind.calculate_indicators(frame.iloc[:50])
+
+
+def test_default_window_matches_pandas_on_trailing_window(frame):
+    engine = _feed(frame)
+    assert engine.window == 200
+    window = frame.iloc[-200:]
+    snap = engine.snapshot()
+
+    # Latest bar of the windowed series, and the whole tail of the rolling ones
+    assert engine.last("vwap") == pytest.approx(ind.calculate_vwap(window).iloc[-1], rel=1e-9)
+    assert engine.last("ema_9") == pytest.approx(ind.calculate_ema(window, 9).iloc[-1], rel=1e-9)
+    assert engine.last("ema_50") == pytest.approx(ind.calculate_ema(window, 50).iloc[-1], rel=1e-9)
+    macd_line, signal_line, hist = ind.calculate_macd(window)
+    assert engine.last("macd_line") == pytest.approx(macd_line.iloc[-1], rel=1e-9, abs=1e-9)
+    assert engine.last("signal_line") == pytest.approx(signal_line.iloc[-1], rel=1e-9, abs=1e-9)
+    assert engine.last("histogram") == pytest.approx(hist.iloc[-1], rel=1e-9, abs=1e-9)
+    tail = slice(-64, None)
+    _assert_series_close(snap["rsi"][tail], ind.calculate_rsi(window, period=14)[tail])
+    _assert_series_close(snap["atr"][tail], ind.calculate_atr(window, 14)[tail])
+
+
+def _assert_matches_calculate_indicators(snap, window):
+    expected = ind.calculate_indicators(window)
+    for key in ("buy_signal", "sell_signal", "long_score", "short_score", "no_trade_zone"):
+        assert snap[key] == expected[key], key
+    for key in ("vwap", "rsi", "ema_9", "ema_21", "ema_50", "macd_line", "signal_line", "histogram"):
+        assert snap[key].iloc[-1] == pytest.approx(expected[key].iloc[-1], rel=1e-9, abs=1e-9), key
+
+
+def test_sync_feeds_only_new_bars_and_reseeds_on_gap(frame):
+    engine = IncrementalIndicators()
+    engine.sync(frame.iloc[:200])
+    assert engine.bar_count == 200
+
+    for end in range(201, 300, 7):
+        window = frame.iloc[end - 200:end]
+        snap = engine.sync(window)
+        assert engine.last_timestamp == window.index[-1]
+        _assert_matches_calculate_indicators(snap, window)
+    assert engine.bar_count == 299
+
+    # A shorter frame narrows the window to it without a replay.
+    window = frame.iloc[160:299]
+    _assert_matches_calculate_indicators(engine.sync(window), window)
+    assert engine.bar_count == 299
+
+    # A frame reaching back before the window → full reseed.
+    window = frame.iloc[100:299]
+    _assert_matches_calculate_indicators(engine.sync(window), window)
+    assert engine.bar_count == len(window)
+
+    # Frame that does not contain the last seen bar → full reseed.
+    engine.sync(frame.iloc[:60])
+    assert engine.bar_count == 60
+
+
+def test_snapshot_tail_is_restated_on_the_current_window(frame):
+    engine = IncrementalIndicators()
+    engine.sync(frame.iloc[:200])
+    window = frame.iloc[90:290]
+    snap = engine.sync(window)
+    expected = ind.calculate_indicators(window)
+    tail = slice(-RESTATED_BARS, None)
+    for key in ("vwap", "ema_9", "ema_21", "ema_50", "macd_line", "signal_line", "histogram"):
+        _assert_series_close(snap[key][tail], expected[key][tail])
+
+
+def test_sync_matches_positional_frames_on_bar_values(frame):
+    engine = IncrementalIndicators()
+    positional = frame.reset_index(drop=True)
+    engine.sync(positional.iloc[:200].reset_index(drop=True))
+    engine.sync(positional.iloc[:200].reset_index(drop=True))
+    assert engine.bar_count == 200
+
+    for end in range(201, 230, 3):
+        window = positional.iloc[end - 200:end].reset_index(drop=True)
+        snap = engine.sync(window)
+        _assert_matches_calculate_indicators(snap, window)
+        assert list(snap["rsi"].index) == list(window.index[-64:])
+    assert engine.bar_count == 228
+
+    # The last bar changed in place (a re-fetched, still-forming candle) → reseed.
+    window = window.copy()
+    window.loc[window.index[-1], "close"] += 1.0
+    _assert_matches_calculate_indicators(engine.sync(window), window)
+    assert engine.bar_count == 200
+
+
+def test_snapshot_series_bounded_by_history(frame):
+    engine = IncrementalIndicators(history=5)
+    snap = engine.sync(frame)
+    assert len(snap["rsi"]) == 5
+    assert list(snap["rsi"].index) == list(frame.index[-5:])
+
+
+def test_registry_returns_one_engine_per_broker_and_symbol():
+    drop_incremental_indicators()
+    a = get_incremental_indicators("BTC-USD", broker="coinbase")
+    assert get_incremental_indicators("BTC-USD", broker="coinbase") is a
+    assert get_incremental_indicators("ETH-USD", broker="coinbase") is not a
+    b = get_incremental_indicators("BTC-USD", broker="kraken")
+    assert b is not a
+    drop_incremental_indicators(["BTC-USD"], broker="kraken")
+    assert get_incremental_indicators("BTC-USD", broker="coinbase") is a
+    assert get_incremental_indicators("BTC-USD", broker="kraken") is not b
+    drop_incremental_indicators(["BTC-USD"])
+    assert get_incremental_indicators("BTC-USD", broker="coinbase") is not a
+    drop_incremental_indicators()
+
+
+def test_core_loop_scan_feeds_each_broker_engine(frame, monkeypatch):
+    from types import SimpleNamespace
+
+    from bot.nija_core_loop import NijaCoreLoop
+
+    class Apex:
+        def calculate_indicators(self, df, incremental=None):
+            return incremental.sync(df) if incremental is not None else ind.calculate_indicators(df)
+
+    drop_incremental_indicators()
+    loop = NijaCoreLoop(Apex(), max_positions=1)
+    coinbase = SimpleNamespace(broker_type=SimpleNamespace(value="coinbase"))
+    kraken = SimpleNamespace(broker_type=SimpleNamespace(value="kraken"))
+    for end in (200, 201, 202):
+        window = frame.iloc[end - 200:end]
+        _assert_matches_calculate_indicators(loop._scan_indicators(coinbase, "BTC-USD", window), window)
+    assert get_incremental_indicators("BTC-USD", broker="coinbase").bar_count == 202
+    loop._scan_indicators(kraken, "BTC-USD", frame.iloc[:200])
+    assert get_incremental_indicators("BTC-USD", broker="kraken").bar_count == 200
+
+    monkeypatch.setenv("NIJA_INCREMENTAL_INDICATORS_ENABLED", "false")
+    loop._scan_indicators(coinbase, "BTC-USD", frame.iloc[3:203])
+    assert get_incremental_indicators("BTC-USD", broker="coinbase").bar_count == 202
+    drop_incremental_indicators()
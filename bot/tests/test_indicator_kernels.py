@@ -0,0 +1,140 @@
+"""Tests for the array indicator kernels and the pandas wrappers built on them."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot import indicator_kernels as kernels
+from bot import indicators
+from bot.benchmark_apex_backtest import make_ohlcv
+from bot.benchmark_indicator_kernels import (
+    ref_adx,
+    ref_atr,
+    ref_bollinger,
+    ref_macd,
+    ref_rsi,
+    ref_stochastic,
+    ref_supertrend,
+)
+
+
+def _frames():
+    df = make_ohlcv(400, seed=5)
+    flat = df.copy()
+    flat.iloc[150:220, :4] = 100.0  # constant stretch: zero range, zero std, 0/0 DX
+    gappy = df.copy()
+    gappy.iloc[[30, 31, 200], 3] = np.nan
+    return {"random": df, "flat": flat, "gappy": gappy, "strings": df.astype(str)}
+
+
+def _assert_same(expected, actual):
+    expected = expected if isinstance(expected, tuple) else (expected,)
+    actual = actual if isinstance(actual, tuple) else (actual,)
+    assert len(expected) == len(actual)
+    for e, a in zip(expected, actual):
+        assert a.dtype == e.dtype and a.index.equals(e.index)
+        np.testing.assert_allclose(a.to_numpy(), e.to_numpy(), rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("frame", ["random", "flat", "gappy", "strings"])
+def test_wrappers_match_previous_pandas_implementations(frame):
+    raw = _frames()[frame]
+    df = indicators._ensure_numeric(raw, ["high", "low", "close"])
+    _assert_same(ref_rsi(df), indicators.calculate_rsi(raw))
+    _assert_same(ref_adx(df), indicators.calculate_adx(raw))
+    _assert_same(ref_stochastic(df), indicators.calculate_stochastic(raw))
+    _assert_same(ref_supertrend(df), indicators.calculate_supertrend(raw))
+    close_df = indicators._ensure_numeric(raw, ["close"])
+    _assert_same(ref_bollinger(close_df), indicators.calculate_bollinger_bands(raw))
+    _assert_same(ref_macd(close_df), indicators.calculate_macd(raw))
+
+
+def _empty_frames():
+    cols = ["open", "high", "low", "close", "volume"]
+    empty = pd.DataFrame({c: pd.Series(dtype=float) for c in cols})
+    # Every row dropped by _ensure_numeric: the wrappers see a zero-length frame.
+    all_nan = pd.DataFrame({c: [np.nan] * 5 for c in cols})
+    return {"empty": empty, "all_nan": all_nan, "empty_strings": empty.astype(str)}
+
+
+@pytest.mark.parametrize("frame", ["empty", "all_nan", "empty_strings"])
+def test_wrappers_return_empty_series_on_empty_frames(frame):
+    raw = _empty_frames()[frame]
+    df = indicators._ensure_numeric(raw, ["high", "low", "close"])
+    close_df = indicators._ensure_numeric(raw, ["close"])
+    assert len(df) == 0 and len(close_df) == 0
+    _assert_same(ref_rsi(df), indicators.calculate_rsi(raw))
+    _assert_same(ref_atr(df), indicators.calculate_atr(raw))
+    _assert_same(ref_adx(df), indicators.calculate_adx(raw))
+    _assert_same(ref_stochastic(df), indicators.calculate_stochastic(raw))
+    _assert_same(ref_bollinger(close_df), indicators.calculate_bollinger_bands(raw))
+    _assert_same(ref_macd(close_df), indicators.calculate_macd(raw))
+    _assert_same(close_df["close"].ewm(span=9, adjust=False).mean().ffill(), indicators.calculate_ema(raw, 9))
+    empty = pd.Series(dtype=np.float64, index=df.index)
+    _assert_same((empty,) * 4, indicators.calculate_volatility_weighted_rsi_bands(raw))
+    _assert_same((empty, pd.Series(dtype=np.int64, index=df.index)), indicators.calculate_supertrend(raw))
+    assert indicators.detect_market_regime(raw)["regime"] == "UNKNOWN"
+
+
+def test_detect_market_regime_uses_last_indicator_values():
+    df = make_ohlcv(300, seed=9)
+    regime = indicators.detect_market_regime(df)
+    assert regime["adx"] == pytest.approx(ref_adx(df)[0].iloc[-1], rel=1e-12)
+    assert regime["bandwidth"] == pytest.approx(ref_bollinger(df)[3].iloc[-1], rel=1e-12)
+    assert indicators.detect_market_regime(df.iloc[:40])["regime"] == "UNKNOWN"
+
+
+def test_loop_kernels_match_numpy_kernels():
+    # The _*_loop functions are what Numba compiles; run them as plain Python.
+    x = np.random.default_rng(3).normal(size=300).cumsum() + 100.0
+    x[120:140] = 5.0
+    x[60] = np.nan
+    for window in (1, 2, 14, 20):
+        np.testing.assert_allclose(kernels._rolling_mean_loop(x, window), kernels._rolling_mean_np(x, window))
+        np.testing.assert_allclose(kernels._rolling_std_loop(x, window), kernels._rolling_std_np(x, window),
+                                   atol=1e-12)
+        np.testing.assert_array_equal(kernels._rolling_min_loop(x, window), kernels._rolling_min_np(x, window))
+        np.testing.assert_array_equal(kernels._rolling_max_loop(x, window), kernels._rolling_max_np(x, window))
+
+    y = x.copy()
+    y[60] = 100.0
+    y[:3] = np.nan
+    for span in (2, 9, 26, 200):
+        alpha = 2.0 / (span + 1.0)
+        expected = pd.Series(y).ewm(span=span, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(kernels._ewm_mean_loop(y, alpha), expected, rtol=1e-12)
+        np.testing.assert_allclose(kernels._ewm_mean_np(y, alpha), expected, rtol=1e-12)
+
+    df = make_ohlcv(300, seed=4)
+    high, low, close = (df[c].to_numpy() for c in ("high", "low", "close"))
+    band = 3.0 * kernels.fill(kernels.atr(high, low, close, 10), 0.0)
+    hl2 = (high + low) / 2.0
+    line_loop, dir_loop = kernels._supertrend_loop(close, hl2 + band, hl2 - band)
+    line_py, dir_py = kernels._supertrend_py(close, hl2 + band, hl2 - band)
+    np.testing.assert_array_equal(line_loop, line_py)
+    np.testing.assert_array_equal(dir_loop, dir_py)
+
+
+def test_long_arrays_take_the_compiled_pandas_path(monkeypatch):
+    x = np.random.default_rng(8).normal(size=2000).cumsum() + 50.0
+    short = [kernels._rolling_mean_np(x, 14), kernels._rolling_std_np(x, 20),
+             kernels._rolling_min_np(x, 14), kernels._ewm_mean_np(x, 0.1)]
+    monkeypatch.setattr(kernels, "_PANDAS_WINDOW_CELLS", 0)
+    monkeypatch.setattr(kernels, "_PANDAS_EWM_ROWS", 0)
+    long = [kernels._rolling_mean_np(x, 14), kernels._rolling_std_np(x, 20),
+            kernels._rolling_min_np(x, 14), kernels._ewm_mean_np(x, 0.1)]
+    for a, b in zip(short, long):
+        np.testing.assert_allclose(a, b, rtol=1e-10)
+
+
+def test_fill_helpers_follow_pandas_semantics():
+    x = np.array([np.nan, np.nan, 1.0, np.nan, 3.0, np.nan])
+    np.testing.assert_array_equal(kernels.ffill(x), pd.Series(x).ffill().to_numpy())
+    np.testing.assert_array_equal(kernels.fill(x, 9.0), pd.Series(x).ffill().fillna(9.0).to_numpy())
+    assert kernels.ffill(np.empty(0)).shape == (0,) and kernels.fill(np.empty(0), 0.0).shape == (0,)
+    other = np.arange(6.0)
+    np.testing.assert_array_equal(kernels.fill(x, other), pd.Series(x).ffill().fillna(pd.Series(other)).to_numpy())
+    clean = np.array([np.nan, 2.0, 3.0])
+    filled = kernels.fill(clean, 0.0)
+    assert np.isnan(clean[0]) and filled[0] == 0.0  # caller's array is not modified
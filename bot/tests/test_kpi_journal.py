@@ -0,0 +1,105 @@
+"""Tests for KPI journal storage: incremental stats, checkpoint + tail replay, bounded windows."""
+from __future__ import annotations
+
+import json
+import random
+import statistics
+
+import pytest
+
+from bot.kpi_journal import KPIJournal, RunningRiskStats
+from bot.kpi_tracker import KPITracker
+
+
+def _equity_series(n, seed=7):
+    rng = random.Random(seed)
+    equity, out = 1000.0, []
+    for _ in range(n):
+        equity *= 1 + rng.uniform(-0.03, 0.035)
+        out.append(equity)
+    return out
+
+
+def _drive(tracker, equities, seed=3):
+    rng = random.Random(seed)
+    for i, equity in enumerate(equities):
+        profit = rng.uniform(-20, 25)
+        tracker.record_trade("BTC-USD", "apex" if i % 2 else "mtf", profit, 0.5, profit > 0, 100.0, 101.0, 10.0)
+        tracker.update_balance(equity, equity)
+
+
+def test_running_stats_match_full_recompute():
+    equities = _equity_series(300)
+    stats = RunningRiskStats()
+    for equity in equities:
+        stats.add_equity(equity)
+
+    returns = [(b - a) / a for a, b in zip(equities, equities[1:])]
+    downside = [r for r in returns if r < 0]
+    mean = statistics.mean(returns)
+    assert stats.sharpe() == pytest.approx(mean / statistics.stdev(returns) * 252 ** 0.5)
+    assert stats.sortino() == pytest.approx(mean / statistics.stdev(downside) * 252 ** 0.5)
+
+    peak, max_dd = equities[0], 0.0
+    for equity in equities:
+        peak = max(peak, equity)
+        max_dd = max(max_dd, (peak - equity) / peak * 100)
+    assert stats.max_drawdown_pct == pytest.approx(max_dd)
+    assert RunningRiskStats.from_dict(stats.to_dict()).sharpe() == stats.sharpe()
+
+
+def test_restart_replays_tail_after_checkpoint(tmp_path):
+    tracker = KPITracker(data_dir=str(tmp_path), storage="journal", window=50, checkpoint_interval=40)
+    _drive(tracker, _equity_series(120))
+    before = tracker.calculate_kpis(tracker.equity_curve[-1], tracker.equity_curve[-1])
+    assert tracker.journal.pending < 40  # checkpointed along the way, tail still pending
+    tracker.journal.close()
+
+    restored = KPITracker(data_dir=str(tmp_path), storage="journal", window=50, checkpoint_interval=40)
+    assert restored.totals == pytest.approx(tracker.totals)
+    assert dict(restored.strategy_performance) == dict(tracker.strategy_performance)
+    assert list(restored.equity_curve) == list(tracker.equity_curve)
+    after = restored.calculate_kpis(restored.equity_curve[-1], restored.equity_curve[-1])
+    for field in ("total_trades", "win_rate", "profit_factor", "sharpe_ratio", "sortino_ratio",
+                  "max_drawdown", "net_profit"):
+        assert getattr(after, field) == pytest.approx(getattr(before, field))
+
+
+def test_windows_are_bounded_but_history_stays_on_disk(tmp_path):
+    tracker = KPITracker(data_dir=str(tmp_path), storage="journal", window=25, checkpoint_interval=1000)
+    _drive(tracker, _equity_series(200))
+    for _ in range(30):
+        tracker.calculate_kpis(1000.0, 1000.0)
+
+    assert len(tracker.trade_history) == len(tracker.equity_curve) == len(tracker.snapshots) == 25
+    assert tracker.totals["trades"] == 200
+    assert sum(1 for _ in tracker.journal.read("trades")) == 200
+    export = tmp_path / "export.json"
+    tracker.export_kpis(str(export))
+    data = json.loads(export.read_text())
+    assert data["trade_count"] == 200 and len(data["kpi_history"]) == 30
+
+
+def test_torn_tail_is_dropped_on_open(tmp_path):
+    journal = KPIJournal(tmp_path)
+    journal.append("trades", {"n": 1})
+    journal.close()
+    with open(journal.paths["trades"], "a") as fh:
+        fh.write('{"n": 2, "tru')
+
+    reopened = KPIJournal(tmp_path)
+    assert list(reopened.read("trades")) == [{"n": 1}]
+    reopened.append("trades", {"n": 3})
+    assert [r["n"] for r in reopened.read("trades")] == [1, 3]
+
+
+def test_json_mode_and_legacy_file_migration(tmp_path):
+    legacy = KPITracker(data_dir=str(tmp_path), storage="json")
+    _drive(legacy, _equity_series(10))
+    legacy.calculate_kpis(1000.0, 1000.0)
+    assert legacy.journal is None and legacy.kpi_file.exists()
+
+    migrated = KPITracker(data_dir=str(tmp_path), storage="journal")
+    assert migrated.totals["trades"] == 10 and len(migrated.snapshots) == 1
+    assert not migrated.kpi_file.exists() and migrated.journal.checkpoint_path.exists()
+    assert KPITracker(data_dir=str(tmp_path), storage="journal").totals == migrated.totals
@@ -0,0 +1,82 @@
+"""Tests for block-reserved nonce issuance in bot.global_kraken_nonce."""
+from __future__ import annotations
+
+import threading
+
+from bot import global_kraken_nonce as gkn
+
+
+def _manager(tmp_path, block_size: int, start: int = 1_000) -> gkn.KrakenNonceManager:
+    # Bypass the singleton constructor (PID lock, NTP check, startup authority)
+    # and wire up only the state the issuance path uses.
+    mgr = object.__new__(gkn.KrakenNonceManager)
+    mgr._key_id = "test"
+    mgr._state_file = str(tmp_path / "kraken_nonce_test.state")
+    mgr._lock_file = mgr._state_file + ".lock"
+    mgr._redis_backend = None
+    mgr._last_nonce = start
+    mgr._block_size = block_size
+    mgr._block_end = 0
+    mgr._blocks_reserved = 0
+    return mgr
+
+
+def test_block_mode_persists_once_per_block(tmp_path, monkeypatch):
+    mgr = _manager(tmp_path, block_size=10)
+    writes = []
+    real_persist = mgr._persist
+    monkeypatch.setattr(mgr, "_persist", lambda: (writes.append(1), real_persist()))
+
+    nonces = [mgr.next_nonce() for _ in range(25)]
+
+    assert nonces == list(range(1_001, 1_026))
+    assert len(writes) == 3
+    assert mgr._read_state_file_raw() == 1_030
+    assert mgr.get_block_stats() == {"block_size": 10, "blocks_reserved": 3, "block_remaining": 5}
+
+
+def test_restart_abandons_unused_part_of_block(tmp_path):
+    first = _manager(tmp_path, block_size=100)
+    issued = [first.next_nonce() for _ in range(3)]
+
+    # A restarted process resumes from the persisted block end, never inside it.
+    restarted = _manager(tmp_path, block_size=100, start=0)
+    assert restarted.next_nonce() == 1_101 > max(issued)
+
+
+def test_refill_picks_up_higher_file_value_and_resync_jumps(tmp_path):
+    mgr = _manager(tmp_path, block_size=5)
+    mgr.next_nonce()
+    (tmp_path / "kraken_nonce_test.state").write_text("5000")
+    for _ in range(4):
+        mgr.next_nonce()  # still inside the reserved block
+    assert mgr.next_nonce() == 5_001
+
+    mgr.jump_forward(1_000)
+    assert mgr.next_nonce() == 6_002
+    assert mgr._read_state_file_raw() == 6_006
+
+
+def test_concurrent_block_issuance_is_unique_and_monotonic_per_thread(tmp_path):
+    mgr = _manager(tmp_path, block_size=16)
+    results = {}
+
+    def worker(idx: int) -> None:
+        results[idx] = [mgr.next_nonce() for _ in range(200)]
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    everything = [n for seq in results.values() for n in seq]
+    assert len(set(everything)) == 1_600
+    assert all(seq == sorted(seq) for seq in results.values())
+    assert mgr._read_state_file_raw() >= max(everything)
+
+
+def test_block_size_zero_keeps_per_call_persist(tmp_path):
+    mgr = _manager(tmp_path, block_size=0)
+    assert mgr.next_nonce() == 1_001
+    assert mgr._read_state_file_raw() == 1_001
@@ -93,13 +93,35 @@ class MarginPositionLedgerTests(unittest.TestCase):
                 self._request(request_id="req-ack-after-reject", intent_id="intent-ack-after-reject"),
                 self._result(filled_size_usd=40.0),
             )
+import os
 import time
 import unittest
+from unittest import mock
 
+import bot.margin_position_ledger as margin_position_ledger_module
 from bot.margin_position_ledger import get_margin_position_ledger
 
 
 class TestMarginPositionLedger(unittest.TestCase):
+    def setUp(self) -> None:
+        # Keep the singleton's SQLite file and tracker JSON out of ./data.
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = mock.patch.dict(
+            os.environ,
+            {
+                "NIJA_MARGIN_POSITION_LEDGER_PATH": f"{self._tmp.name}/margin_position_ledger.db",
+                "NIJA_MARGIN_LEDGER_PATH": f"{self._tmp.name}/margin_position_ledger.json",
+            },
+        )
+        self._env.start()
+        self._saved_singleton = margin_position_ledger_module._LEDGER_SINGLETON
+        margin_position_ledger_module._LEDGER_SINGLETON = None
+
+    def tearDown(self) -> None:
+        margin_position_ledger_module._LEDGER_SINGLETON = self._saved_singleton
+        self._env.stop()
+        self._tmp.cleanup()
+
     def test_risk_math_and_exposure(self):
         ledger = get_margin_position_ledger()
         account_id = f"unit-{int(time.time() * 1000)}"
@@ -0,0 +1,83 @@
+"""Tests for the columnar bar ring in bot.market_data_engine."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bot.market_data_engine import BAR_COLUMNS, MarketDataEngine
+
+
+def _feed(engine: MarketDataEngine, symbol: str, count: int, start: int = 1_700_000_000) -> None:
+    for i in range(count):
+        px = 100.0 + i
+        engine.ingest_bar(
+            symbol,
+            {"time": start + 60 * i, "open": px, "high": px + 1, "low": px - 1, "close": px, "volume": 2.0},
+            exchange="coinbase",
+        )
+
+
+def test_dataframe_is_a_snapshot_with_the_bar_dict_columns():
+    engine = MarketDataEngine(bar_window=8)
+    _feed(engine, "BTC-USD", 5)
+
+    df = engine.get_bars_as_dataframe("BTC-USD")
+    bars = engine.get_bars("BTC-USD")
+    assert list(df.columns) == list(bars[0].to_dict())
+    assert df.to_dict("records") == [b.to_dict() for b in bars]
+    assert df["volume_usd"].iloc[-1] == pytest.approx(208.0)
+    assert not np.shares_memory(df[list(BAR_COLUMNS)].to_numpy(), engine._bars["BTC-USD"].data)
+
+    # Later bars do not show through, and the frame may be mutated.
+    _feed(engine, "BTC-USD", 8, start=1_700_001_000)
+    df.loc[0, "close"] = -1.0
+    assert df["close"].tolist() == [-1.0, 101.0, 102.0, 103.0, 104.0]
+    assert engine.get_bars_as_dataframe("BTC-USD", n=1)["close"].iloc[0] == 107.0
+
+
+def test_view_is_zero_copy_until_wrap():
+    engine = MarketDataEngine(bar_window=8)
+    _feed(engine, "BTC-USD", 5)
+
+    df = engine.get_bars_as_dataframe("BTC-USD", view=True)
+    ring = engine._bars["BTC-USD"]
+    assert list(df.columns) == list(BAR_COLUMNS)
+    assert df["close"].tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+    assert df["mid"].tolist() == df["close"].tolist()
+    assert np.shares_memory(df.to_numpy(), ring.data)
+
+
+def test_wrapped_window_is_unrolled_oldest_first():
+    engine = MarketDataEngine(bar_window=8)
+    _feed(engine, "ETH-USD", 13)
+
+    df = engine.get_bars_as_dataframe("ETH-USD", view=True)
+    assert df["close"].tolist() == [105.0 + i for i in range(8)]
+    assert not np.shares_memory(df.to_numpy(), engine._bars["ETH-USD"].data)
+    assert engine.get_bars_as_dataframe("ETH-USD")["close"].tolist() == df["close"].tolist()
+
+    # The newest three rows are contiguous again, so they come back as a view.
+    tail = engine.get_bars_as_dataframe("ETH-USD", n=3, view=True)
+    assert tail["close"].tolist() == [110.0, 111.0, 112.0]
+    assert np.shares_memory(tail.to_numpy(), engine._bars["ETH-USD"].data)
+
+
+def test_get_bars_rebuilds_normalised_bars():
+    engine = MarketDataEngine(bar_window=4)
+    _feed(engine, "SOL-USD", 6)
+
+    bars = engine.get_bars("SOL-USD", n=2)
+    assert [b.close for b in bars] == [104.0, 105.0]
+    assert bars[-1].exchange == "coinbase"
+    assert bars[-1].symbol == "SOL-USD"
+    assert len(engine.get_bars("SOL-USD")) == 4
+    assert engine.get_bars("UNKNOWN") == []
+    assert engine.get_bars_as_dataframe("UNKNOWN") is None
+    assert engine.get_summary()["total_bars_in_memory"] == 4
+
+
+def test_out_of_order_bar_is_dropped():
+    engine = MarketDataEngine(bar_window=4)
+    _feed(engine, "BTC-USD", 2, start=1_700_000_600)
+    assert engine.ingest_bar("BTC-USD", {"time": 1_700_000_000, "close": 1.0}) is None
+    assert len(engine.get_bars("BTC-USD")) == 2
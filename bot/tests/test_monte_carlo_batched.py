@@ -0,0 +1,69 @@
+"""Tests for the vectorized Monte Carlo portfolio simulator."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bot.monte_carlo_simulator import (
+    BatchedMonteCarloSimulator,
+    MonteCarloPortfolioSimulator,
+    SimulationParameters,
+    _simulate_path_chunk,
+)
+from bot.monte_carlo_stress_test import MonteCarloStressTestEngine
+
+
+def test_results_are_seeded_and_independent_of_process_pool():
+    params = SimulationParameters(num_simulations=600, num_days=60)
+    serial = BatchedMonteCarloSimulator(params, seed=11, max_chunk_mb=0.2, processes=0).run_simulations()
+    pooled = BatchedMonteCarloSimulator(
+        params, seed=11, max_chunk_mb=0.2, processes=2, process_threshold=1
+    ).run_simulations()
+
+    assert serial.all_final_capitals == pooled.all_final_capitals
+    assert len(serial.all_final_capitals) == len(serial.all_max_drawdowns) == 600
+    assert len(serial.equity_curves) == 10 and len(serial.equity_curves[0]) == 61
+    assert serial.equity_curves[0][0] == params.initial_capital
+    assert serial.equity_curves[0][-1] == pytest.approx(serial.all_final_capitals[0])
+
+
+def test_chunk_size_respects_memory_cap():
+    sim = BatchedMonteCarloSimulator(SimulationParameters(num_days=252), max_chunk_mb=1.0)
+    assert 1 <= sim.chunk_size(3) <= 1024 * 1024 // (8 * 253 * 14) + 1
+    assert sim.chunk_size(3) > sim.chunk_size(30)
+
+
+def test_crisis_regime_and_spikes_scale_returns():
+    calm = SimulationParameters(num_days=50, volatility_daily=0.0, mean_return_daily=0.01,
+                                regime_shift_probability=0.0, vol_spike_probability=0.0)
+    finals, drawdowns, _ = _simulate_path_chunk(calm, 1, 4, np.random.SeedSequence(0))
+    np.testing.assert_allclose(finals, calm.initial_capital * 1.01 ** 50)
+    assert np.all(drawdowns == 0.0)
+
+    spiky = SimulationParameters(**{**calm.__dict__, "vol_spike_probability": 1.0})
+    finals, _, _ = _simulate_path_chunk(spiky, 1, 4, np.random.SeedSequence(0))
+    np.testing.assert_allclose(finals, calm.initial_capital * 1.03 ** 50)
+
+    # Always shifting between 5 regimes: roughly a fifth of the days are crisis days at half return.
+    shifting = SimulationParameters(**{**calm.__dict__, "regime_shift_probability": 1.0})
+    finals, _, _ = _simulate_path_chunk(shifting, 1, 2000, np.random.SeedSequence(0))
+    crisis_days = 2 * (50 - np.log(finals / calm.initial_capital) / np.log(1.01))
+    assert 8 < crisis_days.mean() < 12
+
+
+def test_matches_per_path_simulator_in_distribution():
+    params = SimulationParameters(num_simulations=400, num_days=120)
+    np.random.seed(3)
+    reference = MonteCarloPortfolioSimulator(params).run_simulations()
+    batched = BatchedMonteCarloSimulator(params, seed=3).run_simulations()
+    assert batched.mean_final_capital == pytest.approx(reference.mean_final_capital, rel=0.03)
+    assert batched.max_drawdown_mean == pytest.approx(reference.max_drawdown_mean, rel=0.1)
+
+
+def test_stress_engine_runs_portfolio_survivability():
+    engine = MonteCarloStressTestEngine({"num_simulations": 200, "random_seed": 5})
+    first = engine.run_portfolio_survivability()
+    second = engine.run_portfolio_survivability()
+    assert len(first.all_final_capitals) == 200
+    assert first.all_final_capitals == second.all_final_capitals
+    assert 0.0 <= first.probability_of_ruin <= 1.0
@@ -0,0 +1,86 @@
+"""Tests for the incremental multi-timeframe aggregator and the cached MTF RSI check."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot import indicators
+from bot.benchmark_apex_backtest import make_ohlcv
+from bot.multi_timeframe_aggregator import MultiTimeframeAggregator
+
+
+def _minutes(n, seed=2, start="2024-03-01 00:03"):
+    df = make_ohlcv(n, seed=seed)
+    df.index = pd.date_range(start, periods=n, freq="1min")
+    return df
+
+
+def test_cached_check_matches_resampling_across_scans(monkeypatch):
+    import bot.multi_timeframe_aggregator as mta
+
+    monkeypatch.setattr(mta, "_AGGREGATOR", MultiTimeframeAggregator())
+    full = _minutes(420)
+    for end in range(300, 420, 7):
+        window = full.iloc[end - 300:end].copy()
+        in_progress = window.copy()
+        in_progress.iloc[-1, 3] = in_progress.iloc[-1, 0]  # same candle, earlier tick
+        for frame in (in_progress, window):
+            expected = indicators.check_multi_timeframe_rsi_agreement(frame)
+            cached = indicators.check_multi_timeframe_rsi_agreement(frame, symbol="ETH-USD")
+            assert cached["current_rsi"] == pytest.approx(expected["current_rsi"], abs=1e-9)
+            assert cached["higher_rsis"] == pytest.approx(expected["higher_rsis"], abs=1e-9)
+            assert (cached["direction"], cached["timeframes_checked"]) == (
+                expected["direction"], expected["timeframes_checked"])
+
+    # Too short for the 15m timeframe: both paths skip it.
+    short = full.iloc[-100:]
+    assert "15min" not in indicators.check_multi_timeframe_rsi_agreement(short, symbol="SOL-USD")["higher_rsis"]
+
+
+def test_open_bar_rolls_forward_and_seals_on_boundary():
+    agg = MultiTimeframeAggregator(timeframes=("1min", "5min"), rsi_period=3, ema_spans=(2,))
+    t0 = 1_700_000_100.0  # 5m boundary
+    agg.update("BTC", t0, 10, 11, 9, 10.5, 1)
+    agg.update("BTC", t0 + 60, 10.5, 12, 10, 11.5, 2)
+    agg.update("BTC", t0 + 60, 10.5, 12.5, 10, 12.0, 3)  # in-progress candle re-read: replaced
+    snap = agg.snapshot("BTC", "5min")
+    assert (snap["open"], snap["high"], snap["low"], snap["close"], snap["volume"]) == (10, 12.5, 9, 12.0, 4)
+    assert snap["sealed_bars"] == 0 and snap["ema"] == {2: 12.0}
+
+    agg.update("BTC", t0 + 300, 12, 13, 11.5, 12.5, 1)  # next bucket seals the first bar
+    snap = agg.snapshot("BTC", "5min")
+    assert snap["bar_start"] == t0 + 300 and snap["sealed_bars"] == 1
+    assert snap["ema"][2] == pytest.approx(12.0 + 2 / 3 * 0.5)
+    assert agg.update("BTC", t0, 1, 1, 1, 1, 1) is False  # older than the last bar
+
+
+def test_ema_and_ohlcv_match_resampled_frame():
+    df = _minutes(200, seed=7)
+    agg = MultiTimeframeAggregator(timeframes=("15min",), ema_spans=(9, 21))
+    assert agg.sync("ADA", df)
+    resampled = indicators.resample_to_higher_timeframe(df, "15min")
+    snap = agg.snapshot("ADA", "15min")
+    last = resampled.iloc[-1]
+    assert [snap[c] for c in ("open", "high", "low", "close")] == pytest.approx(
+        [last["open"], last["high"], last["low"], last["close"]])
+    assert snap["volume"] == pytest.approx(last["volume"])
+    for span in (9, 21):
+        expected = resampled["close"].ewm(span=span, adjust=False).mean().iloc[-1]
+        assert snap["ema"][span] == pytest.approx(expected, rel=1e-12)
+    assert agg.rsi("ADA", "15min") == pytest.approx(indicators.calculate_rsi(resampled).iloc[-1], abs=1e-9)
+
+
+def test_rewound_frame_rebuilds_and_lru_evicts():
+    agg = MultiTimeframeAggregator(timeframes=("1min", "5min"), max_symbols=2)
+    df = _minutes(120, seed=3)
+    agg.sync("A", df)
+    agg.sync("A", df.iloc[:60])  # history rewritten / replayed: rebuilt from the frame
+    assert agg.metrics()["resets"] == 1
+    assert agg.snapshot("A", "1min")["close"] == df["close"].iloc[59]
+
+    agg.sync("B", df)
+    agg.sync("C", df)
+    assert agg.snapshot("A", "5min") is None and agg.metrics()["evictions"] == 1
+    assert not agg.sync("D", df.reset_index(drop=True))  # no DatetimeIndex
+    assert np.isfinite(agg.rsi("C", "5min"))
@@ -0,0 +1,149 @@
+"""Tests for the lazy runtime patch registry."""
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+
+import pytest
+
+from bot.patch_registry import PatchRegistry, PatchSpec, format_import_tree, parse_importtime
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    reg = PatchRegistry(lazy=True)
+    names = []
+
+    def make_module(name, body="VALUE = 42\n"):
+        (tmp_path / f"{name}.py").write_text(body)
+        names.append(name)
+        importlib.invalidate_caches()
+        return name
+
+    reg.make_module = make_module
+    yield reg
+    reg.uninstall()
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+def test_patch_installs_after_target_module_executes(registry):
+    target = registry.make_module("nija_test_lazy_target")
+    other = registry.make_module("nija_test_unrelated")
+    seen = []
+
+    timing = registry.register(
+        PatchSpec(name="demo", installer=lambda: seen.append(sys.modules[target].VALUE), targets=(target,))
+    )
+    importlib.import_module(other)
+    assert seen == [] and registry.pending() == ["demo"]
+
+    module = importlib.import_module(target)
+    assert seen == [42]
+    assert timing.trigger == target and timing.duration_ms >= 0.0
+    # The module keeps its real loader, and a second import does not re-run the patch.
+    assert type(module.__loader__).__name__ == "SourceFileLoader"
+    importlib.reload(module)
+    assert seen == [42] and registry.pending() == []
+
+
+def test_eager_loaded_and_lazy_disabled_install_immediately(registry):
+    loaded = registry.make_module("nija_test_already_loaded")
+    importlib.import_module(loaded)
+    calls = []
+    registry.register(PatchSpec(name="eager", installer=lambda: calls.append("eager")))
+    registry.register(PatchSpec(name="loaded", installer=lambda: calls.append("loaded"), targets=(loaded,)))
+    assert calls == ["eager", "loaded"]
+
+    eager_registry = PatchRegistry(lazy=False)
+    eager_registry.register(PatchSpec(name="x", installer=lambda: calls.append("x"), targets=("never_imported",)))
+    assert calls[-1] == "x"
+    assert [t.trigger for t in registry.timings()] == ["eager", loaded]
+
+
+def test_refresh_runs_for_each_further_target_and_errors_are_recorded(registry):
+    first = registry.make_module("nija_test_first_target")
+    second = registry.make_module("nija_test_second_target")
+    calls = []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    timing = registry.register(
+        PatchSpec(
+            name="multi",
+            installer=lambda: calls.append("install"),
+            targets=(first, second),
+            refresh=lambda: calls.append("refresh"),
+        )
+    )
+    failed = registry.register(PatchSpec(name="broken", installer=broken, targets=(first,)))
+    importlib.import_module(first)
+    importlib.import_module(second)
+
+    assert calls == ["install", "refresh"]
+    assert timing.refreshed_by == [second]
+    assert "boom" in failed.error
+    report = registry.format_report()
+    assert "2 installed (2 on import), 0 pending" in report and "ERROR RuntimeError: boom" in report
+
+
+def test_refresh_during_install_on_another_thread_is_deferred(registry):
+    first = registry.make_module("nija_test_install_trigger")
+    second = registry.make_module(
+        "nija_test_slow_target",
+        "import time\nimport nija_test_loading\nnija_test_loading.started.set()\ntime.sleep(0.2)\n",
+    )
+    loading = type(sys)("nija_test_loading")
+    loading.started = threading.Event()
+    sys.modules["nija_test_loading"] = loading
+    install_lock = threading.Lock()
+    calls = []
+
+    def install():
+        # Like the real patches: take the install lock, then import the other target.
+        with install_lock:
+            loading.started.wait(5)
+            importlib.import_module(second)
+            calls.append("install")
+
+    def refresh():
+        with install_lock:
+            calls.append("refresh")
+
+    timing = registry.register(PatchSpec(name="x", installer=install, targets=(first, second), refresh=refresh))
+    loader = threading.Thread(target=importlib.import_module, args=(second,), daemon=True)
+    try:
+        loader.start()
+        installer = threading.Thread(target=importlib.import_module, args=(first,), daemon=True)
+        installer.start()
+        installer.join(5)
+        loader.join(5)
+        assert not installer.is_alive() and not loader.is_alive()
+        assert calls == ["install", "refresh"] and timing.refreshed_by == [second]
+    finally:
+        sys.modules.pop("nija_test_loading", None)
+
+
+def test_importtime_tree_parsing():
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |         encodings.idna",
+            "import time:       200 |        200 |     leaf",
+            "import time:      1000 |       1300 |   child",
+            "import time:      5000 |       6300 | sitecustomize",
+            "NIJA runtime patches: 0 installed",
+        ]
+    )
+    roots, other = parse_importtime(stderr)
+    assert other == ["NIJA runtime patches: 0 installed"]
+    assert [r.name for r in roots] == ["sitecustomize"]
+    tree = format_import_tree(roots, min_ms=0.15)
+    assert tree.splitlines()[1:] == [
+        "      6.3      5.0  sitecustomize",
+        "      1.3      1.0    child",
+        "      0.2      0.2      leaf",
+    ]
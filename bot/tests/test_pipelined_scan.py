@@ -0,0 +1,116 @@
+"""Tests for the pipelined phase-3 candle prefetch (bot.pipelined_scan)."""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from bot.pipelined_scan import PipelinedScan
+
+
+class _Pool:
+    """Minimal OHLCWorkerPool stand-in; ``refuse`` keys return ``None``."""
+
+    def __init__(self, workers: int = 4, refuse=()):
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._refuse = set(refuse)
+        self.keys = []
+
+    def submit(self, key, fn, *args):
+        self.keys.append(key)
+        if key.split(":")[-1] in self._refuse:
+            return None
+        return self._executor.submit(fn, *args)
+
+
+def test_yields_in_completion_order_and_hands_over_frames():
+    delays = {"SLOW": 0.3, "A": 0.0, "B": 0.05}
+    scan = PipelinedScan(_Pool(), ["SLOW", "A", "B"], lambda s: (time.sleep(delays[s]), s)[1], deadline_s=5)
+
+    order = list(scan)
+    assert order[-1] == "SLOW"
+    assert set(order) == {"SLOW", "A", "B"}
+    assert all(scan.pop(s) == s for s in order)
+    assert scan.deadline_missed == 0
+    assert scan.stats()["prefetched"] == 3
+
+
+def test_fetches_overlap():
+    running = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def _fetch(sym):
+        with lock:
+            running.append(sym)
+            peak[0] = max(peak[0], len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(sym)
+        return sym
+
+    started = time.monotonic()
+    list(PipelinedScan(_Pool(workers=4), [f"S{i}" for i in range(8)], _fetch, deadline_s=5))
+    assert peak[0] > 1
+    assert time.monotonic() - started < 8 * 0.05
+
+
+def test_deadline_counts_unfetched_symbols():
+    gate = threading.Event()
+    scan = PipelinedScan(
+        _Pool(workers=1),
+        ["FAST", "STUCK", "NEVER"],
+        lambda s: s if s == "FAST" else gate.wait(2),
+        deadline_s=0.2,
+        max_inflight=2,
+    )
+    try:
+        assert list(scan) == ["FAST"]
+        assert scan.deadline_missed == 2
+        assert sorted(scan.missed_symbols) == ["NEVER", "STUCK"]
+        scan.close()  # idempotent after the iterator finished
+        assert scan.deadline_missed == 2
+    finally:
+        gate.set()
+
+
+def test_refused_and_skipped_symbols_are_yielded_without_frames():
+    pool = _Pool(refuse={"DUP"})
+    scan = PipelinedScan(pool, ["Q", "DUP", "OK"], lambda s: s, deadline_s=5, key_prefix="scan:kraken:", skip={"Q"})
+    order = list(scan)
+    assert order[0] == "Q"
+    assert set(order) == {"Q", "DUP", "OK"}
+    assert not scan.has_frame("Q") and not scan.has_frame("DUP")
+    assert scan.pop("OK") == "OK"
+    assert pool.keys == ["scan:kraken:DUP", "scan:kraken:OK"]
+    assert scan.stats()["inline"] == 1
+
+
+def test_early_break_is_not_a_deadline_miss():
+    scan = PipelinedScan(_Pool(), [f"S{i}" for i in range(6)], lambda s: s, deadline_s=5)
+    for _ in scan:
+        break
+    scan.close()
+    assert scan.deadline_missed == 0
+    assert len(scan.pending_symbols()) == 5
+
+
+def test_core_loop_builds_pipeline_only_when_enabled(monkeypatch):
+    from bot import nija_core_loop as ncl
+    from bot.nija_core_loop import NijaCoreLoop
+
+    loop = NijaCoreLoop(SimpleNamespace(broker_client=None), max_positions=1)
+    broker = SimpleNamespace(broker_type=SimpleNamespace(value="kraken"))
+
+    monkeypatch.delenv("NIJA_PIPELINED_SCAN_ENABLED", raising=False)
+    assert loop._build_scan_pipeline(broker, ["A", "B"]) is None
+
+    monkeypatch.setenv("NIJA_PIPELINED_SCAN_ENABLED", "true")
+    monkeypatch.setitem(ncl._DATA_FAILURE_QUARANTINE, "kraken:B", ncl._DATA_FAILURE_QUARANTINE_THRESHOLD)
+    fetched = []
+    monkeypatch.setattr(loop, "_fetch_df", lambda b, s: fetched.append(s) or s)
+    scan = loop._build_scan_pipeline(broker, ["A", "B"])
+    assert isinstance(scan, PipelinedScan)
+    assert list(scan)[0] == "B"  # quarantined: yielded straight away
+    assert fetched == ["A"]
@@ -0,0 +1,78 @@
+"""Tests for batched GA population scoring: vectorized diversity, genome cache, process pool."""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.meta_ai.evolution_config import GENETIC_CONFIG, PARAMETER_SEARCH_SPACE
+from bot.meta_ai.genetic_evolution import GeneticEvolution, parameter_matrix, population_diversity
+from bot.meta_ai.population_evaluator import PerGenome, PopulationEvaluator
+
+DATA = pd.DataFrame({"close": np.linspace(100.0, 110.0, 64)},
+                    index=pd.date_range("2024-01-01", periods=64, freq="1min"))
+
+
+def _metrics(params, data):
+    if params["ema_fast"] > 14.5:
+        raise RuntimeError("unsupported fast period")
+    return {"sharpe_ratio": params["atr_multiplier"] - 1.0, "total_trades": 50,
+            "last_close": float(data["close"].iloc[-1])}
+
+
+def _engine(size, seed=1):
+    random.seed(seed)
+    np.random.seed(seed)
+    engine = GeneticEvolution(dict(GENETIC_CONFIG, population_size=size))
+    engine.initialize_population()
+    return engine
+
+
+def test_vectorized_diversity_matches_pair_loop():
+    population = _engine(40).population
+    names = list(PARAMETER_SEARCH_SPACE)
+    expected = np.mean([
+        np.mean([abs(a.parameters[p] - b.parameters[p]) / (PARAMETER_SEARCH_SPACE[p][1] - PARAMETER_SEARCH_SPACE[p][0])
+                 for p in names])
+        for i, a in enumerate(population) for b in population[i + 1:]
+    ])
+    assert population_diversity(parameter_matrix(population)) == pytest.approx(expected)
+    assert population_diversity(parameter_matrix(population[:1])) == 0.0
+
+
+def test_cache_skips_elites_and_duplicates():
+    calls = []
+
+    def block_fn(block, names, data):
+        calls.append(len(block))
+        return PerGenome(_metrics)(block, names, data)
+
+    engine = _engine(30)
+    engine.population[1].parameters = dict(engine.population[0].parameters)  # duplicate
+    evaluator = PopulationEvaluator(DATA, block_fn, workers=1, cache_size=100)
+    fitness = evaluator.evaluate(engine)
+
+    expected = [0.0 if g.parameters["ema_fast"] > 14.5 else max(0.0, min(1.0, g.parameters["atr_multiplier"] / 4))
+                for g in engine.population]
+    assert fitness == pytest.approx(expected)
+    assert [g.fitness for g in engine.population] == pytest.approx(expected)
+    assert evaluator.stats["evaluated"] == 29 and evaluator.stats["failed"] > 0
+
+    evaluator.stats.update(evaluated=0, cache_hits=0, failed=0)
+    engine.evolve_generation()
+    evaluator.evaluate(engine)
+    elites = int(GENETIC_CONFIG["elite_percentage"] * 30)
+    assert evaluator.stats["cache_hits"] >= elites
+    assert evaluator.stats["evaluated"] + evaluator.stats["cache_hits"] <= 30
+
+
+def test_process_pool_over_shared_data_matches_in_process():
+    engine = _engine(24)
+    in_process = PopulationEvaluator(DATA, PerGenome(_metrics), workers=1).backtest(parameter_matrix(engine.population))
+    with PopulationEvaluator(DATA, PerGenome(_metrics), workers=2, block_size=5, mp_context="fork") as evaluator:
+        pooled = evaluator.backtest(parameter_matrix(engine.population))
+    assert pooled == in_process
+    assert any(m is None for m in pooled)
+    assert all(m["last_close"] == 110.0 for m in pooled if m is not None)
@@ -0,0 +1,90 @@
+"""Tests for the incremental correlation matrix behind PortfolioRiskEngine."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.portfolio_risk_engine import PortfolioRiskEngine
+from bot.streaming_correlation import StreamingCorrelation
+
+
+def _returns(bars, symbols, seed=0):
+    rng = np.random.default_rng(seed)
+    data = rng.normal(0, 0.01, (bars, symbols))
+    data[:, 1] = 0.9 * data[:, 0] + 0.1 * data[:, 1]
+    return data
+
+
+def test_matches_pandas_pairwise_corr_with_gaps_and_eviction():
+    data = _returns(260, 24)
+    gaps = np.random.default_rng(1).random(data.shape) < 0.1
+    names = [f"S{j}" for j in range(data.shape[1])]
+    stream = StreamingCorrelation(window=60)
+    for t in range(data.shape[0]):
+        stream.add_bar(t, {names[j]: data[t, j] for j in range(len(names)) if not gaps[t, j]})
+
+    frame = pd.DataFrame(np.where(gaps, np.nan, data)[-60:], columns=names)
+    expected = frame.corr().loc[stream.symbols, stream.symbols].values
+    assert stream.num_bars == 60
+    np.testing.assert_allclose(stream.matrix(), expected, atol=1e-9)
+    assert stream.correlation("S0", "S1") == pytest.approx(frame["S0"].corr(frame["S1"]))
+
+
+def test_duplicate_stale_and_nonfinite_values_are_ignored():
+    stream = StreamingCorrelation(window=3)
+    assert stream.add("A", 5, 0.01)
+    assert not stream.add("A", 5, 0.02)  # already set for this bar
+    assert not stream.add("A", 6, float("nan"))
+    for label in (6, 7, 8):
+        stream.add("A", label, 0.01 * label)
+    assert not stream.add("B", 5, 0.01)  # evicted from the window
+    assert stream.num_bars == 3 and stream.last_label == 8
+
+
+def test_max_correlation_against_open_book():
+    data = _returns(80, 5)
+    stream = StreamingCorrelation(window=100)
+    for t in range(80):
+        stream.add_bar(t, {f"S{j}": data[t, j] for j in range(5)})
+    best, corr = stream.max_correlation("S0", ["S1", "S2", "S3"])
+    assert best == "S1" and corr > 0.9
+    assert stream.max_correlation("S0", ["missing"]) == (None, 0.0)
+
+
+def test_engine_ingests_only_new_bars_and_groups_from_stream():
+    engine = PortfolioRiskEngine({"correlation_lookback": 40, "correlation_update_interval": 0})
+    data = _returns(61, 4, seed=3)
+    prices = 100.0 * np.cumprod(1.0 + data, axis=0)
+    index = pd.date_range("2026-01-01", periods=61, freq="5min")
+    for end in (50, 61):
+        for j in range(4):
+            engine.update_price_history(f"S{j}-USD", pd.Series(prices[:end, j], index=index[:end]))
+
+    expected = pd.DataFrame(data[-39:], columns=[f"S{j}-USD" for j in range(4)]).corr().values
+    assert engine.correlation_matrix.lookback_periods == 39
+    np.testing.assert_allclose(engine.correlation_matrix.matrix, expected, atol=1e-9)
+    assert {"S0-USD", "S1-USD"} in engine.correlation_groups.values()
+
+    engine.add_position("S1-USD", 1000.0, "long", 10000.0)
+    best, corr = engine.max_correlation_to_open_book("S0-USD")
+    assert best == "S1-USD" and corr == pytest.approx(expected[0, 1])
+
+
+def test_engine_keeps_updating_on_sliding_range_index_windows():
+    engine = PortfolioRiskEngine({"correlation_lookback": 100, "correlation_update_interval": 0})
+    data = _returns(200, 2, seed=5)
+    prices = 100.0 * np.cumprod(1.0 + data, axis=0)
+    for end in (100, 150, 200):
+        for j in range(2):
+            engine.update_price_history(f"S{j}-USD", pd.Series(prices[end - 100:end, j]))
+
+    assert engine._streaming_corr.num_bars == 99
+    expected = pd.DataFrame(data[-99:], columns=["S0-USD", "S1-USD"]).corr().values
+    np.testing.assert_allclose(engine.correlation_matrix.matrix, expected, atol=1e-9)
+
+    # A window with no overlap reseeds the symbol, right-aligned to the newest bar
+    engine.update_price_history("S1-USD", pd.Series(prices[:100, 0]))
+    assert engine._streaming_corr.num_bars == 99
+    assert engine._streaming_corr.correlation("S0-USD", "S1-USD") == pytest.approx(
+        np.corrcoef(data[-99:, 0], data[1:100, 0])[0, 1])
@@ -0,0 +1,144 @@
+"""Tests for the TradeLedgerDB connection layer (WAL writer, read connections, group commit)."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from bot.trade_ledger_db import TradeLedgerDB
+
+
+@pytest.fixture(params=[False, True], ids=["direct", "group_commit"])
+def ledger(request, tmp_path):
+    db = TradeLedgerDB(str(tmp_path / "ledger.db"), group_commit=request.param)
+    yield db
+    db.close()
+
+
+def test_writer_uses_wal_and_reuses_one_connection(ledger):
+    with ledger._get_connection() as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        first = conn
+    with ledger._get_connection() as conn:
+        assert conn is first
+    assert mode == "wal"
+
+
+def test_position_lifecycle_and_statistics(ledger):
+    assert ledger.record_buy("BTC-USD", 100.0, 1.0, 100.0, position_id="p1") >= 1
+    assert ledger.open_position("p1", "BTC-USD", "LONG", 100.0, 1.0, 100.0)
+    assert ledger.open_position("p1", "BTC-USD", "LONG", 100.0, 1.0, 100.0) is False
+    assert [p["position_id"] for p in ledger.get_open_positions()] == ["p1"]
+
+    assert ledger.close_position("p1", 110.0, exit_fee=1.0)
+    assert ledger.close_position("p1", 110.0) is False
+
+    stats = ledger.get_statistics()
+    assert stats["total_trades"] == 1
+    assert stats["total_pnl"] == pytest.approx(9.0)
+    assert stats["open_positions"] == 0
+
+
+
+def test_record_copy_trades_writes_a_broadcast_in_one_batch(ledger):
+    rows = [dict(platform_trade_id="m2", master_symbol="ETH-USD", master_side="sell",
+                 user_id=f"u{i}", user_status="filled" if i else "skipped", user_size=10.0)
+            for i in range(5)]
+    assert ledger.record_copy_trades(rows) == 5
+    assert ledger.record_copy_trades([]) == 0
+    summary = ledger.get_copy_trade_summary("m2")
+    assert summary["total_users"] == 5
+    assert {r["platform_user_id"] for r in ledger.get_copy_trade_map("m2")} == {"platform"}
+
+def test_reads_do_not_wait_for_an_open_write_transaction(ledger):
+    ledger.open_position("p1", "ETH-USD", "LONG", 10.0, 1.0, 10.0)
+    result = {}
+
+    with ledger._get_connection() as conn:
+        conn.execute("DELETE FROM open_positions")
+        reader = threading.Thread(target=lambda: result.setdefault("rows", ledger.get_open_positions()))
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
+    # The reader saw the last committed state, not the uncommitted delete.
+    assert [p["position_id"] for p in result["rows"]] == ["p1"]
+    assert ledger.get_open_positions() == []
+
+
+def test_nested_connection_joins_outer_transaction(ledger):
+    with pytest.raises(RuntimeError):
+        with ledger._get_connection() as conn:
+            conn.execute("UPDATE open_positions SET notes = 'x'")
+            ledger.record_buy("BTC-USD", 1.0, 1.0, 1.0)
+            raise RuntimeError("abort")
+    assert ledger.get_ledger_transactions() == []
+
+
+def test_group_commit_batches_concurrent_writers(tmp_path):
+    db = TradeLedgerDB(str(tmp_path / "ledger.db"), group_commit=True)
+    barrier = threading.Barrier(8)
+
+    def writer(user: int) -> None:
+        barrier.wait()
+        for _ in range(25):
+            db.record_copy_trade("m1", "BTC-USD", "buy", user_id=f"u{user}", user_status="filled")
+
+    threads = [threading.Thread(target=writer, args=(u,)) for u in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = db.commit_stats()
+    assert db.get_copy_trade_summary("m1")["total_users"] == 200
+    assert stats["writes"] >= 200
+    assert stats["batches"] < stats["writes"]
+    db.close()
+
+
+def test_failed_write_in_batch_does_not_roll_back_batch_mates(tmp_path):
+    db = TradeLedgerDB(str(tmp_path / "ledger.db"), group_commit=True)
+    db.open_position("dup", "BTC-USD", "LONG", 1.0, 1.0, 1.0)
+    results = []
+
+    def attempt(pid: str) -> None:
+        results.append((pid, db.open_position(pid, "BTC-USD", "LONG", 1.0, 1.0, 1.0)))
+
+    threads = [threading.Thread(target=attempt, args=(pid,)) for pid in ("dup", "a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert dict(results) == {"dup": False, "a": True, "b": True}
+    assert {p["position_id"] for p in db.get_open_positions()} == {"dup", "a", "b"}
+    db.close()
+
+
+def test_read_connections_are_pooled_across_short_lived_threads(tmp_path, monkeypatch):
+    monkeypatch.setenv("NIJA_TRADE_LEDGER_READERS", "2")
+    db = TradeLedgerDB(str(tmp_path / "ledger.db"))
+    db.open_position("p1", "BTC-USD", "LONG", 100.0, 1.0, 100.0)
+    barrier = threading.Barrier(6)
+    seen = []
+
+    def read():
+        barrier.wait()
+        seen.append(len(db.get_open_positions()))
+
+    for _ in range(5):  # waves of concurrent threads that exit after one read
+        threads = [threading.Thread(target=read) for _ in range(6)]
+        barrier.reset()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+    assert seen == [1] * 30
+    assert len(db._reader_conns) <= 2
+    assert db._reader_pool.qsize() == len(db._reader_conns)  # all returned
+
+    with db._get_read_connection() as outer, db._get_read_connection() as inner:
+        assert inner is outer  # nested reads reuse the thread's connection
+    db.close()
+    assert db._reader_conns == []
@@ -0,0 +1,123 @@
+"""Tests for the parallel / checkpointed walk-forward execution mode."""
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.walk_forward_optimizer import SimpleWalkForwardOptimizer, WalkForwardOptimizer, _GENETIC_AVAILABLE
+from bot.walk_forward_parallel import SharedPriceFrame, attach_shared_frame
+
+WFO_CONFIG = {"train_window_days": 20, "test_window_days": 10, "step_days": 10}
+GRID = {"fast": [3, 5, 8], "slow": [10, 20]}
+
+
+def _prices(days: int = 80, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2026-01-01", periods=days * 24, freq="1h")
+    close = 100.0 + np.cumsum(rng.normal(0, 1, len(idx)))
+    return pd.DataFrame({"close": close, "volume": rng.uniform(1, 5, len(idx))}, index=idx)
+
+
+def sma_backtest(params, data):
+    """Deterministic toy backtest: SMA-cross returns (module level so it pickles)."""
+    close = data["close"].to_numpy()
+    fast = int(params.get("fast", params.get("ema_fast", 5)))
+    slow = int(params.get("slow", params.get("ema_slow", 20)))
+    if len(close) <= slow:
+        return {"sharpe_ratio": 0.0}
+    f = pd.Series(close).rolling(fast).mean().to_numpy()
+    s = pd.Series(close).rolling(slow).mean().to_numpy()
+    rets = np.diff(close) * (f[:-1] > s[:-1])
+    std = rets.std()
+    return {
+        "sharpe_ratio": float(rets.mean() / std) if std else 0.0,
+        "win_rate": float((rets > 0).mean()),
+        "profit_factor": 1.0 + float(rets.sum()) / 100.0,
+        "max_drawdown": 0.1,
+    }
+
+
+def _summary(result):
+    return [(w.window_id, w.best_params, w.train_score, w.test_score) for w in result.windows]
+
+
+def test_parallel_grid_search_matches_serial(tmp_path):
+    data = _prices()
+    serial = SimpleWalkForwardOptimizer(GRID, dict(WFO_CONFIG)).run(data, sma_backtest)
+    progress = []
+    parallel = SimpleWalkForwardOptimizer(GRID, dict(WFO_CONFIG, workers=2)).run(
+        data, sma_backtest, progress_callback=progress.append
+    )
+
+    assert len(serial.windows) == 5
+    assert _summary(parallel) == _summary(serial)
+    assert parallel.best_params == serial.best_params
+    assert progress[-1].done == progress[-1].total == 5 * (6 + 1)
+    assert progress[-1].eta_s == 0
+
+
+def test_checkpoint_resumes_without_reevaluating(tmp_path):
+    data = _prices()
+    ckpt = tmp_path / "wfo.jsonl"
+    first = SimpleWalkForwardOptimizer(GRID, dict(WFO_CONFIG, checkpoint_path=str(ckpt))).run(data, sma_backtest)
+    lines = ckpt.read_text().splitlines()
+    assert len(lines) == 5 * 7
+    # Simulate an interrupted run: drop the tail of the checkpoint, plus a torn line.
+    ckpt.write_text("\n".join(lines[:20]) + "\n{\"key\": \"torn")
+
+    calls = []
+
+    def counting_backtest(params, frame):
+        calls.append(params)
+        return sma_backtest(params, frame)
+
+    progress = []
+    resumed = SimpleWalkForwardOptimizer(GRID, dict(WFO_CONFIG, checkpoint_path=str(ckpt))).run(
+        data, counting_backtest, progress_callback=progress.append
+    )
+    assert len(calls) == 15
+    assert progress[-1].cached == 20
+    assert _summary(resumed) == _summary(first)
+    assert all("key" in json.loads(line) for line in ckpt.read_text().splitlines()[21:])
+
+
+def test_shared_frame_is_zero_copy_and_preserves_index():
+    data = _prices(days=3).tz_localize("UTC")
+    data["label"] = "x"
+    shared = SharedPriceFrame(data)
+    try:
+        shm, frame = attach_shared_frame(shared.spec)
+        assert list(frame.columns) == ["close", "volume"]
+        assert frame.index.equals(data.index)
+        np.testing.assert_array_equal(frame["close"].to_numpy(), data["close"].to_numpy())
+        with pytest.raises(ValueError):
+            frame.to_numpy()[0, 0] = 1.0
+        del frame
+        shm.close()
+    finally:
+        shared.close()
+
+
+@pytest.mark.skipif(not _GENETIC_AVAILABLE, reason="meta_ai genetic engine unavailable")
+def test_genetic_parallel_matches_serial_for_fixed_seed():
+    data = _prices(days=60)
+    config = dict(
+        WFO_CONFIG,
+        generations=3,
+        seed=11,
+        genetic_config={
+            "population_size": 8, "generations": 3, "mutation_rate": 0.2,
+            "crossover_rate": 0.7, "elite_percentage": 0.25, "tournament_size": 3,
+        },
+    )
+    serial = WalkForwardOptimizer(dict(config)).run_optimization(data, sma_backtest)
+    parallel = WalkForwardOptimizer(dict(config, workers=2)).run_optimization(data, sma_backtest)
+
+    def genomes(result):
+        return [(w.window_id, w.best_genome.parameters, w.train_fitness, w.test_fitness) for w in result.windows]
+
+    assert len(serial.windows) == 3
+    assert genomes(parallel) == genomes(serial)
@@ -8,6 +8,22 @@ SQLite database for persistent trade tracking with:
 - Trade history with full P&L
 - Export capabilities (CSV/PDF)
 
+Connection layer:
+- One long-lived writer connection per process (WAL journal, thread-safe
+  behind a lock, compiled statements reused via the sqlite3 statement cache)
+- A small pool of read connections, so dashboard/stat queries never wait on
+  writers; connections are returned after each read, so short-lived threads
+  do not leave open connections behind
+- Optional group commit: concurrent writes are queued and committed together
+  in one transaction, each caller still returning only after its commit
+
+Environment variables (all optional):
+    NIJA_TRADE_LEDGER_GROUP_COMMIT        enable the group-commit queue (default false)
+    NIJA_TRADE_LEDGER_COMMIT_LATENCY_MS   max time a write waits for batch-mates (default 2)
+    NIJA_TRADE_LEDGER_COMMIT_BATCH        max writes per commit (default 256)
+    NIJA_TRADE_LEDGER_SYNCHRONOUS         SQLite synchronous level (default NORMAL)
+    NIJA_TRADE_LEDGER_READERS             max open read connections (default 4)
+
 Author: NIJA Trading Systems
 Date: January 21, 2026
 """
@@ -15,15 +31,152 @@ Date: January 21, 2026
 import sqlite3
 import json
 import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 import csv
 import io
 
 logger = logging.getLogger("nija.trade_ledger")
 
+_TRUE = {"1", "true", "yes", "on"}
+_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+# Statements are module constants so every call hands sqlite3 the same SQL
+# text and hits the connection's compiled-statement cache.
+_SQL_INSERT_LEDGER = """
+    INSERT INTO trade_ledger
+    (timestamp, user_id, symbol, side, action, price, quantity,
+     size_usd, fee, order_id, position_id, platform_trade_id, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_POSITION = """
+    INSERT INTO open_positions
+    (position_id, user_id, symbol, side, entry_price, quantity,
+     size_usd, stop_loss, take_profit_1, take_profit_2,
+     take_profit_3, entry_fee, entry_time, notes, position_source)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_POSITION = "SELECT * FROM open_positions WHERE position_id = ?"
+_SQL_INSERT_COMPLETED = """
+    INSERT INTO completed_trades
+    (position_id, user_id, symbol, side, entry_price, exit_price,
+     quantity, size_usd, entry_fee, exit_fee, total_fees,
+     gross_profit, net_profit, profit_pct, entry_time, exit_time,
+     duration_seconds, exit_reason, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_DELETE_POSITION = "DELETE FROM open_positions WHERE position_id = ?"
+_SQL_INSERT_COPY_TRADE = """
+    INSERT INTO copy_trade_map
+    (platform_trade_id, platform_user_id, master_symbol, master_side,
+     master_order_id, master_timestamp, user_id, user_status,
+     user_order_id, user_error, user_size)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class _GroupCommitQueue:
+    """
+    Batches ledger writes into shared transactions on a background thread.
+
+    ``submit(op)`` blocks until the transaction containing ``op`` commits and
+    returns ``op``'s result (or raises its exception).  The flusher takes the
+    first queued write, waits at most ``max_latency_s`` for more (up to
+    ``max_batch``), then runs each write inside its own SAVEPOINT so one
+    failing write (e.g. a duplicate position) does not roll back the rest.
+    """
+
+    def __init__(self, db: "TradeLedgerDB", max_latency_s: float, max_batch: int):
+        self._db = db
+        self._max_latency_s = max(0.0, max_latency_s)
+        self._max_batch = max(1, max_batch)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._stopped = False
+        self.batches = 0
+        self.writes = 0
+        self.largest_batch = 0
+        self._thread = threading.Thread(
+            target=self._run, name="TradeLedgerGroupCommit", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, op: Callable[[sqlite3.Cursor], Any]) -> Any:
+        if self._stopped:
+            raise RuntimeError("trade ledger group commit queue is closed")
+        future: Future = Future()
+        self._queue.put((op, future))
+        return future.result()
+
+    def close(self, timeout: float = 5.0):
+        self._stopped = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _collect(self, first) -> list:
+        batch = [first]
+        deadline = time.monotonic() + self._max_latency_s
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # re-deliver shutdown after this batch
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+            self._flush(batch)
+
+    def _flush(self, batch: list):
+        outcomes = []
+        try:
+            with self._db._get_connection() as conn:
+                cursor = conn.cursor()
+                for op, _future in batch:
+                    cursor.execute("SAVEPOINT ledger_write")
+                    try:
+                        outcomes.append((True, op(cursor)))
+                        cursor.execute("RELEASE ledger_write")
+                    except Exception as exc:
+                        cursor.execute("ROLLBACK TO ledger_write")
+                        cursor.execute("RELEASE ledger_write")
+                        outcomes.append((False, exc))
+        except Exception as exc:
+            for _op, future in batch:
+                future.set_exception(exc)
+            return
+
+        self.batches += 1
+        self.writes += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        for (_op, future), (ok, value) in zip(batch, outcomes):
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
 
 class TradeLedgerDB:
     """
@@ -31,35 +184,193 @@ class TradeLedgerDB:
     Handles all trade recording and querying operations
     """
 
-    def __init__(self, db_path: str = "./data/trade_ledger.db"):
+    def __init__(self, db_path: str = "./data/trade_ledger.db",
+                 group_commit: Optional[bool] = None):
         """
         Initialize trade ledger database
 
         Args:
             db_path: Path to SQLite database file
+            group_commit: Batch concurrent writes into shared commits
+                (default: NIJA_TRADE_LEDGER_GROUP_COMMIT)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True, parents=True)
 
+        self._write_lock = threading.RLock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_pid: Optional[int] = None
+        self._write_depth = threading.local()
+        self._readers = threading.local()
+        self._reader_conns: List[sqlite3.Connection] = []
+        self._reader_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_pid = os.getpid()
+        self._max_readers = max(1, _env_int("NIJA_TRADE_LEDGER_READERS", 4))
+        self._readers_lock = threading.Lock()
+
         # Initialize database schema
         self._init_database()
 
-        logger.info(f"📊 Trade Ledger DB initialized at {self.db_path}")
+        if group_commit is None:
+            group_commit = os.environ.get("NIJA_TRADE_LEDGER_GROUP_COMMIT", "").strip().lower() in _TRUE
+        self._group_commit: Optional[_GroupCommitQueue] = None
+        if group_commit:
+            self._group_commit = _GroupCommitQueue(
+                self,
+                max_latency_s=_env_int("NIJA_TRADE_LEDGER_COMMIT_LATENCY_MS", 2) / 1000.0,
+                max_batch=_env_int("NIJA_TRADE_LEDGER_COMMIT_BATCH", 256),
+            )
+
+        logger.info(f"📊 Trade Ledger DB initialized at {self.db_path}"
+                    f"{' (group commit)' if group_commit else ''}")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=30.0,
+            isolation_level=None,  # transactions are managed explicitly
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        conn.execute("PRAGMA busy_timeout = 30000")
+        return conn
+
+    def _writer_connection(self) -> sqlite3.Connection:
+        """Long-lived writer connection (reopened after fork); call under _write_lock"""
+        if self._writer is None or self._writer_pid != os.getpid():
+            conn = self._connect()
+            conn.execute("PRAGMA journal_mode = WAL")
+            synchronous = os.environ.get("NIJA_TRADE_LEDGER_SYNCHRONOUS", "NORMAL").strip().upper()
+            if synchronous not in _SYNCHRONOUS_LEVELS:
+                synchronous = "NORMAL"
+            conn.execute(f"PRAGMA synchronous = {synchronous}")
+            self._writer = conn
+            self._writer_pid = os.getpid()
+        return self._writer
 
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        """
+        Context manager for a write transaction on the shared writer connection
+
+        Commits on exit and rolls back on error.  Re-entrant: nested use on the
+        same thread joins the outer transaction.
+        """
+        with self._write_lock:
+            depth = getattr(self._write_depth, "value", 0)
+            conn = self._writer_connection()
+            if depth:
+                self._write_depth.value = depth + 1
+                try:
+                    yield conn
+                finally:
+                    self._write_depth.value = depth
+                return
+
+            self._write_depth.value = 1
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                yield conn
+                if conn.in_transaction:
+                    conn.commit()
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+            finally:
+                self._write_depth.value = 0
+
+    @contextmanager
+    def _get_read_connection(self):
+        """
+        Context manager for a read-only connection from the reader pool
+
+        WAL lets readers see the last committed state without waiting on
+        (or blocking) the writer.  The connection goes back to the pool on
+        exit; nested use on the same thread reuses it.
+        """
+        conn = getattr(self._readers, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+        conn = self._acquire_reader()
+        self._readers.conn = conn
         try:
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
         finally:
+            self._readers.conn = None
+            self._release_reader(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Idle pooled reader, a new one while under the cap, else wait for one"""
+        with self._readers_lock:
+            if self._reader_pid != os.getpid():
+                # Connections inherited across fork belong to the parent.
+                self._reader_conns = []
+                self._reader_pool = queue.LifoQueue()
+                self._reader_pid = os.getpid()
+            pool = self._reader_pool
+            try:
+                return pool.get_nowait()
+            except queue.Empty:
+                pass
+            if len(self._reader_conns) < self._max_readers:
+                conn = self._connect()
+                conn.execute("PRAGMA query_only = ON")
+                self._reader_conns.append(conn)
+                return conn
+        return pool.get()
+
+    def _release_reader(self, conn: sqlite3.Connection):
+        with self._readers_lock:
+            if any(conn is pooled for pooled in self._reader_conns):
+                self._reader_pool.put(conn)
+                return
+        # The pool was reset (close() or fork) while this read was running.
+        try:
             conn.close()
+        except Exception:
+            pass
+
+    def _write(self, op: Callable[[sqlite3.Cursor], Any]) -> Any:
+        """Run ``op(cursor)`` in a committed write, via the group-commit queue if enabled"""
+        if self._group_commit is not None and not getattr(self._write_depth, "value", 0):
+            return self._group_commit.submit(op)
+        with self._get_connection() as conn:
+            return op(conn.cursor())
+
+    def commit_stats(self) -> Dict:
+        """Group-commit counters (batches, writes, largest batch)"""
+        gc = self._group_commit
+        if gc is None:
+            return {'group_commit': False}
+        return {
+            'group_commit': True,
+            'batches': gc.batches,
+            'writes': gc.writes,
+            'largest_batch': gc.largest_batch,
+            'avg_batch': (gc.writes / gc.batches) if gc.batches else 0.0,
+        }
+
+    def close(self):
+        """Flush queued writes and close all connections"""
+        if self._group_commit is not None:
+            self._group_commit.close()
+            self._group_commit = None
+        with self._readers_lock:
+            for conn in self._reader_conns:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._reader_conns = []
+            self._reader_pool = queue.LifoQueue()
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
 
     def _init_database(self):
         """Create database schema if it doesn't exist"""
@@ -328,32 +639,24 @@ class TradeLedgerDB:
         Returns:
             int: Transaction ID
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO trade_ledger
-                (timestamp, user_id, symbol, side, action, price, quantity,
-                 size_usd, fee, order_id, position_id, platform_trade_id, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                datetime.now().isoformat(),
-                user_id,
-                symbol,
-                'BUY',
-                'OPEN',
-                price,
-                quantity,
-                size_usd,
-                fee,
-                order_id,
-                position_id,
-                platform_trade_id,
-                notes
-            ))
-
-            tx_id = cursor.lastrowid
-            logger.info(f"📝 BUY recorded: {symbol} @ ${price:.2f} (ID: {tx_id})")
-            return tx_id
+        params = (
+            datetime.now().isoformat(),
+            user_id,
+            symbol,
+            'BUY',
+            'OPEN',
+            price,
+            quantity,
+            size_usd,
+            fee,
+            order_id,
+            position_id,
+            platform_trade_id,
+            notes
+        )
+        tx_id = self._write(lambda cursor: cursor.execute(_SQL_INSERT_LEDGER, params).lastrowid)
+        logger.info(f"📝 BUY recorded: {symbol} @ ${price:.2f} (ID: {tx_id})")
+        return tx_id
 
     def record_sell(self, symbol: str, price: float, quantity: float,
                     size_usd: float, fee: float = 0.0,
@@ -378,32 +681,24 @@ class TradeLedgerDB:
         Returns:
             int: Transaction ID
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO trade_ledger
-                (timestamp, user_id, symbol, side, action, price, quantity,
-                 size_usd, fee, order_id, position_id, platform_trade_id, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                datetime.now().isoformat(),
-                user_id,
-                symbol,
-                'SELL',
-                'CLOSE',
-                price,
-                quantity,
-                size_usd,
-                fee,
-                order_id,
-                position_id,
-                platform_trade_id,
-                notes
-            ))
-
-            tx_id = cursor.lastrowid
-            logger.info(f"📝 SELL recorded: {symbol} @ ${price:.2f} (ID: {tx_id})")
-            return tx_id
+        params = (
+            datetime.now().isoformat(),
+            user_id,
+            symbol,
+            'SELL',
+            'CLOSE',
+            price,
+            quantity,
+            size_usd,
+            fee,
+            order_id,
+            position_id,
+            platform_trade_id,
+            notes
+        )
+        tx_id = self._write(lambda cursor: cursor.execute(_SQL_INSERT_LEDGER, params).lastrowid)
+        logger.info(f"📝 SELL recorded: {symbol} @ ${price:.2f} (ID: {tx_id})")
+        return tx_id
 
     def open_position(self, position_id: str, symbol: str, side: str,
                      entry_price: float, quantity: float, size_usd: float,
@@ -431,35 +726,27 @@ class TradeLedgerDB:
         Returns:
             True if successful
         """
+        params = (
+            position_id,
+            user_id,
+            symbol,
+            side,
+            entry_price,
+            quantity,
+            size_usd,
+            stop_loss,
+            take_profit_1,
+            take_profit_2,
+            take_profit_3,
+            entry_fee,
+            datetime.now().isoformat(),
+            notes,
+            position_source
+        )
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO open_positions
-                    (position_id, user_id, symbol, side, entry_price, quantity,
-                     size_usd, stop_loss, take_profit_1, take_profit_2,
-                     take_profit_3, entry_fee, entry_time, notes, position_source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    position_id,
-                    user_id,
-                    symbol,
-                    side,
-                    entry_price,
-                    quantity,
-                    size_usd,
-                    stop_loss,
-                    take_profit_1,
-                    take_profit_2,
-                    take_profit_3,
-                    entry_fee,
-                    datetime.now().isoformat(),
-                    notes,
-                    position_source
-                ))
-
-                logger.info(f"📈 Position opened: {symbol} {side} (ID: {position_id}, Source: {position_source})")
-                return True
+            self._write(lambda cursor: cursor.execute(_SQL_INSERT_POSITION, params))
+            logger.info(f"📈 Position opened: {symbol} {side} (ID: {position_id}, Source: {position_source})")
+            return True
         except sqlite3.IntegrityError:
             logger.warning(f"Position {position_id} already exists")
             return False
@@ -475,88 +762,81 @@ class TradeLedgerDB:
         Returns:
             True if successful
         """
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+        def _close(cursor: sqlite3.Cursor) -> Optional[Tuple[str, float, float]]:
+            # Get open position
+            cursor.execute(_SQL_SELECT_POSITION, (position_id,))
+
+            position = cursor.fetchone()
+            if not position:
+                return None
+
+            # Calculate P&L
+            entry_price = position['entry_price']
+            quantity = position['quantity']
+            size_usd = position['size_usd']
+            entry_fee = position['entry_fee']
+            side = position['side']
+
+            exit_value = quantity * exit_price
+
+            # Correct P&L calculation for LONG and SHORT positions
+            if side.upper() in ('LONG', 'BUY'):
+                # For LONG: profit when price goes up
+                gross_profit = exit_value - size_usd
+            else:  # SHORT or SELL
+                # For SHORT: profit when price goes down
+                # Entry: Sell high (receive size_usd)
+                # Exit: Buy low (pay exit_value)
+                gross_profit = size_usd - exit_value
+
+            total_fees = entry_fee + exit_fee
+            net_profit = gross_profit - total_fees
+            profit_pct = (net_profit / size_usd) * 100
+
+            # Calculate duration
+            entry_time = datetime.fromisoformat(position['entry_time'])
+            exit_time = datetime.now()
+            duration = (exit_time - entry_time).total_seconds()
+
+            # Insert into completed trades
+            cursor.execute(_SQL_INSERT_COMPLETED, (
+                position_id,
+                position['user_id'],
+                position['symbol'],
+                side,
+                entry_price,
+                exit_price,
+                quantity,
+                size_usd,
+                entry_fee,
+                exit_fee,
+                total_fees,
+                gross_profit,
+                net_profit,
+                profit_pct,
+                position['entry_time'],
+                exit_time.isoformat(),
+                duration,
+                exit_reason,
+                position['notes']
+            ))
 
-                # Get open position
-                cursor.execute("""
-                    SELECT * FROM open_positions WHERE position_id = ?
-                """, (position_id,))
-
-                position = cursor.fetchone()
-                if not position:
-                    logger.warning(f"Position {position_id} not found")
-                    return False
-
-                # Calculate P&L
-                entry_price = position['entry_price']
-                quantity = position['quantity']
-                size_usd = position['size_usd']
-                entry_fee = position['entry_fee']
-                side = position['side']
-
-                exit_value = quantity * exit_price
-
-                # Correct P&L calculation for LONG and SHORT positions
-                if side.upper() in ('LONG', 'BUY'):
-                    # For LONG: profit when price goes up
-                    gross_profit = exit_value - size_usd
-                else:  # SHORT or SELL
-                    # For SHORT: profit when price goes down
-                    # Entry: Sell high (receive size_usd)
-                    # Exit: Buy low (pay exit_value)
-                    gross_profit = size_usd - exit_value
-
-                total_fees = entry_fee + exit_fee
-                net_profit = gross_profit - total_fees
-                profit_pct = (net_profit / size_usd) * 100
-
-                # Calculate duration
-                entry_time = datetime.fromisoformat(position['entry_time'])
-                exit_time = datetime.now()
-                duration = (exit_time - entry_time).total_seconds()
-
-                # Insert into completed trades
-                cursor.execute("""
-                    INSERT INTO completed_trades
-                    (position_id, user_id, symbol, side, entry_price, exit_price,
-                     quantity, size_usd, entry_fee, exit_fee, total_fees,
-                     gross_profit, net_profit, profit_pct, entry_time, exit_time,
-                     duration_seconds, exit_reason, notes)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    position_id,
-                    position['user_id'],
-                    position['symbol'],
-                    side,
-                    entry_price,
-                    exit_price,
-                    quantity,
-                    size_usd,
-                    entry_fee,
-                    exit_fee,
-                    total_fees,
-                    gross_profit,
-                    net_profit,
-                    profit_pct,
-                    position['entry_time'],
-                    exit_time.isoformat(),
-                    duration,
-                    exit_reason,
-                    position['notes']
-                ))
-
-                # Delete from open positions
-                cursor.execute("""
-                    DELETE FROM open_positions WHERE position_id = ?
-                """, (position_id,))
+            # Delete from open positions
+            cursor.execute(_SQL_DELETE_POSITION, (position_id,))
+            return position['symbol'], net_profit, profit_pct
 
-                profit_emoji = "🟢" if net_profit > 0 else "🔴" if net_profit < 0 else "⚪"
-                logger.info(f"{profit_emoji} Position closed: {position['symbol']} "
-                           f"P&L: ${net_profit:.2f} ({profit_pct:+.2f}%)")
+        try:
+            closed = self._write(_close)
+            if closed is None:
+                logger.warning(f"Position {position_id} not found")
+                return False
 
-                return True
+            symbol, net_profit, profit_pct = closed
+            profit_emoji = "🟢" if net_profit > 0 else "🔴" if net_profit < 0 else "⚪"
+            logger.info(f"{profit_emoji} Position closed: {symbol} "
+                       f"P&L: ${net_profit:.2f} ({profit_pct:+.2f}%)")
+
+            return True
 
         except Exception as e:
             logger.error(f"Error closing position: {e}")
@@ -573,7 +853,7 @@ class TradeLedgerDB:
         Returns:
             List of open position dictionaries
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
 
             query = "SELECT * FROM open_positions WHERE 1=1"
@@ -611,7 +891,7 @@ class TradeLedgerDB:
         Returns:
             List of completed trade dictionaries
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
 
             query = "SELECT * FROM completed_trades WHERE 1=1"
@@ -644,7 +924,7 @@ class TradeLedgerDB:
         Returns:
             List of transaction dictionaries
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
 
             query = "SELECT * FROM trade_ledger WHERE 1=1"
@@ -694,7 +974,7 @@ class TradeLedgerDB:
         # Use validated table name
         safe_table = valid_tables[table]
 
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
 
             # Build query with parameterized user filter
@@ -729,7 +1009,7 @@ class TradeLedgerDB:
         Returns:
             Dictionary with stats
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
 
             # Build user filter
@@ -797,31 +1077,55 @@ class TradeLedgerDB:
         Returns:
             Record ID
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO copy_trade_map
-                (platform_trade_id, platform_user_id, master_symbol, master_side,
-                 master_order_id, master_timestamp, user_id, user_status,
-                 user_order_id, user_error, user_size)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                platform_trade_id,
-                platform_user_id,
-                master_symbol,
-                master_side,
-                master_order_id,
-                datetime.now().isoformat(),
-                user_id,
-                user_status,
-                user_order_id,
-                user_error,
-                user_size
-            ))
+        params = (
+            platform_trade_id,
+            platform_user_id,
+            master_symbol,
+            master_side,
+            master_order_id,
+            datetime.now().isoformat(),
+            user_id,
+            user_status,
+            user_order_id,
+            user_error,
+            user_size
+        )
+        record_id = self._write(lambda cursor: cursor.execute(_SQL_INSERT_COPY_TRADE, params).lastrowid)
+        logger.info(f"📊 Copy trade recorded: {platform_trade_id} → {user_id} ({user_status})")
+        return record_id
+
+    def record_copy_trades(self, records: List[Dict]) -> int:
+        """
+        Record many copy trade executions in one write (one per follower of a broadcast)
+
+        Args:
+            records: Dicts with the keyword arguments of record_copy_trade()
 
-            record_id = cursor.lastrowid
-            logger.info(f"📊 Copy trade recorded: {platform_trade_id} → {user_id} ({user_status})")
-            return record_id
+        Returns:
+            Number of records written
+        """
+        if not records:
+            return 0
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                r['platform_trade_id'],
+                r.get('platform_user_id', 'platform'),
+                r['master_symbol'],
+                r['master_side'],
+                r.get('master_order_id'),
+                now,
+                r.get('user_id'),
+                r.get('user_status'),
+                r.get('user_order_id'),
+                r.get('user_error'),
+                r.get('user_size'),
+            )
+            for r in records
+        ]
+        self._write(lambda cursor: cursor.executemany(_SQL_INSERT_COPY_TRADE, rows))
+        logger.info(f"📊 Copy trades recorded: {records[0]['platform_trade_id']} → {len(rows)} user(s)")
+        return len(rows)
 
     def get_copy_trade_map(self, platform_trade_id: str = None) -> List[Dict]:
         """
@@ -833,7 +1137,7 @@ class TradeLedgerDB:
         Returns:
             List of copy trade execution records
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
 
             if platform_trade_id:
@@ -867,7 +1171,7 @@ class TradeLedgerDB:
         Returns:
             Dictionary with execution summary
         """
-        with self._get_connection() as conn:
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
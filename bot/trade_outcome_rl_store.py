@@ -8,8 +8,9 @@ reinforcement-learning loop that improves future decisions.
 What it does
 -------------
 1. **Persistent JSONL log** – every closed trade is appended to
-   ``data/trade_outcomes.jsonl`` in newline-delimited JSON format.  The log
-   survives restarts and can be replayed or analysed off-line.
+   ``data/trade_outcomes.jsonl`` in newline-delimited JSON format through
+   the shared batched writer (``event_log``).  The log survives restarts and
+   can be replayed or analysed off-line.
 
 2. **Reward computation** – a normalised scalar reward in [-1, +1] is derived
    from the trade's return percentage, holding time, and win/loss status.
@@ -69,6 +70,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    from bot.event_log import event_stream
+except ImportError:
+    from event_log import event_stream  # type: ignore[import]
+
 logger = logging.getLogger("nija.trade_outcome_rl_store")
 
 # ---------------------------------------------------------------------------
@@ -404,15 +410,16 @@ class TradeOutcomeRLStore:
         )
 
     def _append_to_log(self, outcome: TradeOutcome) -> None:
-        """Append outcome to the persistent JSONL log."""
+        """Queue outcome for the persistent JSONL log (batched event-log writer)."""
         try:
-            with open(LOG_FILE, "a") as f:
-                f.write(json.dumps(outcome.to_dict()) + "\n")
+            if not event_stream(LOG_FILE).append(outcome.to_dict()):
+                logger.error("Trade outcome log queue full - outcome not persisted")
         except Exception as exc:
             logger.error("Failed to write trade outcome to JSONL: %s", exc)
 
     def _replay_log(self) -> None:
         """Replay the JSONL log into in-memory analytics on startup."""
+        event_stream(LOG_FILE).flush()
         if not LOG_FILE.exists():
             return
         try:
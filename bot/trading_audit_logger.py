@@ -14,6 +14,10 @@ Audit Log Features:
 - Profit proven milestone tracking
 - Risk control decisions
 
+Appends go through the shared batched event-log writer (see ``event_log``),
+one compact JSON object per line; ``query_events`` flushes pending records
+before reading.
+
 Log files are designed to be:
 1. Machine-readable (structured JSON)
 2. Tamper-evident (checksums)
@@ -35,6 +39,11 @@ from dataclasses import dataclass, asdict, field
 from enum import Enum
 import threading
 
+try:
+    from bot.event_log import event_stream
+except ImportError:
+    from event_log import event_stream  # type: ignore[import]
+
 logger = logging.getLogger("nija.audit_logger")
 
 
@@ -184,6 +193,16 @@ class AuditLogger:
         self.profit_proven_log_file = self.log_dir / "profit_proven.jsonl"
         self.risk_control_log_file = self.log_dir / "risk_control.jsonl"
         self.system_log_file = self.log_dir / "system.jsonl"
+        self._streams = {
+            path: event_stream(path)
+            for path in (
+                self.trade_log_file,
+                self.position_log_file,
+                self.profit_proven_log_file,
+                self.risk_control_log_file,
+                self.system_log_file,
+            )
+        }
         
         # Thread safety
         self._lock = threading.Lock()
@@ -250,9 +269,7 @@ class AuditLogger:
         # Write to appropriate log file
         log_file = self._get_log_file(event_type)
         
-        with self._lock:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(entry.to_json() + '\n')
+        self._streams[log_file].append(entry.to_dict())
         
         # Also log to standard logger for immediate visibility
         logger.info(f"AUDIT [{event_type.value}] {user_id}: {entry.event_id}")
@@ -501,6 +518,7 @@ class AuditLogger:
         
         # Search log files
         for log_file in log_files:
+            self._streams[log_file].flush()
             if not log_file.exists():
                 continue
             
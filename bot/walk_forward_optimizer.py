@@ -20,19 +20,35 @@ Common workflow
     4. Roll the window forward and repeat.
     5. Select the parameter set that generalises best across windows.
 
+Parallel mode
+    Both optimisers accept ``workers``, ``seed`` and ``checkpoint_path`` in
+    their config and a ``progress_callback`` argument to ``run*()``.  With
+    ``workers > 1`` every window × genome (or grid point) evaluation is
+    distributed over a process pool that reads the price data from shared
+    memory (see :mod:`walk_forward_parallel`).  Results are identical to the
+    serial run for the same ``seed``; ``checkpoint_path`` lets an interrupted
+    run resume without re-evaluating finished work.
+
 Author: NIJA Trading Systems
 Version: 1.1
 Date: January 29, 2026 (updated March 2026 – SimpleWalkForwardOptimizer added)
 """
 
 import itertools
+import random
 import pandas as pd
 import numpy as np
-from typing import Any, Dict, List, Optional, Callable
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
 
+try:
+    from bot.walk_forward_parallel import WFOEvaluator, WFOProgress, task_key
+except ImportError:
+    from walk_forward_parallel import WFOEvaluator, WFOProgress, task_key
+
 # Import genetic evolution engine (optional – only needed for WalkForwardOptimizer)
 try:
     from bot.meta_ai.genetic_evolution import GeneticEvolution, StrategyGenome
@@ -53,6 +69,52 @@ except ImportError:
 logger = logging.getLogger("nija.walk_forward")
 
 
+def _iter_windows(
+    start_date: datetime,
+    end_date: datetime,
+    train_days: int,
+    test_days: int,
+    step_days: int,
+) -> Iterator[Tuple[int, datetime, datetime, datetime, datetime]]:
+    """Yield ``(window_id, train_start, train_end, test_start, test_end)``."""
+    window_id = 0
+    train_start = start_date
+    while True:
+        train_end = train_start + timedelta(days=train_days)
+        test_end = train_end + timedelta(days=test_days)
+        if test_end > end_date:
+            return
+        yield window_id, train_start, train_end, train_end, test_end
+        window_id += 1
+        train_start += timedelta(days=step_days)
+
+
+class _WindowRNG:
+    """
+    Private ``random`` / ``numpy.random`` stream for one window's GA.
+
+    GeneticEvolution draws from the global generators; swapping this
+    window's state in around every GA step makes each window's evolution
+    depend only on ``seed + window_id``, whatever order windows run in.
+    """
+
+    def __init__(self, seed: int):
+        self._py_state = random.Random(seed).getstate()
+        self._np_state = np.random.RandomState(seed).get_state()
+
+    @contextmanager
+    def active(self):
+        saved = random.getstate(), np.random.get_state()
+        random.setstate(self._py_state)
+        np.random.set_state(self._np_state)
+        try:
+            yield
+        finally:
+            self._py_state, self._np_state = random.getstate(), np.random.get_state()
+            random.setstate(saved[0])
+            np.random.set_state(saved[1])
+
+
 @dataclass
 class WalkForwardWindow:
     """A single walk-forward optimization window"""
@@ -162,6 +224,11 @@ class WalkForwardOptimizer:
         
         # Parameter stability tracking
         self.stability_lookback = self.config.get('stability_lookback', 5)  # windows
+
+        # Execution: process-pool workers, GA seed, resumable checkpoint
+        self.workers = int(self.config.get('workers', 1))
+        self.seed = self.config.get('seed')
+        self.checkpoint_path = self.config.get('checkpoint_path')
         
         # Results
         self.results: Optional[WalkForwardResult] = None
@@ -178,6 +245,7 @@ class WalkForwardOptimizer:
         backtest_function: Callable[[Dict, pd.DataFrame], Dict],
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        progress_callback: Optional[Callable[[WFOProgress], None]] = None,
     ) -> WalkForwardResult:
         """
         Run walk-forward optimization
@@ -187,6 +255,8 @@ class WalkForwardOptimizer:
             backtest_function: Function(parameters, data) -> metrics
             start_date: Start of walk-forward period (default: first date in data)
             end_date: End of walk-forward period (default: last date in data)
+            progress_callback: Optional ``fn(WFOProgress)`` called as evaluations
+                finish (parallel / checkpointed mode only)
         
         Returns:
             WalkForwardResult with all windows and aggregated metrics
@@ -198,6 +268,12 @@ class WalkForwardOptimizer:
             end_date = data.index[-1]
         
         logger.info(f"🚀 Starting walk-forward optimization: {start_date} to {end_date}")
+
+        if self.workers > 1 or self.checkpoint_path or progress_callback is not None:
+            windows = self._run_evaluated(data, backtest_function, start_date, end_date, progress_callback)
+            result = self._aggregate_results(windows)
+            self.results = result
+            return result
         
         windows = []
         window_id = 0
@@ -243,7 +319,7 @@ class WalkForwardOptimizer:
             
             # Run genetic optimization on training data
             logger.info(f"   🧬 Running genetic optimization on training data...")
-            best_genome = self._optimize_window(train_data, backtest_function)
+            best_genome = self._optimize_window(train_data, backtest_function, window_id)
             
             if best_genome is None:
                 logger.warning(f"   ⚠️  Optimization failed for window {window_id}")
@@ -295,6 +371,7 @@ class WalkForwardOptimizer:
         self,
         train_data: pd.DataFrame,
         backtest_function: Callable,
+        window_id: int = 0,
     ) -> Optional[StrategyGenome]:
         """
         Optimize parameters for a single window using genetic algorithm
@@ -302,12 +379,20 @@ class WalkForwardOptimizer:
         Args:
             train_data: Training data for this window
             backtest_function: Backtest function
+            window_id: Window index (selects the seeded RNG stream)
         
         Returns:
             Best genome found
         """
-        # Initialize population
-        self.genetic_engine.initialize_population(PARAMETER_SEARCH_SPACE)
+        if self.seed is not None:
+            rng = _WindowRNG(int(self.seed) + window_id)
+            step = rng.active
+        else:
+            step = nullcontext
+
+        # Initialize population (PARAMETER_SEARCH_SPACE is read by the engine)
+        with step():
+            self.genetic_engine.initialize_population()
         
         # Fitness evaluation function
         def evaluate_fitness(genome: StrategyGenome) -> float:
@@ -323,7 +408,8 @@ class WalkForwardOptimizer:
                     genome.fitness = evaluate_fitness(genome)
             
             # Evolve to next generation
-            self.genetic_engine.evolve()
+            with step():
+                self.genetic_engine.evolve_generation()
             
             if generation % 5 == 0:
                 best = self.genetic_engine.best_genome
@@ -331,6 +417,102 @@ class WalkForwardOptimizer:
         
         return self.genetic_engine.best_genome
     
+    def _run_evaluated(
+        self,
+        data: pd.DataFrame,
+        backtest_function: Callable,
+        start_date: datetime,
+        end_date: datetime,
+        progress_callback: Optional[Callable[[WFOProgress], None]],
+    ) -> List[WalkForwardWindow]:
+        """
+        Evolve every window's population in lock-step, one generation at a
+        time, evaluating all windows' unevaluated genomes as one batch on the
+        :class:`WFOEvaluator` pool.  Each window uses its own GeneticEvolution
+        and RNG stream, so the result matches the serial run for a given seed.
+        """
+        genetic_config = self.config.get('genetic_config', GENETIC_CONFIG)
+        generations = self.config.get('generations', 20)
+
+        states = []
+        for window_id, train_start, train_end, test_start, test_end in _iter_windows(
+            start_date, end_date, self.train_window_days, self.test_window_days, self.step_days
+        ):
+            window = WalkForwardWindow(
+                window_id=window_id,
+                train_start=train_start,
+                train_end=train_end,
+                test_start=test_start,
+                test_end=test_end,
+            )
+            engine = GeneticEvolution(genetic_config)
+            rng = _WindowRNG(int(self.seed) + window_id) if self.seed is not None else None
+            with rng.active() if rng else nullcontext():
+                engine.initialize_population()
+            states.append((window, engine, rng))
+        logger.info(f"✅ Planned {len(states)} walk-forward windows")
+
+        with WFOEvaluator(
+            data,
+            backtest_function,
+            workers=self.workers,
+            checkpoint_path=self.checkpoint_path,
+            progress_callback=progress_callback,
+            mp_context=self.config.get('mp_context'),
+        ) as evaluator:
+            evaluator.plan(len(states) * (generations * genetic_config['population_size'] + 1))
+
+            for generation in range(generations):
+                tasks, pending = [], []
+                for window, engine, _ in states:
+                    for genome in engine.population:
+                        if genome.fitness == 0.0:  # Not yet evaluated
+                            key = task_key(window.train_start, window.train_end, genome.parameters)
+                            tasks.append((key, window.train_start, window.train_end, genome.parameters))
+                            pending.append((genome, key))
+                results = evaluator.evaluate(tasks)
+                for genome, key in pending:
+                    metrics, error = results[key]
+                    if error:
+                        logger.debug(f"      Genome eval failed: {error}")
+                    genome.fitness = self._calculate_fitness(metrics) if metrics is not None else 0.0
+
+                for _, engine, rng in states:
+                    with rng.active() if rng else nullcontext():
+                        engine.evolve_generation()
+
+            # Out-of-sample evaluation of each window's best genome; the
+            # in-sample metrics are already in the evaluator's memo.
+            finals = [(w, e.best_genome) for w, e, _ in states]
+            tasks = []
+            for window, best in finals:
+                if best is None:
+                    continue
+                for start, end in ((window.train_start, window.train_end), (window.test_start, window.test_end)):
+                    tasks.append((task_key(start, end, best.parameters), start, end, best.parameters))
+            results = evaluator.evaluate(tasks)
+
+        windows = []
+        for window, best in finals:
+            if best is None:
+                logger.warning(f"   ⚠️  Optimization failed for window {window.window_id}")
+                continue
+            train_metrics, train_err = results[task_key(window.train_start, window.train_end, best.parameters)]
+            test_metrics, test_err = results[task_key(window.test_start, window.test_end, best.parameters)]
+            if train_err or test_err:
+                logger.warning(f"   ⚠️  Evaluation failed for window {window.window_id}: {train_err or test_err}")
+                continue
+            window.best_genome = best
+            window.train_metrics = train_metrics
+            window.test_metrics = test_metrics
+            window.train_fitness = self._calculate_fitness(train_metrics)
+            window.test_fitness = self._calculate_fitness(test_metrics)
+            window.efficiency_ratio = (
+                window.test_fitness / window.train_fitness if window.train_fitness > 0 else 0.0
+            )
+            windows.append(window)
+        return windows
+
     def _calculate_fitness(self, metrics: Dict) -> float:
         """
         Calculate fitness score from backtest metrics
@@ -615,6 +797,8 @@ class SimpleWalkForwardOptimizer:
                 - ``step_days``           (int, default 30)
                 - ``efficiency_threshold``(float, default 0.70)
                 - ``fitness_weights``     (dict, default below)
+                - ``workers``             (int, default 1 — serial)
+                - ``checkpoint_path``     (str, optional JSONL results checkpoint)
         """
         self.param_grid = param_grid
         self.config = config or {}
@@ -634,6 +818,9 @@ class SimpleWalkForwardOptimizer:
         }
         self.fitness_weights = self.config.get("fitness_weights", default_weights)
 
+        self.workers = int(self.config.get("workers", 1))
+        self.checkpoint_path = self.config.get("checkpoint_path")
+
         # Compute grid size once for logging; combinations are generated lazily
         # during each grid search so that large param spaces don't pre-allocate
         # memory unnecessarily.
@@ -657,6 +844,7 @@ class SimpleWalkForwardOptimizer:
         backtest_fn: Callable[[Dict[str, Any], pd.DataFrame], Dict[str, float]],
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        progress_callback: Optional[Callable[[WFOProgress], None]] = None,
     ) -> "SimpleWFOResult":
         """
         Execute the walk-forward optimisation.
@@ -669,6 +857,8 @@ class SimpleWalkForwardOptimizer:
                 ``max_drawdown``.
             start_date: Start of the optimisation period (defaults to first row).
             end_date:   End   of the optimisation period (defaults to last row).
+            progress_callback: Optional ``fn(WFOProgress)`` called as grid
+                evaluations finish (parallel / checkpointed mode only).
 
         Returns:
             :class:`SimpleWFOResult` containing per-window results and the
@@ -684,6 +874,11 @@ class SimpleWalkForwardOptimizer:
             f"{self._grid_size:,} combinations/window"
         )
 
+        if self.workers > 1 or self.checkpoint_path or progress_callback is not None:
+            return self._aggregate(
+                self._run_evaluated(data, backtest_fn, start_date, end_date, progress_callback)
+            )
+
         windows: List[SimpleWFOWindow] = []
         window_id = 0
         current_train_start = start_date
@@ -760,6 +955,97 @@ class SimpleWalkForwardOptimizer:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _run_evaluated(
+        self,
+        data: pd.DataFrame,
+        backtest_fn: Callable,
+        start_date: datetime,
+        end_date: datetime,
+        progress_callback: Optional[Callable[[WFOProgress], None]],
+    ) -> List[SimpleWFOWindow]:
+        """
+        Grid search every window at once on a :class:`WFOEvaluator`, then
+        evaluate each window's winner out-of-sample.  Winners are picked in
+        ``itertools.product`` order, so ties resolve exactly as in the serial
+        :meth:`_grid_search`.
+        """
+        keys = list(self.param_grid.keys())
+        combos = [dict(zip(keys, values)) for values in itertools.product(*self.param_grid.values())]
+
+        with WFOEvaluator(
+            data,
+            backtest_fn,
+            workers=self.workers,
+            checkpoint_path=self.checkpoint_path,
+            progress_callback=progress_callback,
+            mp_context=self.config.get("mp_context"),
+        ) as evaluator:
+            specs = []
+            for spec in _iter_windows(
+                start_date, end_date, self.train_window_days, self.test_window_days, self.step_days
+            ):
+                _, train_start, train_end, test_start, test_end = spec
+                train_rows = evaluator.bounds(train_start, train_end)
+                test_rows = evaluator.bounds(test_start, test_end)
+                if train_rows[0] >= train_rows[1] or test_rows[0] >= test_rows[1]:
+                    continue
+                specs.append(spec)
+            evaluator.plan(len(specs) * (len(combos) + 1))
+
+            tasks = [
+                (task_key(train_start, train_end, params), train_start, train_end, params)
+                for _, train_start, train_end, _, _ in specs
+                for params in combos
+            ]
+            results = evaluator.evaluate(tasks)
+
+            winners = []
+            for spec in specs:
+                window_id, train_start, train_end, _, _ = spec
+                best_params: Dict[str, Any] = {}
+                best_score: float = -np.inf
+                for params in combos:
+                    metrics, error = results[task_key(train_start, train_end, params)]
+                    if error:
+                        logger.debug(f"    Grid eval failed for {params}: {error}")
+                        continue
+                    score = self._score(metrics)
+                    if score > best_score:
+                        best_score = score
+                        best_params = params.copy()
+                if not best_params:
+                    logger.warning(f"    ⚠️ No valid params found in window {window_id} – skipping")
+                    continue
+                winners.append((spec, best_params, best_score))
+
+            results = evaluator.evaluate([
+                (task_key(spec[3], spec[4], params), spec[3], spec[4], params)
+                for spec, params, _ in winners
+            ])
+
+        windows: List[SimpleWFOWindow] = []
+        for (window_id, train_start, train_end, test_start, test_end), best_params, train_score in winners:
+            test_metrics, error = results[task_key(test_start, test_end, best_params)]
+            if error:
+                logger.debug(f"    Out-of-sample eval failed for window {window_id}: {error}")
+                continue
+            test_score = self._score(test_metrics)
+            efficiency = test_score / train_score if train_score > 0 else 0.0
+            windows.append(
+                SimpleWFOWindow(
+                    window_id=window_id,
+                    train_start=train_start,
+                    train_end=train_end,
+                    test_start=test_start,
+                    test_end=test_end,
+                    best_params=best_params,
+                    train_score=train_score,
+                    test_score=test_score,
+                    efficiency_ratio=efficiency,
+                )
+            )
+        return windows
+
     def _grid_search(
         self,
         data: pd.DataFrame,
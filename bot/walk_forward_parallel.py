@@ -0,0 +1,339 @@
+"""
+NIJA Walk-Forward Parallel Evaluation
+======================================
+
+Process-pool backend for :mod:`walk_forward_optimizer`.
+
+A walk-forward run is thousands of independent ``backtest_fn(params, slice)``
+calls — every genome / grid point of every window.  :class:`WFOEvaluator`
+fans those calls out over a :class:`~concurrent.futures.ProcessPoolExecutor`:
+
+* **Shared price data** — the numeric columns and the DatetimeIndex are
+  published once into a :mod:`multiprocessing.shared_memory` segment.  Each
+  worker attaches to it at start-up and rebuilds a read-only DataFrame over
+  the segment (no copy), so a window is just ``frame.iloc[start:stop]``.
+  Non-numeric columns are dropped from the shared frame.
+* **Deterministic results** — results are keyed by
+  ``(window range, params)`` and assembled in submission order, never in
+  completion order, so the answer does not depend on scheduling.
+* **Checkpoint / resume** — every finished evaluation is appended to a JSONL
+  checkpoint.  A restarted run with the same checkpoint path reuses those
+  results and only evaluates what is missing.
+* **Progress** — an optional callback receives :class:`WFOProgress`
+  (done / total / elapsed / ETA) after every completed chunk.
+
+``backtest_fn`` must be picklable (a module-level function) and must return a
+picklable metrics dict.  With ``workers <= 1`` tasks run in-process on the
+original DataFrame, which still gives checkpointing and progress reporting.
+
+Author: NIJA Trading Systems
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from multiprocessing import get_context, shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("nija.walk_forward.parallel")
+
+# (key, train/test start, end, params)
+WFOTask = Tuple[str, Any, Any, Dict[str, Any]]
+# key -> (metrics or None, error message or None)
+WFOResults = Dict[str, Tuple[Optional[Dict[str, Any]], Optional[str]]]
+
+
+@dataclass
+class WFOProgress:
+    """Progress snapshot passed to the ``progress_callback``."""
+    done: int
+    total: int
+    elapsed_s: float
+    cached: int = 0
+
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def eta_s(self) -> Optional[float]:
+        """Seconds remaining, extrapolated from evaluations run in this session."""
+        computed = self.done - self.cached
+        if computed <= 0:
+            return None
+        return self.elapsed_s / computed * max(0, self.total - self.done)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serialisable")
+
+
+def task_key(start: Any, end: Any, params: Dict[str, Any]) -> str:
+    """Stable identity of one evaluation: the data range plus the parameter set."""
+    return f"{pd.Timestamp(start).isoformat()}|{pd.Timestamp(end).isoformat()}|" + json.dumps(
+        params, sort_keys=True, default=_json_default
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared price frame
+# ---------------------------------------------------------------------------
+
+class SharedPriceFrame:
+    """Numeric columns + DatetimeIndex of *data* published in one shared-memory segment."""
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        if not isinstance(data.index, pd.DatetimeIndex):
+            raise ValueError("walk-forward data must have a DatetimeIndex")
+        numeric = data.select_dtypes(include=[np.number])
+        dropped = [c for c in data.columns if c not in numeric.columns]
+        if dropped:
+            logger.warning(f"   Shared price frame drops non-numeric columns: {dropped}")
+
+        values = numeric.to_numpy(dtype=np.float64)
+        index = data.index.as_unit("ns").asi8 if hasattr(data.index, "as_unit") else data.index.asi8
+        rows, cols = values.shape
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, rows * (cols + 1) * 8))
+        np.ndarray((rows,), dtype=np.int64, buffer=self._shm.buf)[:] = index
+        np.ndarray((rows, cols), dtype=np.float64, buffer=self._shm.buf, offset=rows * 8)[:] = values
+        self.spec = {
+            "name": self._shm.name,
+            "rows": rows,
+            "columns": list(numeric.columns),
+            "tz": str(data.index.tz) if data.index.tz is not None else None,
+        }
+
+    def close(self) -> None:
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def attach_shared_frame(spec: Dict[str, Any]) -> Tuple[shared_memory.SharedMemory, pd.DataFrame]:
+    """Attach to a :class:`SharedPriceFrame` and return a read-only zero-copy DataFrame."""
+    shm = shared_memory.SharedMemory(name=spec["name"])
+    rows, cols = spec["rows"], len(spec["columns"])
+    index = np.ndarray((rows,), dtype=np.int64, buffer=shm.buf)
+    values = np.ndarray((rows, cols), dtype=np.float64, buffer=shm.buf, offset=rows * 8)
+    values.flags.writeable = False
+    dt_index = pd.DatetimeIndex(index.view("M8[ns]"))
+    if spec["tz"]:
+        dt_index = dt_index.tz_localize("UTC").tz_convert(spec["tz"])
+    frame = pd.DataFrame(values, index=dt_index, columns=spec["columns"], copy=False)
+    return shm, frame
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(spec: Dict[str, Any], backtest_fn: Callable) -> None:
+    shm, frame = attach_shared_frame(spec)
+    _WORKER.update(shm=shm, frame=frame, backtest_fn=backtest_fn)
+
+
+def _run_chunk(chunk: Sequence[Tuple[str, int, int, Dict[str, Any]]]) -> List[Tuple[str, Any, Optional[str]]]:
+    frame = _WORKER["frame"]
+    backtest_fn = _WORKER["backtest_fn"]
+    out = []
+    for key, start, stop, params in chunk:
+        try:
+            out.append((key, backtest_fn(params, frame.iloc[start:stop]), None))
+        except Exception as exc:
+            out.append((key, None, f"{type(exc).__name__}: {exc}"))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Checkpoint
+# ---------------------------------------------------------------------------
+
+class WFOCheckpoint:
+    """Append-only JSONL store of finished evaluations (``{"key", "metrics", "error"}``)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._results: WFOResults = {}
+        try:
+            with open(path, encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        rec = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn last line from an interrupted write
+                    self._results[rec["key"]] = (rec.get("metrics"), rec.get("error"))
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if self._results:
+            logger.info(f"   ♻️  Resuming from checkpoint {path}: {len(self._results):,} evaluations")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._results
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        return self._results[key]
+
+    def record(self, batch: Sequence[Tuple[str, Any, Optional[str]]]) -> None:
+        with open(self.path, "a", encoding="utf-8") as fh:
+            for key, metrics, error in batch:
+                self._results[key] = (metrics, error)
+                fh.write(json.dumps({"key": key, "metrics": metrics, "error": error},
+                                    default=_json_default) + "\n")
+
+
+# ---------------------------------------------------------------------------
+# Evaluator
+# ---------------------------------------------------------------------------
+
+class WFOEvaluator:
+    """
+    Evaluate ``backtest_fn(params, data[start:end])`` tasks, in parallel when
+    ``workers > 1``.  Use as a context manager so the pool and the shared
+    memory segment are always released.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        backtest_fn: Callable[[Dict[str, Any], pd.DataFrame], Dict[str, Any]],
+        workers: int = 1,
+        checkpoint_path: Optional[str] = None,
+        progress_callback: Optional[Callable[[WFOProgress], None]] = None,
+        chunksize: int = 0,
+        mp_context: Optional[str] = None,
+    ) -> None:
+        self.data = data
+        self.backtest_fn = backtest_fn
+        self.workers = max(1, int(workers or 1))
+        self.checkpoint = WFOCheckpoint(checkpoint_path) if checkpoint_path else None
+        self.progress_callback = progress_callback
+        self.chunksize = int(chunksize)
+        self.mp_context = mp_context
+        self.total = 0
+        self.done = 0
+        self.cached = 0
+        self._started = 0.0
+        self._shared: Optional[SharedPriceFrame] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._index = data.index
+        self._memo: WFOResults = {}
+
+    def __enter__(self) -> "WFOEvaluator":
+        self._started = time.monotonic()
+        if self.workers > 1:
+            self._shared = SharedPriceFrame(self.data)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context(self.mp_context) if self.mp_context else None,
+                initializer=_init_worker,
+                initargs=(self._shared.spec, self.backtest_fn),
+            )
+            logger.info(f"   ⚙️  Walk-forward pool: {self.workers} workers")
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def plan(self, evaluations: int) -> None:
+        """Add *evaluations* to the expected total used for progress / ETA."""
+        self.total += int(evaluations)
+
+    def bounds(self, start: Any, end: Any) -> Tuple[int, int]:
+        """Row positions of ``start <= index < end`` (index must be sorted)."""
+        return (
+            int(self._index.searchsorted(start, side="left")),
+            int(self._index.searchsorted(end, side="left")),
+        )
+
+    def evaluate(self, tasks: Sequence[WFOTask]) -> WFOResults:
+        """
+        Run *tasks* and return ``key -> (metrics, error)``.
+
+        Tasks are deduplicated by key, and results already seen by this
+        evaluator or stored in the checkpoint are reused without re-running.
+        """
+        results: WFOResults = {}
+        pending: List[Tuple[str, int, int, Dict[str, Any]]] = []
+        for key, start, end, params in tasks:
+            if key in results:
+                continue
+            if key in self._memo:
+                results[key] = self._memo[key]
+                continue
+            if self.checkpoint is not None and key in self.checkpoint:
+                results[key] = self.checkpoint.get(key)
+                self.cached += 1
+                self.done += 1
+                continue
+            results[key] = (None, None)  # placeholder keeps first-seen order
+            i, j = self.bounds(start, end)
+            pending.append((key, i, j, params))
+        if self.cached:
+            self._report()
+        if not pending:
+            return results
+
+        if self._pool is None:
+            for key, i, j, params in pending:
+                try:
+                    item = (key, self.backtest_fn(params, self.data.iloc[i:j]), None)
+                except Exception as exc:
+                    item = (key, None, f"{type(exc).__name__}: {exc}")
+                self._finish([item], results)
+            return results
+
+        size = self.chunksize or max(1, min(64, len(pending) // (self.workers * 4) or 1))
+        futures = {
+            self._pool.submit(_run_chunk, pending[n:n + size])
+            for n in range(0, len(pending), size)
+        }
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._finish(future.result(), results)
+        return results
+
+    def _finish(self, batch: Sequence[Tuple[str, Any, Optional[str]]], results: WFOResults) -> None:
+        for key, metrics, error in batch:
+            results[key] = self._memo[key] = (metrics, error)
+        if self.checkpoint is not None:
+            self.checkpoint.record(batch)
+        self.done += len(batch)
+        self._report()
+
+    def _report(self) -> None:
+        if self.progress_callback is None:
+            return
+        progress = WFOProgress(
+            done=self.done,
+            total=max(self.total, self.done),
+            elapsed_s=time.monotonic() - self._started,
+            cached=self.cached,
+        )
+        try:
+            self.progress_callback(progress)
+        except Exception as exc:
+            logger.debug(f"    Progress callback failed: {exc}")
@@ -0,0 +1,472 @@
+"""
+NIJA Analytics Rollups
+
+Keeps the per-user analytics tables up to date as trades close, so the
+analytics API reads a handful of pre-aggregated rows instead of scanning
+the raw ``trades`` table on every request.
+
+Rollups maintained per closed trade:
+    daily_statistics     (user_id, date)          counts, P&L, fees, gross profit/loss,
+                                                  best/worst trade, total holding time
+    daily_returns        (user_id, date)          sum of trade pnl_percent for the day
+    market_statistics    (user_id, pair)          lifetime counts, P&L, fees, volume
+    strategy_performance (user_id, strategy_name) lifetime counts and P&L
+
+Every update is an ``INSERT ... ON CONFLICT DO UPDATE`` keyed on the unique
+constraints above (PostgreSQL and SQLite).  A trade is folded in at most
+once: its id is inserted into ``trade_rollups`` first and the rollups are
+only touched when that insert is new, so replays, repeated flushes and
+re-running the backfill are no-ops.  A closed trade that is later edited
+is not re-applied; run the backfill with ``--rebuild`` after corrections.
+
+``performance_snapshots`` rows need NAV/equity/cash, which a closed trade
+does not carry, so they stay with the equity writer; the performance
+summary below is derived from the daily rollups instead.
+
+Usage:
+    # Apply automatically on every flush that closes a Trade
+    register_rollup_listener(session_factory)
+
+    # Backfill existing history (resumable, safe to re-run)
+    python -m database.analytics_rollups backfill [--user-id ID] [--batch-size N] [--rebuild]
+
+Author: NIJA Trading Systems
+Version: 1.0
+Date: October 16, 2026
+"""
+
+import argparse
+import logging
+import math
+import sys
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, delete, event, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from database.models import (
+    DailyReturn,
+    DailyStatistic,
+    MarketStatistic,
+    StrategyPerformance,
+    Trade,
+    TradeRollup,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STRATEGY = 'default'
+DEFAULT_BATCH_SIZE = 500
+MAX_PAGE_SIZE = 366
+
+# Analytics API periods → days (None = all history)
+PERIOD_DAYS: Dict[str, Optional[int]] = {'7d': 7, '30d': 30, '90d': 90, '1y': 365, 'all': None}
+
+_ZERO = Decimal('0')
+
+
+# ========================================
+# Upserts
+# ========================================
+
+def _dialect_insert(conn):
+    """Return the dialect's INSERT construct (needed for ON CONFLICT)"""
+    name = conn.dialect.name
+    if name == 'postgresql':
+        return postgresql.insert
+    if name == 'sqlite':
+        return sqlite.insert
+    raise NotImplementedError(f"Analytics rollups need PostgreSQL or SQLite (got {name})")
+
+
+def _greatest(conn, a, b):
+    return func.greatest(a, b) if conn.dialect.name == 'postgresql' else func.max(a, b)
+
+
+def _least(conn, a, b):
+    return func.least(a, b) if conn.dialect.name == 'postgresql' else func.min(a, b)
+
+
+def _dec(value: Any) -> Decimal:
+    if value is None:
+        return _ZERO
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def is_rollup_ready(trade: Trade) -> bool:
+    """True when *trade* is closed and carries what the rollups need"""
+    return trade.status == 'closed' and trade.closed_at is not None and trade.id is not None
+
+
+def _upsert(conn, model, keys: List[str], values: Dict[str, Any], set_: Callable) -> None:
+    table = model.__table__
+    stmt = _dialect_insert(conn)(table).values(**values)
+    conn.execute(stmt.on_conflict_do_update(index_elements=keys, set_=set_(table.c, stmt.excluded)))
+
+
+def apply_closed_trade(session: Session, trade: Trade, strategy_name: Optional[str] = None) -> bool:
+    """
+    Fold one closed trade into all rollups (idempotent)
+
+    Args:
+        session: Active session; the rollup writes join its transaction
+        trade: Closed, flushed Trade
+        strategy_name: Strategy to credit (default: ``trade.strategy`` if present, else 'default')
+
+    Returns:
+        True if the trade was applied, False if it was not closed or already applied
+    """
+    if not is_rollup_ready(trade):
+        return False
+
+    conn = session.connection()
+    marker = _dialect_insert(conn)(TradeRollup.__table__).values(trade_id=trade.id, user_id=trade.user_id)
+    if conn.execute(marker.on_conflict_do_nothing(index_elements=['trade_id'])).rowcount == 0:
+        return False
+
+    pnl = _dec(trade.pnl)
+    fees = _dec(trade.fees)
+    win = 1 if pnl > 0 else 0
+    loss = 1 if pnl < 0 else 0
+    day = trade.closed_at.date()
+    duration = 0
+    if trade.opened_at is not None:
+        duration = max(0, int((trade.closed_at - trade.opened_at).total_seconds()))
+    volume = _dec(trade.size) * _dec(trade.entry_price)
+    strategy = strategy_name or getattr(trade, 'strategy', None) or DEFAULT_STRATEGY
+
+    _upsert(conn, DailyStatistic, ['user_id', 'date'], dict(
+        user_id=trade.user_id, date=day, total_trades=1, winning_trades=win, losing_trades=loss,
+        total_pnl=pnl, total_fees=fees,
+        gross_profit=pnl if pnl > 0 else _ZERO, gross_loss=pnl if pnl < 0 else _ZERO,
+        best_trade=pnl, worst_trade=pnl, total_duration_seconds=duration,
+    ), lambda c, x: {
+        'total_trades': c.total_trades + x.total_trades,
+        'winning_trades': c.winning_trades + x.winning_trades,
+        'losing_trades': c.losing_trades + x.losing_trades,
+        'total_pnl': c.total_pnl + x.total_pnl,
+        'total_fees': c.total_fees + x.total_fees,
+        'gross_profit': c.gross_profit + x.gross_profit,
+        'gross_loss': c.gross_loss + x.gross_loss,
+        'best_trade': _greatest(conn, func.coalesce(c.best_trade, x.best_trade), x.best_trade),
+        'worst_trade': _least(conn, func.coalesce(c.worst_trade, x.worst_trade), x.worst_trade),
+        'total_duration_seconds': c.total_duration_seconds + x.total_duration_seconds,
+    })
+
+    _upsert(conn, DailyReturn, ['user_id', 'date'], dict(
+        user_id=trade.user_id, date=day, return_pct=_dec(trade.pnl_percent),
+    ), lambda c, x: {'return_pct': c.return_pct + x.return_pct})
+
+    _upsert(conn, MarketStatistic, ['user_id', 'pair'], dict(
+        user_id=trade.user_id, pair=trade.pair, total_trades=1, winning_trades=win, losing_trades=loss,
+        total_pnl=pnl, total_fees=fees, total_volume=volume, last_trade_at=trade.closed_at,
+    ), lambda c, x: {
+        'total_trades': c.total_trades + x.total_trades,
+        'winning_trades': c.winning_trades + x.winning_trades,
+        'losing_trades': c.losing_trades + x.losing_trades,
+        'total_pnl': c.total_pnl + x.total_pnl,
+        'total_fees': c.total_fees + x.total_fees,
+        'total_volume': c.total_volume + x.total_volume,
+        'last_trade_at': _greatest(conn, func.coalesce(c.last_trade_at, x.last_trade_at), x.last_trade_at),
+    })
+
+    _upsert(conn, StrategyPerformance, ['user_id', 'strategy_name'], dict(
+        user_id=trade.user_id, strategy_name=strategy, total_trades=1, winning_trades=win,
+        losing_trades=loss, total_pnl=pnl, last_updated=datetime.now(),
+    ), lambda c, x: {
+        'total_trades': c.total_trades + x.total_trades,
+        'winning_trades': c.winning_trades + x.winning_trades,
+        'losing_trades': c.losing_trades + x.losing_trades,
+        'total_pnl': c.total_pnl + x.total_pnl,
+        'last_updated': x.last_updated,
+    })
+    return True
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    """Apply trades closed by this flush (new/dirty still hold the pre-flush state here)"""
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Trade) and is_rollup_ready(obj):
+            # Savepoint: a rollup failure must not roll back the trade write itself;
+            # the trade stays unmarked and the next backfill picks it up.
+            try:
+                with session.connection().begin_nested():
+                    apply_closed_trade(session, obj)
+            except Exception as e:
+                logger.error(f"Rollup update failed for trade {obj.id}: {e}")
+
+
+def register_rollup_listener(target: Any = Session) -> None:
+    """
+    Update the rollups whenever a flush closes a Trade
+
+    Args:
+        target: Session class or sessionmaker to listen on (default: every Session)
+    """
+    if not event.contains(target, 'after_flush', _after_flush):
+        event.listen(target, 'after_flush', _after_flush)
+
+
+# ========================================
+# Backfill
+# ========================================
+
+def _reset(session: Session, user_id: Optional[str]) -> None:
+    """Clear rollups (and their applied-trade markers) for one user or everyone"""
+    def scoped(model):
+        return [model.user_id == user_id] if user_id else []
+
+    for model in (TradeRollup, DailyStatistic, DailyReturn, MarketStatistic):
+        session.execute(delete(model).where(*scoped(model)))
+    # strategy_performance also holds allocation state: zero the counters, keep the rows
+    session.execute(update(StrategyPerformance).where(*scoped(StrategyPerformance)).values(
+        total_trades=0, winning_trades=0, losing_trades=0, total_pnl=0))
+
+
+def backfill(session_scope: Optional[Callable] = None, user_id: Optional[str] = None,
+             batch_size: int = DEFAULT_BATCH_SIZE, rebuild: bool = False) -> int:
+    """
+    Fold every closed, not-yet-applied trade into the rollups
+
+    Walks ``trades`` by primary key (keyset, one transaction per batch), so
+    it can be interrupted and re-run at any time.
+
+    Args:
+        session_scope: Transactional session context manager (default: get_db_session)
+        user_id: Restrict to one user
+        batch_size: Trades per transaction
+        rebuild: Clear the rollups first and recompute them from scratch
+
+    Returns:
+        Number of trades applied
+    """
+    if session_scope is None:
+        from database.db_connection import get_db_session
+        session_scope = get_db_session
+
+    if rebuild:
+        with session_scope() as session:
+            _reset(session, user_id)
+        logger.info(f"Rollups cleared for {user_id or 'all users'}")
+
+    applied = 0
+    last_id = 0
+    while True:
+        with session_scope() as session:
+            query = (
+                select(Trade)
+                .outerjoin(TradeRollup, TradeRollup.trade_id == Trade.id)
+                .where(TradeRollup.trade_id.is_(None), Trade.status == 'closed',
+                       Trade.closed_at.isnot(None), Trade.id > last_id)
+                .order_by(Trade.id)
+                .limit(batch_size)
+            )
+            if user_id:
+                query = query.where(Trade.user_id == user_id)
+            trades = session.scalars(query).all()
+            if not trades:
+                break
+            applied += sum(1 for trade in trades if apply_closed_trade(session, trade))
+            last_id = trades[-1].id
+        logger.info(f"Rollup backfill: {applied} trade(s) applied (last trade id {last_id})")
+    return applied
+
+
+# ========================================
+# Readers (keyset pagination)
+# ========================================
+
+def _float(value: Any) -> float:
+    return float(value) if value is not None else 0.0
+
+
+def _page_size(limit: int) -> int:
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def get_daily_page(session: Session, user_id: str, days: int = 30, limit: int = 50,
+                   cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Daily P&L rows, newest first
+
+    ``return_pct`` is the day's summed trade ``pnl_percent`` (no equity base).
+
+    Args:
+        days: Look-back window in days
+        limit: Page size
+        cursor: ``next_cursor`` from the previous page (ISO date; rows strictly older are returned)
+
+    Returns:
+        Dict with ``data`` (list of day rows) and ``next_cursor`` (None on the last page)
+    """
+    limit = _page_size(limit)
+    since = date.today() - timedelta(days=max(0, days - 1))
+    query = (
+        select(DailyStatistic, DailyReturn.return_pct)
+        .outerjoin(DailyReturn, and_(DailyReturn.user_id == DailyStatistic.user_id,
+                                     DailyReturn.date == DailyStatistic.date))
+        .where(DailyStatistic.user_id == user_id, DailyStatistic.date >= since)
+        .order_by(DailyStatistic.date.desc())
+        .limit(limit + 1)
+    )
+    if cursor:
+        query = query.where(DailyStatistic.date < date.fromisoformat(cursor))
+    rows = session.execute(query).all()
+
+    data = []
+    for stat, return_pct in rows[:limit]:
+        trades = stat.total_trades or 0
+        data.append({
+            'date': stat.date.isoformat(),
+            'pnl': _float(stat.total_pnl),
+            'fees': _float(stat.total_fees),
+            'trades': trades,
+            'winning_trades': stat.winning_trades or 0,
+            'losing_trades': stat.losing_trades or 0,
+            'win_rate': (stat.winning_trades or 0) / trades * 100 if trades else 0.0,
+            'return_pct': _float(return_pct),
+        })
+    next_cursor = data[-1]['date'] if len(rows) > limit else None
+    return {'data': data, 'next_cursor': next_cursor}
+
+
+def get_market_page(session: Session, user_id: str, limit: int = 50,
+                    cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Per-pair breakdown, ordered by pair
+
+    Args:
+        limit: Page size
+        cursor: ``next_cursor`` from the previous page (pair; rows after it are returned)
+
+    Returns:
+        Dict with ``markets`` (list of pair rows) and ``next_cursor`` (None on the last page)
+    """
+    limit = _page_size(limit)
+    query = (
+        select(MarketStatistic)
+        .where(MarketStatistic.user_id == user_id)
+        .order_by(MarketStatistic.pair)
+        .limit(limit + 1)
+    )
+    if cursor:
+        query = query.where(MarketStatistic.pair > cursor)
+    rows = session.scalars(query).all()
+
+    markets = []
+    for stat in rows[:limit]:
+        trades = stat.total_trades or 0
+        markets.append({
+            'pair': stat.pair,
+            'trades': trades,
+            'winning_trades': stat.winning_trades or 0,
+            'losing_trades': stat.losing_trades or 0,
+            'win_rate': (stat.winning_trades or 0) / trades * 100 if trades else 0.0,
+            'total_pnl': _float(stat.total_pnl),
+            'avg_pnl': _float(stat.total_pnl) / trades if trades else 0.0,
+            'total_fees': _float(stat.total_fees),
+            'volume': _float(stat.total_volume),
+            'last_trade_at': stat.last_trade_at.isoformat() if stat.last_trade_at else None,
+        })
+    next_cursor = markets[-1]['pair'] if len(rows) > limit else None
+    return {'markets': markets, 'next_cursor': next_cursor}
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+def get_performance_summary(session: Session, user_id: str, period: str = '30d') -> Optional[Dict[str, Any]]:
+    """
+    Performance metrics for *period* computed from the daily rollups
+
+    Returns are in percentage points of summed trade ``pnl_percent``; Sharpe is
+    annualised (252) over calendar days in the period, days without trades
+    counting as 0.  Returns None when the user has no rollups in the period.
+    """
+    days = PERIOD_DAYS[period]
+    where = [DailyStatistic.user_id == user_id]
+    if days is not None:
+        where.append(DailyStatistic.date >= date.today() - timedelta(days=days - 1))
+
+    totals = session.execute(select(
+        func.sum(DailyStatistic.total_trades),
+        func.sum(DailyStatistic.winning_trades),
+        func.sum(DailyStatistic.total_pnl),
+        func.sum(DailyStatistic.gross_profit),
+        func.sum(DailyStatistic.gross_loss),
+        func.max(DailyStatistic.best_trade),
+        func.min(DailyStatistic.worst_trade),
+        func.sum(DailyStatistic.total_duration_seconds),
+        func.min(DailyStatistic.date),
+    ).where(*where)).one()
+    total_trades, winning, total_pnl, gross_profit, gross_loss, best, worst, duration, first_day = totals
+    if not total_trades:
+        return None
+
+    return_where = [DailyReturn.user_id == user_id, DailyReturn.date >= first_day]
+    returns = [float(r) for r in session.scalars(
+        select(DailyReturn.return_pct).where(*return_where).order_by(DailyReturn.date))]
+
+    span = days if days is not None else (date.today() - first_day).days + 1
+    series = returns + [0.0] * max(0, span - len(returns))
+    mean = sum(series) / len(series)
+    std = math.sqrt(sum((r - mean) ** 2 for r in series) / len(series))
+    sharpe = mean / std * math.sqrt(252) if std > 0 else 0.0
+
+    cumulative = peak = max_drawdown = 0.0
+    for r in returns:
+        cumulative += r
+        peak = max(peak, cumulative)
+        max_drawdown = max(max_drawdown, peak - cumulative)
+
+    total_return = sum(returns)
+    gross_loss = abs(_float(gross_loss))
+    return {
+        'total_return': total_return,
+        'annualized_return': total_return * 365 / span if span else 0.0,
+        'sharpe_ratio': sharpe,
+        'max_drawdown': max_drawdown,
+        'win_rate': (winning or 0) / total_trades * 100,
+        'profit_factor': _float(gross_profit) / gross_loss if gross_loss else 0.0,
+        'total_trades': int(total_trades),
+        'total_pnl': _float(total_pnl),
+        'avg_trade_duration': _format_duration((duration or 0) / total_trades),
+        'best_trade': _float(best),
+        'worst_trade': _float(worst),
+    }
+
+
+# ========================================
+# CLI
+# ========================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Backfill command: python -m database.analytics_rollups backfill"""
+    parser = argparse.ArgumentParser(description='Maintain NIJA analytics rollup tables')
+    sub = parser.add_subparsers(dest='command', required=True)
+    fill = sub.add_parser('backfill', help='Fold closed trades not yet applied into the rollups')
+    fill.add_argument('--user-id', help='Only this user')
+    fill.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Trades per transaction')
+    fill.add_argument('--rebuild', action='store_true', help='Clear the rollups and recompute from scratch')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    from database.db_connection import close_database, init_database
+
+    init_database()
+    try:
+        applied = backfill(user_id=args.user_id, batch_size=args.batch_size, rebuild=args.rebuild)
+        logger.info(f"✅ Rollup backfill complete: {applied} trade(s) applied")
+        return 0
+    finally:
+        close_database()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -163,6 +163,10 @@ def init_database(
         # Create scoped session for thread-safety
         _scoped_session = scoped_session(_session_factory)
 
+        # Keep analytics rollups current as trades close
+        from database.analytics_rollups import register_rollup_listener
+        register_rollup_listener(_session_factory)
+
         logger.info("✅ Database initialized successfully")
         logger.info(f"   Pool size: {pool_size}")
         logger.info(f"   Max overflow: {max_overflow}")
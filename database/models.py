@@ -10,7 +10,7 @@ Date: January 27, 2026
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, Date, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, Date, ForeignKey, Text, UniqueConstraint
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
 
@@ -155,8 +155,9 @@ class Trade(Base):
 
 
 class DailyStatistic(Base):
-    """Daily aggregated statistics per user"""
+    """Daily aggregated statistics per user (maintained by database.analytics_rollups)"""
     __tablename__ = 'daily_statistics'
+    __table_args__ = (UniqueConstraint('user_id', 'date', name='uq_daily_statistics_user_date'),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(String(50), ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False)
@@ -166,6 +167,11 @@ class DailyStatistic(Base):
     losing_trades = Column(Integer, default=0)
     total_pnl = Column(Numeric(18, 8), default=0)
     total_fees = Column(Numeric(18, 8), default=0)
+    gross_profit = Column(Numeric(18, 8), default=0)
+    gross_loss = Column(Numeric(18, 8), default=0)
+    best_trade = Column(Numeric(18, 8))
+    worst_trade = Column(Numeric(18, 8))
+    total_duration_seconds = Column(Integer, default=0)
     created_at = Column(DateTime, default=func.now())
 
     # Relationships
@@ -211,6 +217,7 @@ class PerformanceSnapshot(Base):
 class StrategyPerformance(Base):
     """Track performance of individual trading strategies"""
     __tablename__ = 'strategy_performance'
+    __table_args__ = (UniqueConstraint('user_id', 'strategy_name', name='uq_strategy_performance_user_strategy'),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(String(50), ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False, index=True)
@@ -291,13 +298,18 @@ class PortfolioEquity(Base):
 
 
 class DailyReturn(Base):
-    """Daily return tracking"""
+    """Daily return tracking
+
+    ``return_pct`` is the sum of ``pnl_percent`` over the trades closed that
+    day (see database/analytics_rollups.py), not an equity-based return.
+    """
     __tablename__ = 'daily_returns'
+    __table_args__ = (UniqueConstraint('user_id', 'date', name='uq_daily_returns_user_date'),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(String(50), ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False, index=True)
     date = Column(Date, nullable=False, index=True)
-    return_pct = Column(Numeric(8, 4), nullable=False)
+    return_pct = Column(Numeric(8, 4), nullable=False)  # sum of closed-trade pnl_percent
 
     created_at = Column(DateTime, default=func.now())
 
@@ -327,3 +339,35 @@ class RiskEvent(Base):
 
     def __repr__(self):
         return f"<RiskEvent(user_id='{self.user_id}', type='{self.event_type}', severity='{self.severity}')>"
+
+
+class MarketStatistic(Base):
+    """Lifetime aggregated statistics per user and pair (maintained by database.analytics_rollups)"""
+    __tablename__ = 'market_statistics'
+    __table_args__ = (UniqueConstraint('user_id', 'pair', name='uq_market_statistics_user_pair'),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(50), ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False)
+    pair = Column(String(20), nullable=False)
+    total_trades = Column(Integer, default=0)
+    winning_trades = Column(Integer, default=0)
+    losing_trades = Column(Integer, default=0)
+    total_pnl = Column(Numeric(18, 8), default=0)
+    total_fees = Column(Numeric(18, 8), default=0)
+    total_volume = Column(Numeric(18, 8), default=0)
+    last_trade_at = Column(DateTime)
+
+    def __repr__(self):
+        return f"<MarketStatistic(user_id='{self.user_id}', pair='{self.pair}', total_pnl={self.total_pnl})>"
+
+
+class TradeRollup(Base):
+    """Marks a closed trade as folded into the analytics rollups (makes re-application a no-op)"""
+    __tablename__ = 'trade_rollups'
+
+    trade_id = Column(Integer, ForeignKey('trades.id', ondelete='CASCADE'), primary_key=True)
+    user_id = Column(String(50), nullable=False, index=True)
+    applied_at = Column(DateTime, default=func.now())
+
+    def __repr__(self):
+        return f"<TradeRollup(trade_id={self.trade_id}, user_id='{self.user_id}')>"
@@ -52,6 +52,8 @@ def get_auth_audit_log() -> Any:
 from vault import get_vault
 from execution import get_permission_validator, UserPermissions
 from user_control import get_user_control_backend
+from database import analytics_rollups
+from database.db_connection import get_db_session, init_database
 
 # Configure logging
 logging.basicConfig(
@@ -747,13 +749,26 @@ async def get_trade_history(
     }
 
 
+def _read_rollups(reader, *args, **kwargs):
+    """Run an analytics_rollups reader in a DB session; None if the database is not configured."""
+    try:
+        with get_db_session() as session:
+            return reader(session, *args, **kwargs)
+    except RuntimeError as e:
+        logger.debug(f"Analytics rollups unavailable: {e}")
+        return None
+
+
 @app.get("/api/analytics/performance", tags=["analytics"])
 async def get_performance_metrics(
     user_id: str = Depends(get_current_user),
     period: str = "30d"
 ):
     """
-    Get comprehensive performance metrics.
+    Get comprehensive performance metrics (from the daily rollup tables).
+
+    Returns, Sharpe and drawdown are in percentage points of summed trade
+    pnl_percent per day, not of account equity.
 
     Args:
         period: Time period (7d, 30d, 90d, 1y, all)
@@ -765,8 +780,7 @@ async def get_performance_metrics(
             detail=f"Invalid period. Must be one of: {', '.join(valid_periods)}"
         )
 
-    # TODO: Calculate actual metrics from database
-    metrics = user_control.get_performance_metrics(user_id, period)
+    metrics = _read_rollups(analytics_rollups.get_performance_summary, user_id, period)
 
     return {
         "user_id": user_id,
@@ -789,41 +803,62 @@ async def get_performance_metrics(
 @app.get("/api/analytics/daily", tags=["analytics"])
 async def get_daily_pnl(
     user_id: str = Depends(get_current_user),
-    days: int = 30
+    days: int = 30,
+    limit: int = 100,
+    cursor: Optional[str] = None
 ):
     """
-    Get daily P&L breakdown.
+    Get daily P&L breakdown, newest first (keyset-paginated).
+
+    ``return_pct`` is the sum of the day's closed-trade pnl_percent.
 
     Args:
         days: Number of days to retrieve (max 365)
+        limit: Rows per page (max 366)
+        cursor: ``next_cursor`` from the previous page
     """
     if days > 365:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Days cannot exceed 365"
         )
-
-    # TODO: Get actual daily P&L from database
-    daily_pnl = user_control.get_daily_pnl(user_id, days)
+    try:
+        page = _read_rollups(analytics_rollups.get_daily_page, user_id, days, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    page = page or {"data": [], "next_cursor": None}
 
     return {
         "user_id": user_id,
         "days": days,
-        "data": daily_pnl or []
+        "data": page["data"],
+        "next_cursor": page["next_cursor"]
     }
 
 
 @app.get("/api/analytics/markets", tags=["analytics"])
-async def get_market_breakdown(user_id: str = Depends(get_current_user)):
+async def get_market_breakdown(
+    user_id: str = Depends(get_current_user),
+    limit: int = 100,
+    cursor: Optional[str] = None
+):
     """
-    Get performance breakdown by market/pair.
+    Get performance breakdown by market/pair (keyset-paginated by pair).
+
+    Args:
+        limit: Rows per page (max 366)
+        cursor: ``next_cursor`` from the previous page
     """
-    # TODO: Get actual market breakdown from database
-    breakdown = user_control.get_market_breakdown(user_id)
+    page = _read_rollups(analytics_rollups.get_market_page, user_id, limit=limit, cursor=cursor)
+    page = page or {"markets": [], "next_cursor": None}
 
     return {
         "user_id": user_id,
-        "markets": breakdown or []
+        "markets": page["markets"],
+        "next_cursor": page["next_cursor"]
     }
 
 
@@ -1313,6 +1348,11 @@ async def startup_event():
     logger.info("Architecture: NIJA as Headless Microservice")
     logger.info("=" * 60)
 
+    try:
+        init_database()
+    except Exception as e:
+        logger.warning(f"Database not initialized - analytics endpoints will return empty results: {e}")
+
 
 if __name__ == "__main__":
     import uvicorn
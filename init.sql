@@ -98,11 +98,69 @@ CREATE TABLE IF NOT EXISTS daily_statistics (
     losing_trades INTEGER DEFAULT 0,
     total_pnl DECIMAL(18, 8) DEFAULT 0,
     total_fees DECIMAL(18, 8) DEFAULT 0,
+    gross_profit DECIMAL(18, 8) DEFAULT 0,
+    gross_loss DECIMAL(18, 8) DEFAULT 0,
+    best_trade DECIMAL(18, 8),
+    worst_trade DECIMAL(18, 8),
+    total_duration_seconds INTEGER DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
     UNIQUE(user_id, date)
 );
 
+-- Daily returns: sum of closed-trade pnl_percent per day (maintained by database/analytics_rollups.py)
+CREATE TABLE IF NOT EXISTS daily_returns (
+    id SERIAL PRIMARY KEY,
+    user_id VARCHAR(50) NOT NULL,
+    date DATE NOT NULL,
+    return_pct DECIMAL(8, 4) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    UNIQUE(user_id, date)
+);
+
+-- Per-strategy statistics (lifetime, maintained by database/analytics_rollups.py)
+CREATE TABLE IF NOT EXISTS strategy_performance (
+    id SERIAL PRIMARY KEY,
+    user_id VARCHAR(50) NOT NULL,
+    strategy_name VARCHAR(50) NOT NULL,
+    total_trades INTEGER DEFAULT 0,
+    winning_trades INTEGER DEFAULT 0,
+    losing_trades INTEGER DEFAULT 0,
+    total_pnl DECIMAL(18, 8) DEFAULT 0,
+    sharpe_ratio DECIMAL(8, 4) DEFAULT 0,
+    max_drawdown_pct DECIMAL(8, 4) DEFAULT 0,
+    current_allocation_pct DECIMAL(8, 4) DEFAULT 0,
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    UNIQUE(user_id, strategy_name)
+);
+
+-- Per-pair statistics (lifetime, maintained by database/analytics_rollups.py)
+CREATE TABLE IF NOT EXISTS market_statistics (
+    id SERIAL PRIMARY KEY,
+    user_id VARCHAR(50) NOT NULL,
+    pair VARCHAR(20) NOT NULL,
+    total_trades INTEGER DEFAULT 0,
+    winning_trades INTEGER DEFAULT 0,
+    losing_trades INTEGER DEFAULT 0,
+    total_pnl DECIMAL(18, 8) DEFAULT 0,
+    total_fees DECIMAL(18, 8) DEFAULT 0,
+    total_volume DECIMAL(18, 8) DEFAULT 0,
+    last_trade_at TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    UNIQUE(user_id, pair)
+);
+
+-- Closed trades already folded into the rollups
+CREATE TABLE IF NOT EXISTS trade_rollups (
+    trade_id INTEGER PRIMARY KEY,
+    user_id VARCHAR(50) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (trade_id) REFERENCES trades(id) ON DELETE CASCADE
+);
+
 -- Indexes for performance
 CREATE INDEX idx_users_email ON users(email);
 CREATE INDEX idx_users_user_id ON users(user_id);
@@ -112,6 +170,9 @@ CREATE INDEX idx_positions_status ON positions(status);
 CREATE INDEX idx_trades_user_id ON trades(user_id);
 CREATE INDEX idx_trades_closed_at ON trades(closed_at);
 CREATE INDEX idx_daily_statistics_user_id_date ON daily_statistics(user_id, date);
+CREATE INDEX idx_daily_returns_user_id_date ON daily_returns(user_id, date);
+CREATE INDEX idx_strategy_performance_user_id ON strategy_performance(user_id);
+CREATE INDEX idx_trade_rollups_user_id ON trade_rollups(user_id);
 
 -- Function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -2,7 +2,10 @@
 
 This module is imported automatically by Python. Keep it deterministic and
 side-effect limited: normalize environment defaults before bot modules read them,
-then request runtime patch installation.
+then request runtime patch installation.  Patches that declare target modules
+are installed on first import of a target (``NIJA_LAZY_RUNTIME_PATCHES=0``
+restores eager installation); ``python bot/patch_registry.py --startup-profile``
+reports import and per-patch install times.
 """
 
 from __future__ import annotations
@@ -243,100 +246,159 @@ def _install_patch_module(*, filename: str, module_name: str, success_log: str,
         logger.warning("%s unavailable: %s", error_prefix, exc)
 
 
+# Import names of the modules that deferred patches modify.  A patch with
+# targets is installed when the first of them finishes importing (see
+# bot/patch_registry.py); a patch without targets is installed immediately.
+_CORE_LOOP = ("bot.nija_core_loop", "nija_core_loop")
+_AI_ENGINE = ("bot.nija_ai_engine", "nija_ai_engine")
+_REGIME_DETECTOR = ("bot.market_regime_detector", "market_regime_detector")
+_EXECUTION_ENGINE = ("bot.execution_engine", "execution_engine")
+_EXECUTION_PIPELINE = ("bot.execution_pipeline", "execution_pipeline")
+_APEX_STRATEGY = (
+    "bot.nija_apex_strategy_v71",
+    "nija_apex_strategy_v71",
+    "bot.nija_apex_strategy",
+    "nija_apex_strategy",
+    "bot.trading_strategy",
+    "trading_strategy",
+)
+
+
+def _patch_registry():
+    """Load bot/patch_registry.py without importing the bot package (None on failure)."""
+    module = sys.modules.get("nija_patch_registry")
+    if module is None:
+        try:
+            registry_path = Path(__file__).resolve().parent / "bot" / "patch_registry.py"
+            spec = importlib.util.spec_from_file_location("nija_patch_registry", registry_path)
+            if spec is None or spec.loader is None:
+                raise RuntimeError(f"could not load spec for {registry_path}")
+            module = importlib.util.module_from_spec(spec)
+            sys.modules["nija_patch_registry"] = module
+            spec.loader.exec_module(module)
+        except Exception as exc:
+            sys.modules.pop("nija_patch_registry", None)
+            logger.warning("Runtime patch registry unavailable, installing eagerly: %s", exc)
+            return None
+    return module
+
+
+def _reapply_patch_module(module_name: str) -> None:
+    """Re-run an installed patch's (idempotent) hook once another target has loaded."""
+    installer = getattr(sys.modules.get(module_name), "install_import_hook", None)
+    if callable(installer):
+        installer()
+
+
+def _register_patch(*, targets: tuple[str, ...] = (), **patch: str) -> None:
+    registry = _patch_registry()
+    if registry is None:
+        _install_patch_module(**patch)
+        return
+    registry.get_patch_registry().register(
+        registry.PatchSpec(
+            name=patch["module_name"],
+            installer=lambda: _install_patch_module(**patch),
+            targets=targets,
+            refresh=lambda: _reapply_patch_module(patch["module_name"]),
+        )
+    )
+
+
 def _install_logging_format_guard() -> None:
-    _install_patch_module(filename="logging_format_guard_patch.py", module_name="nija_logging_format_guard_patch", success_log="LOGGING_FORMAT_GUARD_INSTALL_REQUESTED", error_prefix="Logging format guard")
+    _register_patch(filename="logging_format_guard_patch.py", module_name="nija_logging_format_guard_patch", success_log="LOGGING_FORMAT_GUARD_INSTALL_REQUESTED", error_prefix="Logging format guard")
 
 
 def _install_operator_emergency_stop_clear() -> None:
-    _install_patch_module(filename="operator_emergency_stop_clear_patch.py", module_name="nija_operator_emergency_stop_clear_patch", success_log="OPERATOR_EMERGENCY_STOP_CLEAR_INSTALL_REQUESTED", error_prefix="Operator emergency stop clear")
+    _register_patch(filename="operator_emergency_stop_clear_patch.py", module_name="nija_operator_emergency_stop_clear_patch", success_log="OPERATOR_EMERGENCY_STOP_CLEAR_INSTALL_REQUESTED", error_prefix="Operator emergency stop clear")
 
 
 def _install_stale_exchange_kill_switch_recovery() -> None:
-    _install_patch_module(filename="stale_exchange_kill_switch_recovery_patch.py", module_name="nija_stale_exchange_kill_switch_recovery_patch", success_log="STALE_EXCHANGE_KILL_SWITCH_RECOVERY_INSTALL_REQUESTED", error_prefix="Stale exchange kill-switch recovery")
+    _register_patch(filename="stale_exchange_kill_switch_recovery_patch.py", module_name="nija_stale_exchange_kill_switch_recovery_patch", success_log="STALE_EXCHANGE_KILL_SWITCH_RECOVERY_INSTALL_REQUESTED", error_prefix="Stale exchange kill-switch recovery")
 
 
 def _install_exchange_kill_switch_internal_reject_guard() -> None:
-    _install_patch_module(filename="exchange_kill_switch_internal_reject_guard_patch.py", module_name="nija_exchange_kill_switch_internal_reject_guard_patch", success_log="EXCHANGE_KILL_SWITCH_INTERNAL_REJECT_GUARD_INSTALL_REQUESTED", error_prefix="Exchange kill-switch internal reject guard")
+    _register_patch(filename="exchange_kill_switch_internal_reject_guard_patch.py", module_name="nija_exchange_kill_switch_internal_reject_guard_patch", success_log="EXCHANGE_KILL_SWITCH_INTERNAL_REJECT_GUARD_INSTALL_REQUESTED", error_prefix="Exchange kill-switch internal reject guard")
 
 
 def _install_kraken_ohlc_thread_guard() -> None:
-    _install_patch_module(filename="kraken_ohlc_thread_guard_patch.py", module_name="nija_kraken_ohlc_thread_guard_patch", success_log="KRAKEN_OHLC_THREAD_GUARD_INSTALL_REQUESTED", error_prefix="Kraken OHLC thread guard")
+    _register_patch(filename="kraken_ohlc_thread_guard_patch.py", module_name="nija_kraken_ohlc_thread_guard_patch", success_log="KRAKEN_OHLC_THREAD_GUARD_INSTALL_REQUESTED", error_prefix="Kraken OHLC thread guard")
 
 
 def _install_writer_kraken_runtime_convergence_v80() -> None:
-    _install_patch_module(filename="writer_kraken_runtime_convergence_v80_patch.py", module_name="nija_writer_kraken_runtime_convergence_v80_patch", success_log="WRITER_KRAKEN_RUNTIME_CONVERGENCE_V80_INSTALL_REQUESTED", error_prefix="Writer/Kraken runtime convergence v80")
+    _register_patch(filename="writer_kraken_runtime_convergence_v80_patch.py", module_name="nija_writer_kraken_runtime_convergence_v80_patch", success_log="WRITER_KRAKEN_RUNTIME_CONVERGENCE_V80_INSTALL_REQUESTED", error_prefix="Writer/Kraken runtime convergence v80")
 
 
 def _install_writer_recovery_epoch_core_v81() -> None:
-    _install_patch_module(filename="writer_recovery_epoch_core_v81_patch.py", module_name="nija_writer_recovery_epoch_core_v81_patch", success_log="WRITER_RECOVERY_EPOCH_CORE_V81_INSTALL_REQUESTED", error_prefix="Writer recovery epoch/core v81")
+    _register_patch(filename="writer_recovery_epoch_core_v81_patch.py", module_name="nija_writer_recovery_epoch_core_v81_patch", success_log="WRITER_RECOVERY_EPOCH_CORE_V81_INSTALL_REQUESTED", error_prefix="Writer recovery epoch/core v81")
 
 
 def _install_activation_snapshot_bridge() -> None:
-    _install_patch_module(filename="activation_snapshot_bridge_patch.py", module_name="nija_activation_snapshot_bridge_patch", success_log="ACTIVATION_SNAPSHOT_BRIDGE_INSTALL_REQUESTED", error_prefix="Activation snapshot bridge")
+    _register_patch(filename="activation_snapshot_bridge_patch.py", module_name="nija_activation_snapshot_bridge_patch", success_log="ACTIVATION_SNAPSHOT_BRIDGE_INSTALL_REQUESTED", error_prefix="Activation snapshot bridge")
 
 
 def _install_live_active_dispatch_bridge() -> None:
-    _install_patch_module(filename="live_active_dispatch_bridge_patch.py", module_name="nija_live_active_dispatch_bridge_patch", success_log="LIVE_ACTIVE_DISPATCH_BRIDGE_INSTALL_REQUESTED", error_prefix="Live-active dispatch bridge")
+    _register_patch(filename="live_active_dispatch_bridge_patch.py", module_name="nija_live_active_dispatch_bridge_patch", success_log="LIVE_ACTIVE_DISPATCH_BRIDGE_INSTALL_REQUESTED", error_prefix="Live-active dispatch bridge")
 
 
 def _install_activation_pending_commit_monitor() -> None:
-    _install_patch_module(filename="activation_pending_commit_monitor_patch.py", module_name="nija_activation_pending_commit_monitor_patch", success_log="ACTIVATION_PENDING_COMMIT_MONITOR_INSTALL_REQUESTED", error_prefix="Activation pending commit monitor")
+    _register_patch(filename="activation_pending_commit_monitor_patch.py", module_name="nija_activation_pending_commit_monitor_patch", success_log="ACTIVATION_PENDING_COMMIT_MONITOR_INSTALL_REQUESTED", error_prefix="Activation pending commit monitor")
 
 
 def _install_trading_strategy_apex_wiring() -> None:
-    _install_patch_module(filename="trading_strategy_apex_wiring_patch.py", module_name="nija_trading_strategy_apex_wiring_patch", success_log="TRADING_STRATEGY_APEX_WIRING_INSTALL_REQUESTED", error_prefix="TradingStrategy APEX wiring repair")
+    _register_patch(filename="trading_strategy_apex_wiring_patch.py", module_name="nija_trading_strategy_apex_wiring_patch", success_log="TRADING_STRATEGY_APEX_WIRING_INSTALL_REQUESTED", error_prefix="TradingStrategy APEX wiring repair")
 
 
 def _install_phase3_scan_budget() -> None:
-    _install_patch_module(filename="phase3_scan_budget_patch.py", module_name="nija_phase3_scan_budget_patch", success_log="PHASE3_SCAN_BUDGET_INSTALL_REQUESTED", error_prefix="Phase3 scan budget patch")
+    _register_patch(targets=_CORE_LOOP + _AI_ENGINE, filename="phase3_scan_budget_patch.py", module_name="nija_phase3_scan_budget_patch", success_log="PHASE3_SCAN_BUDGET_INSTALL_REQUESTED", error_prefix="Phase3 scan budget patch")
 
 
 def _install_phase3_overselect_import_repair() -> None:
-    _install_patch_module(filename="phase3_overselect_import_repair_patch.py", module_name="nija_phase3_overselect_import_repair_patch", success_log="PHASE3_OVERSELECT_IMPORT_REPAIR_INSTALL_REQUESTED", error_prefix="Phase3 overselect import repair")
+    _register_patch(targets=_AI_ENGINE, filename="phase3_overselect_import_repair_patch.py", module_name="nija_phase3_overselect_import_repair_patch", success_log="PHASE3_OVERSELECT_IMPORT_REPAIR_INSTALL_REQUESTED", error_prefix="Phase3 overselect import repair")
 
 
 def _install_phase3_force_next_preserve_selection() -> None:
-    _install_patch_module(filename="phase3_force_next_preserve_selection_patch.py", module_name="nija_phase3_force_next_preserve_selection_patch", success_log="PHASE3_FORCE_NEXT_PRESERVE_SELECTION_INSTALL_REQUESTED", error_prefix="Phase3 force-next preserve selection")
+    _register_patch(targets=_CORE_LOOP, filename="phase3_force_next_preserve_selection_patch.py", module_name="nija_phase3_force_next_preserve_selection_patch", success_log="PHASE3_FORCE_NEXT_PRESERVE_SELECTION_INSTALL_REQUESTED", error_prefix="Phase3 force-next preserve selection")
 
 
 def _install_phase3_selection_width() -> None:
-    _install_patch_module(filename="phase3_selection_width_patch.py", module_name="nija_phase3_selection_width_patch", success_log="PHASE3_SELECTION_WIDTH_INSTALL_REQUESTED", error_prefix="Phase3 selection width repair")
+    _register_patch(targets=_CORE_LOOP, filename="phase3_selection_width_patch.py", module_name="nija_phase3_selection_width_patch", success_log="PHASE3_SELECTION_WIDTH_INSTALL_REQUESTED", error_prefix="Phase3 selection width repair")
 
 
 def _install_phase3_fallback_hold_skip() -> None:
-    _install_patch_module(filename="phase3_fallback_hold_skip_patch.py", module_name="nija_phase3_fallback_hold_skip_patch", success_log="PHASE3_FALLBACK_HOLD_SKIP_INSTALL_REQUESTED", error_prefix="Phase3 fallback hold-skip bridge")
+    _register_patch(targets=_CORE_LOOP, filename="phase3_fallback_hold_skip_patch.py", module_name="nija_phase3_fallback_hold_skip_patch", success_log="PHASE3_FALLBACK_HOLD_SKIP_INSTALL_REQUESTED", error_prefix="Phase3 fallback hold-skip bridge")
 
 
 def _install_execution_bootstrap_authority_repair() -> None:
-    _install_patch_module(filename="execution_bootstrap_authority_repair_patch.py", module_name="nija_execution_bootstrap_authority_repair_patch", success_log="EXECUTION_BOOTSTRAP_AUTHORITY_REPAIR_INSTALL_REQUESTED", error_prefix="Execution bootstrap authority repair")
+    _register_patch(filename="execution_bootstrap_authority_repair_patch.py", module_name="nija_execution_bootstrap_authority_repair_patch", success_log="EXECUTION_BOOTSTRAP_AUTHORITY_REPAIR_INSTALL_REQUESTED", error_prefix="Execution bootstrap authority repair")
 
 
 def _install_execution_bootstrap_monitor_iteration_guard() -> None:
-    _install_patch_module(filename="execution_bootstrap_monitor_iteration_guard_patch.py", module_name="nija_execution_bootstrap_monitor_iteration_guard_patch", success_log="EXECUTION_BOOTSTRAP_MONITOR_ITERATION_GUARD_INSTALL_REQUESTED", error_prefix="Execution bootstrap monitor iteration guard")
+    _register_patch(filename="execution_bootstrap_monitor_iteration_guard_patch.py", module_name="nija_execution_bootstrap_monitor_iteration_guard_patch", success_log="EXECUTION_BOOTSTRAP_MONITOR_ITERATION_GUARD_INSTALL_REQUESTED", error_prefix="Execution bootstrap monitor iteration guard")
 
 
 def _install_forced_fallback_payload_repair() -> None:
-    _install_patch_module(filename="forced_fallback_payload_repair_patch.py", module_name="nija_forced_fallback_payload_repair_patch", success_log="FORCED_FALLBACK_PAYLOAD_REPAIR_INSTALL_REQUESTED", error_prefix="Forced fallback payload repair")
+    _register_patch(targets=_CORE_LOOP, filename="forced_fallback_payload_repair_patch.py", module_name="nija_forced_fallback_payload_repair_patch", success_log="FORCED_FALLBACK_PAYLOAD_REPAIR_INSTALL_REQUESTED", error_prefix="Forced fallback payload repair")
 
 
 def _install_fallback_take_profit_geometry_repair() -> None:
-    _install_patch_module(filename="fallback_take_profit_geometry_repair_patch.py", module_name="nija_fallback_take_profit_geometry_patch", success_log="FORCED_FALLBACK_TP_GEOMETRY_REPAIR_INSTALL_REQUESTED", error_prefix="Fallback take-profit geometry repair")
+    _register_patch(targets=_CORE_LOOP + _REGIME_DETECTOR, filename="fallback_take_profit_geometry_repair_patch.py", module_name="nija_fallback_take_profit_geometry_patch", success_log="FORCED_FALLBACK_TP_GEOMETRY_REPAIR_INSTALL_REQUESTED", error_prefix="Fallback take-profit geometry repair")
 
 
 def _install_execution_pipeline_gate_repair() -> None:
-    _install_patch_module(filename="execution_pipeline_gate_repair_patch.py", module_name="nija_execution_pipeline_gate_repair_patch", success_log="EXECUTION_PIPELINE_GATE_REPAIR_INSTALL_REQUESTED", error_prefix="Execution pipeline gate repair")
+    _register_patch(targets=_EXECUTION_PIPELINE, filename="execution_pipeline_gate_repair_patch.py", module_name="nija_execution_pipeline_gate_repair_patch", success_log="EXECUTION_PIPELINE_GATE_REPAIR_INSTALL_REQUESTED", error_prefix="Execution pipeline gate repair")
 
 
 def _install_hard_controls_csm_repair() -> None:
-    _install_patch_module(filename="hard_controls_csm_repair_patch.py", module_name="nija_hard_controls_csm_repair_patch", success_log="HARD_CONTROLS_CSM_REPAIR_INSTALL_REQUESTED", error_prefix="Hard controls CSM repair")
+    _register_patch(filename="hard_controls_csm_repair_patch.py", module_name="nija_hard_controls_csm_repair_patch", success_log="HARD_CONTROLS_CSM_REPAIR_INSTALL_REQUESTED", error_prefix="Hard controls CSM repair")
 
 
 def _install_trading_state_dispatch_latch_repair() -> None:
-    _install_patch_module(filename="trading_state_dispatch_latch_repair_patch.py", module_name="nija_trading_state_dispatch_latch_repair_patch", success_log="TRADING_STATE_DISPATCH_LATCH_REPAIR_INSTALL_REQUESTED", error_prefix="Trading state dispatch latch repair")
+    _register_patch(filename="trading_state_dispatch_latch_repair_patch.py", module_name="nija_trading_state_dispatch_latch_repair_patch", success_log="TRADING_STATE_DISPATCH_LATCH_REPAIR_INSTALL_REQUESTED", error_prefix="Trading state dispatch latch repair")
 
 
 def _install_downstream_risk_governor_equity_repair() -> None:
-    _install_patch_module(filename="downstream_risk_governor_equity_repair_patch.py", module_name="nija_downstream_risk_governor_equity_repair_patch", success_log="DOWNSTREAM_RISK_GOVERNOR_EQUITY_REPAIR_INSTALL_REQUESTED", error_prefix="Downstream risk governor equity repair")
+    _register_patch(filename="downstream_risk_governor_equity_repair_patch.py", module_name="nija_downstream_risk_governor_equity_repair_patch", success_log="DOWNSTREAM_RISK_GOVERNOR_EQUITY_REPAIR_INSTALL_REQUESTED", error_prefix="Downstream risk governor equity repair")
 
 
 def _install_usdt_kraken_ecel_routing_repair() -> None:
@@ -344,35 +406,35 @@ def _install_usdt_kraken_ecel_routing_repair() -> None:
 
 
 def _install_coinbase_execution_failover() -> None:
-    _install_patch_module(filename="coinbase_execution_failover_patch.py", module_name="nija_coinbase_execution_failover_patch", success_log="COINBASE_EXECUTION_FAILOVER_INSTALL_REQUESTED", error_prefix="Coinbase execution failover")
+    _register_patch(targets=_EXECUTION_ENGINE, filename="coinbase_execution_failover_patch.py", module_name="nija_coinbase_execution_failover_patch", success_log="COINBASE_EXECUTION_FAILOVER_INSTALL_REQUESTED", error_prefix="Coinbase execution failover")
 
 
 def _install_execution_entry_safe_logger() -> None:
-    _install_patch_module(filename="execution_entry_nonblocking_logger_patch.py", module_name="nija_execution_entry_nonblocking_logger_patch", success_log="EXECUTION_ENTRY_SAFE_LOGGER_INSTALL_REQUESTED", error_prefix="Execution entry safe logger")
+    _register_patch(filename="execution_entry_nonblocking_logger_patch.py", module_name="nija_execution_entry_nonblocking_logger_patch", success_log="EXECUTION_ENTRY_SAFE_LOGGER_INSTALL_REQUESTED", error_prefix="Execution entry safe logger")
 
 
 def _install_risk_gate_execution_bridge() -> None:
-    _install_patch_module(filename="risk_gate_execution_bridge_patch.py", module_name="nija_risk_gate_execution_bridge_patch", success_log="RISK_GATE_EXECUTION_BRIDGE_INSTALL_REQUESTED", error_prefix="Risk gate execution bridge")
+    _register_patch(filename="risk_gate_execution_bridge_patch.py", module_name="nija_risk_gate_execution_bridge_patch", success_log="RISK_GATE_EXECUTION_BRIDGE_INSTALL_REQUESTED", error_prefix="Risk gate execution bridge")
 
 
 def _install_tpe_min_notional_reason_sanitizer() -> None:
-    _install_patch_module(filename="tpe_min_notional_reason_sanitizer_patch.py", module_name="nija_tpe_min_notional_reason_sanitizer_patch", success_log="TPE_MIN_NOTIONAL_REASON_SANITIZER_INSTALL_REQUESTED", error_prefix="TPE min-notional reason sanitizer")
+    _register_patch(targets=_APEX_STRATEGY, filename="tpe_min_notional_reason_sanitizer_patch.py", module_name="nija_tpe_min_notional_reason_sanitizer_patch", success_log="TPE_MIN_NOTIONAL_REASON_SANITIZER_INSTALL_REQUESTED", error_prefix="TPE min-notional reason sanitizer")
 
 
 def _install_direct_broker_metadata_guard() -> None:
-    _install_patch_module(filename="direct_broker_metadata_guard_patch.py", module_name="nija_direct_broker_metadata_guard_patch", success_log="DIRECT_BROKER_METADATA_GUARD_INSTALL_REQUESTED", error_prefix="Direct broker metadata guard")
+    _register_patch(filename="direct_broker_metadata_guard_patch.py", module_name="nija_direct_broker_metadata_guard_patch", success_log="DIRECT_BROKER_METADATA_GUARD_INSTALL_REQUESTED", error_prefix="Direct broker metadata guard")
 
 
 def _install_okx_min_notional_prefilter_repair() -> None:
-    _install_patch_module(filename="okx_min_notional_prefilter_repair_patch.py", module_name="nija_okx_min_notional_prefilter_repair_patch", success_log="OKX_MIN_NOTIONAL_PREFILTER_REPAIR_INSTALL_REQUESTED", error_prefix="OKX min-notional prefilter repair")
+    _register_patch(filename="okx_min_notional_prefilter_repair_patch.py", module_name="nija_okx_min_notional_prefilter_repair_patch", success_log="OKX_MIN_NOTIONAL_PREFILTER_REPAIR_INSTALL_REQUESTED", error_prefix="OKX min-notional prefilter repair")
 
 
 def _install_okx_final_order_submission_bridge() -> None:
-    _install_patch_module(filename="okx_final_order_submission_bridge_patch.py", module_name="nija_okx_final_order_submission_bridge_patch", success_log="OKX_FINAL_ORDER_SUBMISSION_BRIDGE_INSTALL_REQUESTED", error_prefix="OKX final order submission bridge")
+    _register_patch(filename="okx_final_order_submission_bridge_patch.py", module_name="nija_okx_final_order_submission_bridge_patch", success_log="OKX_FINAL_ORDER_SUBMISSION_BRIDGE_INSTALL_REQUESTED", error_prefix="OKX final order submission bridge")
 
 
 def _install_ecel_min_notional_rounding_repair() -> None:
-    _install_patch_module(filename="ecel_min_notional_rounding_repair_patch.py", module_name="nija_ecel_min_notional_rounding_repair_patch", success_log="ECEL_MIN_NOTIONAL_ROUNDING_REPAIR_INSTALL_REQUESTED", error_prefix="ECEL min-notional rounding repair")
+    _register_patch(filename="ecel_min_notional_rounding_repair_patch.py", module_name="nija_ecel_min_notional_rounding_repair_patch", success_log="ECEL_MIN_NOTIONAL_ROUNDING_REPAIR_INSTALL_REQUESTED", error_prefix="ECEL min-notional rounding repair")
 
 
 # The shell startup handoff marks every preflight and the canonical launcher as
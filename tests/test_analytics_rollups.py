@@ -0,0 +1,149 @@
+"""Tests for the incremental analytics rollups (database/analytics_rollups.py) on SQLite."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from database import analytics_rollups as rollups  # noqa: E402
+from database.models import Base, DailyReturn, DailyStatistic, MarketStatistic, StrategyPerformance, Trade  # noqa: E402
+
+TODAY = datetime.combine(date.today(), datetime.min.time()) + timedelta(hours=12)
+
+
+@pytest.fixture
+def factory():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _scope(factory):
+    @contextmanager
+    def scope():
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+    return scope
+
+
+def _trade(user, pair, pnl, days_ago=0, status="closed", pnl_percent=None):
+    closed = TODAY - timedelta(days=days_ago)
+    return Trade(user_id=user, pair=pair, side="buy", size=Decimal("1"), entry_price=Decimal("100"),
+                 exit_price=Decimal(100 + pnl), pnl=Decimal(str(pnl)), fees=Decimal("0.1"),
+                 pnl_percent=Decimal(str(pnl if pnl_percent is None else pnl_percent)),
+                 opened_at=closed - timedelta(hours=2), closed_at=closed if status == "closed" else None,
+                 status=status)
+
+
+def _snapshot(session):
+    daily = {(r.user_id, r.date, r.total_trades, float(r.total_pnl), float(r.gross_profit), float(r.gross_loss),
+              float(r.best_trade), float(r.worst_trade), r.total_duration_seconds)
+             for r in session.scalars(select(DailyStatistic))}
+    markets = {(r.user_id, r.pair, r.total_trades, r.winning_trades, float(r.total_pnl), float(r.total_volume))
+               for r in session.scalars(select(MarketStatistic))}
+    returns = {(r.user_id, r.date, float(r.return_pct)) for r in session.scalars(select(DailyReturn))}
+    return daily, markets, returns
+
+
+def test_listener_applies_each_close_once(factory):
+    rollups.register_rollup_listener(factory)
+    rollups.register_rollup_listener(factory)  # idempotent registration
+    with _scope(factory)() as session:
+        open_trade = _trade("u1", "BTC-USD", 5, status="open")
+        session.add_all([open_trade, _trade("u1", "BTC-USD", -2), _trade("u1", "ETH-USD", 3)])
+        session.flush()
+        session.flush()  # nothing new: no double counting
+
+        open_trade.status, open_trade.closed_at = "closed", TODAY
+        session.flush()
+        open_trade.fees = Decimal("0.2")  # later edits of a closed trade are not re-applied
+        session.flush()
+
+    with factory() as session:
+        day = session.scalars(select(DailyStatistic)).one()
+        assert (day.total_trades, day.winning_trades, day.losing_trades) == (3, 2, 1)
+        assert float(day.total_pnl) == 6 and float(day.gross_loss) == -2
+        assert (float(day.best_trade), float(day.worst_trade)) == (5, -2)
+        btc = session.scalars(select(MarketStatistic).where(MarketStatistic.pair == "BTC-USD")).one()
+        assert (btc.total_trades, float(btc.total_pnl), float(btc.total_volume)) == (2, 3, 200)
+        strategy = session.scalars(select(StrategyPerformance)).one()
+        assert (strategy.strategy_name, strategy.total_trades) == (rollups.DEFAULT_STRATEGY, 3)
+
+
+def test_backfill_matches_incremental_and_is_rerunnable(factory):
+    scope = _scope(factory)
+    with scope() as session:
+        session.add_all([_trade(f"u{i % 3}", pair, pnl, days_ago=i % 9)
+                         for i, (pair, pnl) in enumerate([("BTC-USD", 4), ("ETH-USD", -1), ("SOL-USD", 2)] * 20)])
+        session.add(_trade("u0", "BTC-USD", 9, status="open"))
+
+    assert rollups.backfill(scope, batch_size=7) == 60
+    assert rollups.backfill(scope, batch_size=7) == 0
+    with factory() as session:
+        incremental = _snapshot(session)
+
+    assert rollups.backfill(scope, user_id="u1", rebuild=True) == 20
+    with factory() as session:
+        assert _snapshot(session) == incremental
+        assert sum(r[2] for r in incremental[0]) == 60
+
+
+def test_readers_paginate_by_key_and_summarise(factory):
+    scope = _scope(factory)
+    with scope() as session:
+        for days_ago in range(12):
+            session.add(_trade("u1", f"P{days_ago:02d}-USD", 2 if days_ago % 3 else -1, days_ago=days_ago))
+        session.add(_trade("u2", "BTC-USD", 50))
+    rollups.backfill(scope)
+
+    with factory() as session:
+        seen, cursor = [], None
+        while True:
+            page = rollups.get_daily_page(session, "u1", days=10, limit=4, cursor=cursor)
+            seen += [row["date"] for row in page["data"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == [(TODAY - timedelta(days=d)).date().isoformat() for d in range(10)]
+
+        first = rollups.get_market_page(session, "u1", limit=5)
+        second = rollups.get_market_page(session, "u1", limit=50, cursor=first["next_cursor"])
+        pairs = [m["pair"] for m in first["markets"] + second["markets"]]
+        assert pairs == sorted(f"P{d:02d}-USD" for d in range(12)) and second["next_cursor"] is None
+
+        summary = rollups.get_performance_summary(session, "u1", "30d")
+        assert summary["total_trades"] == 12 and summary["win_rate"] == pytest.approx(8 / 12 * 100)
+        assert summary["profit_factor"] == pytest.approx(16 / 4)
+        assert summary["max_drawdown"] == pytest.approx(1.0)
+        assert summary["avg_trade_duration"] == "2.0h"
+        assert rollups.get_performance_summary(session, "u3", "7d") is None
+
+
+def test_rollup_failure_does_not_lose_the_trade(factory, monkeypatch):
+    rollups.register_rollup_listener(factory)
+    scope = _scope(factory)
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("rollup table missing")
+
+    monkeypatch.setattr(rollups, "_upsert", broken)
+    with scope() as session:
+        session.add(_trade("u1", "BTC-USD", 3))
+    monkeypatch.undo()
+
+    with factory() as session:
+        assert session.scalars(select(Trade)).one().pnl == Decimal("3")
+        assert session.scalars(select(DailyStatistic)).all() == []
+    assert rollups.backfill(scope) == 1